@@ -36,12 +36,68 @@ class DjangoEvolutionSettings(object):
         2.2
 
     Attributes:
+        COALESCE_EVOLUTIONS:
+            Whether to move pending evolutions into the earliest batch of
+            evolutions permitted by their dependencies.
+
+            If enabled, evolutions may be applied ahead of migrations (for
+            apps unrelated to their models) that they would otherwise follow.
+            More of each app's mutations can then be optimized together.
+
+            This only considers declared dependencies and current model
+            relations. It doesn't account for
+            :py:class:`~django_evolution.mutations.SQLMutation` or
+            :py:class:`~django_evolution.mutations.ChunkedDataMutation`
+            operations on other apps' tables, ``RunPython``/``RunSQL``
+            operations in migrations, or relations that no longer exist in
+            the models. It should only be enabled if evolutions are
+            independent of other apps' migrations.
+
+            Type:
+                bool
+
+            Version Added:
+                3.0
+
         CUSTOM_EVOLUTIONS:
             A mapping of app labels to lists of custom evolution modules.
 
             Type:
                 dict
 
+        DEFERRED_TABLE_DROPS:
+            Whether to defer dropping the tables of deleted models.
+
+            If enabled, tables deleted through
+            :py:class:`~django_evolution.mutations.DeleteModel` (including
+            deleted and purged applications) will be renamed aside during the
+            evolution, to be dropped later by running
+            ``evolve --drain-drops``. This avoids stalls when dropping large
+            tables. Databases that cannot defer drops will drop the tables
+            immediately.
+
+            Type:
+                bool
+
+            Version Added:
+                3.0
+
+        DATABASE_STATE_SCAN_JOBS:
+            The number of database connections used to scan tables for
+            indexes and constraints.
+
+            If greater than 1, and the database backend supports it, tables
+            will be introspected in parallel when scanning the database
+            state. This can greatly speed up scans of databases with many
+            tables, particularly remote databases, where each table's scan is
+            dominated by the round-trip time.
+
+            Type:
+                int
+
+            Version Added:
+                3.0
+
         ENABLED:
             Whether Django Evolution is enabled.
 
@@ -69,7 +125,10 @@ class DjangoEvolutionSettings(object):
 
     #: Default settings for all keys.
     _DEFAULTS = {
+        'COALESCE_EVOLUTIONS': False,
         'CUSTOM_EVOLUTIONS': {},
+        'DATABASE_STATE_SCAN_JOBS': 1,
+        'DEFERRED_TABLE_DROPS': False,
         'ENABLED': True,
         'RENAMED_FIELD_TYPES': {},
     }
@@ -168,6 +227,16 @@ def _on_setting_changed(setting, value, **kwargs):
     Version Added:
         2.2
 
+    Version Changed:
+        3.0:
+        Cached field type information on
+        :py:class:`~django_evolution.signature.FieldSignature` is now cleared
+        when ``settings.DJANGO_EVOLUTION`` changes.
+
+        Compiled mutation plans on
+        :py:class:`~django_evolution.evolve.EvolveAppTask` are now cleared
+        when ``settings.DJANGO_EVOLUTION`` changes.
+
     Args:
         setting (unicode):
             The name of the setting.
@@ -179,7 +248,18 @@ def _on_setting_changed(setting, value, **kwargs):
             Extra keyword arguments passed to the signal.
     """
     if setting == 'DJANGO_EVOLUTION':
+        from django_evolution.evolve import EvolveAppTask
+        from django_evolution.signature import FieldSignature
+
         django_evolution_settings.replace_settings(value or {})
+
+        # RENAMED_FIELD_TYPES may have changed, so any field types resolved
+        # using the old mappings must be discarded.
+        FieldSignature.clear_caches()
+
+        # DEFERRED_TABLE_DROPS or COALESCE_EVOLUTIONS may have changed, so
+        # any SQL compiled using the old values must be discarded.
+        EvolveAppTask.clear_caches()
     elif setting in django_evolution_settings._DEPRECATED_SETTINGS:
         django_evolution_settings._set_deprecated_setting(setting, value)
 
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import copy
 import logging
+import time
+import uuid
 from collections import defaultdict
 
 import django
@@ -30,7 +32,17 @@ from django_evolution.utils.models import iter_non_m2m_reverse_relations
 
 
 class BaseEvolutionOperations(object):
-    """Base class for evolution operations for a database backend."""
+    """Base class for evolution operations for a database backend.
+
+    Attributes:
+        sql_notes (list of unicode):
+            Notes on how generated SQL will be applied by the database, such
+            as whether a change will rewrite a table. These are for display
+            only, and are never executed.
+
+            Version Added:
+                3.0
+    """
 
     #: The name of the database type.
     #:
@@ -94,6 +106,73 @@ class BaseEvolutionOperations(object):
 
     alter_table_sql_result_cls = AlterTableSQLResult
 
+    #: The name of the lock used to serialize evolutions across processes.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     unicode
+    evolve_lock_name = 'django_evolution.evolve'
+
+    #: Whether deleted tables can be set aside to be dropped later.
+    #:
+    #: If ``False``, :py:meth:`defer_delete_table` will drop tables
+    #: immediately.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     bool
+    supports_deferred_table_drops = False
+
+    #: The prefix for the names of tables set aside to be dropped later.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     unicode
+    deferred_drop_table_prefix = '_evodrop_'
+
+    #: Whether several SQL statements can be executed in a single call.
+    #:
+    #: If ``True``, a bulk install will group statements together when
+    #: creating new models, reducing round-trips to the database.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     bool
+    supports_multi_statement_sql = False
+
+    #: Whether indexes can be created from several connections at once.
+    #:
+    #: If ``True``, a bulk install may create indexes for new models in
+    #: parallel.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     bool
+    supports_concurrent_index_creation = False
+
+    #: Whether tables can be introspected from several connections at once.
+    #:
+    #: If ``True``, scans of the database state may look up the constraints
+    #: for tables in parallel, based on
+    #: ``settings.DJANGO_EVOLUTION['DATABASE_STATE_SCAN_JOBS']``.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     bool
+    supports_concurrent_introspection = False
+
     def __init__(self, database_state, connection=default_connection):
         """Initialize the evolution operations.
 
@@ -106,6 +185,84 @@ class BaseEvolutionOperations(object):
         """
         self.database_state = database_state
         self.connection = connection
+        self.sql_notes = []
+
+    def acquire_evolve_lock(self):
+        """Acquire a lock preventing other processes from evolving.
+
+        This will block until the lock is acquired. The lock is held until
+        :py:meth:`release_evolve_lock` is called on this instance.
+
+        By default, this does nothing. Backends that can coordinate between
+        processes sharing a database will override this.
+
+        Version Added:
+            3.0
+
+        Raises:
+            django_evolution.errors.EvolutionException:
+                The lock could not be acquired.
+        """
+        pass
+
+    def release_evolve_lock(self):
+        """Release a lock acquired by :py:meth:`acquire_evolve_lock`.
+
+        By default, this does nothing.
+
+        Version Added:
+            3.0
+        """
+        pass
+
+    def begin_bulk_install(self):
+        """Prepare the database for installing a large number of models.
+
+        This is called before a bulk install of a new database begins,
+        outside of any transaction. Backends can override this to relax
+        settings that slow down large numbers of schema changes. Any changes
+        must be reverted by :py:meth:`end_bulk_install`.
+
+        By default, this does nothing.
+
+        Version Added:
+            3.0
+        """
+        pass
+
+    def end_bulk_install(self):
+        """Restore the database after a bulk install.
+
+        This reverts any changes made by :py:meth:`begin_bulk_install` on
+        this instance.
+
+        By default, this does nothing.
+
+        Version Added:
+            3.0
+        """
+        pass
+
+    def get_schema_fingerprint(self):
+        """Return a fingerprint of the database's tables and indexes.
+
+        The fingerprint must change whenever a table or an index tracked by
+        :py:class:`~django_evolution.db.state.DatabaseState` is added,
+        removed, or changed. It's used to determine whether a stored
+        snapshot of the database state can be used instead of scanning the
+        database. It should be much cheaper to compute than a scan.
+
+        By default, this returns ``None``, meaning the database must always
+        be scanned.
+
+        Version Added:
+            3.0
+
+        Returns:
+            unicode:
+            The fingerprint, or ``None`` if not supported.
+        """
+        return None
 
     def can_add_index(self, index):
         """Return whether an index can be added to this database.
@@ -481,6 +638,124 @@ class BaseEvolutionOperations(object):
         qn = self.connection.ops.quote_name
         return SQLResult(['DROP TABLE %s;' % qn(table_name)])
 
+    def defer_delete_table(self, table_name):
+        """Return SQL for setting aside a table to be dropped later.
+
+        The table will be renamed using :py:meth:`get_deferred_drop_table_name`,
+        which is cheap regardless of the size of the table. It can then be
+        dropped outside of the evolution by
+        :py:func:`~django_evolution.utils.sql.drain_deferred_table_drops`.
+
+        If the database doesn't support deferred drops, the table will be
+        dropped immediately.
+
+        Version Added:
+            3.0
+
+        Args:
+            table_name (unicode):
+                The name of the table to delete.
+
+        Returns:
+            django_evolution.db.sql_result.SQLResult:
+            The resulting SQL for setting aside the table.
+        """
+        if not self.supports_deferred_table_drops:
+            return self.delete_table(table_name)
+
+        return self.get_rename_table_sql(
+            model=None,
+            old_db_table=table_name,
+            new_db_table=self.get_deferred_drop_table_name(table_name))
+
+    def get_deferred_drop_table_name(self, table_name):
+        """Return a new name for a table being set aside to be dropped later.
+
+        The name will start with :py:attr:`deferred_drop_table_prefix`,
+        followed by a unique token that sorts in the order tables were set
+        aside.
+
+        Version Added:
+            3.0
+
+        Args:
+            table_name (unicode):
+                The name of the table being set aside.
+
+        Returns:
+            unicode:
+            The new name for the table.
+        """
+        return truncate_name(
+            '%s%08x%s_%s' % (self.deferred_drop_table_prefix,
+                             int(time.time()),
+                             uuid.uuid4().hex[:4],
+                             table_name),
+            self.connection.ops.max_name_length())
+
+    def get_deferred_drop_table_names(self):
+        """Return the names of all tables waiting to be dropped.
+
+        Version Added:
+            3.0
+
+        Returns:
+            list of unicode:
+            The names of the tables, in the order they were set aside.
+        """
+        prefix = self.deferred_drop_table_prefix
+
+        with self.connection.cursor() as cursor:
+            table_names = \
+                self.connection.introspection.table_names(cursor)
+
+        return sorted(
+            table_name
+            for table_name in table_names
+            if table_name.startswith(prefix)
+        )
+
+    def get_drop_deferred_table_sql(self, table_name):
+        """Return SQL for dropping a table that was set aside.
+
+        Version Added:
+            3.0
+
+        Args:
+            table_name (unicode):
+                The name of the table, as returned by
+                :py:meth:`get_deferred_drop_table_names`.
+
+        Returns:
+            django_evolution.db.sql_result.SQLResult:
+            The resulting SQL for dropping the table.
+        """
+        return self.delete_table(table_name)
+
+    def get_delete_table_rows_chunk_sql(self, table_name, chunk_size):
+        """Return SQL for deleting a chunk of rows from a table set aside.
+
+        This is used to empty a large table in small transactions before
+        dropping it. By default, this isn't supported, and tables will be
+        dropped without first being emptied.
+
+        Version Added:
+            3.0
+
+        Args:
+            table_name (unicode):
+                The name of the table, as returned by
+                :py:meth:`get_deferred_drop_table_names`.
+
+            chunk_size (int):
+                The maximum number of rows to delete.
+
+        Returns:
+            unicode:
+            The SQL statement, or ``None`` if not supported.
+        """
+        return None
+
     def add_m2m_table(self, model, field):
         """Return SQL statements for creating a ManyToManyField's table.
 
@@ -630,24 +905,114 @@ class BaseEvolutionOperations(object):
                                          col_names=[column]),
             columns=[column])
 
-        return SQLResult(sql_indexes_for_field(self.connection, model, field))
+        return self.get_create_index_sql(model, [field])
 
-    def create_unique_index(self, model, index_name, fields):
-        qn = self.connection.ops.quote_name
-        table_name = model._meta.db_table
+    def get_create_index_sql(self, model, fields, index_together=False):
+        """Return the database-specific SQL to create an index.
+
+        This can be overridden by subclasses if they use a syntax other than
+        Django's ``CREATE INDEX`` statements.
+
+        Version Added:
+            3.0
+
+        Args:
+            model (type):
+                The model owning the fields.
+
+            fields (list of django.db.models.Field):
+                The fields to index. Unless ``index_together`` is set, this
+                will contain a single field, and no SQL will be returned if
+                that field isn't set to be indexed.
+
+            index_together (bool, optional):
+                Whether this is from an ``index_together`` rule.
 
+        Returns:
+            django_evolution.db.sql_result.SQLResult:
+            The SQL for creating the index.
+        """
+        if index_together:
+            sql = sql_indexes_for_fields(self.connection, model, fields,
+                                         index_together=True)
+        else:
+            assert len(fields) == 1
+
+            sql = sql_indexes_for_field(self.connection, model, fields[0])
+
+        return SQLResult(sql)
+
+    def create_unique_index(self, model, index_name, fields):
         self.database_state.add_index(
-            table_name=table_name,
+            table_name=model._meta.db_table,
             index_name=index_name,
             columns=self.get_column_names_for_fields(fields),
             unique=True)
 
+        return self.get_create_unique_index_sql(model, index_name, fields)
+
+    def get_create_unique_index_sql(self, model, index_name, fields):
+        """Return the database-specific SQL to create a unique index.
+
+        This can be overridden by subclasses if they use a syntax other than
+        ``CREATE UNIQUE INDEX``.
+
+        Version Added:
+            3.0
+
+        Args:
+            model (type):
+                The model owning the fields.
+
+            index_name (unicode):
+                The name of the index to create.
+
+            fields (list of django.db.models.Field):
+                The fields to index.
+
+        Returns:
+            django_evolution.db.sql_result.SQLResult:
+            The SQL for creating the index.
+        """
+        qn = self.connection.ops.quote_name
+
         return SQLResult([
             'CREATE UNIQUE INDEX %s ON %s (%s);'
-            % (qn(index_name), qn(table_name),
+            % (qn(index_name), qn(model._meta.db_table),
                ', '.join([qn(field.column) for field in fields])),
         ])
 
+    def get_statement_sql(self, model, statement):
+        """Return SQL for a statement generated by Django's schema editor.
+
+        This is used for the index and constraint statements generated for
+        :py:attr:`Meta.indexes <django.db.models.Options.indexes>` and
+        :py:attr:`Meta.constraints <django.db.models.Options.constraints>`.
+        Subclasses can override this to turn statements into
+        :py:class:`~django_evolution.db.sql_result.AlterTableSQLResult`
+        items that can be merged with other changes to the table.
+
+        Version Added:
+            3.0
+
+        Args:
+            model (type):
+                The model the statement applies to.
+
+            statement (django.db.backends.ddl_references.Statement or
+                       unicode):
+                The statement generated by the schema editor. This may be
+                ``None`` if the schema editor had nothing to generate.
+
+        Returns:
+            django_evolution.db.sql_result.SQLResult:
+            The SQL for the statement.
+        """
+        if statement is None:
+            return SQLResult()
+
+        return SQLResult(['%s;' % statement])
+
     def drop_index(self, model, field):
         """Returns the SQL for dropping an index for a single field.
 
@@ -1221,8 +1586,8 @@ class BaseEvolutionOperations(object):
             When :py:attr:`change_column_type_sets_attrs` is ``True``
             (MySQL/MariaDB), any ``db_index`` or ``unique`` changes in
             ``new_attrs`` are now handled here. Index drops are emitted
-            as pre-SQL (before the column type change) and index adds as
-            post-SQL (after the column type change).
+            as pre-SQL (before the column type change) and index adds
+            after the column type change.
 
             This is necessary because on those backends,
             :py:meth:`~django_evolution.mutations.ChangeField.mutate`
@@ -1268,10 +1633,10 @@ class BaseEvolutionOperations(object):
         # changes here so they aren't silently lost.
         #
         # Index drops must happen before the column type change (as
-        # pre-SQL), and index adds after (as post-SQL). This is
-        # critical for MySQL, which rejects MODIFY COLUMN on a
-        # TEXT/BLOB column that has an existing index without a key
-        # length.
+        # pre-SQL), and index adds after. This is critical for MySQL,
+        # which rejects MODIFY COLUMN on a TEXT/BLOB column that has an
+        # existing index without a key length. Index adds are merged in
+        # after the column type change, so they can share its ALTER TABLE.
         index_add_sql = None
 
         if self.change_column_type_sets_attrs and new_attrs:
@@ -1284,13 +1649,13 @@ class BaseEvolutionOperations(object):
 
             sql_result.add_pre_sql(index_drop_sql)
 
-        sql_result.add_sql(self.get_change_column_type_sql(
+        sql_result.add(self.get_change_column_type_sql(
             model=model,
             old_field=old_field,
             new_field=new_field))
 
         if index_add_sql is not None:
-            sql_result.add_post_sql(index_add_sql)
+            sql_result.add(index_add_sql)
 
         sql_result.add_post_sql(self.restore_field_ref_constraints(stash))
 
@@ -1373,8 +1738,8 @@ class BaseEvolutionOperations(object):
         # 10: test_change_field_type_plain_to_unique
         # 11: test_change_field_type_plain_to_db_index
         # 12: test_change_field_type
-        drop_sql = SQLResult()
-        add_sql = SQLResult()
+        drop_sql = self.alter_table_sql_result_cls(self, model)
+        add_sql = self.alter_table_sql_result_cls(self, model)
 
         db_index_attr = new_attrs.get('db_index', {})
         unique_attr = new_attrs.get('unique', {})
@@ -1473,7 +1838,7 @@ class BaseEvolutionOperations(object):
             The SQL statements for changing the ``unique_together``
             constraints.
         """
-        sql_result = SQLResult()
+        sql_result = self.alter_table_sql_result_cls(self, model)
         table_name = model._meta.db_table
 
         old_unique_together = set(old_unique_together)
@@ -1494,7 +1859,7 @@ class BaseEvolutionOperations(object):
                 self.database_state.remove_index(table_name=table_name,
                                                  index_name=index_name,
                                                  unique=True)
-                sql_result.add_sql(
+                sql_result.add(
                     self.get_drop_unique_constraint_sql(model, index_name))
 
         for field_names in new_unique_together:
@@ -1508,7 +1873,7 @@ class BaseEvolutionOperations(object):
                 # This doesn't exist in the database, so we want to add it.
                 index_name = self.get_new_index_name(model, fields,
                                                      unique=True)
-                sql_result.add_sql(
+                sql_result.add(
                     self.create_unique_index(model, index_name, fields))
 
         return sql_result
@@ -1531,7 +1896,7 @@ class BaseEvolutionOperations(object):
             django_evolution.sql_result.SQLResult:
             The SQL statements for changing the ``index_together`` indexes.
         """
-        sql_result = SQLResult()
+        sql_result = self.alter_table_sql_result_cls(self, model)
         table_name = model._meta.db_table
 
         old_index_together = set(old_index_together or [])
@@ -1562,8 +1927,8 @@ class BaseEvolutionOperations(object):
                 self.database_state.add_index(table_name=table_name,
                                               index_name=index_name,
                                               columns=columns)
-                sql_result.add(sql_indexes_for_fields(
-                    self.connection, model, fields, index_together=True))
+                sql_result.add(self.get_create_index_sql(
+                    model, fields, index_together=True))
 
         return sql_result
 
@@ -1743,14 +2108,16 @@ class BaseEvolutionOperations(object):
             django_evolution.sql_result.SQLResult:
             The SQL statements for changing the constraints.
         """
-        sql_result = SQLResult()
+        sql_result = self.alter_table_sql_result_cls(self, model)
 
         with self.connection.schema_editor(collect_sql=True) as schema_editor:
             for constraint in to_remove:
-                sql_result.add(constraint.remove_sql(model, schema_editor))
+                sql_result.add(self.get_statement_sql(
+                    model, constraint.remove_sql(model, schema_editor)))
 
             for constraint in to_add:
-                sql_result.add(constraint.create_sql(model, schema_editor))
+                sql_result.add(self.get_statement_sql(
+                    model, constraint.create_sql(model, schema_editor)))
 
         return sql_result
 
@@ -1818,7 +2185,7 @@ class BaseEvolutionOperations(object):
             if index_key not in old_indexes_map
         ]
 
-        sql_result = SQLResult()
+        sql_result = self.alter_table_sql_result_cls(self, model)
         table_name = model._meta.db_table
         db_state = self.database_state
 
@@ -1853,8 +2220,8 @@ class BaseEvolutionOperations(object):
                             'name': index_name,
                             'fields': list(index_field_names),
                         }))
-                    sql_result.add('%s;' % index.remove_sql(model,
-                                                            schema_editor))
+                    sql_result.add(self.get_statement_sql(
+                        model, index.remove_sql(model, schema_editor)))
 
                     db_state.remove_index(table_name=table_name,
                                           index_name=index_name)
@@ -1902,8 +2269,8 @@ class BaseEvolutionOperations(object):
                             columns=self.get_column_names_for_fields(
                                 fields or []))
 
-                        sql_result.add(
-                            '%s;' % index.create_sql(model, schema_editor))
+                        sql_result.add(self.get_statement_sql(
+                            model, index.create_sql(model, schema_editor)))
 
         return sql_result
 
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+from django.core.exceptions import FieldDoesNotExist
 from django.core.management import color
+from django.db.backends.ddl_references import Statement
 
-from django_evolution.compat.db import sql_delete_constraints
+from django_evolution.compat.db import (collect_sql_schema_editor,
+                                        sql_delete_constraints)
 from django_evolution.compat.models import (get_rel_target_field,
                                             get_remote_field,
                                             get_remote_field_model)
 from django_evolution.db.common import BaseEvolutionOperations
 from django_evolution.db.sql_result import AlterTableSQLResult, SQLResult
+from django_evolution.errors import EvolutionException
 
 
 class EvolutionOperations(BaseEvolutionOperations):
@@ -34,6 +38,117 @@ class EvolutionOperations(BaseEvolutionOperations):
         'json',
     }
 
+    #: Operations that can be merged into a single ALTER TABLE.
+    #:
+    #: Each ``ALTER TABLE`` on MySQL may involve copying the entire table, so
+    #: all of these are merged, as long as they don't change the same
+    #: columns. See :py:meth:`generate_table_ops_sql`.
+    #:
+    #: Version Added:
+    #:     3.0
+    mergeable_ops = (
+        'add_column',
+        'change_column',
+        'change_column_type',
+        'change_meta',
+        'delete_column',
+    )
+
+    #: Templates for schema editor statements that map to ALTER TABLE items.
+    #:
+    #: Each entry maps the start of a statement template to the start of the
+    #: equivalent ``ALTER TABLE`` item.
+    #:
+    #: Version Added:
+    #:     3.0
+    _ALTER_TABLE_STATEMENT_PREFIXES = (
+        ('CREATE INDEX %(name)s ON %(table)s ', 'ADD INDEX %(name)s '),
+        ('CREATE UNIQUE INDEX %(name)s ON %(table)s ',
+         'ADD UNIQUE INDEX %(name)s '),
+        ('DROP INDEX %(name)s ON %(table)s', 'DROP INDEX %(name)s'),
+        ('ALTER TABLE %(table)s ', ''),
+    )
+
+    #: The number of seconds to wait for the evolve lock.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     int
+    evolve_lock_timeout = 24 * 60 * 60
+
+    supports_concurrent_index_creation = True
+    supports_concurrent_introspection = True
+    supports_deferred_table_drops = True
+
+    def acquire_evolve_lock(self):
+        """Acquire a lock preventing other processes from evolving.
+
+        This uses a named user-level lock, which is held across transactions
+        until released or until the connection is closed.
+
+        Version Added:
+            3.0
+
+        Raises:
+            django_evolution.errors.EvolutionException:
+                The lock could not be acquired within
+                :py:attr:`evolve_lock_timeout` seconds.
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute('SELECT GET_LOCK(%s, %s)',
+                           [self.evolve_lock_name, self.evolve_lock_timeout])
+            row = cursor.fetchone()
+
+        if not row or row[0] != 1:
+            raise EvolutionException(
+                'Timed out waiting for another process to finish evolving '
+                'the database.')
+
+    def release_evolve_lock(self):
+        """Release a lock acquired by :py:meth:`acquire_evolve_lock`.
+
+        Version Added:
+            3.0
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute('SELECT RELEASE_LOCK(%s)',
+                           [self.evolve_lock_name])
+
+    def get_schema_fingerprint(self):
+        """Return a fingerprint of the database's tables and indexes.
+
+        This is made up of counts and checksums of the table names in
+        ``information_schema.TABLES`` and the index columns in
+        ``information_schema.STATISTICS``. Table update times aren't used,
+        since they change along with the data.
+
+        Version Added:
+            3.0
+
+        Returns:
+            unicode:
+            The fingerprint.
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT COUNT(*), COALESCE(SUM(CRC32(TABLE_NAME)), 0)'
+                '  FROM information_schema.TABLES'
+                ' WHERE TABLE_SCHEMA = DATABASE()')
+            table_info = cursor.fetchone()
+
+            cursor.execute(
+                "SELECT COUNT(*),"
+                "       COALESCE(SUM(CRC32(CONCAT_WS(':', TABLE_NAME,"
+                "                INDEX_NAME, SEQ_IN_INDEX, COLUMN_NAME,"
+                "                NON_UNIQUE))), 0)"
+                "  FROM information_schema.STATISTICS"
+                " WHERE TABLE_SCHEMA = DATABASE()")
+            index_info = cursor.fetchone()
+
+        return 'mysql:%s:%s:%s:%s' % (tuple(table_info) + tuple(index_info))
+
     def get_field_type_allows_default(self, field):
         """Return whether default values are allowed for a field.
 
@@ -110,12 +225,12 @@ class EvolutionOperations(BaseEvolutionOperations):
         if remote_field:
             remote_field_model = get_remote_field_model(remote_field)
 
-            sql_result.add(sql_delete_constraints(
+            sql_result.add_pre_sql(sql_delete_constraints(
                 self.connection,
                 remote_field_model,
                 {remote_field_model: [(model, f)]}))
 
-        sql_result.add_sql(
+        sql_result.add(
             super(EvolutionOperations, self).delete_column(model, f))
 
         return sql_result
@@ -239,30 +354,153 @@ class EvolutionOperations(BaseEvolutionOperations):
             ]
         )
 
+    def get_create_index_sql(self, model, fields, index_together=False):
+        """Return SQL to create an index.
+
+        The index is added through an Alter Table operation, so that it can
+        be merged with other changes to the table.
+
+        Version Added:
+            3.0
+
+        Args:
+            model (type):
+                The model owning the fields.
+
+            fields (list of django.db.models.Field):
+                The fields to index. Unless ``index_together`` is set, this
+                will contain a single field, and no SQL will be returned if
+                that field isn't set to be indexed.
+
+            index_together (bool, optional):
+                Whether this is from an ``index_together`` rule.
+
+        Returns:
+            django_evolution.db.sql_result.SQLResult:
+            The SQL for creating the index.
+        """
+        if index_together:
+            suffix = '_idx'
+        else:
+            assert len(fields) == 1
+
+            field = fields[0]
+
+            if not field.db_index or field.unique:
+                return SQLResult()
+
+            suffix = ''
+
+        with collect_sql_schema_editor(self.connection) as schema_editor:
+            statement = schema_editor._create_index_sql(model,
+                                                        fields=fields,
+                                                        suffix=suffix)
+
+        return self.get_statement_sql(model, statement)
+
+    def get_create_unique_index_sql(self, model, index_name, fields):
+        """Return SQL to create a unique index.
+
+        The index is added through an Alter Table operation, so that it can
+        be merged with other changes to the table.
+
+        Version Added:
+            3.0
+
+        Args:
+            model (type):
+                The model owning the fields.
+
+            index_name (unicode):
+                The name of the index to create.
+
+            fields (list of django.db.models.Field):
+                The fields to index.
+
+        Returns:
+            django_evolution.db.sql_result.AlterTableSQLResult:
+            The SQL for creating the index.
+        """
+        qn = self.connection.ops.quote_name
+
+        return AlterTableSQLResult(
+            self,
+            model,
+            [{
+                'sql': 'ADD UNIQUE INDEX %s (%s)'
+                       % (qn(index_name),
+                          ', '.join(qn(field.column) for field in fields)),
+            }])
+
     def get_drop_index_sql(self, model, index_name):
         qn = self.connection.ops.quote_name
 
-        return SQLResult([
-            'DROP INDEX %s ON %s;'
-            % (qn(index_name), qn(model._meta.db_table))
-        ])
+        return AlterTableSQLResult(
+            self,
+            model,
+            [{'sql': 'DROP INDEX %s' % qn(index_name)}])
 
     def get_change_unique_sql(self, model, field, new_unique_value,
                               constraint_name, initial):
         qn = self.connection.ops.quote_name
-        opts = model._meta
-        sql = []
 
         if new_unique_value:
-            sql.append(
-                'CREATE UNIQUE INDEX %s ON %s(%s);'
-                % (constraint_name, qn(opts.db_table), qn(field.column)))
+            alter_table_item = {
+                'sql': 'ADD UNIQUE INDEX %s (%s)'
+                       % (constraint_name, qn(field.column)),
+            }
         else:
-            sql.append(
-                'DROP INDEX %s ON %s;'
-                % (constraint_name, qn(opts.db_table)))
+            alter_table_item = {
+                'sql': 'DROP INDEX %s' % constraint_name,
+            }
+
+        return AlterTableSQLResult(self, model, [alter_table_item])
+
+    def get_statement_sql(self, model, statement):
+        """Return SQL for a statement generated by Django's schema editor.
+
+        Statements creating or dropping indexes or constraints on the table
+        are turned into Alter Table operations, so that they can be merged
+        with other changes to the table. Foreign key changes are left alone,
+        since MySQL can't drop and re-add a foreign key of the same name in
+        one ``ALTER TABLE``.
 
-        return SQLResult(sql)
+        Version Added:
+            3.0
+
+        Args:
+            model (type):
+                The model the statement applies to.
+
+            statement (django.db.backends.ddl_references.Statement or
+                       unicode):
+                The statement generated by the schema editor. This may be
+                ``None`` if the schema editor had nothing to generate.
+
+        Returns:
+            django_evolution.db.sql_result.SQLResult:
+            The SQL for the statement.
+        """
+        if (isinstance(statement, Statement) and
+            'FOREIGN KEY' not in statement.template and
+            (str(statement.parts.get('table')) ==
+             self.connection.ops.quote_name(model._meta.db_table))):
+            template = statement.template
+
+            for prefix, alter_table_prefix in \
+                    self._ALTER_TABLE_STATEMENT_PREFIXES:
+                if template.startswith(prefix):
+                    return AlterTableSQLResult(
+                        self,
+                        model,
+                        [{
+                            'sql': ((alter_table_prefix +
+                                     template[len(prefix):])
+                                    % statement.parts),
+                        }])
+
+        return super(EvolutionOperations, self).get_statement_sql(
+            model, statement)
 
     def get_rename_table_sql(self, model, old_db_table, new_db_table):
         """Return SQL for renaming a table.
@@ -288,6 +526,28 @@ class EvolutionOperations(BaseEvolutionOperations):
             % (qn(old_db_table), qn(new_db_table))
         ])
 
+    def get_delete_table_rows_chunk_sql(self, table_name, chunk_size):
+        """Return SQL for deleting a chunk of rows from a table set aside.
+
+        Version Added:
+            3.0
+
+        Args:
+            table_name (unicode):
+                The name of the table, as returned by
+                :py:meth:`get_deferred_drop_table_names`.
+
+            chunk_size (int):
+                The maximum number of rows to delete.
+
+        Returns:
+            unicode:
+            The SQL statement.
+        """
+        qn = self.connection.ops.quote_name
+
+        return 'DELETE FROM %s LIMIT %d;' % (qn(table_name), chunk_size)
+
     def get_default_index_name(self, table_name, field):
         """Return a default index name for the database.
 
@@ -365,3 +625,186 @@ class EvolutionOperations(BaseEvolutionOperations):
             indexes[index_name]['columns'].append(col_name)
 
         return indexes
+
+    def generate_table_ops_sql(self, mutator, ops):
+        """Generate SQL for a sequence of mutation operations.
+
+        Each ``ALTER TABLE`` on MySQL may involve copying the entire table.
+        To keep this to a minimum, operations on the table are merged into
+        as few :py:class:`~django_evolution.db.sql_result.AlterTableSQLResult`
+        instances as possible.
+
+        Merging an operation moves any SQL it runs before its ``ALTER TABLE``
+        ahead of the operations already merged, and any SQL they run after
+        their ``ALTER TABLE`` after this operation. An operation is only
+        merged if it doesn't touch any of the columns touched by the
+        operations already merged, which keeps this safe and avoids changing
+        a column more than once in an ``ALTER TABLE`` (which MySQL won't
+        allow).
+
+        Version Added:
+            3.0
+
+        Args:
+            mutator (django_evolution.mutators.model_mutator.ModelMutator):
+                The mutator generating the SQL.
+
+            ops (list of dict):
+                The operations to generate SQL for.
+
+        Returns:
+            list:
+            The list of SQL statements.
+        """
+        model = mutator.create_model()
+        sql_results = []
+        prev_sql_result = None
+        prev_op = None
+        merged_columns = None
+
+        for op in ops:
+            op_columns = self._get_op_columns(model, op)
+
+            if (prev_op is not None and
+                merged_columns is not None and
+                op_columns is not None and
+                merged_columns.isdisjoint(op_columns) and
+                self._are_ops_mergeable(prev_op, op)):
+                merge_op = prev_op
+                merged_columns.update(op_columns)
+            else:
+                merge_op = None
+
+                if op_columns is None:
+                    merged_columns = None
+                else:
+                    merged_columns = set(op_columns)
+
+            sql_result = self.generate_table_op_sql(mutator, op,
+                                                    prev_sql_result, merge_op)
+
+            if sql_result is not prev_sql_result:
+                sql_results.append(sql_result)
+                prev_sql_result = sql_result
+
+            prev_op = op
+
+        sql = []
+
+        for sql_result in sql_results:
+            sql.extend(sql_result.to_sql())
+
+        return sql
+
+    def _get_op_columns(self, model, op):
+        """Return the columns touched by an operation.
+
+        Version Added:
+            3.0
+
+        Args:
+            model (type):
+                The model being changed.
+
+            op (dict):
+                The operation.
+
+        Returns:
+            set of unicode:
+            The names of the columns, or ``None`` if they couldn't be
+            determined.
+        """
+        op_type = op['type']
+
+        if op_type in ('add_column', 'delete_column'):
+            return {op['field'].column}
+        elif op_type == 'change_column':
+            field = op['field']
+            columns = {field.column}
+
+            if 'db_column' in op['new_attrs']:
+                columns.add(op['new_attrs']['db_column']['new_value'] or
+                            field.name)
+
+            return columns
+        elif op_type == 'change_column_type':
+            return {op['old_field'].column, op['new_field'].column}
+        elif op_type == 'change_meta':
+            return self._get_change_meta_columns(model=model,
+                                                 prop_name=op['prop_name'],
+                                                 old_value=op['old_value'],
+                                                 new_value=op['new_value'])
+
+        return None
+
+    def _get_change_meta_columns(self, model, prop_name, old_value,
+                                 new_value):
+        """Return the columns touched by a change to a Meta attribute.
+
+        Version Added:
+            3.0
+
+        Args:
+            model (type):
+                The model being changed.
+
+            prop_name (unicode):
+                The name of the Meta attribute.
+
+            old_value (object):
+                The old serialized value.
+
+            new_value (object):
+                The new serialized value.
+
+        Returns:
+            set of unicode:
+            The names of the columns, or ``None`` if they couldn't be
+            determined.
+        """
+        if prop_name == 'db_table_comment':
+            return set()
+
+        if prop_name in ('index_together', 'unique_together'):
+            old_items = set(tuple(item) for item in old_value or [])
+            new_items = set(tuple(item) for item in new_value or [])
+
+            field_names_list = [
+                list(field_names)
+                for field_names in old_items ^ new_items
+            ]
+        elif prop_name in ('constraints', 'indexes'):
+            old_items = {repr(item): item for item in old_value or []}
+            new_items = {repr(item): item for item in new_value or []}
+            field_names_list = []
+
+            for key in set(old_items) ^ set(new_items):
+                item = old_items.get(key) or new_items[key]
+                field_names = item.get('fields')
+
+                if (not field_names or
+                    set(item) - {'fields', 'name', 'type',
+                                 'db_tablespace'}):
+                    # This is based on expressions, conditions, or checks,
+                    # which may involve any columns.
+                    return None
+
+                field_names_list.append([
+                    field_name.lstrip('-')
+                    for field_name in field_names
+                ])
+        else:
+            return None
+
+        columns = set()
+
+        try:
+            for field_names in field_names_list:
+                columns.update(
+                    model._meta.get_field(field_name).column
+                    for field_name in field_names
+                )
+        except FieldDoesNotExist:
+            return None
+
+        return columns
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import re
+import zlib
+
 import django
 
 from django_evolution.compat.db import truncate_name
 from django_evolution.db.common import BaseEvolutionOperations
-from django_evolution.db.sql_result import AlterTableSQLResult
+from django_evolution.db.sql_result import AlterTableSQLResult, SQLResult
 from django_evolution.utils.models import get_field_is_relation
 
 
@@ -19,6 +22,23 @@ class EvolutionOperations(BaseEvolutionOperations):
 
     change_column_type_sets_attrs = False
 
+    supports_concurrent_index_creation = True
+    supports_concurrent_introspection = True
+    supports_deferred_table_drops = True
+    supports_multi_statement_sql = True
+
+    #: The schema that tables are moved into to be dropped later.
+    #:
+    #: Moving tables out of the main schema also moves their indexes,
+    #: constraints, and sequences, freeing up those names for any new tables.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     unicode
+    deferred_drop_schema = 'django_evolution_drops'
+
     #: A mapping of field types for use when altering types.
     #:
     #: Version Added:
@@ -29,12 +49,199 @@ class EvolutionOperations(BaseEvolutionOperations):
         'smallserial': 'smallint',
     }
 
+    #: A column type change only requiring an update to the table metadata.
+    #:
+    #: The new type is binary-coercible from the old type and can hold any
+    #: existing value, so Postgres neither rewrites nor scans the table.
+    #:
+    #: Version Added:
+    #:     3.0
+    COLUMN_TYPE_CHANGE_METADATA_ONLY = 'metadata-only'
+
+    #: A column type change requiring the table to be rewritten.
+    #:
+    #: This includes lowering or adding a length limit on a string column.
+    #: Postgres rewrites the table for these, and existing values must be
+    #: cast to fit the new limit.
+    #:
+    #: Version Added:
+    #:     3.0
+    COLUMN_TYPE_CHANGE_NEEDS_REWRITE = 'needs-rewrite'
+
+    #: Column types that share a binary-compatible string representation.
+    #:
+    #: Version Added:
+    #:     3.0
+    _STRING_COLUMN_TYPES = {'text', 'varchar'}
+
+    #: A regex for parsing a column type and any modifiers.
+    #:
+    #: Version Added:
+    #:     3.0
+    _COLUMN_TYPE_RE = re.compile(
+        r'^(?P<name>[a-z][a-z ]*?)\s*(?:\((?P<modifiers>[\d, ]+)\))?$')
+
+    def acquire_evolve_lock(self):
+        """Acquire a lock preventing other processes from evolving.
+
+        This uses a session-level advisory lock, which is held across
+        transactions until released or until the connection is closed.
+
+        Version Added:
+            3.0
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_lock(%s)',
+                           [self._get_evolve_lock_key()])
+
+    def release_evolve_lock(self):
+        """Release a lock acquired by :py:meth:`acquire_evolve_lock`.
+
+        Version Added:
+            3.0
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_unlock(%s)',
+                           [self._get_evolve_lock_key()])
+
+    def get_schema_fingerprint(self):
+        """Return a fingerprint of the database's tables and indexes.
+
+        This is a checksum of the names of all visible tables, and the
+        definitions of their indexes, computed from ``pg_class`` and
+        ``pg_index``.
+
+        Version Added:
+            3.0
+
+        Returns:
+            unicode:
+            The fingerprint.
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT COUNT(*),"
+                "       md5(COALESCE(string_agg("
+                "           c.relname || ':' || c.relkind::text || ':' ||"
+                "           COALESCE(pg_get_indexdef(i.indexrelid), ''),"
+                "           ',' ORDER BY c.relname, i.indexrelid), ''))"
+                "  FROM pg_catalog.pg_class c"
+                "  JOIN pg_catalog.pg_namespace n"
+                "       ON n.oid = c.relnamespace"
+                "  LEFT JOIN pg_catalog.pg_index i"
+                "       ON i.indrelid = c.oid"
+                " WHERE c.relkind IN ('f', 'm', 'p', 'r', 'v')"
+                "   AND n.nspname NOT IN ('pg_catalog', 'pg_toast')"
+                "   AND pg_catalog.pg_table_is_visible(c.oid)")
+
+            return 'postgres:%s:%s' % cursor.fetchone()
+
+    def defer_delete_table(self, table_name):
+        """Return SQL for setting aside a table to be dropped later.
+
+        The table will be renamed and moved into
+        :py:attr:`deferred_drop_schema`.
+
+        Version Added:
+            3.0
+
+        Args:
+            table_name (unicode):
+                The name of the table to delete.
+
+        Returns:
+            django_evolution.db.sql_result.SQLResult:
+            The resulting SQL for setting aside the table.
+        """
+        qn = self.connection.ops.quote_name
+        new_table_name = self.get_deferred_drop_table_name(table_name)
+
+        return SQLResult([
+            'CREATE SCHEMA IF NOT EXISTS %s;' % qn(self.deferred_drop_schema),
+            'ALTER TABLE %s RENAME TO %s;'
+            % (qn(table_name), qn(new_table_name)),
+            'ALTER TABLE %s SET SCHEMA %s;'
+            % (qn(new_table_name), qn(self.deferred_drop_schema)),
+        ])
+
+    def get_deferred_drop_table_names(self):
+        """Return the names of all tables waiting to be dropped.
+
+        Version Added:
+            3.0
+
+        Returns:
+            list of unicode:
+            The names of the tables, in the order they were set aside.
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT tablename FROM pg_catalog.pg_tables'
+                ' WHERE schemaname = %s',
+                [self.deferred_drop_schema])
+
+            return sorted(
+                row[0]
+                for row in cursor.fetchall()
+            )
+
+    def get_drop_deferred_table_sql(self, table_name):
+        """Return SQL for dropping a table that was set aside.
+
+        Version Added:
+            3.0
+
+        Args:
+            table_name (unicode):
+                The name of the table, as returned by
+                :py:meth:`get_deferred_drop_table_names`.
+
+        Returns:
+            django_evolution.db.sql_result.SQLResult:
+            The resulting SQL for dropping the table.
+        """
+        return SQLResult([
+            'DROP TABLE %s;' % self._qn_deferred_drop_table(table_name),
+        ])
+
+    def get_delete_table_rows_chunk_sql(self, table_name, chunk_size):
+        """Return SQL for deleting a chunk of rows from a table set aside.
+
+        Version Added:
+            3.0
+
+        Args:
+            table_name (unicode):
+                The name of the table, as returned by
+                :py:meth:`get_deferred_drop_table_names`.
+
+            chunk_size (int):
+                The maximum number of rows to delete.
+
+        Returns:
+            unicode:
+            The SQL statement.
+        """
+        qualified_name = self._qn_deferred_drop_table(table_name)
+
+        return (
+            'DELETE FROM %s WHERE ctid IN (SELECT ctid FROM %s LIMIT %d);'
+            % (qualified_name, qualified_name, chunk_size)
+        )
+
     def get_change_column_type_sql(self, model, old_field, new_field):
         """Return SQL to change the type of a column.
 
         Version Added:
             2.2
 
+        Version Changed:
+            3.0:
+            Type changes that Postgres can apply without rewriting the table
+            no longer cast existing values, and each change now adds a note
+            to :py:attr:`sql_notes` stating how it will be applied. See
+            :py:meth:`get_column_type_change_kind`.
+
         Args:
             model (type):
                 The type of model owning the field.
@@ -77,13 +284,23 @@ class EvolutionOperations(BaseEvolutionOperations):
             new_field_type = self.alter_field_type_map.get(new_field_type,
                                                            new_field_type)
 
+        change_kind = self.get_column_type_change_kind(
+            self.alter_field_type_map.get(old_field_type, old_field_type),
+            new_field_type)
+
         alter_type_params = ['TYPE', new_field_type] + schema['definition']
 
-        if not self._are_column_types_compatible(old_field, new_field):
+        if (change_kind != self.COLUMN_TYPE_CHANGE_METADATA_ONLY and
+            not self._are_column_types_compatible(old_field, new_field)):
             alter_type_params += [
                 'USING', '%s::%s' % (column_name, new_field_type),
             ]
 
+        self._add_column_type_change_note(table_name=table_name,
+                                          column_name=column_name,
+                                          old_field_type=old_field_type,
+                                          new_field_type=new_field_type,
+                                          change_kind=change_kind)
         sql_result.add_alter_table([{
             'op': 'ALTER COLUMN',
             'column': column_name,
@@ -294,22 +511,192 @@ class EvolutionOperations(BaseEvolutionOperations):
             django_evolution.db.sql_result.AlterTableSQLResult:
             The SQL for modifying the value.
         """
+        old_field_type = field.db_type(connection=self.connection)
+
         if new_max_digits is not None:
             field.max_digits = new_max_digits
 
         if new_decimal_places is not None:
             field.decimal_places = new_decimal_places
 
+        new_field_type = field.db_type(connection=self.connection)
+
+        self._add_column_type_change_note(table_name=model._meta.db_table,
+                                          column_name=field.column,
+                                          old_field_type=old_field_type,
+                                          new_field_type=new_field_type)
+
         return self.alter_table_sql_result_cls(
             self,
             model,
             alter_table=[{
                 'op': 'ALTER COLUMN',
                 'column': field.column,
-                'params': ['TYPE', field.db_type(connection=self.connection)],
+                'params': ['TYPE', new_field_type],
+            }]
+        )
+
+    def change_column_attr_max_length(self, model, mutation, field, old_value,
+                                      new_value):
+        """Return SQL for changing a column's max length.
+
+        Increasing or removing the length limit of a column is applied
+        without casting existing values, letting Postgres skip the table
+        rewrite. Decreasing it casts each existing value to the new length.
+
+        Version Added:
+            3.0
+
+        Args:
+            model (type):
+                The model class that owns the field.
+
+            mutation (django_evolution.mutations.BaseModelMutation):
+                The mutation applying this change.
+
+            field (django.db.models.Field):
+                The field being modified.
+
+            old_value (int):
+                The old value for ``max_length``.
+
+            new_value (int):
+                The new value for ``max_length``.
+
+        Returns:
+            django_evolution.db.sql_result.AlterTableSQLResult:
+            The SQL for modifying the value.
+        """
+        connection = self.connection
+        qn = connection.ops.quote_name
+        column = field.column
+
+        field.max_length = old_value
+        old_field_type = field.db_type(connection=connection)
+
+        field.max_length = new_value
+        new_field_type = field.db_type(connection=connection)
+
+        change_kind = self.get_column_type_change_kind(old_field_type,
+                                                       new_field_type)
+
+        if change_kind == self.COLUMN_TYPE_CHANGE_METADATA_ONLY:
+            alter_type_params = ['TYPE %s' % new_field_type]
+        else:
+            alter_type_params = [
+                'TYPE %s USING CAST(%s as %s)'
+                % (new_field_type, qn(column), new_field_type),
+            ]
+
+        self._add_column_type_change_note(table_name=model._meta.db_table,
+                                          column_name=column,
+                                          old_field_type=old_field_type,
+                                          new_field_type=new_field_type,
+                                          change_kind=change_kind)
+
+        return self.alter_table_sql_result_cls(
+            self,
+            model,
+            alter_table=[{
+                'op': 'ALTER COLUMN',
+                'column': column,
+                'params': alter_type_params,
             }]
         )
 
+    def get_column_type_change_kind(self, old_field_type, new_field_type):
+        """Return how Postgres will need to apply a column type change.
+
+        Changes are classified as one of:
+
+        :py:attr:`COLUMN_TYPE_CHANGE_METADATA_ONLY`:
+            The type is unchanged, or is a ``varchar``/``text`` or
+            ``numeric`` type with a limit that's been raised or removed.
+
+        :py:attr:`COLUMN_TYPE_CHANGE_NEEDS_REWRITE`:
+            Any other change, including a ``varchar``/``text`` type with a
+            limit that's been lowered or added.
+
+        Version Added:
+            3.0
+
+        Args:
+            old_field_type (unicode):
+                The old database column type.
+
+            new_field_type (unicode):
+                The new database column type.
+
+        Returns:
+            unicode:
+            The kind of column type change.
+        """
+        old_type_name, old_modifiers = \
+            self._parse_column_type(old_field_type)
+        new_type_name, new_modifiers = \
+            self._parse_column_type(new_field_type)
+
+        if old_type_name is None or new_type_name is None:
+            return self.COLUMN_TYPE_CHANGE_NEEDS_REWRITE
+
+        if (old_type_name == new_type_name and
+            old_modifiers == new_modifiers):
+            return self.COLUMN_TYPE_CHANGE_METADATA_ONLY
+
+        if (old_type_name in self._STRING_COLUMN_TYPES and
+            new_type_name in self._STRING_COLUMN_TYPES):
+            # text and varchar share a representation, and only differ in
+            # any length limit that's been set.
+            if not new_modifiers:
+                return self.COLUMN_TYPE_CHANGE_METADATA_ONLY
+            elif old_modifiers and new_modifiers[0] >= old_modifiers[0]:
+                return self.COLUMN_TYPE_CHANGE_METADATA_ONLY
+
+        if old_type_name == new_type_name == 'numeric':
+            # Precision can be raised or removed without a rewrite, but
+            # changing the scale alters how every value is stored.
+            if not new_modifiers:
+                return self.COLUMN_TYPE_CHANGE_METADATA_ONLY
+            elif old_modifiers:
+                old_precision, old_scale = (old_modifiers + (0,))[:2]
+                new_precision, new_scale = (new_modifiers + (0,))[:2]
+
+                if (new_scale == old_scale and
+                    new_precision >= old_precision):
+                    return self.COLUMN_TYPE_CHANGE_METADATA_ONLY
+
+        return self.COLUMN_TYPE_CHANGE_NEEDS_REWRITE
+
+    def _qn_deferred_drop_table(self, table_name):
+        """Return a quoted, schema-qualified name for a table set aside.
+
+        Version Added:
+            3.0
+
+        Args:
+            table_name (unicode):
+                The name of the table.
+
+        Returns:
+            unicode:
+            The quoted, schema-qualified table name.
+        """
+        qn = self.connection.ops.quote_name
+
+        return '%s.%s' % (qn(self.deferred_drop_schema), qn(table_name))
+
+    def _get_evolve_lock_key(self):
+        """Return the advisory lock key used for the evolve lock.
+
+        Version Added:
+            3.0
+
+        Returns:
+            int:
+            The lock key, derived from :py:attr:`evolve_lock_name`.
+        """
+        return zlib.crc32(self.evolve_lock_name.encode('utf-8'))
+
     def _are_column_types_compatible(self, old_field, new_field):
         """Return whether two column types are compatible.
 
@@ -348,6 +735,83 @@ class EvolutionOperations(BaseEvolutionOperations):
         return (list(self._iter_field_types(old_field)) ==
                 list(self._iter_field_types(new_field)))
 
+    def _parse_column_type(self, field_type):
+        """Parse a database column type into a name and modifiers.
+
+        Version Added:
+            3.0
+
+        Args:
+            field_type (unicode):
+                The database column type to parse.
+
+        Returns:
+            tuple:
+            A 2-tuple of:
+
+            1. The normalized type name (:py:class:`unicode`), or ``None``
+               if the type couldn't be parsed.
+            2. A tuple of integer type modifiers (:py:class:`tuple`).
+        """
+        m = self._COLUMN_TYPE_RE.match(field_type.strip().lower())
+
+        if not m:
+            return None, ()
+
+        type_name = m.group('name')
+        modifiers = m.group('modifiers')
+
+        if type_name == 'character varying':
+            type_name = 'varchar'
+
+        if modifiers:
+            modifiers = tuple(
+                int(modifier)
+                for modifier in modifiers.split(',')
+            )
+        else:
+            modifiers = ()
+
+        return type_name, modifiers
+
+    def _add_column_type_change_note(self, table_name, column_name,
+                                     old_field_type, new_field_type,
+                                     change_kind=None):
+        """Add a note to sql_notes describing a column type change.
+
+        This is shown along with the output of :command:`evolve --sql`, and
+        is never executed.
+
+        Version Added:
+            3.0
+
+        Args:
+            table_name (unicode):
+                The name of the table owning the column.
+
+            column_name (unicode):
+                The name of the column.
+
+            old_field_type (unicode):
+                The old database column type.
+
+            new_field_type (unicode):
+                The new database column type.
+
+            change_kind (unicode, optional):
+                The kind of change, if already computed. If not provided,
+                it will be computed.
+        """
+        qn = self.connection.ops.quote_name
+
+        if change_kind is None:
+            change_kind = self.get_column_type_change_kind(old_field_type,
+                                                           new_field_type)
+
+        self.sql_notes.append('Column type change (%s): %s.%s %s -> %s' % (
+            change_kind, qn(table_name), qn(column_name), old_field_type,
+            new_field_type))
+
     def _iter_field_types(self, field):
         """Iterate through the types of fields.
 
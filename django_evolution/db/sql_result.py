@@ -10,6 +10,14 @@ except ImportError:
     Statement = None
 
 
+class _UnparameterizedSQL(str):
+    """An Alter Table statement that has no SQL parameters of its own.
+
+    Version Added:
+        3.0
+    """
+
+
 class SQLResult(object):
     """Represents one or more SQL statements.
 
@@ -188,6 +196,11 @@ class AlterTableSQLResult(SQLResult):
 
         It will also split the Alter Table operations into batches,
         separated by operations setting independent=True.
+
+        Version Changed:
+            3.0:
+            Any ``%`` characters in operations without SQL parameters are
+            now escaped if other operations in the batch have parameters.
         """
         qn = self.evolver.connection.ops.quote_name
         new_alter_table_items = []
@@ -259,10 +272,18 @@ class AlterTableSQLResult(SQLResult):
                         if param
                     ])
 
-            alter_table_statements.append(' '.join(alter_table_attrs))
+            alter_table_statement = ' '.join(alter_table_attrs)
 
-            if 'sql_params' in item:
+            if item.get('sql_params'):
                 alter_table_sql_params.extend(item['sql_params'])
+            else:
+                # If other statements in this batch have parameters, any
+                # "%" characters here will need to be escaped. We'll know
+                # once the batch is complete.
+                alter_table_statement = _UnparameterizedSQL(
+                    alter_table_statement)
+
+            alter_table_statements.append(alter_table_statement)
 
             if independent:
                 # Now that we've processed this independent statement,
@@ -272,6 +293,14 @@ class AlterTableSQLResult(SQLResult):
                 alter_table_batches.append((alter_table_statements,
                                             alter_table_sql_params))
 
+        for statements, sql_params in alter_table_batches:
+            statements[:] = [
+                str(statement).replace('%', '%%')
+                if sql_params and isinstance(statement, _UnparameterizedSQL)
+                else str(statement)
+                for statement in statements
+            ]
+
         # Filter out any batches that we are empty, and return the result.
         return [
             alter_table_batch
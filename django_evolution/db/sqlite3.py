@@ -4,6 +4,12 @@ from __future__ import annotations
 
 from collections import OrderedDict
 
+try:
+    import fcntl
+except ImportError:
+    # This isn't available on Windows.
+    fcntl = None
+
 import django
 from django.db import models
 from django.db.backends.sqlite3.base import Database
@@ -371,6 +377,143 @@ class EvolutionOperations(BaseEvolutionOperations):
     _can_rename_cols = (Database.sqlite_version_info >=
                         _can_rename_cols_min_version)
 
+    _evolve_lock_file = None
+
+    #: The journal mode to use during a bulk install.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     unicode
+    bulk_install_journal_mode = 'MEMORY'
+
+    #: The synchronous setting to use during a bulk install.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     unicode
+    bulk_install_synchronous = 'OFF'
+
+    _bulk_install_pragmas = None
+
+    def acquire_evolve_lock(self):
+        """Acquire a lock preventing other processes from evolving.
+
+        This takes an exclusive lock on a :file:`{dbname}.evolve-lock` file
+        alongside the database file. A file lock is used instead of
+        ``BEGIN IMMEDIATE``, since the evolution process must be able to
+        manage its own transactions while the lock is held.
+
+        In-memory databases can't be shared between processes, so no lock
+        will be taken for them. Locking also isn't available on platforms
+        without :py:mod:`fcntl`.
+
+        Version Added:
+            3.0
+        """
+        lock_path = self._get_evolve_lock_path()
+
+        if lock_path is not None:
+            lock_file = open(lock_path, 'a')
+
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            except Exception:
+                lock_file.close()
+                raise
+
+            self._evolve_lock_file = lock_file
+
+    def release_evolve_lock(self):
+        """Release a lock acquired by :py:meth:`acquire_evolve_lock`.
+
+        Version Added:
+            3.0
+        """
+        lock_file = self._evolve_lock_file
+
+        if lock_file is not None:
+            self._evolve_lock_file = None
+
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            finally:
+                lock_file.close()
+
+    def begin_bulk_install(self):
+        """Prepare the database for installing a large number of models.
+
+        This will set the ``journal_mode`` and ``synchronous`` pragmas to
+        :py:attr:`bulk_install_journal_mode` and
+        :py:attr:`bulk_install_synchronous`, trading durability for speed.
+        If the install is interrupted, the database will need to be created
+        again.
+
+        Pragmas can't be changed inside a transaction, so nothing will be
+        changed if one is active.
+
+        Version Added:
+            3.0
+        """
+        connection = self.connection
+
+        if connection.in_atomic_block:
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            journal_mode = cursor.fetchone()[0]
+
+            cursor.execute('PRAGMA synchronous')
+            synchronous = cursor.fetchone()[0]
+
+            cursor.execute('PRAGMA journal_mode = %s'
+                           % self.bulk_install_journal_mode)
+            cursor.execute('PRAGMA synchronous = %s'
+                           % self.bulk_install_synchronous)
+
+        self._bulk_install_pragmas = (journal_mode, synchronous)
+
+    def end_bulk_install(self):
+        """Restore the database after a bulk install.
+
+        This will restore the ``journal_mode`` and ``synchronous`` pragmas
+        changed by :py:meth:`begin_bulk_install`.
+
+        Version Added:
+            3.0
+        """
+        pragmas = self._bulk_install_pragmas
+
+        if pragmas is not None:
+            self._bulk_install_pragmas = None
+            journal_mode, synchronous = pragmas
+
+            with self.connection.cursor() as cursor:
+                cursor.execute('PRAGMA journal_mode = %s' % journal_mode)
+                cursor.execute('PRAGMA synchronous = %d' % synchronous)
+
+    def get_schema_fingerprint(self):
+        """Return a fingerprint of the database's tables and indexes.
+
+        This is the database's ``schema_version``, which SQLite increments
+        on every schema change.
+
+        Version Added:
+            3.0
+
+        Returns:
+            unicode:
+            The fingerprint.
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute('PRAGMA schema_version')
+
+            return 'sqlite:%s' % cursor.fetchone()[0]
+
     def get_deferrable_sql(self):
         """Return the SQL for marking a reference as deferrable.
 
@@ -955,6 +1098,29 @@ class EvolutionOperations(BaseEvolutionOperations):
 
         return False
 
+    def _get_evolve_lock_path(self):
+        """Return the path to the file used for the evolve lock.
+
+        Version Added:
+            3.0
+
+        Returns:
+            unicode:
+            The path to the lock file, or ``None`` if the database can't be
+            locked.
+        """
+        db_name = self.connection.settings_dict.get('NAME')
+
+        if fcntl is None or not db_name:
+            return None
+
+        db_name = str(db_name)
+
+        if db_name == ':memory:' or 'mode=memory' in db_name:
+            return None
+
+        return '%s.evolve-lock' % db_name
+
     def _change_attribute(self, model, field, attr_name, new_attr_value,
                           initial=None):
         """Change an attribute on a column.
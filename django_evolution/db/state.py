@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 
 from django.db import connections
 
 from django_evolution.compat.db import convert_table_name
+from django_evolution.conf import django_evolution_settings
 from django_evolution.db import EvolutionOperationsMulti
 from django_evolution.errors import DatabaseStateError
 
@@ -74,8 +78,26 @@ class DatabaseState(object):
 
     This primarily tracks indexes associated with tables, allowing them to be
     scanned from the database, explicitly added, removed, or cleared.
+
+    Version Changed:
+        3.0:
+        Indexes are now also tracked by their columns, allowing
+        :py:meth:`find_index` to look them up without scanning every index
+        on the table.
     """
 
+    #: The version of the format used by :py:meth:`serialize`.
+    #:
+    #: This must be increased if the format changes, or if scanning the
+    #: database would produce different results for the same schema.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     int
+    SERIALIZED_VERSION = 1
+
     def __init__(self, db_name, scan=True):
         """Initialize the state.
 
@@ -91,12 +113,64 @@ class DatabaseState(object):
 
         self.db_name = db_name
         self._tables = {}
+
+        # A mapping of table names to indexes on the table, keyed by a tuple
+        # of the index's columns and unique flag. This is kept in sync with
+        # the indexes in _tables, and is used by find_index().
+        self._indexes_by_columns = {}
         self._norm_table_name = \
             lambda name: convert_table_name(connection, name)
 
         if scan:
             self.rescan_tables()
 
+    @classmethod
+    def deserialize(cls, db_name, state_dict):
+        """Deserialize a serialized database state.
+
+        Version Added:
+            3.0
+
+        Args:
+            db_name (unicode):
+                The name of the database.
+
+            state_dict (dict):
+                The serialized state, from :py:meth:`serialize`.
+
+        Returns:
+            DatabaseState:
+            The resulting database state.
+
+        Raises:
+            django_evolution.errors.DatabaseStateError:
+                The serialized state is not in a supported format.
+        """
+        if state_dict.get('version') != cls.SERIALIZED_VERSION:
+            raise DatabaseStateError(
+                'Unsupported serialized database state version %r.'
+                % state_dict.get('version'))
+
+        database_state = cls(db_name=db_name, scan=False)
+        tables = database_state._tables
+
+        for table_name, indexes in state_dict['tables'].items():
+            tables[table_name] = {
+                'indexes': {},
+                'unique_indexes': {},
+            }
+
+            for index_name, columns, unique in indexes:
+                database_state._get_indexes_dict(
+                    table_name=table_name,
+                    unique=unique)[index_name] = IndexState(name=index_name,
+                                                            columns=columns,
+                                                            unique=unique)
+
+            database_state._rebuild_indexes_by_columns(table_name)
+
+        return database_state
+
     def clone(self):
         """Clone the database state.
 
@@ -107,6 +181,9 @@ class DatabaseState(object):
         cloned_sig = DatabaseState(db_name=self.db_name, scan=False)
         cloned_sig._tables = deepcopy(self._tables)
 
+        for table_name in cloned_sig._tables.keys():
+            cloned_sig._rebuild_indexes_by_columns(table_name)
+
         return cloned_sig
 
     def add_table(self, table_name):
@@ -118,10 +195,13 @@ class DatabaseState(object):
             table_name (unicode):
                 The name of the table.
         """
-        self._tables[self._norm_table_name(table_name)] = {
+        table_name = self._norm_table_name(table_name)
+
+        self._tables[table_name] = {
             'indexes': {},
             'unique_indexes': {},
         }
+        self._indexes_by_columns[table_name] = {}
 
     def has_table(self, table_name):
         """Return whether a table is being tracked.
@@ -207,9 +287,13 @@ class DatabaseState(object):
                 'exists.'
                 % (index_name, table_name))
 
-        indexes[index_name] = IndexState(name=index_name,
-                                         columns=columns,
-                                         unique=unique)
+        index_state = IndexState(name=index_name,
+                                 columns=columns,
+                                 unique=unique)
+        indexes[index_name] = index_state
+
+        self._indexes_by_columns[table_name].setdefault(
+            (tuple(columns), unique), {})[index_name] = index_state
 
     def remove_index(self, table_name, index_name, unique=False):
         """Remove an index from the database state.
@@ -258,6 +342,14 @@ class DatabaseState(object):
 
         del indexes[index_name]
 
+        indexes_by_columns = self._indexes_by_columns[table_name]
+        key = (tuple(existing_index.columns), unique)
+        column_indexes = indexes_by_columns[key]
+        del column_indexes[index_name]
+
+        if not column_indexes:
+            del indexes_by_columns[key]
+
     def get_index(self, table_name, index_name, unique=False):
         """Return the index state for a given name.
 
@@ -290,6 +382,14 @@ class DatabaseState(object):
     def find_index(self, table_name, columns, unique=False):
         """Find and return an index matching the given columns and flags.
 
+        If there are multiple matching indexes, the first one added will be
+        returned.
+
+        Version Changed:
+            3.0:
+            This now looks up the index by its columns, rather than scanning
+            all indexes on the table.
+
         Args:
             table_name (unicode):
                 The name of the table.
@@ -307,12 +407,13 @@ class DatabaseState(object):
         """
         table_name = self._norm_table_name(table_name)
 
-        for index_state in self.iter_indexes(table_name):
-            if (index_state.columns == columns and
-                index_state.unique == unique):
-                return index_state
+        try:
+            indexes = \
+                self._indexes_by_columns[table_name][(tuple(columns), unique)]
+        except KeyError:
+            return None
 
-        return None
+        return next(iter(indexes.values()))
 
     def clear_indexes(self, table_name):
         """Clear all recorded indexes for a table.
@@ -331,6 +432,9 @@ class DatabaseState(object):
             except KeyError:
                 pass
 
+        if table_name in self._indexes_by_columns:
+            self._indexes_by_columns[table_name] = {}
+
     def iter_indexes(self, table_name):
         """Iterate through all indexes for a table.
 
@@ -353,18 +457,144 @@ class DatabaseState(object):
 
             yield from indexes.values()
 
-    def rescan_tables(self):
+    def serialize(self):
+        """Serialize the database state.
+
+        The result can be stored as JSON, and loaded again through
+        :py:meth:`deserialize`.
+
+        Version Added:
+            3.0
+
+        Returns:
+            dict:
+            The serialized state.
+        """
+        return {
+            'tables': {
+                table_name: [
+                    [index_state.name, list(index_state.columns),
+                     index_state.unique]
+                    for key in ('indexes', 'unique_indexes')
+                    for index_state in table_info[key].values()
+                ]
+                for table_name, table_info in self._tables.items()
+            },
+            'version': self.SERIALIZED_VERSION,
+        }
+
+    def get_digest(self):
+        """Return a digest of the tracked tables and indexes.
+
+        Two database states with the same digest track the same tables,
+        with the same indexes.
+
+        Version Added:
+            3.0
+
+        Returns:
+            str:
+            The digest of the state.
+        """
+        data = sorted(
+            (
+                table_name,
+                sorted(
+                    (index_state.name, list(index_state.columns),
+                     index_state.unique)
+                    for key in ('indexes', 'unique_indexes')
+                    for index_state in table_info[key].values()
+                ),
+            )
+            for table_name, table_info in self._tables.items()
+        )
+
+        return hashlib.sha256(
+            json.dumps(data).encode('utf-8')).hexdigest()
+
+    def get_changes(self, old_state):
+        """Return the table changes made since an older database state.
+
+        The result can be applied to another database state matching
+        ``old_state`` through :py:meth:`apply_changes`.
+
+        Version Added:
+            3.0
+
+        Args:
+            old_state (DatabaseState):
+                The older database state to compare against.
+
+        Returns:
+            dict:
+            A mapping of normalized table names to table information. Tables
+            that were removed will map to ``None``.
+        """
+        tables = self._tables
+        old_tables = old_state._tables
+
+        changes = {
+            table_name: deepcopy(table_info)
+            for table_name, table_info in tables.items()
+            if old_tables.get(table_name) != table_info
+        }
+        changes.update(
+            (table_name, None)
+            for table_name in old_tables.keys() - tables.keys()
+        )
+
+        return changes
+
+    def apply_changes(self, changes):
+        """Apply table changes computed by :py:meth:`get_changes`.
+
+        Version Added:
+            3.0
+
+        Args:
+            changes (dict):
+                The table changes to apply.
+        """
+        tables = self._tables
+
+        for table_name, table_info in changes.items():
+            if table_info is None:
+                tables.pop(table_name, None)
+            else:
+                tables[table_name] = deepcopy(table_info)
+
+            self._rebuild_indexes_by_columns(table_name)
+
+    def rescan_tables(self, jobs=None):
         """Rescan the list of tables from the database.
 
         This will look up all tables found in the database, along with
         information (such as indexes) on those tables.
 
         Existing information on the tables will be flushed.
+
+        Version Changed:
+            3.0:
+            Added the ``jobs`` argument.
+
+        Args:
+            jobs (int, optional):
+                The maximum number of database connections to use for
+                looking up the constraints on tables. If not provided,
+                ``settings.DJANGO_EVOLUTION['DATABASE_STATE_SCAN_JOBS']``
+                will be used. This only applies to database backends that
+                support concurrent introspection, and only outside of a
+                transaction.
         """
-        evolver = EvolutionOperationsMulti(self.db_name).get_evolver()
+        if jobs is None:
+            jobs = django_evolution_settings.DATABASE_STATE_SCAN_JOBS
+
+        evolver = EvolutionOperationsMulti(self.db_name,
+                                           database_state=self).get_evolver()
         connection = evolver.connection
         introspection = connection.introspection
         cursor = connection.cursor()
+        table_names = []
 
         for table_name in introspection.get_table_list(cursor):
             # NOTE: The table names are already normalized, so there's no
@@ -375,12 +605,31 @@ class DatabaseState(object):
                 # anything but 'name'.
                 table_name = table_name.name
 
+            table_names.append(table_name)
+
+        # Other connections can't see any uncommitted changes to the schema
+        # made in a transaction, so tables can only be introspected
+        # concurrently outside of one.
+        if (jobs > 1 and
+            len(table_names) > 1 and
+            evolver.supports_concurrent_introspection and
+            not connection.in_atomic_block):
+            all_constraints = self._get_constraints_concurrently(
+                table_names=table_names,
+                jobs=jobs)
+        else:
+            all_constraints = {
+                table_name: evolver.get_constraints_for_table(table_name)
+                for table_name in table_names
+            }
+
+        for table_name in table_names:
             if self.has_table(table_name):
                 self.clear_indexes(table_name)
             else:
                 self.add_table(table_name)
 
-            constraints = evolver.get_constraints_for_table(table_name)
+            constraints = all_constraints[table_name]
 
             for constraint_name, constraint_info in constraints.items():
                 if not (constraint_info['index'] or
@@ -398,6 +647,93 @@ class DatabaseState(object):
                                columns=constraint_info['columns'],
                                unique=constraint_info['unique'])
 
+    def _get_constraints_concurrently(self, table_names, jobs):
+        """Return the constraints for tables, using several connections.
+
+        The tables are split across up to ``jobs`` worker threads. Database
+        connections are per-thread, so each worker introspects its share of
+        the tables over its own connection, which is closed when done.
+
+        Version Added:
+            3.0
+
+        Args:
+            table_names (list of unicode):
+                The normalized names of the tables to introspect.
+
+            jobs (int):
+                The maximum number of connections to use.
+
+        Returns:
+            dict:
+            A mapping of table names to the constraints returned by
+            :py:meth:`BaseEvolutionOperations.get_constraints_for_table()
+            <django_evolution.db.common.BaseEvolutionOperations.
+            get_constraints_for_table>`.
+
+        Raises:
+            Exception:
+                A table could not be introspected. This will be the first
+                error encountered.
+        """
+        db_name = self.db_name
+        jobs = min(jobs, len(table_names))
+
+        def _get_constraints(worker_table_names):
+            try:
+                evolver = EvolutionOperationsMulti(
+                    db_name,
+                    database_state=self).get_evolver()
+
+                return [
+                    (table_name,
+                     evolver.get_constraints_for_table(table_name))
+                    for table_name in worker_table_names
+                ]
+            finally:
+                connections[db_name].close()
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = executor.map(_get_constraints, [
+                table_names[i::jobs]
+                for i in range(jobs)
+            ])
+
+            return {
+                table_name: constraints
+                for worker_results in results
+                for table_name, constraints in worker_results
+            }
+
+    def _rebuild_indexes_by_columns(self, table_name):
+        """Rebuild the lookup of indexes by columns for a table.
+
+        This must be called after replacing a table's information in
+        :py:attr:`_tables`.
+
+        Version Added:
+            3.0
+
+        Args:
+            table_name (unicode):
+                The normalized name of the table.
+        """
+        table_info = self._tables.get(table_name)
+
+        if table_info is None:
+            self._indexes_by_columns.pop(table_name, None)
+            return
+
+        indexes_by_columns = {}
+
+        for key in ('indexes', 'unique_indexes'):
+            for index_state in table_info[key].values():
+                indexes_by_columns.setdefault(
+                    (tuple(index_state.columns), index_state.unique),
+                    {})[index_state.name] = index_state
+
+        self._indexes_by_columns[table_name] = indexes_by_columns
+
     def _get_indexes_dict(self, table_name, unique):
         """Return the indexes dictionary for the given criteria.
 
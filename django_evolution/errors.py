@@ -103,6 +103,14 @@ class InvalidSignatureVersion(EvolutionException):
             '%s is not a known signature version' % version)
 
 
+class InvalidSchemaBundleError(EvolutionException):
+    """A schema bundle was invalid or could not be installed.
+
+    Version Added:
+        3.0
+    """
+
+
 class BaseMigrationError(EvolutionException):
     """Base class for migration errors."""
 
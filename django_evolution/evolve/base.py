@@ -38,6 +38,15 @@ class BaseEvolutionTask(object):
             A list of SQL statements to perform for the task. Each entry can
             be a string or tuple accepted by
             :py:meth:`~django_evolution.utils.sql.SQLExecutor.run_sql`.
+
+        sql_notes (list of unicode):
+            Notes from the database backend on how :py:attr:`sql` will be
+            applied. These are for display only, and are never executed.
+
+            This is set after calling :py:meth:`prepare`.
+
+            Version Added:
+                3.0
     """
 
     @classmethod
@@ -114,6 +123,7 @@ class BaseEvolutionTask(object):
         self.evolution_required = False
         self.new_evolutions = []
         self.sql = []
+        self.sql_notes = []
 
     def is_mutation_mutable(self, mutation, **kwargs):
         """Return whether a mutation is mutable.
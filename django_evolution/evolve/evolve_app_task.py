@@ -9,13 +9,21 @@ from __future__ import annotations
 
 import itertools
 import logging
+import re
+import threading
+import weakref
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 
+from django.db import connections
 from django.utils.translation import gettext as _
 
 from django_evolution.compat.db import (db_get_installable_models_for_app,
                                         sql_create_models)
+from django_evolution.conf import django_evolution_settings
 from django_evolution.consts import UpgradeMethod
+from django_evolution.db import EvolutionOperationsMulti
 from django_evolution.errors import EvolutionExecutionError
 from django_evolution.evolve.base import BaseEvolutionTask
 from django_evolution.models import Evolution
@@ -31,7 +39,6 @@ from django_evolution.utils.datastructures import (filter_dup_list_items,
                                                    merge_dicts)
 from django_evolution.utils.evolutions import (get_app_pending_mutations,
                                                get_app_upgrade_info,
-                                               get_applied_evolutions,
                                                get_evolution_sequence,
                                                get_unapplied_evolutions)
 from django_evolution.utils.graph import EvolutionGraph
@@ -48,11 +55,15 @@ from django_evolution.utils.migrations import (
     is_migration_initial,
     record_applied_migrations,
     register_global_custom_migrations)
+from django_evolution.utils.sql import SQLExecutor, join_sql_statements
 
 
 logger = logging.getLogger(__name__)
 
 
+_create_index_re = re.compile(r'^CREATE\s+(UNIQUE\s+)?INDEX\b', re.I)
+
+
 class EvolveAppTask(BaseEvolutionTask):
     """A task for evolving models in an application.
 
@@ -67,6 +78,51 @@ class EvolveAppTask(BaseEvolutionTask):
             The app label for the app to evolve.
     """
 
+    #: Compiled mutation plans, cached for reuse across databases.
+    #:
+    #: Each key identifies the starting project signature and database
+    #: state, the app, the evolutions and mutations being applied, and the
+    #: database backend. Each value contains the generated SQL, along with
+    #: the changes made to the signature and database state. Other evolvers
+    #: for databases with identical stored state and pending evolutions
+    #: (such as per-tenant databases) can then skip simulation and SQL
+    #: generation.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     collections.OrderedDict
+    _compiled_plans = OrderedDict()
+
+    #: The maximum number of compiled mutation plans to cache.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     int
+    _compiled_plans_max_size = 256
+
+    #: A lock guarding access to :py:attr:`_compiled_plans`.
+    #:
+    #: Version Added:
+    #:     3.0
+    #:
+    #: Type:
+    #:     threading.Lock
+    _compiled_plans_lock = threading.Lock()
+
+    @classmethod
+    def clear_caches(cls):
+        """Clear all cached compiled mutation plans.
+
+        Version Added:
+            3.0
+        """
+        with cls._compiled_plans_lock:
+            cls._compiled_plans.clear()
+
     @classmethod
     def prepare_tasks(cls, evolver, tasks, hinted=False, **kwargs):
         """Prepare a list of tasks.
@@ -97,8 +153,8 @@ class EvolveAppTask(BaseEvolutionTask):
                 A subclass containing additional details will be raised.
         """
         # Register any custom migrations that we want globally available.
-        # This is of course not thread-safe, but nobody should be doing
-        # concurrent migrations, or they're in for a pretty bad time.
+        # This registration is local to the thread, so evolvers for different
+        # databases can be prepared concurrently.
         if supports_migrations:
             custom_migrations = MigrationList()
 
@@ -108,56 +164,60 @@ class EvolveAppTask(BaseEvolutionTask):
 
             register_global_custom_migrations(custom_migrations)
 
-        # We're going to let Django determine a plan for all migrations, and
-        # we'll determine a plan for evolutions. These will be combined into a
-        # dependency graph, which will produce the order in which we'll need
-        # to apply migrations and evolutions.
-        #
-        # First, run through the tasks, preparing state that we'll use to
-        # build the migrations and evolutions graph and resulting batches.
-        super(EvolveAppTask, cls).prepare_tasks(
-            evolver=evolver,
-            tasks=tasks,
-            hinted=hinted,
-            **kwargs)
-
-        # Now we can generate the remaining state needed to determine the
-        # order in which migrations and evolutions need to be applied. We'll
-        # compute the migration plans, build a graph from it, and then
-        # convert that into batches for execution.
-        migration_executor = cls._build_migration_executor(
-            evolver=evolver,
-            tasks=tasks)
-        migrations_info = cls._build_migrations_info(
-            evolver=evolver,
-            migration_executor=migration_executor,
-            tasks=tasks)
-        graph = cls._build_evolutions_graph(
-            evolver=evolver,
-            migration_executor=migration_executor,
-            migrations_info=migrations_info,
-            tasks=tasks)
-        batches = cls._build_batches(
-            evolver=evolver,
-            graph=graph,
-            hinted=hinted)
-
-        # Set some state that execute_tasks() and unit tests can get to.
-        evolver._evolve_app_task_state = {
-            # These are used for the execution stage.
-            'batches': batches,
-            'full_migration_plan': migrations_info.get('full_plan'),
-            'migration_executor': migration_executor,
-            'pre_migrate_state': migrations_info.get('pre_migrate_state'),
-
-            # These are just stored for the benefit of unit tests.
-            'post_migration_plan': migrations_info.get('post_plan'),
-            'post_migration_targets': migrations_info.get('post_targets'),
-            'pre_migration_plan': migrations_info.get('pre_plan'),
-            'pre_migration_targets': migrations_info.get('pre_targets'),
-        }
-
-        clear_global_custom_migrations()
+        try:
+            # We're going to let Django determine a plan for all migrations,
+            # and we'll determine a plan for evolutions. These will be
+            # combined into a dependency graph, which will produce the order
+            # in which we'll need to apply migrations and evolutions.
+            #
+            # First, run through the tasks, preparing state that we'll use to
+            # build the migrations and evolutions graph and resulting batches.
+            super(EvolveAppTask, cls).prepare_tasks(
+                evolver=evolver,
+                tasks=tasks,
+                hinted=hinted,
+                **kwargs)
+
+            # Now we can generate the remaining state needed to determine
+            # the order in which migrations and evolutions need to be
+            # applied. We'll compute the migration plans, build a graph from
+            # it, and then convert that into batches for execution.
+            migration_executor = cls._build_migration_executor(
+                evolver=evolver,
+                tasks=tasks)
+            migrations_info = cls._build_migrations_info(
+                evolver=evolver,
+                migration_executor=migration_executor,
+                tasks=tasks)
+            graph = cls._build_evolutions_graph(
+                evolver=evolver,
+                migration_executor=migration_executor,
+                migrations_info=migrations_info,
+                tasks=tasks)
+            batches = cls._build_batches(
+                evolver=evolver,
+                graph=graph,
+                hinted=hinted,
+                checkpoint=cls._can_checkpoint_batches(tasks))
+
+            # Set some state that execute_tasks() and unit tests can get to.
+            evolver._evolve_app_task_state = {
+                # These are used for the execution stage.
+                'batches': batches,
+                'full_migration_plan': migrations_info.get('full_plan'),
+                'migration_executor': migration_executor,
+                'pre_migrate_state': migrations_info.get('pre_migrate_state'),
+
+                # These are just stored for the benefit of unit tests.
+                'post_migration_plan': migrations_info.get('post_plan'),
+                'post_migration_targets': migrations_info.get('post_targets'),
+                'pre_migration_plan': migrations_info.get('pre_plan'),
+                'pre_migration_targets': migrations_info.get('pre_targets'),
+            }
+        finally:
+            # This must always be cleared, or the next evolver prepared
+            # in this thread won't be able to register its migrations.
+            clear_global_custom_migrations()
 
     @classmethod
     def execute_tasks(cls, evolver, tasks, **kwargs):
@@ -167,6 +227,14 @@ class EvolveAppTask(BaseEvolutionTask):
         provided tasks. It can augment this by executing any steps before or
         after the tasks.
 
+        After each batch of evolutions is committed, the project signature
+        and applied evolutions up to that point are saved, so that a failure
+        in a later batch doesn't leave committed changes unrecorded.
+
+        Version Changed:
+            3.0:
+            Progress is now saved after each batch of evolutions.
+
         Args:
             evolver (Evolver):
                 The evolver that's handling the tasks.
@@ -205,6 +273,7 @@ class EvolveAppTask(BaseEvolutionTask):
             if applied_migrations:
                 record_applied_migrations(connection=evolver.connection,
                                           migrations=applied_migrations)
+                evolver.mark_migrations_applied(applied_migrations)
 
             # Let any listeners know that we're beginning the process.
             #
@@ -223,6 +292,7 @@ class EvolveAppTask(BaseEvolutionTask):
                 migrate_state = migrate_state.clone()
 
         deferred_sql = []
+        checkpoint_evolutions = []
 
         for batch_info in batches:
             batch_type = batch_info['type']
@@ -251,6 +321,29 @@ class EvolveAppTask(BaseEvolutionTask):
                             task.execute(sql_executor=sql_executor,
                                          sql=task_sql,
                                          **kwargs)
+
+                # The batch has been committed. Save our progress, so that
+                # if a later batch fails, a new evolution run will pick up
+                # from here, rather than re-applying this batch.
+                for task, task_info in task_evolutions.items():
+                    labels = set(task_info.get('evolutions', []))
+                    checkpoint_evolutions += [
+                        evolution
+                        for evolution in task.new_evolutions
+                        if evolution.label in labels
+                    ]
+
+                checkpoint_project_sig = \
+                    batch_info.get('checkpoint_project_sig')
+
+                # Deferred SQL for new models may reference tables created
+                # in later batches. Until it's applied, the new models are
+                # incomplete, so we can't save progress.
+                if checkpoint_project_sig is not None and not deferred_sql:
+                    evolver._save_project_sig(
+                        new_evolutions=checkpoint_evolutions,
+                        project_sig=checkpoint_project_sig)
+                    checkpoint_evolutions = []
             elif batch_type == UpgradeMethod.MIGRATIONS:
                 assert migrating
 
@@ -271,8 +364,9 @@ class EvolveAppTask(BaseEvolutionTask):
             finalize_migrations(migrate_state)
 
             # Write the new lists of applied migrations out to the signature.
-            applied_migrations = \
-                MigrationList.from_database(evolver.connection)
+            # The evolver has been tracking these as they were applied, so
+            # there's no need to query the database again.
+            applied_migrations = evolver.get_applied_migrations()
             project_sig = evolver.project_sig
 
             for app_label in applied_migrations.get_app_labels():
@@ -338,7 +432,8 @@ class EvolveAppTask(BaseEvolutionTask):
 
         migration_executor = MigrationExecutor(
             connection=evolver.connection,
-            signal_sender=evolver)
+            signal_sender=evolver,
+            database_applied_migrations=evolver.get_applied_migrations())
         migration_executor.run_checks()
 
         return migration_executor
@@ -442,7 +537,7 @@ class EvolveAppTask(BaseEvolutionTask):
         assert not extra_applied_migrations
 
         migrations_to_mark_applied = MigrationList()
-        applied_migrations = MigrationList.from_database(evolver.connection)
+        applied_migrations = evolver.get_applied_migrations()
         migration_app_labels = set()
 
         if applied_migrations:
@@ -473,8 +568,9 @@ class EvolveAppTask(BaseEvolutionTask):
                 # Rebuild the migration graph, based on anything we've
                 # added to extra_applied_migrations above (which is a local
                 # reference to the variable on MigrationLoader), and re-run
-                # checks.
-                migration_loader.build_graph()
+                # checks. Only the applied state has changed, so there's no
+                # need to load the migrations from disk again.
+                migration_loader.build_graph(reload_migrations=False)
                 migration_executor.run_checks()
 
             # Build the lists of migration targets we'll be applying. Each
@@ -692,12 +788,24 @@ class EvolveAppTask(BaseEvolutionTask):
         if migrations_to_mark_applied:
             graph.mark_migrations_applied(migrations_to_mark_applied)
 
-        for task in tasks:
-            applied_evolutions = get_applied_evolutions(task.app,
-                                                        database=database_name)
-
-            if applied_evolutions:
-                graph.mark_evolutions_applied(task.app, applied_evolutions)
+        # The same goes for evolutions. The applied evolutions for all apps
+        # are fetched in one query and marked in one pass over the pending
+        # dependencies, rather than once per app, so that this stays linear
+        # for large projects.
+        applied_evolutions = {}
+
+        for app_label, evolution_label in (Evolution.objects
+                                           .using(database_name)
+                                           .values_list('app_label',
+                                                        'label')):
+            applied_evolutions.setdefault(app_label, []).append(
+                evolution_label)
+
+        graph.mark_apps_evolutions_applied([
+            (task.app, applied_evolutions[task.app_label])
+            for task in tasks
+            if task.app_label in applied_evolutions
+        ])
 
         # The graph is built! Finalize it (which will check that all
         # dependencies are valid) so we can begin converting it into batches
@@ -707,7 +815,33 @@ class EvolveAppTask(BaseEvolutionTask):
         return graph
 
     @classmethod
-    def _build_batches(cls, evolver, graph, hinted):
+    def _can_checkpoint_batches(cls, tasks):
+        """Return whether progress can be saved after each batch.
+
+        Checkpoints store a partial project signature. The signature for an
+        app being added for the first time is built up-front from the target
+        signature, and can't accurately be split across batches. If any app
+        is being added, progress will only be saved once all batches have
+        been executed.
+
+        Version Added:
+            3.0
+
+        Args:
+            tasks (list of EvolveAppTask):
+                The list of tasks that were prepared.
+
+        Returns:
+            bool:
+            ``True`` if checkpoints can be saved after each batch.
+        """
+        return not any(
+            task.app_sig_is_new and task.evolution_required
+            for task in tasks
+        )
+
+    @classmethod
+    def _build_batches(cls, evolver, graph, hinted, checkpoint=False):
         """Return batches of evolution/migration operations to execute.
 
         This takes the order of migrations, evolutions, and model creations
@@ -717,8 +851,23 @@ class EvolveAppTask(BaseEvolutionTask):
         Each resulting batch will represent either a migration or an
         evolution.
 
+        Version Changed:
+            3.0:
+            * If ``settings.DJANGO_EVOLUTION['COALESCE_EVOLUTIONS']`` is
+              enabled, evolutions are moved into the earliest batch of
+              evolutions allowed by their dependencies, so that more of an
+              app's mutations can be optimized together.
+            * Added the ``checkpoint`` argument.
+
         If a batch represents an evolution, it will contain the following keys:
 
+        ``checkpoint_project_sig`` (:py:class:`~django_evolution.signature.ProjectSignature`, optional):
+            The project signature reflecting the database once this batch
+            and all batches before it have been applied.
+
+            This will only be present if ``checkpoint`` is set and this isn't
+            the last batch.
+
         ``new_models_sql`` (list, optional):
             The complete, optimized list of SQL statements to execute to
             create models for this batch.
@@ -769,6 +918,10 @@ class EvolveAppTask(BaseEvolutionTask):
             hinted (bool):
                 Whether a hinted evolution was requested.
 
+            checkpoint (bool, optional):
+                Whether to store project signatures for saving progress
+                after each batch.
+
         Returns:
             list of dict:
             The list of batches.
@@ -780,11 +933,19 @@ class EvolveAppTask(BaseEvolutionTask):
         # Any adjancent model creations/evolutions will be converted into a
         # single EVOLUTIONS batch, anad adjacent migrations will be
         # converted into a single MIGRATIONS batch.
+        #
+        # If enabled, evolutions are coalesced into the earliest batch their
+        # dependencies allow, across all apps. This keeps as many of an app's
+        # pending mutations as possible in one batch, where they can be
+        # optimized together below. They're never moved ahead of migrations
+        # for apps their models are related to.
         batches = []
         prev_batch_type = None
         prev_batch_info = None
+        coalesce_evolutions = django_evolution_settings.COALESCE_EVOLUTIONS
 
-        for node_batch_type, batch_nodes in graph.iter_batches():
+        for node_batch_type, batch_nodes in \
+                graph.iter_batches(coalesce_evolutions=coalesce_evolutions):
             batch_info = {}
             batch_type = None
 
@@ -876,6 +1037,8 @@ class EvolveAppTask(BaseEvolutionTask):
         else:
             hinted_evolution = None
 
+        last_batch_info = batches[-1] if batches else None
+
         for batch_info in batches:
             if batch_info['type'] == UpgradeMethod.EVOLUTIONS:
                 new_models = batch_info.pop('new_models', None)
@@ -934,11 +1097,13 @@ class EvolveAppTask(BaseEvolutionTask):
                             mutations_map[_label]
                             for _label in batch_task_info['evolutions']
                         ))
+                        evolution_labels = batch_task_info['evolutions']
                     elif hinted:
                         # This is a hinted mutation, so grab the mutations
                         # hinted for this task's app.
                         pending_mutations = \
                             hinted_evolution.get(batch_task.app_label)
+                        evolution_labels = None
                     else:
                         # This is our standard case: An actual evolution from
                         # written evolution files. Generate the set of
@@ -950,6 +1115,7 @@ class EvolveAppTask(BaseEvolutionTask):
                             old_project_sig=evolver.project_sig,
                             project_sig=evolver.target_project_sig,
                             database=database_name)
+                        evolution_labels = batch_task_info['evolutions']
 
                     if pending_mutations:
                         # We have pending mutations for this task. Generate
@@ -958,7 +1124,8 @@ class EvolveAppTask(BaseEvolutionTask):
                         #
                         # This will modify the signature in the Evolver.
                         mutations_info = batch_task.generate_mutations_info(
-                            pending_mutations)
+                            pending_mutations,
+                            evolution_labels=evolution_labels)
 
                         if mutations_info:
                             batch_task_info.update({
@@ -966,12 +1133,24 @@ class EvolveAppTask(BaseEvolutionTask):
                                 'sql': mutations_info['sql'],
                             })
 
+                if checkpoint and batch_info is not last_batch_info:
+                    # The signature now reflects the mutations for this and
+                    # all prior batches. Store a copy of it, so progress can
+                    # be saved once this batch is applied.
+                    batch_info['checkpoint_project_sig'] = \
+                        evolver.project_sig.clone()
+
         return batches
 
     @classmethod
     def _create_models(cls, sql_executor, evolver, tasks, sql):
         """Create tables for models in the database.
 
+        Version Changed:
+            3.0:
+            Statements are joined together in bulk install mode, if the
+            database supports it.
+
         Args:
             sql_executor (django_evolution.utils.sql.SQLExecutor):
                 The SQL executor used to run any SQL on the database.
@@ -1011,6 +1190,10 @@ class EvolveAppTask(BaseEvolutionTask):
                                  app_label=task.app_label,
                                  model_names=task.new_model_names)
 
+        if evolver.bulk_install:
+            sql = cls._get_bulk_install_sql(evolver=evolver,
+                                            sql=sql)
+
         try:
             result = sql_executor.run_sql(sql=sql,
                                           execute=True,
@@ -1045,6 +1228,13 @@ class EvolveAppTask(BaseEvolutionTask):
     def _apply_deferred_sql(cls, sql_executor, evolver, sql):
         """Create tables for models in the database.
 
+        Version Changed:
+            3.0:
+            Indexes are created concurrently in bulk install mode, if the
+            database supports it, multiple jobs were requested, and the
+            tables can be committed first (that is, this isn't being run
+            inside of an existing transaction).
+
         Args:
             sql_executor (django_evolution.utils.sql.SQLExecutor):
                 The SQL executor used to run any SQL on the database.
@@ -1067,10 +1257,56 @@ class EvolveAppTask(BaseEvolutionTask):
         assert sql_executor
         assert sql
 
+        result = []
+
         try:
-            return sql_executor.run_sql(sql=sql,
-                                        execute=True,
-                                        capture=True)
+            if evolver.bulk_install:
+                evolver_backend = cls._get_evolver_backend(evolver)
+
+                if (evolver.bulk_install_jobs > 1 and
+                    evolver_backend.supports_concurrent_index_creation):
+                    # The indexes would be created over separate
+                    # connections, which can only see tables once they've
+                    # been committed, so commit anything run so far. If
+                    # we're inside a caller's transaction, that's not
+                    # possible, and the indexes must be created serially.
+                    sql_executor.finish_transaction()
+                    create_concurrently = \
+                        not evolver.connection.in_atomic_block
+                else:
+                    create_concurrently = False
+
+                if create_concurrently:
+                    # Indexes don't depend on each other, so they can be
+                    # created at the same time over separate connections.
+                    # Anything else (such as foreign key constraints) is
+                    # applied afterward, in order, to avoid lock conflicts.
+                    index_sql = []
+                    other_sql = []
+
+                    for statement in sql:
+                        if (isinstance(statement, str) and
+                            _create_index_re.match(statement.strip())):
+                            index_sql.append(statement)
+                        else:
+                            other_sql.append(statement)
+
+                    if index_sql:
+                        result += cls._create_indexes_concurrently(
+                            evolver=evolver,
+                            sql=index_sql)
+
+                    sql = other_sql
+
+                sql = cls._get_bulk_install_sql(evolver=evolver,
+                                                sql=sql)
+
+            if sql:
+                result += sql_executor.run_sql(sql=sql,
+                                               execute=True,
+                                               capture=True)
+
+            return result
         except Exception as e:
             raise EvolutionExecutionError(
                 _('Error applying deferred SQL for new database models: %s')
@@ -1078,6 +1314,96 @@ class EvolveAppTask(BaseEvolutionTask):
                 detailed_error=str(e),
                 last_sql_statement=getattr(e, 'last_sql_statement', None))
 
+    @classmethod
+    def _get_evolver_backend(cls, evolver):
+        """Return the evolution operations backend for the evolver.
+
+        Version Added:
+            3.0
+
+        Args:
+            evolver (Evolver):
+                The evolver executing the tasks.
+
+        Returns:
+            django_evolution.db.common.BaseEvolutionOperations:
+            The evolution operations backend for the evolver's database.
+        """
+        return EvolutionOperationsMulti(evolver.database_name,
+                                        evolver.database_state).get_evolver()
+
+    @classmethod
+    def _get_bulk_install_sql(cls, evolver, sql):
+        """Return SQL to execute when installing in bulk install mode.
+
+        If the database can execute several statements at once, consecutive
+        statements will be joined together, reducing the number of
+        round-trips needed to install the database.
+
+        Version Added:
+            3.0
+
+        Args:
+            evolver (Evolver):
+                The evolver executing the tasks.
+
+            sql (list):
+                The list of SQL statements to execute.
+
+        Returns:
+            list:
+            The list of SQL statements to execute.
+        """
+        if cls._get_evolver_backend(evolver).supports_multi_statement_sql:
+            sql = join_sql_statements(sql)
+
+        return sql
+
+    @classmethod
+    def _create_indexes_concurrently(cls, evolver, sql):
+        """Create indexes concurrently over separate database connections.
+
+        Up to :py:attr:`Evolver.bulk_install_jobs
+        <django_evolution.evolve.evolver.Evolver.bulk_install_jobs>` indexes
+        will be created at once. Each is created in its own transaction.
+
+        Version Added:
+            3.0
+
+        Args:
+            evolver (Evolver):
+                The evolver executing the tasks.
+
+            sql (list of unicode):
+                The list of ``CREATE INDEX`` statements to execute.
+
+        Returns:
+            list:
+            The list of SQL statements that were executed.
+
+        Raises:
+            Exception:
+                An index could not be created. This will be the first error
+                encountered.
+        """
+        database_name = evolver.database_name
+
+        def _create_index(statement):
+            # Database connections are per-thread, so each worker will
+            # get its own connection, which must be closed when done.
+            try:
+                with SQLExecutor(database=database_name) as sql_executor:
+                    return sql_executor.run_sql(sql=[statement],
+                                                execute=True,
+                                                capture=True)
+            finally:
+                connections[database_name].close()
+
+        with ThreadPoolExecutor(max_workers=evolver.bulk_install_jobs) as \
+                executor:
+            return list(itertools.chain.from_iterable(
+                executor.map(_create_index, sql)))
+
     def __init__(self, evolver, app, evolutions=None, migrations=None):
         """Initialize the task.
 
@@ -1123,7 +1449,8 @@ class EvolveAppTask(BaseEvolutionTask):
         self._mutations = None
         self._pending_mutations = None
 
-    def generate_mutations_info(self, pending_mutations, update_evolver=True):
+    def generate_mutations_info(self, pending_mutations, update_evolver=True,
+                                evolution_labels=None):
         """Generate information on a series of mutations.
 
         This will optimize and run the list of pending mutations against the
@@ -1134,6 +1461,20 @@ class EvolveAppTask(BaseEvolutionTask):
         disabled in order to just retrieve information without making any
         changes.
 
+        If ``evolution_labels`` is provided, results are cached as compiled
+        mutation plans. If another evolver later runs the same evolutions
+        against a matching signature and database state on the same type of
+        database, the plan will be reused instead of re-simulating the
+        mutations and re-generating SQL.
+
+        Version Changed:
+            3.0:
+            * Added compiled mutation plan caching.
+            * Added the ``evolution_labels`` argument.
+            * Added the ``can_simulate`` and ``sql_notes`` keys to the
+              result.
+            * ``app_mutator`` in the result may now be ``None``.
+
         Args:
             pending_mutations (list of
                                django_evolution.mutations.BaseMutation):
@@ -1142,23 +1483,36 @@ class EvolveAppTask(BaseEvolutionTask):
             update_evolver (bool, optional):
                 Whether to update the evolver's signature.
 
+            evolution_labels (list of unicode, optional):
+                The labels of the evolutions providing the mutations. This
+                is required for compiled mutation plans to be cached or
+                reused.
+
         Returns:
             dict:
             The resulting information from running the mutations. This
             includes the following:
 
             ``app_mutator`` (:py:class:`~django_evolution.mutations.AppMutator`):
-                The app mutator that ran the mutations.
+                The app mutator that ran the mutations. This will be ``None``
+                if a compiled mutation plan was reused.
 
             ``applied_migrations`` (list of tuple):
                 The list of migrations that were ultimately marked as applied.
 
+            ``can_simulate`` (bool):
+                Whether the mutations could be simulated.
+
             ``mutations`` (list of :py:class:`~django_evolution.mutations.BaseMutation`):
                 The optimized list of mutations.
 
             ``sql`` (list):
                 The optimized list of SQL statements to execute.
 
+            ``sql_notes`` (list of unicode):
+                Notes from the database backend on how the SQL will be
+                applied. These are for display only.
+
             ``upgrade_method`` (unicode):
                 The resulting upgrade method for the app, after applying all
                 mutations.
@@ -1177,38 +1531,61 @@ class EvolveAppTask(BaseEvolutionTask):
             return None
 
         app_label = self.app_label
-        legacy_app_label = self.legacy_app_label
+        evolver = self.evolver
+        app_mutator = None
 
         logger.debug('Mutations for %s: %r', app_label, mutations)
 
-        app_mutator = AppMutator.from_evolver(
-            evolver=self.evolver,
-            app_label=app_label,
-            legacy_app_label=legacy_app_label,
-            update_evolver=update_evolver)
-        app_mutator.run_mutations(mutations)
+        if evolver.hinted or evolution_labels is None:
+            # Hinted mutations are generated fresh for each evolver, and
+            # mutations not tied to evolutions can't be reliably identified,
+            # so there's no chance of reusing a plan.
+            plan_key = None
+            plan = None
+        else:
+            plan_key = self._get_compiled_plan_key(
+                mutations=mutations,
+                evolution_labels=evolution_labels)
+
+            with self._compiled_plans_lock:
+                plan = self._compiled_plans.get(plan_key)
+
+                if plan is not None:
+                    if plan['evolver_ref']() is evolver:
+                        # This evolver compiled the plan itself. It will
+                        # run the mutations again, rather than replaying
+                        # its own plan.
+                        plan = None
+                    else:
+                        self._compiled_plans.move_to_end(plan_key)
 
-        project_sig = app_mutator.project_sig
-        app_sig = (
-            project_sig.get_app_sig(app_label) or
-            project_sig.get_app_sig(legacy_app_label)
-        )
+        if plan is None:
+            app_mutator, plan = self._compile_plan(
+                mutations=mutations,
+                update_evolver=update_evolver)
 
-        if app_sig is None:
-            # The evolutions didn't make any changes to an existing app
-            # signature. We may not have had an existing one. Bail.
-            applied_migrations = []
-            upgrade_method = None
+            if plan_key is not None:
+                compiled_plans = self._compiled_plans
+
+                with self._compiled_plans_lock:
+                    compiled_plans[plan_key] = plan
+
+                    while len(compiled_plans) > self._compiled_plans_max_size:
+                        compiled_plans.popitem(last=False)
         else:
-            applied_migrations = app_sig.applied_migrations
-            upgrade_method = app_sig.upgrade_method
+            logger.debug('Using compiled mutation plan for %s', app_label)
+
+            if update_evolver:
+                self._apply_compiled_plan(plan)
 
         return {
             'app_mutator': app_mutator,
-            'applied_migrations': applied_migrations,
-            'mutations': mutations,
-            'sql': app_mutator.to_sql(),
-            'upgrade_method': upgrade_method,
+            'applied_migrations': plan['applied_migrations'],
+            'can_simulate': plan['can_simulate'],
+            'mutations': list(plan['mutations']),
+            'sql': list(plan['sql']),
+            'sql_notes': list(plan['sql_notes']),
+            'upgrade_method': plan['upgrade_method'],
         }
 
     def prepare(self, hinted=False, **kwargs):
@@ -1273,9 +1650,11 @@ class EvolveAppTask(BaseEvolutionTask):
                 project_sig.add_app_sig(app_sig)
                 orig_upgrade_method = app_sig.upgrade_method
 
-            app_upgrade_info = get_app_upgrade_info(app,
-                                                    simulate_applied=True,
-                                                    database=database_name)
+            app_upgrade_info = get_app_upgrade_info(
+                app,
+                simulate_applied=True,
+                database=database_name,
+                database_applied_migrations=evolver.get_applied_migrations())
             upgrade_method = app_upgrade_info.get('upgrade_method')
             evolutions = get_evolution_sequence(app)
         else:
@@ -1322,12 +1701,13 @@ class EvolveAppTask(BaseEvolutionTask):
 
                 mutations_info = self.generate_mutations_info(
                     pending_mutations,
-                    update_evolver=False)
+                    update_evolver=False,
+                    evolution_labels=None if hinted else evolutions)
 
                 if mutations_info:
-                    app_mutator = mutations_info['app_mutator']
-                    self.can_simulate = app_mutator.can_simulate
+                    self.can_simulate = mutations_info['can_simulate']
                     self.sql = mutations_info['sql']
+                    self.sql_notes = mutations_info['sql_notes']
                     self.evolution_required = True
                     self._mutations = mutations_info['mutations']
 
@@ -1458,6 +1838,206 @@ class EvolveAppTask(BaseEvolutionTask):
                                    task=self,
                                    evolutions=evolutions)
 
+    def _get_compiled_plan_key(self, mutations, evolution_labels):
+        """Return a key identifying a compiled mutation plan.
+
+        Mutations are identified by their content, as represented in a
+        hinted evolution, along with the labels of the evolutions they came
+        from. Some mutations (such as
+        :py:class:`~django_evolution.mutations.SQLMutation`) aren't fully
+        represented by their hinted evolution, but are fully identified by
+        their evolution.
+
+        Version Added:
+            3.0
+
+        Args:
+            mutations (list of django_evolution.mutations.BaseMutation):
+                The mutations being run.
+
+            evolution_labels (list of unicode):
+                The labels of the evolutions providing the mutations.
+
+        Returns:
+            tuple:
+            The key for the plan.
+        """
+        evolver = self.evolver
+        connection = evolver.connection
+
+        try:
+            database_version = connection.get_database_version()
+        except NotImplementedError:
+            database_version = None
+
+        return (
+            evolver.project_sig.get_digest(),
+            evolver.database_state.get_digest(),
+            self.app_label,
+            self.legacy_app_label,
+            tuple(evolution_labels),
+            tuple(
+                (type(mutation).__module__,
+                 type(mutation).__name__,
+                 mutation.generate_hint())
+                for mutation in mutations
+            ),
+            connection.vendor,
+            connection.settings_dict.get('ENGINE'),
+            database_version,
+        )
+
+    def _compile_plan(self, mutations, update_evolver):
+        """Run mutations and compile the results into a reusable plan.
+
+        Version Added:
+            3.0
+
+        Args:
+            mutations (list of django_evolution.mutations.BaseMutation):
+                The mutations to run.
+
+            update_evolver (bool):
+                Whether to update the evolver's signature.
+
+        Returns:
+            tuple:
+            A tuple containing:
+
+            1. The :py:class:`~django_evolution.mutators.AppMutator` that ran
+               the mutations.
+            2. The compiled plan.
+        """
+        app_label = self.app_label
+        legacy_app_label = self.legacy_app_label
+        evolver = self.evolver
+
+        old_app_sig_digests = {
+            app_sig.app_id: app_sig.get_digest()
+            for app_sig in evolver.project_sig.app_sigs
+        }
+
+        if update_evolver:
+            # The evolver's state will be modified in place, so we'll need
+            # a copy to compare against.
+            old_database_state = evolver.database_state.clone()
+        else:
+            old_database_state = evolver.database_state
+
+        app_mutator = AppMutator.from_evolver(
+            evolver=evolver,
+            app_label=app_label,
+            legacy_app_label=legacy_app_label,
+            update_evolver=update_evolver)
+        app_mutator.run_mutations(mutations)
+
+        project_sig = app_mutator.project_sig
+        database_state = app_mutator.database_state
+        app_sig = (
+            project_sig.get_app_sig(app_label) or
+            project_sig.get_app_sig(legacy_app_label)
+        )
+
+        if app_sig is None:
+            # The evolutions didn't make any changes to an existing app
+            # signature. We may not have had an existing one. Bail.
+            applied_migrations = []
+            upgrade_method = None
+        else:
+            applied_migrations = app_sig.applied_migrations
+            upgrade_method = app_sig.upgrade_method
+
+        # Generating SQL finalizes the mutators, which may make further
+        # changes to the signature, so this must happen before comparing
+        # state.
+        sql = app_mutator.to_sql()
+
+        plan = {
+            'app_ids': [
+                _app_sig.app_id
+                for _app_sig in project_sig.app_sigs
+            ],
+            'app_sigs': {
+                _app_sig.app_id: _app_sig.clone()
+                for _app_sig in project_sig.app_sigs
+                if (old_app_sig_digests.get(_app_sig.app_id) !=
+                    _app_sig.get_digest())
+            },
+            'applied_migrations': applied_migrations,
+            'can_simulate': app_mutator.can_simulate,
+            'database_state_changes':
+                database_state.get_changes(old_database_state),
+            'evolver_ref': weakref.ref(evolver),
+            'mutations': mutations,
+            'sql': sql,
+            'sql_notes': list(app_mutator.sql_notes),
+            'upgrade_method': upgrade_method,
+        }
+
+        return app_mutator, plan
+
+    def _apply_compiled_plan(self, plan):
+        """Apply a compiled plan's changes to the evolver's state.
+
+        This updates the evolver's project signature and database state to
+        match the result of running the plan's mutations.
+
+        Version Added:
+            3.0
+
+        Args:
+            plan (dict):
+                The compiled plan to apply.
+        """
+        evolver = self.evolver
+        project_sig = evolver.project_sig
+        old_app_sigs = OrderedDict(
+            (app_sig.app_id, app_sig)
+            for app_sig in project_sig.app_sigs
+        )
+
+        # Signatures are normally modified in place by mutations, and callers
+        # may hold onto them. Update any existing app and model signatures
+        # in place, rather than replacing them.
+        for app_id, new_app_sig in plan['app_sigs'].items():
+            app_sig = old_app_sigs.get(app_id)
+
+            if app_sig is None:
+                old_app_sigs[app_id] = new_app_sig.clone()
+            else:
+                old_model_sigs = {
+                    model_sig.model_name: model_sig
+                    for model_sig in app_sig.model_sigs
+                }
+
+                app_sig.legacy_app_label = new_app_sig.legacy_app_label
+                app_sig.upgrade_method = new_app_sig.upgrade_method
+                app_sig.applied_migrations = \
+                    deepcopy(new_app_sig.applied_migrations)
+                app_sig.clear_model_sigs()
+
+                for new_model_sig in new_app_sig.model_sigs:
+                    model_sig = old_model_sigs.get(new_model_sig.model_name)
+
+                    if (model_sig is None or
+                        model_sig.get_digest() != new_model_sig.get_digest()):
+                        model_sig = new_model_sig.clone()
+
+                    app_sig.add_model_sig(model_sig)
+
+        app_ids = plan['app_ids']
+
+        if list(old_app_sigs.keys()) != app_ids:
+            # Apps were added, removed, or renamed. Rebuild the list in the
+            # plan's order.
+            for app_sig in list(project_sig.app_sigs):
+                project_sig.remove_app_sig(app_sig.app_id)
+
+            for app_id in app_ids:
+                project_sig.add_app_sig(old_app_sigs[app_id])
+
+        evolver.database_state.apply_changes(plan['database_state_changes'])
+
     def get_evolution_content(self):
         """Return the content for an evolution file for this task.
 
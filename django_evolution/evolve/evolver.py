@@ -7,29 +7,42 @@ Version Added:
 
 from __future__ import annotations
 
+import json
+import logging
 from collections import OrderedDict
 from contextlib import contextmanager
 
-from django.db import connections
+from django.db import DatabaseError, connections
 from django.db.utils import DEFAULT_DB_ALIAS
 from django.utils.translation import gettext as _
 
 from django_evolution.compat.db import atomic
+from django_evolution.db import EvolutionOperationsMulti
 from django_evolution.db.state import DatabaseState
 from django_evolution.diff import Diff
-from django_evolution.errors import (EvolutionException,
+from django_evolution.errors import (DatabaseStateError,
+                                     EvolutionException,
                                      EvolutionTaskAlreadyQueuedError,
                                      EvolutionExecutionError,
                                      QueueEvolverTaskError)
 from django_evolution.evolve.evolve_app_task import EvolveAppTask
 from django_evolution.evolve.purge_app_task import PurgeAppTask
-from django_evolution.models import Evolution, Version
-from django_evolution.signals import evolved, evolving, evolving_failed
+from django_evolution.models import (DatabaseStateSnapshot,
+                                     Evolution,
+                                     Version)
+from django_evolution.signals import (applied_migration,
+                                      evolved,
+                                      evolving,
+                                      evolving_failed)
 from django_evolution.signature import AppSignature, ProjectSignature
 from django_evolution.utils.apps import get_app, get_app_label, get_apps
+from django_evolution.utils.migrations import MigrationList
 from django_evolution.utils.sql import SQLExecutor
 
 
+logger = logging.getLogger(__name__)
+
+
 class Evolver(object):
     """The main class for managing database evolutions.
 
@@ -53,6 +66,21 @@ class Evolver(object):
     Django management command.
 
     Attributes:
+        bulk_install (bool):
+            Whether a new database is being installed in bulk install mode.
+            This is only ever set if :py:attr:`installed_new_database` is
+            set.
+
+            Version Added:
+                3.0
+
+        bulk_install_jobs (int):
+            The number of concurrent connections to use when creating
+            indexes in bulk install mode.
+
+            Version Added:
+                3.0
+
         connection (django.db.backends.base.base.BaseDatabaseWrapper):
             The database connection object being used for the evolver.
 
@@ -62,10 +90,23 @@ class Evolver(object):
         database_state (django_evolution.db.state.DatabaseState):
             The state of the database, for evolution purposes.
 
+            Version Changed:
+                3.0:
+                This may be loaded from a snapshot saved by a previous
+                evolution, if the database schema hasn't changed since.
+
         evolved (bool):
             Whether the evolver has already performed its evolutions. These
             can only be done once per evolver.
 
+        evolved_elsewhere (bool):
+            Whether :py:meth:`evolve` found that another process had evolved
+            the database while waiting for the evolve lock, and so skipped
+            performing any evolutions itself.
+
+            Version Added:
+                3.0
+
         hinted (bool):
             Whether the evolver is operating against hinted evolutions. This
             may result in changes to the database without there being any
@@ -85,6 +126,14 @@ class Evolver(object):
             signature stored in the database, but will be modified when
             mutations are simulated.
 
+        use_lock (bool):
+            Whether :py:meth:`evolve` will hold a database-wide lock, to
+            prevent concurrent evolutions by other processes. The lock is
+            also held while installing a new database.
+
+            Version Added:
+                3.0
+
         verbosity (int):
             The verbosity level for any output. This is passed along to
             signal emissions.
@@ -96,9 +145,15 @@ class Evolver(object):
     """
 
     def __init__(self, hinted=False, verbosity=0, interactive=False,
-                 database_name=DEFAULT_DB_ALIAS):
+                 database_name=DEFAULT_DB_ALIAS, use_lock=False,
+                 bulk_install=False, bulk_install_jobs=1):
         """Initialize the evolver.
 
+        Version Changed:
+            3.0:
+            Added the ``use_lock``, ``bulk_install``, and
+            ``bulk_install_jobs`` arguments.
+
         Args:
             hinted (bool, optional):
                 Whether to operate against hinted evolutions. This may
@@ -117,6 +172,23 @@ class Evolver(object):
             database_name (unicode, optional):
                 The name of the database to evolve.
 
+            use_lock (bool, optional):
+                Whether :py:meth:`evolve` should hold a database-wide lock,
+                to prevent concurrent evolutions by other processes sharing
+                the database. If the database is new, the lock will also be
+                held while installing it.
+
+            bulk_install (bool, optional):
+                Whether to install a new database in bulk install mode.
+                Backends may relax durability settings for the duration of
+                the install, batch statements together, and create indexes
+                concurrently. This has no effect if the database has already
+                been installed.
+
+            bulk_install_jobs (int, optional):
+                The number of concurrent connections to use when creating
+                indexes in bulk install mode, on backends that support it.
+
         Raises:
             django_evolution.errors.EvolutionBaselineMissingError:
                 An initial baseline for the project was not yet installed.
@@ -126,8 +198,12 @@ class Evolver(object):
         self.hinted = hinted
         self.verbosity = verbosity
         self.interactive = interactive
+        self.use_lock = use_lock
+        self.bulk_install = False
+        self.bulk_install_jobs = max(bulk_install_jobs, 1)
 
         self.evolved = False
+        self.evolved_elsewhere = False
         self.initial_diff = None
         self.project_sig = None
         self.version = None
@@ -139,61 +215,45 @@ class Evolver(object):
             # Django >= 1.8
             self.connection.prepare_database()
 
-        self.database_state = DatabaseState(self.database_name)
+        self.database_state = self._load_database_state()
         self.target_project_sig = \
             ProjectSignature.from_database(database_name)
 
         self._tasks_by_class = OrderedDict()
         self._tasks_by_id = OrderedDict()
         self._tasks_prepared = False
+        self._applied_migrations = None
+        self._saved_evolution_keys = set()
 
-        latest_version = None
+        applied_migration.connect(self._on_applied_migration, sender=self)
 
-        if self.database_state.has_model(Version):
-            try:
-                latest_version = \
-                    Version.objects.current_version(using=database_name)
-            except Version.DoesNotExist:
-                # We'll populate this next.
-                pass
+        latest_version = self._get_latest_version()
 
         if latest_version is None:
             # Either the models aren't yet synced to the database, or we
             # don't have a saved project signature, so let's set these up.
-            self.installed_new_database = True
-
-            self.project_sig = ProjectSignature()
-            app = get_app('django_evolution')
-
-            task = EvolveAppTask(evolver=self,
-                                 app=app)
-            task.prepare(hinted=False)
-
-            with self.sql_executor() as sql_executor:
-                task.execute(sql_executor=sql_executor,
-                             create_models_now=True)
-
-            self.database_state.rescan_tables()
-
-            app_sig = AppSignature.from_app(app=app,
-                                            database=database_name)
-            self.project_sig.add_app_sig(app_sig)
-
-            # Let's make completely sure that we've only found the models
-            # we expect. This is mostly for the benefit of unit tests.
-            model_names = set(
-                model_sig.model_name
-                for model_sig in app_sig.model_sigs
-            )
-            expected_model_names = set(['Evolution', 'Version'])
-
-            assert model_names == expected_model_names, (
-                'Unexpected models found for django_evolution app: %s'
-                % ', '.join(model_names - expected_model_names))
-
-            self._save_project_sig(new_evolutions=task.new_evolutions)
-            latest_version = self.version
-
+            if use_lock:
+                # Another process may be installing the database at the
+                # same time. Wait for it, and then check again.
+                evolution_ops = EvolutionOperationsMulti(
+                    database_name,
+                    self.database_state).get_evolver()
+                evolution_ops.acquire_evolve_lock()
+
+                try:
+                    self.database_state.rescan_tables()
+                    latest_version = self._get_latest_version()
+
+                    if latest_version is None:
+                        latest_version = self._install_new_database(
+                            bulk_install=bulk_install)
+                finally:
+                    evolution_ops.release_evolve_lock()
+            else:
+                latest_version = self._install_new_database(
+                    bulk_install=bulk_install)
+
+        self._base_version_id = latest_version.pk
         self.project_sig = latest_version.signature
         self.initial_diff = Diff(self.project_sig,
                                  self.target_project_sig)
@@ -402,6 +462,19 @@ class Evolver(object):
 
         This can only be called once per evolver instance.
 
+        If :py:attr:`use_lock` is set, this will first wait for any other
+        process evolving the same database to finish. If that process
+        applied the same changes that this evolver would, this will return
+        without performing any evolutions, and :py:attr:`evolved_elsewhere`
+        will be set. If that process only partially evolved the database
+        (for instance, if it saved progress and then failed), an error will
+        be raised, and a new evolver must be constructed to apply the
+        remaining changes.
+
+        Version Changed:
+            3.0:
+            Added support for locking with :py:attr:`use_lock`.
+
         Raises:
             django_evolution.errors.EvolutionException:
                 Something went wrong during the evolution process. Details
@@ -416,10 +489,77 @@ class Evolver(object):
                 _('Evolver.evolve() has already been run once. It cannot be '
                   'run again.'))
 
+        if not self.use_lock:
+            self._evolve()
+            return
+
+        evolution_ops = EvolutionOperationsMulti(
+            self.database_name,
+            self.database_state).get_evolver()
+        evolution_ops.acquire_evolve_lock()
+
+        try:
+            # Another process may have evolved the database while we were
+            # waiting on the lock. If so, our queued tasks were based on a
+            # stale signature.
+            current_version = Version.objects.current_version(
+                using=self.database_name)
+
+            if current_version.pk == self._base_version_id:
+                self._evolve()
+                return
+
+            # Preparing the tasks simulates them, leaving our signature as it
+            # would be after evolving. We can compare that to what the other
+            # process stored.
+            self._prepare_tasks()
+
+            if Diff(current_version.signature, self.project_sig).is_empty():
+                # The other process made the same changes we would have, so
+                # there's nothing left for us to do.
+                self.version = current_version
+                self.project_sig = current_version.signature
+                self.evolved = True
+                self.evolved_elsewhere = True
+            else:
+                # The other process saved some progress, but didn't finish
+                # (it may have failed partway through). Our queued tasks
+                # can't be applied on top of that progress.
+                raise EvolutionException(
+                    _('The database was partially evolved by another '
+                      'process while waiting to evolve it. Run the '
+                      'evolution again to apply the remaining changes.'))
+        finally:
+            evolution_ops.release_evolve_lock()
+
+    def _evolve(self):
+        """Perform the evolution.
+
+        This is called by :py:meth:`evolve`, once any lock has been
+        acquired.
+
+        Version Added:
+            3.0
+
+        Raises:
+            django_evolution.errors.EvolutionException:
+                Something went wrong during the evolution process.
+
+            django_evolution.errors.EvolutionExecutionError:
+                A specific evolution task failed.
+        """
         self._prepare_tasks()
 
         evolving.send(sender=self)
 
+        if self.bulk_install:
+            evolution_ops = EvolutionOperationsMulti(
+                self.database_name,
+                self.database_state).get_evolver()
+            evolution_ops.begin_bulk_install()
+        else:
+            evolution_ops = None
+
         try:
             new_evolutions = []
 
@@ -436,14 +576,175 @@ class Evolver(object):
                 self.database_state.rescan_tables()
 
             self._save_project_sig(new_evolutions=new_evolutions)
+            self._save_database_state_snapshot()
             self.evolved = True
         except Exception as e:
             evolving_failed.send(sender=self,
                                  exception=e)
             raise
+        finally:
+            if evolution_ops is not None:
+                evolution_ops.end_bulk_install()
 
         evolved.send(sender=self)
 
+    def _get_latest_version(self):
+        """Return the latest stored version of the project signature.
+
+        Version Added:
+            3.0
+
+        Returns:
+            django_evolution.models.Version:
+            The latest version, or ``None`` if the database hasn't been set
+            up for evolutions.
+        """
+        if self.database_state.has_model(Version):
+            try:
+                return Version.objects.current_version(
+                    using=self.database_name)
+            except Version.DoesNotExist:
+                pass
+
+        return None
+
+    def _install_new_database(self, bulk_install):
+        """Install Django Evolution's models and a baseline signature.
+
+        Version Added:
+            3.0
+
+        Args:
+            bulk_install (bool):
+                Whether to install the new database in bulk install mode.
+
+        Returns:
+            django_evolution.models.Version:
+            The newly-saved version.
+        """
+        database_name = self.database_name
+
+        self.installed_new_database = True
+        self.bulk_install = bulk_install
+
+        self.project_sig = ProjectSignature()
+        app = get_app('django_evolution')
+
+        task = EvolveAppTask(evolver=self,
+                             app=app)
+        task.prepare(hinted=False)
+
+        with self.sql_executor() as sql_executor:
+            task.execute(sql_executor=sql_executor,
+                         create_models_now=True)
+
+        self.database_state.rescan_tables()
+
+        app_sig = AppSignature.from_app(app=app,
+                                        database=database_name)
+        self.project_sig.add_app_sig(app_sig)
+
+        # Let's make completely sure that we've only found the models
+        # we expect. This is mostly for the benefit of unit tests.
+        model_names = set(
+            model_sig.model_name
+            for model_sig in app_sig.model_sigs
+        )
+        expected_model_names = set(['DatabaseStateSnapshot', 'Evolution',
+                                    'Version'])
+
+        assert model_names == expected_model_names, (
+            'Unexpected models found for django_evolution app: %s'
+            % ', '.join(model_names - expected_model_names))
+
+        self._save_project_sig(new_evolutions=task.new_evolutions)
+
+        return self.version
+
+    def _load_database_state(self):
+        """Load the state of the database.
+
+        If a snapshot of the database state was saved after the last
+        evolution, and the database schema hasn't changed since, the
+        snapshot will be used. Otherwise, the database will be scanned.
+
+        Version Added:
+            3.0
+
+        Returns:
+            django_evolution.db.state.DatabaseState:
+            The state of the database.
+        """
+        database_name = self.database_name
+        connection = self.connection
+        fingerprint = EvolutionOperationsMulti(database_name).get_evolver() \
+            .get_schema_fingerprint()
+
+        if fingerprint is not None:
+            table_name = DatabaseStateSnapshot._meta.db_table
+
+            with connection.cursor() as cursor:
+                has_snapshots = \
+                    table_name in connection.introspection.table_names(cursor)
+
+            if has_snapshots:
+                snapshot = (
+                    DatabaseStateSnapshot.objects
+                    .using(database_name)
+                    .filter(fingerprint=fingerprint)
+                    .order_by('-pk')
+                    .first()
+                )
+
+                if snapshot is not None:
+                    try:
+                        return DatabaseState.deserialize(
+                            database_name,
+                            json.loads(snapshot.state))
+                    except (DatabaseStateError, KeyError, TypeError,
+                            ValueError) as e:
+                        logger.warning('Ignoring invalid database state '
+                                       'snapshot for database "%s": %s',
+                                       database_name, e)
+
+        return DatabaseState(database_name)
+
+    def _save_database_state_snapshot(self):
+        """Save a snapshot of the current database state.
+
+        This will be used by future evolvers, until the database schema
+        changes. Failing to save the snapshot is logged, but is otherwise
+        ignored.
+
+        Version Added:
+            3.0
+        """
+        database_name = self.database_name
+        database_state = self.database_state
+
+        if not database_state.has_model(DatabaseStateSnapshot):
+            return
+
+        fingerprint = EvolutionOperationsMulti(
+            database_name,
+            database_state).get_evolver().get_schema_fingerprint()
+
+        if fingerprint is None:
+            return
+
+        try:
+            with atomic(using=database_name):
+                queryset = \
+                    DatabaseStateSnapshot.objects.using(database_name)
+                queryset.all().delete()
+                queryset.create(
+                    fingerprint=fingerprint,
+                    state=json.dumps(database_state.serialize()))
+        except DatabaseError as e:
+            logger.warning('Unable to save database state snapshot for '
+                           'database "%s": %s',
+                           database_name, e)
+
     def _prepare_tasks(self):
         """Prepare all queued tasks for further operations.
 
@@ -458,6 +759,45 @@ class Evolver(object):
                                        tasks=tasks,
                                        hinted=self.hinted)
 
+    def get_applied_migrations(self):
+        """Return the migrations applied to the database.
+
+        The list is loaded from the database the first time this is called,
+        and then kept up-to-date for the lifetime of the evolver as
+        migrations are applied or recorded, rather than being queried again.
+
+        Callers must not modify the returned list.
+
+        Version Added:
+            3.0
+
+        Returns:
+            django_evolution.utils.migrations.MigrationList:
+            The list of applied migrations.
+        """
+        if self._applied_migrations is None:
+            self._applied_migrations = \
+                MigrationList.from_database(self.connection)
+
+        return self._applied_migrations
+
+    def mark_migrations_applied(self, migrations):
+        """Mark migrations as applied in the evolver's cached state.
+
+        This does not record anything in the database. It's used to keep
+        :py:meth:`get_applied_migrations` in sync after migrations are
+        recorded outside of a migration executor.
+
+        Version Added:
+            3.0
+
+        Args:
+            migrations (django_evolution.utils.migrations.MigrationList):
+                The migrations that were applied.
+        """
+        if self._applied_migrations is not None:
+            self._applied_migrations.update(migrations)
+
     def sql_executor(self, **kwargs):
         """Return an SQLExecutor for executing SQL.
 
@@ -502,7 +842,30 @@ class Evolver(object):
             finally:
                 cursor.close()
 
-    def _save_project_sig(self, new_evolutions):
+    def _on_applied_migration(self, migration, **kwargs):
+        """Handle a migration being applied by this evolver.
+
+        This will add the migration (and any migrations it replaces) to the
+        cached list of applied migrations.
+
+        Args:
+            migration (django.db.migrations.Migration):
+                The migration that was applied.
+
+            **kwargs (dict, unused):
+                Additional keyword arguments sent by the signal.
+        """
+        if self._applied_migrations is not None:
+            migrations = MigrationList()
+            migrations.add_migration(migration)
+
+            # Squashed migrations are recorded by Django as their replaced
+            # migrations, followed by the squashed migration itself.
+            migrations.add_migration_targets(migration.replaces or [])
+
+            self.mark_migrations_applied(migrations)
+
+    def _save_project_sig(self, new_evolutions, project_sig=None):
         """Save the project signature and any new evolutions.
 
         This will serialize the current modified project signature to the
@@ -510,21 +873,46 @@ class Evolver(object):
         project version.
 
         This can be called many times for one evolver instance. After the
-        first time, the version already saved will simply be updated.
+        first time, the version already saved will simply be updated, and
+        any evolutions already saved will be skipped.
+
+        Version Changed:
+            3.0:
+            * Added the ``project_sig`` argument.
+            * Evolutions already saved by this evolver are now skipped.
 
         Args:
             new_evolutions (list of django_evolution.models.Evolution):
                 The list of new evolutions to save to the database.
 
+            project_sig (django_evolution.signature.ProjectSignature,
+                         optional):
+                The project signature to save. This defaults to
+                :py:attr:`project_sig`. A different signature is passed when
+                saving progress partway through an evolution.
+
         Raises:
             django_evolution.errors.EvolutionExecutionError:
                 There was an error saving to the database.
         """
+        if project_sig is None:
+            project_sig = self.project_sig
+
         version = self.version
 
         if version is None:
-            version = Version(signature=self.project_sig)
+            version = Version(signature=project_sig)
             self.version = version
+        else:
+            version.signature = project_sig
+
+        saved_evolution_keys = self._saved_evolution_keys
+        new_evolutions = [
+            evolution
+            for evolution in new_evolutions
+            if (evolution.app_label,
+                evolution.label) not in saved_evolution_keys
+        ]
 
         try:
             version.save(using=self.database_name)
@@ -535,6 +923,11 @@ class Evolver(object):
 
                 Evolution.objects.using(self.database_name).bulk_create(
                     new_evolutions)
+
+                saved_evolution_keys.update(
+                    (evolution.app_label, evolution.label)
+                    for evolution in new_evolutions
+                )
         except Exception as e:
             raise EvolutionExecutionError(
                 _('Error saving new evolution version information: %s')
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import logging
+import threading
 
 import django
 from django.db.models import signals
 from django.db.utils import DEFAULT_DB_ALIAS
 from django.dispatch import receiver
 
+try:
+    # Django >= 1.8
+    from django.core.signals import setting_changed
+except ImportError:
+    # Django < 1.8
+    from django.test.signals import setting_changed
+
 from django_evolution.conf import django_evolution_settings
-from django_evolution.evolve import Evolver
 from django_evolution.models import Evolution, Version
 from django_evolution.signals import evolved, evolving, evolving_failed
+from django_evolution.signature import ProjectSignature
 from django_evolution.utils.apps import get_app, get_app_label, get_apps
 from django_evolution.utils.evolutions import get_evolution_sequence
 
@@ -21,6 +29,25 @@ _django_evolution_app = None
 _evolve_lock = 0
 
 
+#: A lock guarding changes to _evolve_lock.
+#:
+#: Databases may be evolved concurrently from several threads.
+#:
+#: Version Added:
+#:     3.0
+_evolve_lock_guard = threading.Lock()
+
+
+#: Cached baseline information for databases, keyed by database name.
+#:
+#: Each value is a tuple of the project signature and a list of
+#: ``(app_label, evolution_label)`` tuples to mark as applied.
+#:
+#: Version Added:
+#:     3.0
+_baselines = {}
+
+
 @receiver(evolving)
 def _on_evolving(**kwargs):
     """Handler for when an Evolver begins evolving.
@@ -34,7 +61,8 @@ def _on_evolving(**kwargs):
     """
     global _evolve_lock
 
-    _evolve_lock += 1
+    with _evolve_lock_guard:
+        _evolve_lock += 1
 
 
 @receiver([evolved, evolving_failed])
@@ -42,7 +70,11 @@ def _on_evolving_done(**kwargs):
     """Handler for when an Evolver finishes evolving.
 
     This will decrement a lock, used to determine whether to react to any
-    Django post-migrate/syncdb signals.
+    Django post-migrate/syncdb signals, and clear any cached baselines.
+
+    Version Changed:
+        3.0:
+        Cached baselines are now cleared.
 
     Args:
         **kwargs (dict):
@@ -50,7 +82,96 @@ def _on_evolving_done(**kwargs):
     """
     global _evolve_lock
 
-    _evolve_lock -= 1
+    with _evolve_lock_guard:
+        _evolve_lock -= 1
+
+    # The models or migrations may have changed.
+    _baselines.clear()
+
+
+@receiver(signals.class_prepared)
+def _on_class_prepared(**kwargs):
+    """Handler for when a new model class is prepared.
+
+    This will clear any cached baselines, since they may no longer reflect
+    the registered models.
+
+    Version Added:
+        3.0
+
+    Args:
+        **kwargs (dict):
+            Keyword arguments passed to the signal.
+    """
+    _baselines.clear()
+
+
+@receiver(setting_changed)
+def _on_setting_changed(setting, **kwargs):
+    """Handler for when a Django setting changes.
+
+    This will clear any cached baselines if the setting may affect them.
+
+    Version Added:
+        3.0
+
+    Args:
+        setting (unicode):
+            The name of the setting.
+
+        **kwargs (dict):
+            Additional keyword arguments passed to the signal.
+    """
+    if setting in ('DATABASES', 'DATABASE_ROUTERS', 'DJANGO_EVOLUTION',
+                   'INSTALLED_APPS'):
+        _baselines.clear()
+
+
+def _get_baseline(using):
+    """Return the baseline information for a database.
+
+    The baseline is computed the first time it's needed for a database, and
+    then cached until the models or settings change. This saves scanning
+    the database and every app each time a test database is created or
+    flushed.
+
+    The cache lives in the process, so test runners that fork workers after
+    setting up the first test database will share the baseline computed
+    there.
+
+    Version Added:
+        3.0
+
+    Args:
+        using (unicode):
+            The name of the database.
+
+    Returns:
+        tuple:
+        A 2-tuple containing:
+
+        1. The project signature (:py:class:`~django_evolution.signature.
+           ProjectSignature`). This must not be modified.
+        2. The list of ``(app_label, evolution_label)`` tuples to mark as
+           applied.
+    """
+    baseline = _baselines.get(using)
+
+    if baseline is None:
+        evolution_keys = []
+
+        for app in get_apps():
+            app_label = get_app_label(app)
+
+            evolution_keys += [
+                (app_label, evolution_label)
+                for evolution_label in get_evolution_sequence(app)
+            ]
+
+        baseline = (ProjectSignature.from_database(using), evolution_keys)
+        _baselines[using] = baseline
+
+    return baseline
 
 
 def _on_app_models_updated(app, using=DEFAULT_DB_ALIAS, **kwargs):
@@ -66,6 +187,13 @@ def _on_app_models_updated(app, using=DEFAULT_DB_ALIAS, **kwargs):
     to some other process that emits the signals (such as the flush management
     command).
 
+    Version Changed:
+        3.0:
+        The baseline is now written directly from a cached signature, rather
+        than through an :py:class:`~django_evolution.evolve.Evolver`. This
+        avoids scanning the database each time a test database is created or
+        flushed.
+
     Args:
         app (module):
             The app models module that was updated.
@@ -87,25 +215,17 @@ def _on_app_models_updated(app, using=DEFAULT_DB_ALIAS, **kwargs):
         Version.objects.using(using).exists()):
         return
 
-    evolver = Evolver(database_name=using)
+    project_sig, evolution_keys = _get_baseline(using)
 
-    version = evolver.version
-    version.signature = evolver.target_project_sig
+    version = Version(signature=project_sig.clone())
     version.save(using=using)
 
-    evolutions = []
-
-    for app in get_apps():
-        app_label = get_app_label(app)
-
-        evolutions += [
-            Evolution(app_label=app_label,
-                      label=evolution_label,
-                      version=version)
-            for evolution_label in get_evolution_sequence(app)
-        ]
-
-    Evolution.objects.using(using).bulk_create(evolutions)
+    Evolution.objects.using(using).bulk_create([
+        Evolution(app_label=app_label,
+                  label=evolution_label,
+                  version=version)
+        for app_label, evolution_label in evolution_keys
+    ])
 
 
 def _on_post_syncdb(app, **kwargs):
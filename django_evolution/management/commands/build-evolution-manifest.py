@@ -0,0 +1,88 @@
+"""Management command for building evolutions manifests.
+
+Version Added:
+    3.0
+"""
+
+from __future__ import annotations
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import CommandError
+from django.utils.translation import gettext as _
+
+from django_evolution.compat.commands import BaseCommand
+from django_evolution.utils.apps import get_app, get_app_label, get_apps
+from django_evolution.utils.evolutions import write_evolutions_manifest
+
+
+class Command(BaseCommand):
+    """Builds evolutions manifests for one or more apps.
+
+    Version Added:
+        3.0
+    """
+
+    help = _(
+        'Builds manifests indexing the evolutions for apps. These speed up '
+        'loading evolution information, particularly for apps with many '
+        'evolutions.'
+    )
+
+    def add_arguments(self, parser):
+        """Add arguments to the command.
+
+        Args:
+            parser (object):
+                The argument parser to add to.
+        """
+        parser.add_argument(
+            'args',
+            metavar='APP_LABEL',
+            nargs='*',
+            help=_('One or more app labels to build manifests for.'))
+
+    def handle(self, *app_labels, **options):
+        """Handle the command.
+
+        This will build and write a manifest for each app that has
+        evolutions.
+
+        Args:
+            app_labels (list of unicode):
+                The app labels to build manifests for. If empty, manifests
+                will be built for all apps.
+
+            options (dict):
+                Options parsed by the argument parser.
+
+        Raises:
+            django.core.management.base.CommandError:
+                An app label was invalid.
+        """
+        if app_labels:
+            try:
+                apps = [
+                    get_app(app_label)
+                    for app_label in app_labels
+                ]
+            except (ImportError, ImproperlyConfigured) as e:
+                raise CommandError(
+                    _('%s. Are you sure your INSTALLED_APPS setting is '
+                      'correct?')
+                    % e)
+        else:
+            apps = get_apps()
+
+        verbosity = int(options['verbosity'])
+
+        for app in apps:
+            manifest_path = write_evolutions_manifest(app)
+
+            if manifest_path and verbosity > 0:
+                self.stdout.write(
+                    _('Wrote evolutions manifest for "%(app_label)s" to '
+                      '%(path)s\n')
+                    % {
+                        'app_label': get_app_label(app),
+                        'path': manifest_path,
+                    })
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
-import textwrap
+import logging
 import os
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from django.core.exceptions import ImproperlyConfigured
 from django.core.management.base import CommandError
+from django.db import DatabaseError, connections
 from django.db.utils import DEFAULT_DB_ALIAS
 from django.dispatch import receiver
 from django.utils.translation import ngettext, gettext as _
 
 from django_evolution.compat.commands import BaseCommand
 from django_evolution.conf import django_evolution_settings
+from django_evolution.db import EvolutionOperationsMulti
 from django_evolution.errors import EvolutionException
 from django_evolution.evolve import EvolveAppTask, Evolver, PurgeAppTask
 from django_evolution.signals import (applied_evolution,
@@ -20,10 +25,18 @@ from django_evolution.signals import (applied_evolution,
                                       applying_evolution,
                                       applying_migration,
                                       created_models,
-                                      creating_models)
+                                      creating_models,
+                                      processed_data_chunk)
 from django_evolution.utils.apps import import_management_modules, get_app
 from django_evolution.utils.evolutions import get_evolutions_path
-from django_evolution.utils.sql import SQLExecutor
+from django_evolution.utils.schema_bundles import (install_schema_bundle,
+                                                   is_database_empty,
+                                                   load_schema_bundle)
+from django_evolution.utils.sql import (SQLExecutor,
+                                       drain_deferred_table_drops)
+
+
+logger = logging.getLogger(__name__)
 
 
 class Command(BaseCommand):
@@ -90,11 +103,85 @@ class Command(BaseCommand):
             dest='execute',
             default=False,
             help=_('Apply evolutions to the database.'))
+        parser.add_argument(
+            '--lock',
+            action='store_true',
+            dest='use_lock',
+            default=False,
+            help=_('Wait for any other process evolving the same database '
+                   'to finish before applying evolutions. If that process '
+                   'upgraded the database, nothing more will be applied. '
+                   'This must be used with --execute.'))
         parser.add_argument(
             '--database',
             action='store',
             dest='database',
             help=_('Specify the database containing models to synchronize.'))
+        parser.add_argument(
+            '--all-databases',
+            action='store_true',
+            dest='all_databases',
+            default=False,
+            help=_('Apply evolutions to every configured database. This '
+                   'must be used with --execute.'))
+        parser.add_argument(
+            '--databases',
+            metavar='DATABASES',
+            action='store',
+            dest='databases',
+            default=None,
+            help=_('Apply evolutions to each of the comma-separated list of '
+                   'databases, in the same way as --all-databases. This '
+                   'must be used with --execute.'))
+        parser.add_argument(
+            '-j',
+            '--jobs',
+            metavar='N',
+            action='store',
+            type=int,
+            dest='jobs',
+            default=1,
+            help=_('The number of databases to evolve concurrently when '
+                   'using --all-databases or --databases, or the number of '
+                   'indexes to create concurrently when using '
+                   '--bulk-install.'))
+        parser.add_argument(
+            '--bulk-install',
+            action='store_true',
+            dest='bulk_install',
+            default=False,
+            help=_('When installing a new database, relax durability '
+                   'settings and batch statements where the database '
+                   'supports it, to speed up installation. This must be '
+                   'used with --execute.'))
+        parser.add_argument(
+            '--schema-bundle',
+            metavar='PATH',
+            action='store',
+            dest='schema_bundle',
+            default=None,
+            help=_('If the database is empty, install it from a schema '
+                   'bundle written by export-schema-bundle, before applying '
+                   'any newer evolutions. This must be used with '
+                   '--execute.'))
+        parser.add_argument(
+            '--drain-drops',
+            action='store_true',
+            dest='drain_drops',
+            default=False,
+            help=_('Drop any tables that were set aside to be dropped later '
+                   'by deleted models, when using the DEFERRED_TABLE_DROPS '
+                   'setting.'))
+        parser.add_argument(
+            '--drain-chunk-size',
+            metavar='ROWS',
+            action='store',
+            type=int,
+            dest='drain_chunk_size',
+            default=None,
+            help=_('The maximum number of rows to delete per transaction '
+                   'from each table before dropping it, when using '
+                   '--drain-drops.'))
 
     def handle(self, *app_labels, **options):
         """Handle the command.
@@ -120,6 +207,8 @@ class Command(BaseCommand):
                   'Evolutions cannot be manually run.'))
 
         self.purge = options['purge']
+        self.use_lock = options['use_lock']
+        self.bulk_install = options['bulk_install']
         self.verbosity = int(options['verbosity'])
 
         hint = options['hint']
@@ -129,6 +218,13 @@ class Command(BaseCommand):
         interactive = options['interactive']
         write_evolution_name = options['write_evolution_name']
 
+        if options['all_databases']:
+            databases_option = '--all-databases'
+        elif options['databases']:
+            databases_option = '--databases'
+        else:
+            databases_option = None
+
         if app_labels and self.execute:
             raise CommandError(
                 _('Cannot specify an application name when executing '
@@ -137,13 +233,99 @@ class Command(BaseCommand):
         if write_evolution_name and not hint:
             raise CommandError(_('--write cannot be used without --hint.'))
 
+        if self.use_lock and not execute:
+            raise CommandError(_('--lock can only be used with --execute.'))
+
+        if self.bulk_install and not execute:
+            raise CommandError(
+                _('--bulk-install can only be used with --execute.'))
+
+        if options['schema_bundle']:
+            if not execute or hint:
+                raise CommandError(
+                    _('--schema-bundle can only be used with --execute.'))
+
+            if databases_option:
+                raise CommandError(
+                    _('--schema-bundle cannot be used with %s.')
+                    % databases_option)
+
+        if options['drain_chunk_size'] is not None:
+            if not options['drain_drops']:
+                raise CommandError(
+                    _('--drain-chunk-size can only be used with '
+                      '--drain-drops.'))
+
+            if options['drain_chunk_size'] < 1:
+                raise CommandError(
+                    _('--drain-chunk-size must be 1 or higher.'))
+
+        if options['drain_drops']:
+            if (app_labels or execute or hint or compile_sql or self.purge or
+                databases_option):
+                raise CommandError(
+                    _('--drain-drops cannot be used with other evolve '
+                      'options.'))
+
+            self._drain_deferred_drops(
+                database_name=database_name,
+                chunk_size=options['drain_chunk_size'])
+            return
+
+        if databases_option:
+            if options['all_databases'] and options['databases']:
+                raise CommandError(
+                    _('--all-databases cannot be used with --databases.'))
+
+            if options['database']:
+                raise CommandError(
+                    _('%s cannot be used with --database.')
+                    % databases_option)
+
+            if not execute or hint or compile_sql:
+                raise CommandError(
+                    _('%s can only be used with --execute.')
+                    % databases_option)
+
+            if options['jobs'] < 1:
+                raise CommandError(_('--jobs must be 1 or higher.'))
+
+            if options['all_databases']:
+                database_names = self._get_all_database_names()
+            else:
+                database_names = [
+                    database_name.strip()
+                    for database_name in options['databases'].split(',')
+                    if database_name.strip()
+                ]
+
+                for database_name in database_names:
+                    if database_name not in connections:
+                        raise CommandError(
+                            _('"%s" is not a configured database.')
+                            % database_name)
+
+            import_management_modules()
+
+            self._evolve_databases(database_names=database_names,
+                                   jobs=options['jobs'],
+                                   interactive=interactive)
+            return
+
         import_management_modules()
 
+        if options['schema_bundle']:
+            self._install_schema_bundle(database_name=database_name,
+                                        path=options['schema_bundle'])
+
         try:
             self.evolver = Evolver(database_name=database_name,
                                    hinted=hint,
                                    verbosity=self.verbosity,
-                                   interactive=interactive)
+                                   interactive=interactive,
+                                   use_lock=self.use_lock,
+                                   bulk_install=self.bulk_install,
+                                   bulk_install_jobs=options['jobs'])
 
             # Figure out what tasks we need to add to the evolver. This
             # must be done before we check any state (as that will finalize
@@ -196,6 +378,138 @@ class Command(BaseCommand):
         except EvolutionException as e:
             raise CommandError(str(e))
 
+    def _drain_deferred_drops(self, database_name, chunk_size):
+        """Drop any tables that were set aside to be dropped later.
+
+        Version Added:
+            3.0
+
+        Args:
+            database_name (unicode):
+                The name of the database.
+
+            chunk_size (int):
+                The maximum number of rows to delete per transaction before
+                dropping each table, or ``None`` to drop tables directly.
+
+        Raises:
+            django.core.management.base.CommandError:
+                One or more tables could not be dropped.
+        """
+        try:
+            table_names = drain_deferred_table_drops(database_name,
+                                                     chunk_size=chunk_size)
+        except DatabaseError as e:
+            raise CommandError(
+                _('Unable to drop deferred tables: %s') % e)
+
+        if self.verbosity > 0:
+            if table_names:
+                if self.verbosity > 1:
+                    for table_name in table_names:
+                        self.stdout.write(_('Dropped table "%s".\n')
+                                          % table_name)
+
+                self.stdout.write(
+                    ngettext('Dropped %d deferred table.\n',
+                             'Dropped %d deferred tables.\n',
+                             len(table_names))
+                    % len(table_names))
+            else:
+                self.stdout.write(_('No deferred tables to drop.\n'))
+
+    def _install_schema_bundle(self, database_name, path):
+        """Install a schema bundle into the database, if it's empty.
+
+        If the database already contains tables, the bundle will be skipped,
+        and the database will be evolved normally.
+
+        If ``--lock`` was passed, the evolve lock will be held while checking
+        and installing the database, so that only one process installs it.
+
+        Version Added:
+            3.0
+
+        Args:
+            database_name (unicode):
+                The name of the database.
+
+            path (unicode):
+                The path to the schema bundle.
+
+        Raises:
+            django.core.management.base.CommandError:
+                The schema bundle could not be loaded or installed.
+        """
+        if self.use_lock:
+            evolution_ops = \
+                EvolutionOperationsMulti(database_name).get_evolver()
+            evolution_ops.acquire_evolve_lock()
+
+            try:
+                self._install_schema_bundle_if_empty(
+                    database_name=database_name,
+                    path=path)
+            finally:
+                evolution_ops.release_evolve_lock()
+        else:
+            self._install_schema_bundle_if_empty(database_name=database_name,
+                                                 path=path)
+
+    def _install_schema_bundle_if_empty(self, database_name, path):
+        """Install a schema bundle into the database, if it's empty.
+
+        This is called by :py:meth:`_install_schema_bundle`, once any lock
+        has been acquired.
+
+        Version Added:
+            3.0
+
+        Args:
+            database_name (unicode):
+                The name of the database.
+
+            path (unicode):
+                The path to the schema bundle.
+
+        Raises:
+            django.core.management.base.CommandError:
+                The schema bundle could not be loaded or installed.
+        """
+        if not is_database_empty(database_name):
+            if self.verbosity > 0:
+                self.stdout.write(
+                    _('The database is not empty. Skipping the schema '
+                      'bundle.\n'))
+
+            return
+
+        try:
+            with open(path, 'r') as fp:
+                bundle = load_schema_bundle(fp)
+
+            statement_count = install_schema_bundle(bundle,
+                                                    database=database_name)
+        except IOError as e:
+            raise CommandError(
+                _('Unable to read the schema bundle %(path)s: %(error)s')
+                % {
+                    'error': e,
+                    'path': path,
+                })
+        except EvolutionException as e:
+            raise CommandError(str(e))
+        except DatabaseError as e:
+            raise CommandError(
+                _('Unable to install the schema bundle: %s') % e)
+
+        if self.verbosity > 0:
+            self.stdout.write(
+                ngettext('Installed the schema bundle (%d SQL statement).\n',
+                         'Installed the schema bundle (%d SQL statements).\n',
+                         statement_count)
+                % statement_count)
+
     def _add_tasks(self, app_labels):
         """Add tasks to the evolver, based on the command options.
 
@@ -313,13 +627,22 @@ class Command(BaseCommand):
             'Your models contain changes that Django Evolution cannot '
             'resolve automatically.'))
 
-    def _confirm_execute(self):
+    def _confirm_execute(self, database_names=None):
         """Prompt the user to confirm execution of an evolution.
 
         This will warn the user of the risks of evolving the database and
         to recommend a backup. It will then prompt for confirmation, returning
         the result.
 
+        Version Changed:
+            3.0:
+            Added the ``database_names`` argument.
+
+        Args:
+            database_names (list of unicode, optional):
+                The names of the databases being evolved. This defaults to
+                the evolver's database.
+
         Returns:
             bool:
             ``True`` if the user confirmed the execution. ``False`` if the
@@ -336,7 +659,7 @@ class Command(BaseCommand):
               'Are you sure you want to execute the database upgrade?\n'
               '\n'
               'Type "yes" to continue, or "no" to cancel:')
-            % self.evolver.database_name)
+            % '", "'.join(database_names or [self.evolver.database_name]))
 
         # Note that we must append a space here, rather than above, since the
         # paragraph wrapping logic will strip trailing whitespace.
@@ -352,154 +675,378 @@ class Command(BaseCommand):
             django.core.management.base.CommandError:
                 The evolution failed.
         """
-        evolver = self.evolver
-        verbosity = self.verbosity
+        self.stdout.write(
+            '\n%s\n\n'
+            % self._wrap_paragraphs(_(
+                'This may take a while. Please be patient, and DO NOT '
+                'cancel the upgrade!')))
+
+        try:
+            self._run_evolver(
+                evolver=self.evolver,
+                verbosity=self.verbosity,
+                write=lambda message: self.stdout.write('%s\n' % message))
+        except EvolutionException as e:
+            self.stderr.write('%s\n' % self._get_evolution_error_message(e))
+
+            raise CommandError(str(e))
+
+    def _run_evolver(self, evolver, verbosity, write):
+        """Run an evolver, reporting progress and the result.
+
+        This is used when evolving a single database or many databases.
+
+        Version Added:
+            3.0
+
+        Args:
+            evolver (django_evolution.evolve.Evolver):
+                The evolver to run.
+
+            verbosity (int):
+                The verbosity level for progress. Each step will be reported
+                at 1 and higher, each completed step at 2 and higher, and the
+                evolutions and models involved in each step at 3 and higher.
+                The result will be reported if the command's verbosity is 1
+                or higher.
+
+            write (callable):
+                A function taking a line of output to write, without a
+                trailing newline.
 
+        Raises:
+            django_evolution.errors.EvolutionException:
+                The evolution failed.
+        """
+        def _get_evolutions_message(message, message_with_labels, task,
+                                    evolutions):
+            if verbosity > 2:
+                return message_with_labels % {
+                    'app_label': task.app_label,
+                    'evolution_labels': ', '.join(
+                        evolution.label
+                        for evolution in evolutions
+                    ),
+                }
+            else:
+                return message % {
+                    'app_label': task.app_label,
+                }
+
+        def _get_models_message(message, message_with_names, app_label,
+                                model_names):
+            if verbosity > 2:
+                return message_with_names % {
+                    'app_label': app_label,
+                    'model_names': ', '.join(model_names),
+                }
+            else:
+                return message % {
+                    'app_label': app_label,
+                }
+
+        # These are connected for the lifetime of this function, which
+        # covers the evolution below.
         if verbosity > 0:
             @receiver(applying_evolution, sender=evolver)
             def _on_applying_evolution(task, evolutions, **kwargs):
-                if verbosity > 2:
-                    message = (
-                        _('Applying database evolutions for %(app_label)s '
-                          '(%(evolution_labels)s)...\n')
-                        % {
-                            'app_label': task.app_label,
-                            'evolution_labels': ', '.join(
-                                evolution.label
-                                for evolution in evolutions
-                            ),
-                        }
-                    )
-                else:
-                    message = (
-                        _('Applying database evolutions for '
-                          '%(app_label)s...\n')
-                        % {
-                            'app_label': task.app_label,
-                        }
-                    )
-
-                self.stdout.write(message)
+                write(_get_evolutions_message(
+                    _('Applying database evolutions for %(app_label)s...'),
+                    _('Applying database evolutions for %(app_label)s '
+                      '(%(evolution_labels)s)...'),
+                    task=task,
+                    evolutions=evolutions))
 
             @receiver(applying_migration, sender=evolver)
             def _on_applying_migration(migration, **kwargs):
-                self.stdout.write(
-                    _('Applying database migration %(migration_name)s for '
-                      '%(app_label)s...\n')
-                    % {
-                        'app_label': migration.app_label,
-                        'migration_name': migration.name,
-                    })
+                write(_('Applying database migration %(migration_name)s for '
+                        '%(app_label)s...')
+                      % {
+                          'app_label': migration.app_label,
+                          'migration_name': migration.name,
+                      })
 
             @receiver(creating_models, sender=evolver)
             def _on_creating_models(app_label, model_names, **kwargs):
-                if verbosity > 2:
-                    message = (
-                        _('Creating new database models for %(app_label)s '
-                          '(%(model_names)s)...\n')
-                        % {
-                            'app_label': app_label,
-                            'model_names': ', '.join(model_names),
-                        }
-                    )
-                else:
-                    message = (
-                        _('Creating new database models for '
-                          '%(app_label)s...\n')
-                        % {
-                            'app_label': app_label,
-                        }
-                    )
-
-                self.stdout.write(message)
+                write(_get_models_message(
+                    _('Creating new database models for %(app_label)s...'),
+                    _('Creating new database models for %(app_label)s '
+                      '(%(model_names)s)...'),
+                    app_label=app_label,
+                    model_names=model_names))
 
         if verbosity > 1:
             @receiver(applied_evolution, sender=evolver)
             def _on_applied_evolution(task, evolutions, **kwargs):
-                if verbosity > 2:
-                    message = (
-                        _('Successfully applied database evolutions for '
-                          '%(app_label)s (%(evolution_labels)s).\n')
-                        % {
-                            'app_label': task.app_label,
-                            'evolution_labels': ', '.join(
-                                evolution.label
-                                for evolution in evolutions
-                            ),
-                        }
-                    )
-                else:
-                    message = (
-                        _('Successfully applied database evolutions for '
-                          '%(app_label)s.\n')
-                        % {
-                            'app_label': task.app_label,
-                        }
-                    )
-
-                self.stdout.write(message)
+                write(_get_evolutions_message(
+                    _('Successfully applied database evolutions for '
+                      '%(app_label)s.'),
+                    _('Successfully applied database evolutions for '
+                      '%(app_label)s (%(evolution_labels)s).'),
+                    task=task,
+                    evolutions=evolutions))
 
             @receiver(applied_migration, sender=evolver)
             def _on_applied_migration(migration, **kwargs):
-                self.stdout.write(
-                    _('Successfully applied database migration '
-                      '%(migration_name)s for %(app_label)s.\n')
-                    % {
-                        'app_label': migration.app_label,
-                        'migration_name': migration.name,
-                    })
+                write(_('Successfully applied database migration '
+                        '%(migration_name)s for %(app_label)s.')
+                      % {
+                          'app_label': migration.app_label,
+                          'migration_name': migration.name,
+                      })
 
             @receiver(created_models, sender=evolver)
             def _on_created_models(app_label, model_names, **kwargs):
-                if verbosity > 2:
-                    message = (
-                        _('Successfully created new database models for '
-                          '%(app_label)s (%(model_names)s).\n')
-                        % {
-                            'app_label': app_label,
-                            'model_names': ', '.join(model_names),
-                        }
-                    )
-                else:
-                    message = (
-                        _('Successfully created new database models for '
-                          '%(app_label)s.\n')
-                        % {
-                            'app_label': app_label,
-                        }
-                    )
+                write(_get_models_message(
+                    _('Successfully created new database models for '
+                      '%(app_label)s.'),
+                    _('Successfully created new database models for '
+                      '%(app_label)s (%(model_names)s).'),
+                    app_label=app_label,
+                    model_names=model_names))
+
+            @receiver(processed_data_chunk)
+            def _on_processed_data_chunk(mutation, app_label, database,
+                                         total_row_count, **kwargs):
+                if database == evolver.database_name:
+                    write(_('Processed %(row_count)d rows for data mutation '
+                            '"%(tag)s" in %(app_label)s...')
+                          % {
+                              'app_label': app_label,
+                              'row_count': total_row_count,
+                              'tag': mutation.tag,
+                          })
+
+        evolver.evolve()
+
+        if self.verbosity > 0:
+            if evolver.evolved_elsewhere:
+                write(_('The database was upgraded by another process.'))
+            elif evolver.installed_new_database:
+                write(_('The database creation was successful!'))
+            else:
+                write(_('The database upgrade was successful!'))
 
-                self.stdout.write(message)
+    def _get_evolution_error_message(self, e):
+        """Return an error message for a failed evolution.
 
-        self.stdout.write(
-            '\n%s\n\n'
-            % self._wrap_paragraphs(_(
-                'This may take a while. Please be patient, and DO NOT '
-                'cancel the upgrade!')))
+        Version Added:
+            3.0
+
+        Args:
+            e (django_evolution.errors.EvolutionException):
+                The error raised by the evolution.
+
+        Returns:
+            unicode:
+            The error message, including any SQL statement that failed.
+        """
+        last_sql_statement = getattr(e, 'last_sql_statement', None)
+
+        if last_sql_statement:
+            return (_('%(error)s (The SQL statement that failed was: '
+                      '%(sql)s)')
+                    % {
+                        'error': e,
+                        'sql': last_sql_statement,
+                    })
+
+        return str(e)
+
+    def _get_all_database_names(self):
+        """Return the names of all databases to evolve for --all-databases.
+
+        Databases configured as test mirrors of another database (through
+        the ``TEST['MIRROR']`` setting) are skipped, since they share the
+        database they mirror.
+
+        Version Added:
+            3.0
+
+        Returns:
+            list of unicode:
+            The names of the databases to evolve.
+        """
+        database_names = []
+
+        for database_name in connections:
+            test_settings = \
+                connections.settings[database_name].get('TEST') or {}
+
+            if not test_settings.get('MIRROR'):
+                database_names.append(database_name)
 
+        return database_names
+
+    def _evolve_databases(self, database_names, jobs, interactive):
+        """Evolve a list of databases.
+
+        Each database is evolved by its own :py:class:`Evolver`. Up to
+        ``jobs`` databases are evolved at once, each in its own worker
+        thread with its own connection. Progress for each database is
+        written as it happens, prefixed by the database name.
+
+        A failure on one database won't stop the evolution of any others.
+        Once all databases have been processed, any failures will be
+        reported, and the command will exit with an error.
+
+        Version Added:
+            3.0
+
+        Args:
+            database_names (list of unicode):
+                The names of the databases to evolve.
+
+            jobs (int):
+                The maximum number of databases to evolve concurrently.
+
+            interactive (bool):
+                Whether to prompt for confirmation before evolving.
+
+        Raises:
+            django.core.management.base.CommandError:
+                One or more databases failed to evolve.
+        """
+        if interactive and not self._confirm_execute(database_names):
+            self.stderr.write(_('Database upgrade cancelled.\n'))
+            return
+
+        self._output_lock = threading.Lock()
+
+        if jobs == 1 or len(database_names) == 1:
+            # There's no need for worker threads. Evolve in this thread,
+            # using the existing connections.
+            results = [
+                self._evolve_database(database_name)
+                for database_name in database_names
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(self._evolve_database_in_thread,
+                                            database_names))
+
+        failures = [
+            (database_name, error)
+            for database_name, error in zip(database_names, results)
+            if error is not None
+        ]
+
+        if failures:
+            self.stderr.write(
+                _('\nEvolution failed for the following databases:\n'))
+
+            for database_name, error in failures:
+                self.stderr.write('    %s: %s\n' % (database_name, error))
+
+            raise CommandError(
+                _('%(failed)s of %(total)s databases failed to evolve.')
+                % {
+                    'failed': len(failures),
+                    'total': len(database_names),
+                })
+
+        if self.verbosity > 0:
+            self.stdout.write(
+                _('All %s databases were evolved successfully!\n')
+                % len(database_names))
+
+    def _evolve_database_in_thread(self, database_name):
+        """Evolve a database from a worker thread.
+
+        This wraps :py:meth:`_evolve_database`, closing the worker thread's
+        connection to the database when finished.
+
+        Version Added:
+            3.0
+
+        Args:
+            database_name (unicode):
+                The name of the database to evolve.
+
+        Returns:
+            unicode:
+            An error message, if evolution failed, or ``None`` on success.
+        """
         try:
-            evolver.evolve()
-        except EvolutionException as e:
-            self.stderr.write('%s\n' % e)
+            return self._evolve_database(database_name)
+        finally:
+            connections[database_name].close()
 
-            if getattr(e, 'last_sql_statement', None):
-                self.stderr.write(
-                    _('The SQL statement that failed was: %s\n')
-                    % (e.last_sql_statement,))
+    def _evolve_database(self, database_name):
+        """Evolve a single database as part of a multi-database evolution.
 
-            raise CommandError(str(e))
+        Version Added:
+            3.0
 
-        if verbosity > 0:
-            if evolver.installed_new_database:
-                self.stdout.write(_('The database creation was successful!\n'))
-            else:
-                self.stdout.write(_('The database upgrade was successful!\n'))
+        Args:
+            database_name (unicode):
+                The name of the database to evolve.
+
+        Returns:
+            unicode:
+            An error message, if evolution failed, or ``None`` on success.
+        """
+        verbosity = self.verbosity
+
+        def _write(message):
+            with self._output_lock:
+                self.stdout.write('[%s] %s\n' % (database_name, message))
+
+        try:
+            evolver = Evolver(database_name=database_name,
+                              verbosity=verbosity,
+                              interactive=False,
+                              use_lock=self.use_lock,
+                              bulk_install=self.bulk_install)
+            evolver.queue_evolve_all_apps()
+
+            if self.purge:
+                evolver.queue_purge_old_apps()
+
+            if (evolver.can_simulate() and
+                not evolver.diff_evolutions().is_empty(
+                    ignore_apps=not self.purge)):
+                return _(
+                    'The stored evolutions do not completely resolve all '
+                    'model changes.')
+
+            if not evolver.get_evolution_required():
+                if verbosity > 0:
+                    _write(_('No database upgrade required.'))
+
+                return None
+
+            if verbosity > 0:
+                _write(_('Upgrading database...'))
+
+            # Progress is only shown for each database at higher verbosity
+            # levels, to keep the interleaved output readable.
+            self._run_evolver(evolver=evolver,
+                              verbosity=verbosity - 1,
+                              write=_write)
+        except EvolutionException as e:
+            return self._get_evolution_error_message(e)
+        except Exception as e:
+            logger.exception('Unexpected error evolving database "%s": %s',
+                             database_name, e)
+
+            return _('Unexpected error: %s') % e
+
+        return None
 
     def _display_compiled_sql(self):
         """Display the compiled SQL for the evolution run.
 
         This will output the SQL that would be executed based on the options
         passed to the command.
+
+        Version Changed:
+            3.0:
+            Statements are now written as they're processed, rather than
+            after all SQL for a task has been processed. Any notes from the
+            database backend on how changes will be applied, such as whether
+            a column type change will rewrite the table, are now written
+            after each task's header.
         """
         database_name = self.evolver.database_name
 
@@ -511,7 +1058,11 @@ class Command(BaseCommand):
 
                     self.stdout.write('-- %s\n' % task)
 
-                    for statement in executor.run_sql(task.sql, capture=True):
+                    for note in task.sql_notes:
+                        self.stdout.write('-- %s\n' % note)
+
+                    for statement in executor.iter_sql(task.sql,
+                                                       capture=True):
                         self.stdout.write('%s\n' % statement)
 
     def _display_available_purges(self):
@@ -0,0 +1,97 @@
+"""Management command for exporting schema bundles.
+
+Version Added:
+    3.0
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import CommandError
+from django.db.utils import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext as _
+
+from django_evolution.compat.commands import BaseCommand
+from django_evolution.utils.apps import import_management_modules
+from django_evolution.utils.schema_bundles import (build_schema_bundle,
+                                                   serialize_schema_bundle)
+
+
+class Command(BaseCommand):
+    """Exports a schema bundle for installing new databases.
+
+    Version Added:
+        3.0
+    """
+
+    help = _(
+        'Exports the SQL, project signature, and applied evolutions needed '
+        'to install a new database for the project. The bundle can be '
+        'installed with "evolve --schema-bundle", instead of generating SQL '
+        'from the models.'
+    )
+
+    def add_arguments(self, parser):
+        """Add arguments to the command.
+
+        Args:
+            parser (object):
+                The argument parser to add to.
+        """
+        parser.add_argument(
+            '--database',
+            action='store',
+            dest='database',
+            default=DEFAULT_DB_ALIAS,
+            help=_('Specify the database whose backend the bundle will be '
+                   'built for.'))
+        parser.add_argument(
+            '-o',
+            '--output',
+            metavar='PATH',
+            action='store',
+            dest='output',
+            help=_('The path to write the bundle to. If not provided, the '
+                   'bundle will be written to standard output.'))
+
+    def handle(self, **options):
+        """Handle the command.
+
+        This will build the schema bundle and write it out.
+
+        Args:
+            options (dict):
+                Options parsed by the argument parser.
+
+        Raises:
+            django.core.management.base.CommandError:
+                The bundle could not be written.
+        """
+        import_management_modules()
+
+        bundle = build_schema_bundle(options['database'])
+        data = serialize_schema_bundle(bundle)
+        output = options['output']
+
+        if output:
+            try:
+                with open(output, 'w') as fp:
+                    fp.write(data)
+            except IOError as e:
+                raise CommandError(
+                    _('Unable to write the schema bundle to %(path)s: '
+                      '%(error)s')
+                    % {
+                        'error': e,
+                        'path': output,
+                    })
+
+            if int(options['verbosity']) > 0:
+                self.stdout.write(
+                    _('Wrote schema bundle with %(count)d SQL statements to '
+                      '%(path)s\n')
+                    % {
+                        'count': len(bundle['sql']),
+                        'path': output,
+                    })
+        else:
+            self.stdout.write(data)
@@ -304,12 +304,13 @@ class MockMeta(object):
             primary_key = field_sig.get_attr_value('primary_key')
 
             if not stub or primary_key:
-                field = create_field(project_sig=self._project_sig,
-                                     field_name=field_sig.field_name,
-                                     field_type=field_sig.field_type,
-                                     field_attrs=field_sig.field_attrs,
-                                     parent_model=model,
-                                     related_model=field_sig.related_model)
+                field = create_field(
+                    project_sig=self._project_sig,
+                    field_name=field_sig.field_name,
+                    field_type=field_sig.field_type,
+                    field_attrs=field_sig.readonly_field_attrs,
+                    parent_model=model,
+                    related_model=field_sig.related_model)
 
                 if isinstance(field, (models.AutoField, models.BigAutoField)):
                     self.meta['has_auto_field'] = True
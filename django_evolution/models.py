@@ -265,3 +265,26 @@ class Evolution(models.Model):
     class Meta:
         db_table = 'django_evolution'
         ordering = ('id',)
+
+
+class DatabaseStateSnapshot(models.Model):
+    """A stored snapshot of the tables and indexes in the database.
+
+    This is saved after evolving the database, along with a fingerprint of
+    the database schema. If the fingerprint still matches when an evolver
+    is next constructed, the snapshot is used instead of scanning the
+    database.
+
+    Version Added:
+        3.0
+    """
+
+    fingerprint = models.CharField(max_length=255)
+    state = models.TextField()
+    when = models.DateTimeField(default=now)
+
+    def __str__(self):
+        return 'Database state snapshot, saved on %s' % self.when
+
+    class Meta:
+        db_table = 'django_evolution_state_snapshot'
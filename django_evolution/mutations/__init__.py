@@ -17,6 +17,7 @@ Version Changed:
    ~django_evolution.mutations.base.Simulation
    ~django_evolution.mutations.change_field.ChangeField
    ~django_evolution.mutations.change_meta.ChangeMeta
+   ~django_evolution.mutations.chunked_data_mutation.ChunkedDataMutation
    ~django_evolution.mutations.delete_application.DeleteApplication
    ~django_evolution.mutations.delete_field.DeleteField
    ~django_evolution.mutations.delete_model.DeleteModel
@@ -37,6 +38,8 @@ from django_evolution.mutations.base import (BaseModelFieldMutation,
                                              Simulation)
 from django_evolution.mutations.change_field import ChangeField
 from django_evolution.mutations.change_meta import ChangeMeta
+from django_evolution.mutations.chunked_data_mutation import \
+    ChunkedDataMutation
 from django_evolution.mutations.delete_application import DeleteApplication
 from django_evolution.mutations.delete_field import DeleteField
 from django_evolution.mutations.delete_model import DeleteModel
@@ -56,6 +59,7 @@ __all__ = (
     'BaseUpgradeMethodMutation',
     'ChangeField',
     'ChangeMeta',
+    'ChunkedDataMutation',
     'DeleteApplication',
     'DeleteField',
     'DeleteModel',
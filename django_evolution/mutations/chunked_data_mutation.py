@@ -0,0 +1,223 @@
+"""Mutation for processing a model's rows in chunks.
+
+Version Added:
+    3.0
+"""
+
+from __future__ import annotations
+
+from django_evolution.compat.db import atomic
+from django_evolution.mutations.base import BaseMutation
+from django_evolution.signals import processed_data_chunk
+from django_evolution.utils.sql import NoTransactionSQL
+
+
+class ChunkedDataMutation(BaseMutation):
+    """A mutation that processes a model's rows in chunks.
+
+    This runs a function over every row in a model's table, one chunk of rows
+    at a time, in primary key order. Each chunk is read and processed in its
+    own transaction, which is committed before the next chunk is read. This
+    allows large data migrations to run as part of an evolution without
+    loading the whole table into memory or holding locks for the duration.
+
+    Rows are read using the primary key of the last row in the previous
+    chunk, rather than through a single long-running cursor, so that no
+    cursor needs to stay open between transactions.
+
+    This doesn't change the schema, so it can be simulated. Like
+    :py:class:`~django_evolution.mutations.SQLMutation`, it can't be optimized
+    alongside other mutations.
+
+    Version Added:
+        3.0
+    """
+
+    simulation_failure_error = (
+        'Cannot run the data mutation "%(tag)s" on the model '
+        '"%(app_label)s.%(model_name)s".'
+    )
+
+    error_vars = dict({
+        'model_name': 'model_name',
+        'tag': 'tag',
+    }, **BaseMutation.error_vars)
+
+    def __init__(self, tag, model_name, chunk_func, chunk_size=1000):
+        """Initialize the mutation.
+
+        Args:
+            tag (unicode):
+                A unique tag identifying this data mutation.
+
+            model_name (unicode):
+                The name of the model whose rows will be processed.
+
+            chunk_func (callable):
+                The function to call for each chunk of rows. This takes a
+                ``cursor`` argument for executing SQL in the chunk's
+                transaction, and a ``rows`` argument containing a list of
+                dictionaries mapping column names to values.
+
+            chunk_size (int, optional):
+                The maximum number of rows in each chunk.
+        """
+        assert chunk_size > 0, 'chunk_size must be greater than 0'
+
+        super(ChunkedDataMutation, self).__init__()
+
+        self.tag = tag
+        self.model_name = model_name
+        self.chunk_func = chunk_func
+        self.chunk_size = chunk_size
+
+    def get_hint_params(self):
+        """Return parameters for the mutation's hinted evolution.
+
+        The chunk function can't be represented in a hinted evolution, so
+        it's left out. The chunk size is included, since it affects the
+        generated SQL.
+
+        Returns:
+            list of unicode:
+            A list of parameter strings to pass to the mutation's constructor
+            in a hinted evolution.
+        """
+        return [
+            self.serialize_value(self.tag),
+            self.serialize_value(self.model_name),
+            self.serialize_attr('chunk_size', self.chunk_size),
+        ]
+
+    def simulate(self, simulation):
+        """Simulate the mutation.
+
+        This will check that the model exists. No changes are made to the
+        signature.
+
+        Args:
+            simulation (Simulation):
+                The state for the simulation.
+
+        Raises:
+            django_evolution.errors.SimulationFailure:
+                The simulation failed. The reason is in the exception's
+                message.
+        """
+        simulation.get_model_sig(self.model_name)
+
+    def mutate(self, mutator):
+        """Schedule the processing of rows on the mutator.
+
+        Args:
+            mutator (django_evolution.mutators.AppMutator):
+                The mutator to perform an operation on.
+        """
+        app_label = mutator.app_label
+        model_sig = (
+            mutator.project_sig
+            .get_app_sig(app_label, required=True)
+            .get_model_sig(self.model_name, required=True)
+        )
+
+        table_name = model_sig.table_name
+        pk_column = model_sig.pk_column
+
+        # The database is looked up from the cursor when executing, rather
+        # than stored here, so that the compiled SQL can be reused for other
+        # databases with the same schema.
+        def _process_rows(cursor):
+            self._process_rows(app_label=app_label,
+                               connection=cursor.db,
+                               table_name=table_name,
+                               pk_column=pk_column)
+
+        mutator.add_sql(self, [
+            NoTransactionSQL([
+                '-- Process rows from %s in chunks of %d for "%s"'
+                % (table_name, self.chunk_size, self.tag),
+                _process_rows,
+            ]),
+        ])
+
+    def is_mutable(self, *args, **kwargs):
+        """Return whether the mutation can be applied to the database.
+
+        Args:
+            *args (tuple, unused):
+                Unused positional arguments.
+
+            **kwargs (tuple, unused):
+                Unused positional arguments.
+
+        Returns:
+            bool:
+            ``True``, always.
+        """
+        return True
+
+    def _process_rows(self, app_label, connection, table_name, pk_column):
+        """Process all rows in the table, one chunk at a time.
+
+        Args:
+            app_label (unicode):
+                The label of the app owning the model.
+
+            connection (django.db.backends.base.base.BaseDatabaseWrapper):
+                The connection for the database being evolved.
+
+            table_name (unicode):
+                The name of the model's table.
+
+            pk_column (unicode):
+                The name of the table's primary key column.
+        """
+        database = connection.alias
+        qn = connection.ops.quote_name
+        chunk_size = self.chunk_size
+
+        select_sql = 'SELECT * FROM %s' % qn(table_name)
+        order_sql = ' ORDER BY %s LIMIT %d' % (qn(pk_column), chunk_size)
+        next_chunk_sql = '%s WHERE %s > %%s%s' % (select_sql, qn(pk_column),
+                                                  order_sql)
+        first_chunk_sql = select_sql + order_sql
+
+        last_pk = None
+        total_row_count = 0
+
+        while True:
+            with atomic(using=database):
+                with connection.cursor() as cursor:
+                    if last_pk is None:
+                        cursor.execute(first_chunk_sql)
+                    else:
+                        cursor.execute(next_chunk_sql, [last_pk])
+
+                    columns = [
+                        column[0]
+                        for column in cursor.description
+                    ]
+                    rows = [
+                        dict(zip(columns, row))
+                        for row in cursor.fetchall()
+                    ]
+
+                    if rows:
+                        self.chunk_func(cursor=cursor,
+                                        rows=rows)
+
+            if not rows:
+                break
+
+            last_pk = rows[-1][pk_column]
+            total_row_count += len(rows)
+
+            processed_data_chunk.send(sender=type(self),
+                                      mutation=self,
+                                      app_label=app_label,
+                                      database=database,
+                                      row_count=len(rows),
+                                      total_row_count=total_row_count)
+
+            if len(rows) < chunk_size:
+                break
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from django.db import models
 
+from django_evolution.conf import django_evolution_settings
 from django_evolution.db.sql_result import SQLResult
 from django_evolution.mutations.base import BaseModelMutation
 
@@ -16,6 +17,10 @@ class DeleteModel(BaseModelMutation):
     """A mutation that deletes a model.
 
     Version Changed:
+        3.0:
+        Tables are set aside to be dropped later if
+        ``settings.DJANGO_EVOLUTION['DEFERRED_TABLE_DROPS']`` is enabled.
+
         2.2:
         Moved into the :py:mod:`django_evolution.mutations.delete_model`
         module.
@@ -60,6 +65,9 @@ class DeleteModel(BaseModelMutation):
         This will instruct the mutator to delete a model. It will be scheduled
         and later executed on the database, if not optimized out.
 
+        If deferred table drops are enabled, the tables will instead be set
+        aside, to be dropped later by ``evolve --drain-drops``.
+
         Args:
             mutator (django_evolution.mutators.ModelMutator):
                 The mutator to perform an operation on.
@@ -69,14 +77,19 @@ class DeleteModel(BaseModelMutation):
         """
         sql_result = SQLResult()
 
+        if django_evolution_settings.DEFERRED_TABLE_DROPS:
+            delete_table = mutator.evolver.defer_delete_table
+        else:
+            delete_table = mutator.evolver.delete_table
+
         # Remove any many-to-many tables.
         for field_sig in mutator.model_sig.field_sigs:
             if issubclass(field_sig.field_type, models.ManyToManyField):
                 field = model._meta.get_field(field_sig.field_name)
                 m2m_table = field._get_m2m_db_table(model._meta)
-                sql_result.add(mutator.evolver.delete_table(m2m_table))
+                sql_result.add(delete_table(m2m_table))
 
         # Remove the table itself.
-        sql_result.add(mutator.evolver.delete_table(model._meta.db_table))
+        sql_result.add(delete_table(model._meta.db_table))
 
         mutator.add_sql(self, sql_result)
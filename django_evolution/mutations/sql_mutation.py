@@ -9,7 +9,7 @@ from __future__ import annotations
 import inspect
 
 from django_evolution.errors import CannotSimulate
-from django_evolution.mutations.base import BaseMutation
+from django_evolution.mutations.base import BaseModelMutation, BaseMutation
 from django_evolution.signature import ProjectSignature
 
 
@@ -26,15 +26,32 @@ class SQLMutation(BaseMutation):
     prior to the SQL statement will be executed without any further
     optimization. This can lead to longer database evolution times.
 
+    The changes the SQL makes to the schema can be declared through
+    ``effects``, as a list of model mutations (such as
+    :py:class:`~django_evolution.mutations.AddField` or
+    :py:class:`~django_evolution.mutations.DeleteModel`). These are only
+    simulated, updating the signature as if they had been applied, and never
+    generate SQL of their own. An empty list declares that the SQL makes no
+    schema changes. This allows the mutation to be simulated without an
+    ``update_func``.
+
+    Version Changed:
+        3.0:
+        Added support for declaring schema changes through ``effects``.
+
     Version Changed:
         2.2:
         Moved into the :py:mod:`django_evolution.mutations.sql_mutation`
         module.
     """
 
-    def __init__(self, tag, sql, update_func=None):
+    def __init__(self, tag, sql, update_func=None, effects=None):
         """Initialize the mutation.
 
+        Version Changed:
+            3.0:
+            Added the ``effects`` argument.
+
         Args:
             tag (unicode):
                 A unique tag identifying this SQL operation.
@@ -44,13 +61,27 @@ class SQLMutation(BaseMutation):
 
             update_func (callable, optional):
                 A function to call to simulate updating the database signature.
-                This is required for :py:meth:`simulate` to work.
+                This is required for :py:meth:`simulate` to work, unless
+                ``effects`` is provided.
+
+            effects (list of django_evolution.mutations.BaseModelMutation,
+                     optional):
+                Model mutations describing the schema changes made by the
+                SQL. These are simulated before any ``update_func``, but
+                never applied to the database. An empty list declares that
+                the SQL makes no schema changes.
         """
+        assert effects is None or all(
+            isinstance(effect, BaseModelMutation)
+            for effect in effects
+        ), 'effects must be a list of model mutations'
+
         super(SQLMutation, self).__init__()
 
         self.tag = tag
         self.sql = sql
         self.update_func = update_func
+        self.effects = effects
 
     def get_hint_params(self):
         """Return parameters for the mutation's hinted evolution.
@@ -65,9 +96,14 @@ class SQLMutation(BaseMutation):
     def simulate(self, simulation):
         """Simulate a mutation for an application.
 
-        This will run the :py:attr:`update_func` provided when instantiating
-        the mutation, passing it ``app_label`` and ``project_sig``. It should
-        then modify the signature to match what the SQL statement would do.
+        This will simulate any :py:attr:`effects`, and then run the
+        :py:attr:`update_func` provided when instantiating the mutation,
+        passing it ``app_label`` and ``project_sig``. It should then modify
+        the signature to match what the SQL statement would do.
+
+        Version Changed:
+            3.0:
+            Added support for :py:attr:`effects`.
 
         Args:
             simulation (Simulation):
@@ -75,12 +111,26 @@ class SQLMutation(BaseMutation):
 
         Raises:
             django_evolution.errors.CannotSimulate:
-                :py:attr:`update_func` was not provided or was not a function.
+                Neither :py:attr:`effects` nor a function for
+                :py:attr:`update_func` were provided.
 
             django_evolution.errors.SimulationFailure:
                 The simulation failed. The reason is in the exception's
-                message. This would be run by :py:attr:`update_func`.
+                message. This would be run by one of the :py:attr:`effects`
+                or by :py:attr:`update_func`.
         """
+        if self.effects is not None:
+            for effect in self.effects:
+                effect.run_simulation(
+                    app_label=simulation.app_label,
+                    legacy_app_label=simulation.legacy_app_label,
+                    project_sig=simulation.project_sig,
+                    database_state=simulation.database_state,
+                    database=simulation.database)
+
+            if self.update_func is None:
+                return
+
         if callable(self.update_func):
             if hasattr(inspect, 'getfullargspec'):
                 # Python 3
@@ -207,6 +207,7 @@ class AppMutator(BaseMutator):
 
         for mutator in self._mutators:
             sql.extend(mutator.to_sql())
+            self.sql_notes += mutator.sql_notes
 
         self.finalize()
 
@@ -264,19 +265,43 @@ class AppMutator(BaseMutator):
 
         Mutations that are not pre-processable will be left in their own
         non-pre-processable batches.
+
+        Version Changed:
+            3.0:
+            Mutations that change the app's upgrade method no longer split
+            a batch of pre-processable mutations. They don't make any changes
+            to the database schema, so they're moved to immediately after the
+            batch they were found in.
         """
         cur_mutation_batch = (True, [])
         mutation_batches = [cur_mutation_batch]
+        upgrade_method_mutations = []
 
         for mutation in mutations:
             can_process = isinstance(mutation, BaseModelMutation)
 
+            if (cur_mutation_batch[0] and
+                isinstance(mutation, BaseUpgradeMethodMutation)):
+                # Hold onto this until the current batch ends, so that
+                # model mutations on either side of it can be optimized
+                # together.
+                upgrade_method_mutations.append(mutation)
+                continue
+
             if can_process != cur_mutation_batch[0]:
+                if upgrade_method_mutations:
+                    mutation_batches.append((False,
+                                             upgrade_method_mutations))
+                    upgrade_method_mutations = []
+
                 cur_mutation_batch = (can_process, [])
                 mutation_batches.append(cur_mutation_batch)
 
             cur_mutation_batch[1].append(mutation)
 
+        if upgrade_method_mutations:
+            mutation_batches.append((False, upgrade_method_mutations))
+
         return mutation_batches
 
     def _process_mutation_batch(self, mutation_batch):
@@ -14,12 +14,22 @@ class BaseMutator(object):
 
     Version Added:
         2.2
+
+    Attributes:
+        sql_notes (list of unicode):
+            Notes from the database backend on how the SQL from
+            :py:meth:`to_sql` will be applied. These are for display only,
+            and are never executed.
+
+            Version Added:
+                3.0
     """
 
     def __init__(self):
         """Initialize the mutator."""
         self.can_simulate = True
         self.finalized = False
+        self.sql_notes = []
 
     def finalize(self):
         """Finalize the mutator.
@@ -82,6 +82,7 @@ class ModelMutator(BaseAppStateMutator):
 
         self.model_name = model_name
         self._ops = []
+        self._cached_model_info = None
 
         evolution_ops = EvolutionOperationsMulti(self.database,
                                                  self.database_state)
@@ -128,6 +129,15 @@ class ModelMutator(BaseAppStateMutator):
         and passing a model instance, but can also be called whenever
         a new instance of the model is needed for any lookups.
 
+        The mock model is cached, and will be returned again on future calls
+        until the project signature changes. Mock models reference the
+        models they relate to, so changes to any other model in the project
+        signature must also result in a new mock model.
+
+        Version Changed:
+            3.0:
+            Mock models are now cached between calls.
+
         Returns:
             django_evolution.mock_models.MockModel:
             The resulting mock model.
@@ -136,11 +146,32 @@ class ModelMutator(BaseAppStateMutator):
             django_evolution.errors.EvolutionBaselineMissingError:
                 The model signature or parent app signature could not be found.
         """
-        return MockModel(project_sig=self.project_sig,
-                         app_name=self.app_label,
-                         model_name=self.model_name,
-                         model_sig=self.model_sig,
-                         db_name=self.database)
+        project_sig = self.project_sig
+        model_sig = self.model_sig
+        project_sig_digest = project_sig.get_digest()
+        cached_model_info = self._cached_model_info
+
+        if cached_model_info is not None:
+            (cached_project_sig, cached_model_sig, cached_digest,
+             cached_model) = cached_model_info
+
+            # The project signature may be swapped out by the parent app
+            # mutator, so make sure we're working with the same signature
+            # objects, and not just equivalent contents.
+            if (cached_project_sig is project_sig and
+                cached_model_sig is model_sig and
+                cached_digest == project_sig_digest):
+                return cached_model
+
+        model = MockModel(project_sig=project_sig,
+                          app_name=self.app_label,
+                          model_name=self.model_name,
+                          model_sig=model_sig,
+                          db_name=self.database)
+        self._cached_model_info = (project_sig, model_sig, project_sig_digest,
+                                   model)
+
+        return model
 
     def add_column(self, mutation, field, initial):
         """Adds a pending Add Column operation.
@@ -335,7 +366,10 @@ class ModelMutator(BaseAppStateMutator):
 
         self.finalize()
 
-        return self.evolver.generate_table_ops_sql(self, self._ops)
+        sql = self.evolver.generate_table_ops_sql(self, self._ops)
+        self.sql_notes += self.evolver.sql_notes
+
+        return sql
 
     def finish_op(self, op):
         """Finishes handling an operation.
@@ -93,3 +93,29 @@ creating_models = Signal()
 #:     model_names (list of unicode):
 #:         The list of models that were created.
 created_models = Signal()
+
+#: Emitted when a chunk of rows has been processed by a data mutation.
+#:
+#: This is sent by
+#: :py:class:`~django_evolution.mutations.ChunkedDataMutation` after each
+#: chunk's transaction has been committed.
+#:
+#: Version Added:
+#:     3.0
+#:
+#: Args:
+#:     mutation (django_evolution.mutations.ChunkedDataMutation):
+#:         The mutation processing the rows.
+#:
+#:     app_label (unicode):
+#:         The label of the app owning the model.
+#:
+#:     database (unicode):
+#:         The name of the database being evolved.
+#:
+#:     row_count (int):
+#:         The number of rows processed in this chunk.
+#:
+#:     total_row_count (int):
+#:         The number of rows processed so far by the mutation.
+processed_data_chunk = Signal()
@@ -129,8 +129,12 @@ Version 2:
 
 from __future__ import annotations
 
+import hashlib
+import json
+import sys
 from copy import deepcopy
 from importlib import import_module
+from types import MappingProxyType
 
 from django.conf import global_settings
 from django.core.exceptions import ImproperlyConfigured
@@ -165,8 +169,82 @@ from django_evolution.utils.migrations import MigrationList
 LATEST_SIGNATURE_VERSION = 2
 
 
+#: A shared, empty dictionary used for read-only access to unset attributes.
+#:
+#: This must never be modified.
+#:
+#: Version Added:
+#:     3.0
+_EMPTY_ATTRS = {}
+
+
+def _intern(value):
+    """Return an interned version of a string.
+
+    Signatures for large projects contain many copies of the same names
+    (field names, table names, model paths). Interning these ensures that
+    only one copy is kept in memory, and speeds up comparisons.
+
+    Version Added:
+        3.0
+
+    Args:
+        value (object):
+            The value to intern. Values that aren't strings are returned
+            as-is.
+
+    Returns:
+        object:
+        The interned string, or the original value.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+
+    return value
+
+
+def _make_digest(data):
+    """Return a digest for signature data.
+
+    Version Added:
+        3.0
+
+    Args:
+        data (object):
+            The data to generate a digest for. This must be serializable to
+            JSON, or have a stable :py:func:`repr`.
+
+    Returns:
+        str:
+        The resulting digest.
+    """
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=repr).encode('utf-8')
+    ).hexdigest()
+
+
 class BaseSignature(object):
-    """Base class for a signature."""
+    """Base class for a signature.
+
+    Signatures can compute a digest of their contents, which is cached until
+    the signature (or any signature it contains) is modified. Signatures with
+    equal digests are guaranteed to be equal, which allows diffing and
+    comparison to skip over unchanged parts of a signature tree.
+
+    Setting any public attribute on a signature, or adding or removing a
+    child signature, will invalidate the digest for the signature and all of
+    its parents. Code modifying a mutable value on a signature in place
+    (other than :py:attr:`FieldSignature.field_attrs`) must call
+    :py:meth:`invalidate_digest`.
+
+    Version Changed:
+        3.0:
+        * Subclasses representing models, fields, indexes, and constraints
+          now use ``__slots__``, and cannot have arbitrary attributes set.
+        * Added :py:meth:`get_digest` and :py:meth:`invalidate_digest`.
+    """
+
+    __slots__ = ('_digest', '_parent_sig')
 
     @classmethod
     def deserialize(self, sig_dict, sig_version, database=DEFAULT_DB_ALIAS):
@@ -234,6 +312,146 @@ class BaseSignature(object):
         """
         raise NotImplementedError
 
+    def __init__(self):
+        """Initialize the signature."""
+        self._digest = None
+        self._parent_sig = None
+
+    def get_digest(self):
+        """Return a digest of the contents of the signature.
+
+        The digest is computed the first time it's needed, and then cached
+        until the signature is modified.
+
+        Version Added:
+            3.0
+
+        Returns:
+            str:
+            The digest of the signature.
+        """
+        digest = self._digest
+
+        if digest is None:
+            digest = self._compute_digest()
+            self._digest = digest
+
+        return digest
+
+    def invalidate_digest(self):
+        """Invalidate the cached digest for this signature and its parents.
+
+        This is called automatically when setting attributes or adding or
+        removing child signatures.
+
+        Version Added:
+            3.0
+        """
+        sig = self
+
+        while sig is not None:
+            sig._digest = None
+
+            # This may be called while the signature is still being
+            # constructed or copied, before the parent is set.
+            sig = getattr(sig, '_parent_sig', None)
+
+    def _compute_digest(self):
+        """Compute a new digest for the signature.
+
+        This must be implemented by subclasses.
+
+        Version Added:
+            3.0
+
+        Returns:
+            str:
+            The digest of the signature.
+        """
+        raise NotImplementedError
+
+    def _adopt_sig(self, sig):
+        """Set this signature as the parent of a child signature.
+
+        Version Added:
+            3.0
+
+        Args:
+            sig (BaseSignature):
+                The child signature.
+        """
+        sig._parent_sig = self
+        self.invalidate_digest()
+
+    def _orphan_sig(self, sig):
+        """Remove this signature as the parent of a child signature.
+
+        Version Added:
+            3.0
+
+        Args:
+            sig (BaseSignature):
+                The child signature.
+        """
+        if sig._parent_sig is self:
+            sig._parent_sig = None
+
+        self.invalidate_digest()
+
+    def _adopt_sigs(self, old_sigs, new_sigs):
+        """Replace a list of child signatures with a new list.
+
+        Any signatures in the old list that aren't in the new list will be
+        orphaned, and all signatures in the new list will be adopted.
+
+        Version Added:
+            3.0
+
+        Args:
+            old_sigs (list of BaseSignature):
+                The list of child signatures being replaced.
+
+            new_sigs (list of BaseSignature):
+                The new child signatures.
+
+        Returns:
+            list of BaseSignature:
+            The new list of child signatures to store.
+        """
+        new_sigs = list(new_sigs)
+        new_sig_ids = set(id(sig) for sig in new_sigs)
+
+        for sig in old_sigs:
+            if id(sig) not in new_sig_ids:
+                self._orphan_sig(sig)
+
+        for sig in new_sigs:
+            self._adopt_sig(sig)
+
+        self.invalidate_digest()
+
+        return new_sigs
+
+    def __setattr__(self, name, value):
+        """Set an attribute on the signature.
+
+        Setting any public attribute will invalidate the cached digest.
+
+        Version Added:
+            3.0
+
+        Args:
+            name (str):
+                The name of the attribute.
+
+            value (object):
+                The new value.
+        """
+        object.__setattr__(self, name, value)
+
+        if not name.startswith('_'):
+            self.invalidate_digest()
+
     def __eq__(self, other):
         """Return whether two signatures are equal.
 
@@ -349,6 +567,8 @@ class ProjectSignature(BaseSignature):
 
     def __init__(self):
         """Initialize the signature."""
+        super(ProjectSignature, self).__init__()
+
         self._app_sigs = OrderedDict()
 
     @property
@@ -379,6 +599,7 @@ class ProjectSignature(BaseSignature):
                 The application signature to add.
         """
         self._app_sigs[app_sig.app_id] = app_sig
+        self._adopt_sig(app_sig)
 
     def remove_app_sig(self, app_id):
         """Remove an application signature from the project signature.
@@ -393,12 +614,14 @@ class ProjectSignature(BaseSignature):
                 signature.
         """
         try:
-            del self._app_sigs[app_id]
+            app_sig = self._app_sigs.pop(app_id)
         except KeyError:
             raise MissingSignatureError(
                 _('An application signature for "%s" could not be found.')
                 % app_id)
 
+        self._orphan_sig(app_sig)
+
     def get_app_sig(self, app_id, required=False):
         """Return an application signature with the given ID.
 
@@ -483,6 +706,10 @@ class ProjectSignature(BaseSignature):
             new_app_sig = self.get_app_sig(old_app_sig.app_id)
 
             if new_app_sig:
+                if new_app_sig.get_digest() == old_app_sig.get_digest():
+                    # The application is unchanged.
+                    continue
+
                 app_changes = new_app_sig.diff(old_app_sig)
 
                 if app_changes:
@@ -563,7 +790,8 @@ class ProjectSignature(BaseSignature):
             are not.
         """
         return (other is not None and
-                dict.__eq__(self._app_sigs, other._app_sigs))
+                (_has_same_cached_digest(self, other) or
+                 dict.__eq__(self._app_sigs, other._app_sigs)))
 
     def __repr__(self):
         """Return a string representation of the signature.
@@ -575,6 +803,21 @@ class ProjectSignature(BaseSignature):
         return ('<ProjectSignature(apps=%r)>'
                 % list(self._app_sigs.keys()))
 
+    def _compute_digest(self):
+        """Compute a new digest for the signature.
+
+        Version Added:
+            3.0
+
+        Returns:
+            str:
+            The digest of the signature.
+        """
+        return _make_digest(sorted(
+            (app_id, app_sig.get_digest())
+            for app_id, app_sig in self._app_sigs.items()
+        ))
+
 
 class AppSignature(BaseSignature):
     """Signature information for an application.
@@ -717,6 +960,8 @@ class AppSignature(BaseSignature):
             applied_migrations (set of unicode, optional):
                 The migration names that are applied as of this signature.
         """
+        super(AppSignature, self).__init__()
+
         self.app_id = app_id
         self.legacy_app_label = legacy_app_label or app_id
         self.upgrade_method = upgrade_method
@@ -794,6 +1039,7 @@ class AppSignature(BaseSignature):
                 The model signature to add.
         """
         self._model_sigs[model_sig.model_name] = model_sig
+        self._adopt_sig(model_sig)
 
     def remove_model_sig(self, model_name):
         """Remove a model signature from the application signature.
@@ -807,15 +1053,21 @@ class AppSignature(BaseSignature):
                 The model name does not represent a known model signature.
         """
         try:
-            del self._model_sigs[model_name]
+            model_sig = self._model_sigs.pop(model_name)
         except KeyError:
             raise MissingSignatureError(
                 _('A model signature for "%s" could not be found.')
                 % model_name)
 
+        self._orphan_sig(model_sig)
+
     def clear_model_sigs(self):
         """Clear all model signatures from the application signature."""
+        for model_sig in self._model_sigs.values():
+            self._orphan_sig(model_sig)
+
         self._model_sigs.clear()
+        self.invalidate_digest()
 
     def get_model_sig(self, model_name, required=False):
         """Return a model signature for the given model name.
@@ -898,6 +1150,10 @@ class AppSignature(BaseSignature):
             new_model_sig = self.get_model_sig(model_name)
 
             if new_model_sig:
+                if new_model_sig.get_digest() == old_model_sig.get_digest():
+                    # The model is unchanged.
+                    continue
+
                 model_changes = new_model_sig.diff(old_model_sig)
 
                 if model_changes:
@@ -983,7 +1239,7 @@ class AppSignature(BaseSignature):
             app_id=self.app_id,
             legacy_app_label=self.legacy_app_label,
             upgrade_method=self.upgrade_method,
-            applied_migrations=deepcopy(self.applied_migrations))
+            applied_migrations=deepcopy(self._applied_migrations))
 
         for model_sig in self.model_sigs:
             cloned_sig.add_model_sig(model_sig.clone())
@@ -1018,7 +1274,7 @@ class AppSignature(BaseSignature):
 
                 if self.upgrade_method == UpgradeMethod.MIGRATIONS:
                     app_sig_dict['applied_migrations'] = \
-                        sorted(self.applied_migrations or [])
+                        sorted(self._applied_migrations or [])
 
             # Add an ordered dictionary of models to the signature.
             model_sigs_dict = OrderedDict()
@@ -1044,11 +1300,12 @@ class AppSignature(BaseSignature):
             they are not.
         """
         return (other is not None and
-                self.app_id == other.app_id and
-                self.legacy_app_label == other.legacy_app_label and
-                self.upgrade_method == other.upgrade_method and
-                self.applied_migrations == other.applied_migrations and
-                dict.__eq__(self._model_sigs, other._model_sigs))
+                (_has_same_cached_digest(self, other) or
+                 (self.app_id == other.app_id and
+                  self.legacy_app_label == other.legacy_app_label and
+                  self.upgrade_method == other.upgrade_method and
+                  self._applied_migrations == other._applied_migrations and
+                  dict.__eq__(self._model_sigs, other._model_sigs))))
 
     def __repr__(self):
         """Return a string representation of the signature.
@@ -1062,6 +1319,32 @@ class AppSignature(BaseSignature):
                 % (self.app_id, self.legacy_app_label, self.upgrade_method,
                    list(self._model_sigs.keys())))
 
+    def _compute_digest(self):
+        """Compute a new digest for the signature.
+
+        Version Added:
+            3.0
+
+        Returns:
+            str:
+            The digest of the signature.
+        """
+        applied_migrations = self._applied_migrations
+
+        if applied_migrations is not None:
+            applied_migrations = sorted(applied_migrations)
+
+        return _make_digest([
+            self.app_id,
+            self.legacy_app_label,
+            self.upgrade_method,
+            applied_migrations,
+            sorted(
+                (model_name, model_sig.get_digest())
+                for model_name, model_sig in self._model_sigs.items()
+            ),
+        ])
+
 
 class ModelSignature(BaseSignature):
     """Signature information for a model.
@@ -1070,6 +1353,20 @@ class ModelSignature(BaseSignature):
     its fields and ``_meta`` attributes.
     """
 
+    __slots__ = (
+        '_constraint_sigs',
+        '_field_sigs',
+        '_index_sigs',
+        '_index_together',
+        '_unique_together',
+        '_unique_together_applied',
+        'db_table_comment',
+        'db_tablespace',
+        'model_name',
+        'pk_column',
+        'table_name',
+    )
+
     @classmethod
     def from_model(cls, model):
         """Create a model signature from a model.
@@ -1221,15 +1518,19 @@ class ModelSignature(BaseSignature):
                 Version Added:
                     2.3
         """
-        self.model_name = model_name
-        self.db_table_comment = db_table_comment
-        self.db_tablespace = db_tablespace
-        self.table_name = table_name
-        self.pk_column = pk_column
+        super(ModelSignature, self).__init__()
 
-        self.constraint_sigs = []
-        self.index_sigs = []
-        self._field_sigs = OrderedDict()
+        self.model_name = _intern(model_name)
+        self.db_table_comment = db_table_comment
+        self.db_tablespace = _intern(db_tablespace)
+        self.table_name = _intern(table_name)
+        self.pk_column = _intern(pk_column)
+
+        self._constraint_sigs = []
+        self._index_sigs = []
+        # Dictionaries preserve insertion order, and are considerably
+        # smaller than OrderedDict for large numbers of models.
+        self._field_sigs = {}
         self._index_together = []
         self._unique_together = []
         self._unique_together_applied = unique_together_applied
@@ -1238,6 +1539,56 @@ class ModelSignature(BaseSignature):
         self.index_together = index_together
         self.unique_together = unique_together
 
+    @property
+    def constraint_sigs(self):
+        """The explicit constraint signatures on the model signature.
+
+        Version Changed:
+            3.0:
+            Setting this now takes ownership of the constraint signatures,
+            so that later changes to them invalidate this signature's
+            digest.
+
+        Type:
+            list of ConstraintSignature
+        """
+        return self._constraint_sigs
+
+    @constraint_sigs.setter
+    def constraint_sigs(self, new_value):
+        """Set the explicit constraint signatures on the model signature.
+
+        Args:
+            new_value (list of ConstraintSignature):
+                The new list of constraint signatures.
+        """
+        self._constraint_sigs = self._adopt_sigs(self._constraint_sigs,
+                                                 new_value)
+
+    @property
+    def index_sigs(self):
+        """The explicit index signatures on the model signature.
+
+        Version Changed:
+            3.0:
+            Setting this now takes ownership of the index signatures, so
+            that later changes to them invalidate this signature's digest.
+
+        Type:
+            list of IndexSignature
+        """
+        return self._index_sigs
+
+    @index_sigs.setter
+    def index_sigs(self, new_value):
+        """Set the explicit index signatures on the model signature.
+
+        Args:
+            new_value (list of IndexSignature):
+                The new list of index signatures.
+        """
+        self._index_sigs = self._adopt_sigs(self._index_sigs, new_value)
+
     @property
     def index_together(self):
         """A list of fields that are indexed together.
@@ -1307,6 +1658,7 @@ class ModelSignature(BaseSignature):
                 The field signature to add.
         """
         self._field_sigs[field_sig.field_name] = field_sig
+        self._adopt_sig(field_sig)
 
     def remove_field_sig(self, field_name):
         """Remove a field signature from the model signature.
@@ -1320,12 +1672,14 @@ class ModelSignature(BaseSignature):
                 The field name does not represent a known field signature.
         """
         try:
-            del self._field_sigs[field_name]
+            field_sig = self._field_sigs.pop(field_name)
         except KeyError:
             raise MissingSignatureError(
                 _('A field signature for "%s" could not be found.')
                 % field_name)
 
+        self._orphan_sig(field_sig)
+
     def get_field_sig(self, field_name, required=False):
         """Return a field signature for the given field name.
 
@@ -1383,6 +1737,7 @@ class ModelSignature(BaseSignature):
                 The constraint signature to add.
         """
         self.constraint_sigs.append(constraint_sig)
+        self._adopt_sig(constraint_sig)
 
     def add_index(self, index):
         """Add an explicit index to the models.
@@ -1409,6 +1764,7 @@ class ModelSignature(BaseSignature):
                 The index signature to add.
         """
         self.index_sigs.append(index_sig)
+        self._adopt_sig(index_sig)
 
     def apply_unique_together(self, unique_together):
         """Record an applied unique_together change to the model.
@@ -1429,6 +1785,7 @@ class ModelSignature(BaseSignature):
         """
         self.unique_together = unique_together
         self._unique_together_applied = True
+        self.invalidate_digest()
 
     def has_unique_together_changed(self, old_model_sig):
         """Return whether unique_together has changed between signatures.
@@ -1504,6 +1861,10 @@ class ModelSignature(BaseSignature):
             raise TypeError('Must provide a ModelSignature to diff against, '
                             'not a %s.' % type(old_model_sig))
 
+        if self.get_digest() == old_model_sig.get_digest():
+            # Nothing has changed.
+            return OrderedDict()
+
         # Go through all the fields, looking for changed and deleted fields.
         changed_fields = OrderedDict()
         deleted_fields = []
@@ -1642,16 +2003,17 @@ class ModelSignature(BaseSignature):
             are not.
         """
         return (other is not None and
-                self.table_name == other.table_name and
-                self.db_table_comment == other.db_table_comment and
-                self.db_tablespace == other.db_tablespace and
-                set(self.constraint_sigs) == set(other.constraint_sigs) and
-                set(self.index_sigs) == set(other.index_sigs) and
-                set(self.index_together) == set(other.index_together) and
-                self.model_name == other.model_name and
-                self.pk_column == other.pk_column and
-                dict.__eq__(self._field_sigs, other._field_sigs) and
-                not self.has_unique_together_changed(other))
+                (_has_same_cached_digest(self, other) or
+                 (self.table_name == other.table_name and
+                  self.db_table_comment == other.db_table_comment and
+                  self.db_tablespace == other.db_tablespace and
+                  set(self.constraint_sigs) == set(other.constraint_sigs) and
+                  set(self.index_sigs) == set(other.index_sigs) and
+                  set(self.index_together) == set(other.index_together) and
+                  self.model_name == other.model_name and
+                  self.pk_column == other.pk_column and
+                  dict.__eq__(self._field_sigs, other._field_sigs) and
+                  not self.has_unique_together_changed(other))))
 
     def __repr__(self):
         """Return a string representation of the signature.
@@ -1662,6 +2024,39 @@ class ModelSignature(BaseSignature):
         """
         return '<ModelSignature(model_name=%r)>' % self.model_name
 
+    def _compute_digest(self):
+        """Compute a new digest for the signature.
+
+        Version Added:
+            3.0
+
+        Returns:
+            str:
+            The digest of the signature.
+        """
+        return _make_digest([
+            self.model_name,
+            self.table_name,
+            self.db_table_comment,
+            self.db_tablespace,
+            self.pk_column,
+            self._index_together,
+            self._unique_together,
+            self._unique_together_applied,
+            [
+                constraint_sig.get_digest()
+                for constraint_sig in self.constraint_sigs
+            ],
+            [
+                index_sig.get_digest()
+                for index_sig in self.index_sigs
+            ],
+            sorted(
+                (field_name, field_sig.get_digest())
+                for field_name, field_sig in self._field_sigs.items()
+            ),
+        ])
+
     def _normalize_together(self, together):
         """Normalize a <field>_together value.
 
@@ -1685,7 +2080,7 @@ class ModelSignature(BaseSignature):
 
         return [
             tuple(
-                str(value)
+                sys.intern(str(value))
                 for value in item
             )
             for item in together
@@ -1704,6 +2099,8 @@ class ConstraintSignature(BaseSignature):
     constructing the constraint.
     """
 
+    __slots__ = ('attrs', 'name', 'type')
+
     @classmethod
     def from_constraint(cls, constraint):
         """Create a constraint signature from a field.
@@ -1842,9 +2239,11 @@ class ConstraintSignature(BaseSignature):
                     key == 'check'):
                     key = 'condition'
 
-                norm_attrs[key] = value
+                norm_attrs[sys.intern(key)] = value
+
+        super(ConstraintSignature, self).__init__()
 
-        self.name = name
+        self.name = _intern(name)
         self.type = constraint_type
         self.attrs = norm_attrs
 
@@ -1941,6 +2340,18 @@ class ConstraintSignature(BaseSignature):
         return ('<ConstraintSignature(name=%r, type=%r, attrs=%r)>'
                 % (self.name, self.type, self.attrs))
 
+    def _compute_digest(self):
+        """Compute a new digest for the signature.
+
+        Version Added:
+            3.0
+
+        Returns:
+            str:
+            The digest of the signature.
+        """
+        return _make_digest(self.serialize())
+
     def _serialize_attr_value(self, value):
         """Return a serialized version of a constraint attribute value.
 
@@ -1995,6 +2406,8 @@ class IndexSignature(BaseSignature):
         Added a new :py:attr:`expressions` attribute for Django 3.2+.
     """
 
+    __slots__ = ('attrs', 'expressions', 'fields', 'name')
+
     @classmethod
     def from_index(cls, index):
         """Create an index signature from an index.
@@ -2068,9 +2481,11 @@ class IndexSignature(BaseSignature):
             attrs (dict, optional):
                 Additional attributes to pass when constructing the index.
         """
+        super(IndexSignature, self).__init__()
+
         self.expressions = expressions
         self.fields = fields
-        self.name = name
+        self.name = _intern(name)
 
         norm_attrs = {}
 
@@ -2084,7 +2499,7 @@ class IndexSignature(BaseSignature):
                 if isinstance(value, tuple):
                     value = list(value)
 
-                norm_attrs[key] = value
+                norm_attrs[sys.intern(key)] = value
 
         self.attrs = norm_attrs
 
@@ -2179,6 +2594,129 @@ class IndexSignature(BaseSignature):
             % (self.name, self.fields, self.expressions, self.attrs)
         )
 
+    def _compute_digest(self):
+        """Compute a new digest for the signature.
+
+        Version Added:
+            3.0
+
+        Returns:
+            str:
+            The digest of the signature.
+        """
+        return _make_digest(self.serialize())
+
+
+class _FieldAttrs(OrderedDict):
+    """Attributes for a field signature.
+
+    This invalidates the owning field signature's digest whenever the
+    attributes are modified in place. Reading attributes has no effect on
+    the digest.
+
+    Copies of this are plain :py:class:`~collections.OrderedDict` instances,
+    and are not tied to the field signature.
+
+    Version Added:
+        3.0
+    """
+
+    __slots__ = ('_field_sig',)
+
+    def __init__(self, field_sig, *args, **kwargs):
+        """Initialize the attributes.
+
+        Args:
+            field_sig (FieldSignature):
+                The field signature owning these attributes.
+
+            *args (tuple):
+                Positional arguments for the dictionary.
+
+            **kwargs (dict):
+                Keyword arguments for the dictionary.
+        """
+        self._field_sig = None
+
+        super(_FieldAttrs, self).__init__(*args, **kwargs)
+
+        self._field_sig = field_sig
+
+    def _invalidate(self):
+        """Invalidate the owning field signature's digest."""
+        field_sig = self._field_sig
+
+        if field_sig is not None:
+            field_sig.invalidate_digest()
+
+    def __setitem__(self, key, value):
+        """Set an attribute, invalidating the digest."""
+        super(_FieldAttrs, self).__setitem__(key, value)
+        self._invalidate()
+
+    def __delitem__(self, key):
+        """Delete an attribute, invalidating the digest."""
+        super(_FieldAttrs, self).__delitem__(key)
+        self._invalidate()
+
+    def __ior__(self, other):
+        """Update attributes in place, invalidating the digest."""
+        self.update(other)
+
+        return self
+
+    def clear(self):
+        """Clear all attributes, invalidating the digest."""
+        super(_FieldAttrs, self).clear()
+        self._invalidate()
+
+    def pop(self, *args):
+        """Pop an attribute, invalidating the digest."""
+        try:
+            return super(_FieldAttrs, self).pop(*args)
+        finally:
+            self._invalidate()
+
+    def popitem(self, *args, **kwargs):
+        """Pop an attribute pair, invalidating the digest."""
+        try:
+            return super(_FieldAttrs, self).popitem(*args, **kwargs)
+        finally:
+            self._invalidate()
+
+    def setdefault(self, key, default=None):
+        """Set a default for an attribute, invalidating the digest."""
+        try:
+            return super(_FieldAttrs, self).setdefault(key, default)
+        finally:
+            self._invalidate()
+
+    def update(self, *args, **kwargs):
+        """Update attributes, invalidating the digest."""
+        # OrderedDict.update() doesn't consistently go through
+        # __setitem__, so invalidate explicitly.
+        super(_FieldAttrs, self).update(*args, **kwargs)
+        self._invalidate()
+
+    def copy(self):
+        """Return a plain copy of the attributes."""
+        return OrderedDict(self)
+
+    def __copy__(self):
+        """Return a plain copy of the attributes."""
+        return OrderedDict(self)
+
+    def __deepcopy__(self, memo):
+        """Return a plain deep copy of the attributes."""
+        return OrderedDict(
+            (deepcopy(key, memo), deepcopy(value, memo))
+            for key, value in self.items()
+        )
+
+    def __reduce__(self):
+        """Pickle the attributes as a plain dictionary."""
+        return (OrderedDict, (list(self.items()),))
+
 
 class FieldSignature(BaseSignature):
     """Signature information for a field.
@@ -2186,8 +2724,15 @@ class FieldSignature(BaseSignature):
     Field signatures store information on a field on model, including the
     field name, type, and any attribute values needed for migrating the
     schema.
+
+    Version Changed:
+        3.0:
+        Storage for :py:attr:`field_attrs` is now only allocated when
+        attributes are set or when the attribute is accessed directly.
     """
 
+    __slots__ = ('_field_attrs', 'field_name', 'field_type', 'related_model')
+
     _ATTRIBUTE_DEFAULTS = {
         '*': {
             'primary_key': False,
@@ -2226,6 +2771,18 @@ class FieldSignature(BaseSignature):
         'rel': 'remote_field',
     }
 
+    #: A cache of field types to merged attribute defaults.
+    #:
+    #: Version Added:
+    #:     3.0
+    _field_type_defaults_cache = {}
+
+    #: A cache of serialized field type paths to field classes.
+    #:
+    #: Version Added:
+    #:     3.0
+    _field_types_cache = {}
+
     @classmethod
     def from_field(cls, field):
         """Create a field signature from a field.
@@ -2304,28 +2861,8 @@ class FieldSignature(BaseSignature):
         if sig_version == 2:
             field_sig_attrs = field_sig_dict.get('attrs', {})
 
-            field_type = field_sig_dict['type']
-            renamed_types = django_evolution_settings.RENAMED_FIELD_TYPES
-
-            if field_type in renamed_types:
-                field_type = renamed_types[field_type]
-
-            # Load the class for the referenced field type.
-            field_type_module, field_type_name = field_type.rsplit('.', 1)
-
-            # If we have a field path in the signature that lives in
-            # django.db.models.fields, update it to look in django.db.models
-            # instead. This is for compatibility across all Django versions.
-            if field_type_module.startswith('django.db.models.fields'):
-                field_type_module = 'django.db.models'
-
-            try:
-                field_type = getattr(import_module(field_type_module),
-                                     field_type_name)
-            except (AttributeError, ImportError):
-                raise ImportError('Unable to locate field type %s'
-                                  % '%s.%s' % (field_type_module,
-                                               field_type_name))
+            field_type = cls._get_field_type_for_path(
+                field_sig_dict['type'])
         elif sig_version == 1:
             field_sig_attrs = field_sig_dict
             field_type = field_sig_dict['field_type']
@@ -2355,6 +2892,77 @@ class FieldSignature(BaseSignature):
                    field_attrs=field_attrs,
                    related_model=field_sig_dict.get('related_model'))
 
+    @classmethod
+    def clear_caches(cls):
+        """Clear the cached field type information.
+
+        This will clear the cached attribute defaults and resolved field
+        types. It's called automatically when
+        ``settings.DJANGO_EVOLUTION`` changes, in case
+        ``RENAMED_FIELD_TYPES`` has been modified.
+
+        Version Added:
+            3.0
+        """
+        cls._field_type_defaults_cache.clear()
+        cls._field_types_cache.clear()
+
+    @classmethod
+    def _get_field_type_for_path(cls, field_type_path):
+        """Return the field class for a serialized field type path.
+
+        This will take into account any renamed field types listed in
+        ``settings.DJANGO_EVOLUTION['RENAMED_FIELD_TYPES']``. Results are
+        cached for future lookups.
+
+        Version Added:
+            3.0
+
+        Args:
+            field_type_path (unicode):
+                The full class path to the field type, as stored in a
+                signature.
+
+        Returns:
+            type:
+            The class for the field type.
+
+        Raises:
+            ImportError:
+                The field type could not be found.
+        """
+        try:
+            return cls._field_types_cache[field_type_path]
+        except KeyError:
+            pass
+
+        field_type = field_type_path
+        renamed_types = django_evolution_settings.RENAMED_FIELD_TYPES
+
+        if field_type in renamed_types:
+            field_type = renamed_types[field_type]
+
+        # Load the class for the referenced field type.
+        field_type_module, field_type_name = field_type.rsplit('.', 1)
+
+        # If we have a field path in the signature that lives in
+        # django.db.models.fields, update it to look in django.db.models
+        # instead. This is for compatibility across all Django versions.
+        if field_type_module.startswith('django.db.models.fields'):
+            field_type_module = 'django.db.models'
+
+        try:
+            field_type = getattr(import_module(field_type_module),
+                                 field_type_name)
+        except (AttributeError, ImportError):
+            raise ImportError('Unable to locate field type %s'
+                              % '%s.%s' % (field_type_module,
+                                           field_type_name))
+
+        cls._field_types_cache[field_type_path] = field_type
+
+        return field_type
+
     @classmethod
     def _iter_attrs_for_field_type(cls, field_type):
         """Iterate through attribute names for a field type.
@@ -2380,6 +2988,13 @@ class FieldSignature(BaseSignature):
         The attributes returned are those that impact the schema for a field's
         column.
 
+        The resulting dictionary is cached and shared between callers, and
+        must not be modified.
+
+        Version Changed:
+            3.0:
+            Results are now cached per field type.
+
         Args:
             field_type (type):
                 The class for the field. This would be a subclass of
@@ -2389,8 +3004,14 @@ class FieldSignature(BaseSignature):
             dict:
             The dictionary of attribute names and values.
         """
+        try:
+            return cls._field_type_defaults_cache[field_type]
+        except KeyError:
+            pass
+
         defaults = cls._ATTRIBUTE_DEFAULTS['*'].copy()
         defaults.update(cls._ATTRIBUTE_DEFAULTS.get(field_type, {}))
+        cls._field_type_defaults_cache[field_type] = defaults
 
         return defaults
 
@@ -2412,10 +3033,62 @@ class FieldSignature(BaseSignature):
             related_model (unicode, optional):
                 The full path to a related model.
         """
-        self.field_name = field_name
+        super(FieldSignature, self).__init__()
+
+        self.field_name = _intern(field_name)
         self.field_type = field_type
-        self.field_attrs = field_attrs or OrderedDict()
-        self.related_model = related_model
+        self.related_model = _intern(related_model)
+
+        # Many fields have no custom attributes, so we avoid allocating
+        # storage until it's needed.
+        if field_attrs:
+            self._field_attrs = _FieldAttrs(self, field_attrs)
+        else:
+            self._field_attrs = None
+
+    @property
+    def field_attrs(self):
+        """Attributes set on the field.
+
+        This can be modified in place by callers. Doing so will invalidate
+        the signature's digest.
+
+        Type:
+            dict
+        """
+        field_attrs = self._field_attrs
+
+        if field_attrs is None:
+            field_attrs = _FieldAttrs(self)
+            self._field_attrs = field_attrs
+
+        return field_attrs
+
+    @field_attrs.setter
+    def field_attrs(self, value):
+        """Set the attributes on the field.
+
+        Args:
+            value (dict):
+                The new attributes.
+        """
+        self._field_attrs = _FieldAttrs(self, value or {})
+        self.invalidate_digest()
+
+    @property
+    def readonly_field_attrs(self):
+        """A read-only view of the attributes set on the field.
+
+        Unlike :py:attr:`field_attrs`, accessing this will not allocate
+        storage for the attributes if they're unset.
+
+        Version Added:
+            3.0
+
+        Type:
+            types.MappingProxyType
+        """
+        return MappingProxyType(self._field_attrs or _EMPTY_ATTRS)
 
     def get_attr_value(self, attr_name, use_default=True):
         """Return the value for an attribute.
@@ -2436,7 +3109,7 @@ class FieldSignature(BaseSignature):
             The value for the attribute.
         """
         try:
-            return self.field_attrs[attr_name]
+            return (self._field_attrs or _EMPTY_ATTRS)[attr_name]
         except KeyError:
             if use_default:
                 return self.get_attr_default(attr_name)
@@ -2454,14 +3127,10 @@ class FieldSignature(BaseSignature):
             object:
             The default value for the attribute, or ``None``.
         """
-        for defaults in (self._ATTRIBUTE_DEFAULTS.get(self.field_type, {}),
-                         self._ATTRIBUTE_DEFAULTS['*']):
-            try:
-                return defaults[attr_name]
-            except KeyError:
-                continue
-
-        return None
+        return (
+            self._get_defaults_for_field_type(self.field_type)
+            .get(attr_name)
+        )
 
     def is_attr_value_default(self, attr_name):
         """Return whether an attribute is set to its default value.
@@ -2476,7 +3145,7 @@ class FieldSignature(BaseSignature):
             ``False`` if it has a custom value.
         """
         try:
-            attr_value = self.field_attrs[attr_name]
+            attr_value = (self._field_attrs or _EMPTY_ATTRS)[attr_name]
         except KeyError:
             return True
 
@@ -2505,10 +3174,12 @@ class FieldSignature(BaseSignature):
             raise TypeError('Must provide a FieldSignature to diff against, '
                             'not a %s.' % type(old_field_sig))
 
+        old_field_attrs = old_field_sig._field_attrs or _EMPTY_ATTRS
+        new_field_attrs = self._field_attrs or _EMPTY_ATTRS
+
         changed_attrs = [
             attr
-            for attr in (set(old_field_sig.field_attrs) |
-                         set(self.field_attrs))
+            for attr in set(old_field_attrs) | set(new_field_attrs)
             if self.get_attr_value(attr) != old_field_sig.get_attr_value(attr)
         ]
 
@@ -2518,8 +3189,8 @@ class FieldSignature(BaseSignature):
 
         if old_field_type is not new_field_type:
             try:
-                old_field = old_field_type(**old_field_sig.field_attrs)
-                new_field = new_field_type(**self.field_attrs)
+                old_field = old_field_type(**old_field_attrs)
+                new_field = new_field_type(**new_field_attrs)
 
                 field_type_changed = (old_field.get_internal_type() !=
                                       new_field.get_internal_type())
@@ -2547,7 +3218,7 @@ class FieldSignature(BaseSignature):
         """
         return FieldSignature(field_name=self.field_name,
                               field_type=self.field_type,
-                              field_attrs=deepcopy(self.field_attrs),
+                              field_attrs=deepcopy(self._field_attrs),
                               related_model=self.related_model)
 
     def serialize(self, sig_version=LATEST_SIGNATURE_VERSION):
@@ -2582,11 +3253,13 @@ class FieldSignature(BaseSignature):
             field_sig_dict['type'] = '%s.%s' % (field_module,
                                                 self.field_type.__name__)
 
-            if self.field_attrs:
-                field_sig_dict['attrs'] = deepcopy(self.field_attrs)
+            if self._field_attrs:
+                field_sig_dict['attrs'] = deepcopy(self._field_attrs)
         elif sig_version == 1:
             field_sig_dict['field_type'] = self.field_type
-            field_sig_dict.update(self.field_attrs)
+
+            if self._field_attrs:
+                field_sig_dict.update(self._field_attrs)
 
         if self.related_model:
             field_sig_dict['related_model'] = self.related_model
@@ -2606,10 +3279,12 @@ class FieldSignature(BaseSignature):
             are not.
         """
         return (other is not None and
-                self.field_name == other.field_name and
-                self.field_type is other.field_type and
-                dict.__eq__(self.field_attrs, other.field_attrs) and
-                self.related_model == other.related_model)
+                (_has_same_cached_digest(self, other) or
+                 (self.field_name == other.field_name and
+                  self.field_type is other.field_type and
+                  dict.__eq__(self._field_attrs or _EMPTY_ATTRS,
+                              other._field_attrs or _EMPTY_ATTRS) and
+                  self.related_model == other.related_model)))
 
     def __repr__(self):
         """Return a string representation of the signature.
@@ -2620,9 +3295,51 @@ class FieldSignature(BaseSignature):
         """
         return ('<FieldSignature(field_name=%r, field_type=%r,'
                 ' field_attrs=%r, related_model=%r)>'
-                % (self.field_name, self.field_type, self.field_attrs,
+                % (self.field_name, self.field_type,
+                   dict(self._field_attrs or _EMPTY_ATTRS),
                    self.related_model))
 
+    def _compute_digest(self):
+        """Compute a new digest for the signature.
+
+        Version Added:
+            3.0
+
+        Returns:
+            str:
+            The digest of the signature.
+        """
+        return _make_digest([self.field_name, self.serialize()])
+
+
+def _has_same_cached_digest(sig1, sig2):
+    """Return whether two signatures have the same cached digest.
+
+    This is used to short-circuit equality checks. Digests will not be
+    computed if they're not already cached, since that's more expensive than
+    a direct comparison.
+
+    Version Added:
+        3.0
+
+    Args:
+        sig1 (BaseSignature):
+            The first signature.
+
+        sig2 (BaseSignature):
+            The second signature.
+
+    Returns:
+        bool:
+        ``True`` if both signatures have a cached digest and they're equal.
+        ``False`` otherwise.
+    """
+    digest = sig1._digest
+
+    return (digest is not None and
+            type(sig1) is type(sig2) and
+            digest == sig2._digest)
+
 
 def validate_sig_version(sig_version):
     """Validate that a signature version is supported.
@@ -13,7 +13,7 @@ from django.test.utils import override_settings
 from django_evolution.compat.db import sql_delete
 from django_evolution.db.state import DatabaseState
 from django_evolution.diff import Diff
-from django_evolution.evolve import Evolver
+from django_evolution.evolve import EvolveAppTask, Evolver
 from django_evolution.models import Evolution, Version
 from django_evolution.mutators import AppMutator
 from django_evolution.support import supports_migrations
@@ -117,6 +117,7 @@ class TestCase(DjangoTestCase):
         self.ensure_deleted_apps()
         unregister_test_models()
         clear_model_rel_tree()
+        EvolveAppTask.clear_caches()
 
     def shortDescription(self):
         """Returns the description of the current test.
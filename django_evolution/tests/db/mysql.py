@@ -171,9 +171,8 @@ def add_field(connection):
 
         'AddIndexedColumnModel': [
             'ALTER TABLE `tests_testmodel`'
-            ' ADD COLUMN `add_field` integer NULL;',
-
-            'CREATE INDEX `%s` ON `tests_testmodel` (`add_field`);'
+            ' ADD COLUMN `add_field` integer NULL,'
+            ' ADD INDEX `%s` (`add_field`);'
             % generate_index_name('tests_testmodel', 'add_field')
         ],
 
@@ -190,9 +189,8 @@ def add_field(connection):
         'AddForeignKeyModel': [
             f'ALTER TABLE `tests_testmodel`'
             f' ADD COLUMN `added_field_id` {pk_type} NULL'
-            f' REFERENCES `tests_addanchor1` (`id`);',
-
-            'CREATE INDEX `%s` ON `tests_testmodel` (`added_field_id`);'
+            f' REFERENCES `tests_addanchor1` (`id`),'
+            f' ADD INDEX `%s` (`added_field_id`);'
             % generate_index_name('tests_testmodel',
                                   'added_field_id', 'added_field'),
         ],
@@ -822,40 +820,43 @@ def change_field(connection):
         ],
 
         'AddDBIndexChangeModel': [
-            'CREATE INDEX `%s` ON `tests_testmodel` (`int_field2`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD INDEX `%s` (`int_field2`);'
             % generate_index_name('tests_testmodel', 'int_field2'),
         ],
 
         'AddDBIndexNoOpChangeModel': [],
 
         'RemoveDBIndexChangeModel': [
-            'DROP INDEX `%s` ON `tests_testmodel`;'
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX `%s`;'
             % generate_index_name('tests_testmodel', 'int_field1'),
         ],
 
         'RemoveDBIndexAddUniqueChangeModel': [
-            'DROP INDEX `%s` ON `tests_testmodel`;'
-            % generate_index_name('tests_testmodel', 'int_field1'),
-
-            'CREATE UNIQUE INDEX %s ON `tests_testmodel`(`int_field1`);'
-            % generate_unique_constraint_name('tests_testmodel',
-                                              ['int_field1']),
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX `%s`,'
+            ' ADD UNIQUE INDEX %s (`int_field1`);'
+            % (generate_index_name('tests_testmodel', 'int_field1'),
+               generate_unique_constraint_name('tests_testmodel',
+                                               ['int_field1'])),
         ],
 
         'RemoveDBIndexAddNullChangeModel': [
             'ALTER TABLE `tests_testmodel`'
-            ' MODIFY COLUMN `int_field1` integer DEFAULT NULL;',
-
-            'DROP INDEX `%s` ON `tests_testmodel`;'
+            ' DROP INDEX `%s`,'
+            ' MODIFY COLUMN `int_field1` integer DEFAULT NULL;'
             % generate_index_name('tests_testmodel', 'int_field1'),
         ],
 
         'AddDBIndexRemoveUniqueChangeModel': [
-            'DROP INDEX int_field3 ON `tests_testmodel`;'
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX int_field3;'
         ],
 
         'AddDBIndexAddUniqueChangeModel': [
-            'CREATE UNIQUE INDEX %s ON `tests_testmodel`(`int_field4`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD UNIQUE INDEX %s (`int_field4`);'
             % generate_unique_constraint_name('tests_testmodel',
                                               ['int_field4']),
         ],
@@ -863,13 +864,15 @@ def change_field(connection):
         'RemoveDBIndexNoOpChangeModel': [],
 
         'AddUniqueChangeModel': [
-            'CREATE UNIQUE INDEX %s ON `tests_testmodel`(`int_field4`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD UNIQUE INDEX %s (`int_field4`);'
             % generate_unique_constraint_name('tests_testmodel',
                                               ['int_field4']),
         ],
 
         'RemoveUniqueChangeModel': [
-            'DROP INDEX int_field3 ON `tests_testmodel`;',
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX int_field3;',
         ],
 
         'MultiAttrChangeModel': [
@@ -918,14 +921,16 @@ def change_field(connection):
         ],
 
         'field_type_unique_false': [
-            'DROP INDEX int_field3 ON `tests_testmodel`;',
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX int_field3;',
 
             'ALTER TABLE `tests_testmodel`'
             ' MODIFY `int_field3` longtext NOT NULL;',
         ],
 
         'field_type_db_index_false': [
-            'DROP INDEX `%s` ON `tests_testmodel`;'
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX `%s`;'
             % generate_index_name('tests_testmodel', 'int_field1'),
 
             'ALTER TABLE `tests_testmodel`'
@@ -938,39 +943,36 @@ def change_field(connection):
         ],
 
         'field_type_db_index_to_unique': [
-            'DROP INDEX `%s` ON `tests_testmodel`;'
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX `%s`;'
             % generate_index_name('tests_testmodel', 'int_field1'),
 
             'ALTER TABLE `tests_testmodel`'
-            ' MODIFY `int_field1` bigint NOT NULL UNIQUE;',
-
-            'CREATE UNIQUE INDEX %s ON `tests_testmodel`(`int_field1`);'
+            ' MODIFY `int_field1` bigint NOT NULL UNIQUE,'
+            ' ADD UNIQUE INDEX %s (`int_field1`);'
             % generate_unique_constraint_name('tests_testmodel',
                                               ['int_field1']),
         ],
 
         'field_type_plain_to_db_index': [
             'ALTER TABLE `tests_testmodel`'
-            ' MODIFY `int_field4` bigint NOT NULL;',
-
-            'CREATE INDEX `%s` ON `tests_testmodel` (`int_field4`);'
+            ' MODIFY `int_field4` bigint NOT NULL,'
+            ' ADD INDEX `%s` (`int_field4`);'
             % generate_index_name('tests_testmodel', 'int_field4'),
         ],
 
         'field_type_plain_to_unique': [
             'ALTER TABLE `tests_testmodel`'
-            ' MODIFY `int_field4` bigint NOT NULL UNIQUE;',
-
-            'CREATE UNIQUE INDEX %s ON `tests_testmodel`(`int_field4`);'
+            ' MODIFY `int_field4` bigint NOT NULL UNIQUE,'
+            ' ADD UNIQUE INDEX %s (`int_field4`);'
             % generate_unique_constraint_name('tests_testmodel',
                                               ['int_field4']),
         ],
 
         'field_type_unique_missing_index_to_db_index': [
             'ALTER TABLE `tests_testmodel`'
-            ' MODIFY `int_field3` bigint NOT NULL;',
-
-            'CREATE INDEX `%s` ON `tests_testmodel` (`int_field3`);'
+            ' MODIFY `int_field3` bigint NOT NULL,'
+            ' ADD INDEX `%s` (`int_field3`);'
             % generate_index_name('tests_testmodel', 'int_field3'),
         ],
 
@@ -985,12 +987,12 @@ def change_field(connection):
         ],
 
         'field_type_unique_to_db_index': [
-            'DROP INDEX int_field3 ON `tests_testmodel`;',
-
             'ALTER TABLE `tests_testmodel`'
-            ' MODIFY `int_field3` bigint NOT NULL;',
+            ' DROP INDEX int_field3;',
 
-            'CREATE INDEX `%s` ON `tests_testmodel` (`int_field3`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' MODIFY `int_field3` bigint NOT NULL,'
+            ' ADD INDEX `%s` (`int_field3`);'
             % generate_index_name('tests_testmodel', 'int_field3'),
         ],
 
@@ -1351,36 +1353,36 @@ def unique_together(connection):
 
     mappings = {
         'setting_from_empty': [
-            'CREATE UNIQUE INDEX `%s`'
-            ' ON `tests_testmodel` (`int_field1`, `char_field1`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD UNIQUE INDEX `%s` (`int_field1`, `char_field1`);'
             % generate_unique_constraint_name('tests_testmodel',
                                               ['int_field1', 'char_field1']),
         ],
 
         'append_list': [
-            'CREATE UNIQUE INDEX `%s`'
-            ' ON `tests_testmodel` (`int_field2`, `char_field2`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD UNIQUE INDEX `%s` (`int_field2`, `char_field2`);'
             % generate_unique_constraint_name('tests_testmodel',
                                               ['int_field2', 'char_field2']),
         ],
 
         'set_remove': [
-            'CREATE UNIQUE INDEX `%s`'
-            ' ON `tests_testmodel` (`int_field1`, `char_field1`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD UNIQUE INDEX `%s` (`int_field1`, `char_field1`);'
             % generate_unique_constraint_name('tests_testmodel',
                                               ['int_field1', 'char_field1']),
         ],
 
         'ignore_missing_indexes': [
-            'CREATE UNIQUE INDEX `%s`'
-            ' ON `tests_testmodel` (`char_field1`, `char_field2`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD UNIQUE INDEX `%s` (`char_field1`, `char_field2`);'
             % generate_unique_constraint_name('tests_testmodel',
                                               ['char_field1', 'char_field2']),
         ],
 
         'upgrade_from_v1_sig': [
-            'CREATE UNIQUE INDEX `%s`'
-            ' ON `tests_testmodel` (`int_field1`, `char_field1`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD UNIQUE INDEX `%s` (`int_field1`, `char_field1`);'
             % generate_unique_constraint_name('tests_testmodel',
                                               ['int_field1', 'char_field1']),
         ],
@@ -1391,23 +1393,23 @@ def unique_together(connection):
         # after table creation, using Django's generated constraint names.
         mappings.update({
             'removing': [
-                'DROP INDEX `%s` ON `tests_testmodel`;'
+                'ALTER TABLE `tests_testmodel`'
+                ' DROP INDEX `%s`;'
                 % generate_unique_constraint_name(
                     'tests_testmodel',
                     ['int_field1', 'char_field1']),
             ],
 
             'replace_list': [
-                'DROP INDEX `%s` ON `tests_testmodel`;'
-                % generate_unique_constraint_name(
-                    'tests_testmodel',
-                    ['int_field1', 'char_field1']),
-
-                'CREATE UNIQUE INDEX `%s`'
-                ' ON `tests_testmodel` (`int_field2`, `char_field2`);'
-                % generate_unique_constraint_name(
-                    'tests_testmodel',
-                    ['int_field2', 'char_field2']),
+                'ALTER TABLE `tests_testmodel`'
+                ' DROP INDEX `%s`,'
+                ' ADD UNIQUE INDEX `%s` (`int_field2`, `char_field2`);'
+                % (generate_unique_constraint_name(
+                       'tests_testmodel',
+                       ['int_field1', 'char_field1']),
+                   generate_unique_constraint_name(
+                       'tests_testmodel',
+                       ['int_field2', 'char_field2'])),
             ],
         })
     else:
@@ -1416,14 +1418,14 @@ def unique_together(connection):
         # generated name, so we need to drop with those hard-coded names.
         mappings.update({
             'removing': [
-                'DROP INDEX `int_field1` ON `tests_testmodel`;',
+                'ALTER TABLE `tests_testmodel`'
+                ' DROP INDEX `int_field1`;',
             ],
 
             'replace_list': [
-                'DROP INDEX `int_field1` ON `tests_testmodel`;',
-
-                'CREATE UNIQUE INDEX `%s`'
-                ' ON `tests_testmodel` (`int_field2`, `char_field2`);'
+                'ALTER TABLE `tests_testmodel`'
+                ' DROP INDEX `int_field1`,'
+                ' ADD UNIQUE INDEX `%s` (`int_field2`, `char_field2`);'
                 % generate_unique_constraint_name(
                     'tests_testmodel',
                     ['int_field2', 'char_field2']),
@@ -1448,44 +1450,44 @@ def index_together(connection):
 
     return {
         'setting_from_empty': [
-            'CREATE INDEX `%s`'
-            ' ON `tests_testmodel` (`int_field1`, `char_field1`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD INDEX `%s` (`int_field1`, `char_field1`);'
             % generate_index_name('tests_testmodel',
                                   ['int_field1', 'char_field1'],
                                   index_together=True),
         ],
 
         'replace_list': [
-            'DROP INDEX `%s` ON `tests_testmodel`;'
-            % generate_index_name('tests_testmodel',
-                                  ['int_field1', 'char_field1'],
-                                  index_together=True),
-
-            'CREATE INDEX `%s`'
-            ' ON `tests_testmodel` (`int_field2`, `char_field2`);'
-            % generate_index_name('tests_testmodel',
-                                  ['int_field2', 'char_field2'],
-                                  index_together=True),
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX `%s`,'
+            ' ADD INDEX `%s` (`int_field2`, `char_field2`);'
+            % (generate_index_name('tests_testmodel',
+                                   ['int_field1', 'char_field1'],
+                                   index_together=True),
+               generate_index_name('tests_testmodel',
+                                   ['int_field2', 'char_field2'],
+                                   index_together=True)),
         ],
 
         'append_list': [
-            'CREATE INDEX `%s`'
-            ' ON `tests_testmodel` (`int_field2`, `char_field2`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD INDEX `%s` (`int_field2`, `char_field2`);'
             % generate_index_name('tests_testmodel',
                                   ['int_field2', 'char_field2'],
                                   index_together=True),
         ],
 
         'removing': [
-            'DROP INDEX `%s` ON `tests_testmodel`;'
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX `%s`;'
             % generate_index_name('tests_testmodel',
                                   ['int_field1', 'char_field1'],
                                   index_together=True),
         ],
 
         'ignore_missing_indexes': [
-            'CREATE INDEX `%s`'
-            ' ON `tests_testmodel` (`char_field1`, `char_field2`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD INDEX `%s` (`char_field1`, `char_field2`);'
             % generate_index_name('tests_testmodel',
                                   ['char_field1', 'char_field2'],
                                   index_together=True),
@@ -1520,9 +1522,7 @@ def constraints(connection):
             'append_list': [
                 "ALTER TABLE `tests_testmodel`"
                 " ADD CONSTRAINT `new_unique_constraint`"
-                " UNIQUE (`int_field2`, `int_field1`);",
-
-                "ALTER TABLE `tests_testmodel`"
+                " UNIQUE (`int_field2`, `int_field1`),"
                 " ADD CONSTRAINT `new_check_constraint`"
                 " CHECK (`int_field1` >= 100);",
             ],
@@ -1530,11 +1530,9 @@ def constraints(connection):
             'setting_from_empty': [
                 f"ALTER TABLE `tests_testmodel`"
                 f" ADD CONSTRAINT `new_check_constraint`"
-                f" CHECK (`char_field1` LIKE BINARY 'test{PCT}');",
-
-                'ALTER TABLE `tests_testmodel`'
-                ' ADD CONSTRAINT `new_unique_constraint_plain`'
-                ' UNIQUE (`int_field1`, `int_field2`);',
+                f" CHECK (`char_field1` LIKE BINARY 'test{PCT}'),"
+                f" ADD CONSTRAINT `new_unique_constraint_plain`"
+                f" UNIQUE (`int_field1`, `int_field2`);",
             ],
         })
 
@@ -1542,52 +1540,36 @@ def constraints(connection):
             mappings.update({
                 'removing': [
                     "ALTER TABLE `tests_testmodel`"
-                    " DROP CONSTRAINT IF EXISTS `base_check_constraint`;",
-
-                    "ALTER TABLE `tests_testmodel`"
+                    " DROP CONSTRAINT IF EXISTS `base_check_constraint`,"
                     " DROP INDEX `base_unique_constraint_plain`;",
                 ],
 
                 'replace_list': [
-                    'ALTER TABLE `tests_testmodel`'
-                    ' DROP CONSTRAINT IF EXISTS `base_check_constraint`;',
-
-                    'ALTER TABLE `tests_testmodel`'
-                    ' DROP INDEX `base_unique_constraint_plain`;',
-
                     f"ALTER TABLE `tests_testmodel`"
+                    f" DROP CONSTRAINT IF EXISTS `base_check_constraint`,"
+                    f" DROP INDEX `base_unique_constraint_plain`,"
                     f" ADD CONSTRAINT `new_check_constraint`"
-                    f" CHECK (`char_field1` LIKE BINARY 'test{PCT}');",
-
-                    'ALTER TABLE `tests_testmodel`'
-                    ' ADD CONSTRAINT `new_unique_constraint_plain`'
-                    ' UNIQUE (`int_field1`, `char_field1`);',
+                    f" CHECK (`char_field1` LIKE BINARY 'test{PCT}'),"
+                    f" ADD CONSTRAINT `new_unique_constraint_plain`"
+                    f" UNIQUE (`int_field1`, `char_field1`);",
                 ],
             })
         else:
             mappings.update({
                 'removing': [
                     "ALTER TABLE `tests_testmodel`"
-                    " DROP CHECK `base_check_constraint`;",
-
-                    "ALTER TABLE `tests_testmodel`"
+                    " DROP CHECK `base_check_constraint`,"
                     " DROP INDEX `base_unique_constraint_plain`;",
                 ],
 
                 'replace_list': [
-                    'ALTER TABLE `tests_testmodel`'
-                    ' DROP CHECK `base_check_constraint`;',
-
-                    'ALTER TABLE `tests_testmodel`'
-                    ' DROP INDEX `base_unique_constraint_plain`;',
-
                     f"ALTER TABLE `tests_testmodel`"
+                    f" DROP CHECK `base_check_constraint`,"
+                    f" DROP INDEX `base_unique_constraint_plain`,"
                     f" ADD CONSTRAINT `new_check_constraint`"
-                    f" CHECK (`char_field1` LIKE BINARY 'test{PCT}');",
-
-                    'ALTER TABLE `tests_testmodel`'
-                    ' ADD CONSTRAINT `new_unique_constraint_plain`'
-                    ' UNIQUE (`int_field1`, `char_field1`);',
+                    f" CHECK (`char_field1` LIKE BINARY 'test{PCT}'),"
+                    f" ADD CONSTRAINT `new_unique_constraint_plain`"
+                    f" UNIQUE (`int_field1`, `char_field1`);",
                 ],
             })
     else:
@@ -1605,9 +1587,7 @@ def constraints(connection):
 
             'replace_list': [
                 "ALTER TABLE `tests_testmodel`"
-                " DROP INDEX `base_unique_constraint_plain`;",
-
-                "ALTER TABLE `tests_testmodel`"
+                " DROP INDEX `base_unique_constraint_plain`,"
                 " ADD CONSTRAINT `new_unique_constraint_plain`"
                 " UNIQUE (`int_field1`, `char_field1`);",
             ],
@@ -1656,96 +1636,86 @@ def indexes(connection):
     mappings = {
         # NOTE: condition is ignored for MySQL.
         'replace_condition': [
-            'DROP INDEX `my_index` ON `tests_testmodel`;',
-
-            'CREATE INDEX `my_index`'
-            ' ON `tests_testmodel` (`int_field1`);',
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX `my_index`,'
+            ' ADD INDEX `my_index` (`int_field1`);',
         ],
 
         # NOTE: db_tablespace is ignored for MySQL.
         'replace_db_tablespace': [
-            'DROP INDEX `my_index` ON `tests_testmodel`;',
-
-            'CREATE INDEX `my_index`'
-            ' ON `tests_testmodel` (`int_field1`)%s;'
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX `my_index`,'
+            ' ADD INDEX `my_index` (`int_field1`)%s;'
             % tablespace_spacer,
         ],
 
         # NOTE: include is ignored for MySQL.
         'replace_include': [
-            'DROP INDEX `my_index` ON `tests_testmodel`;',
-
-            'CREATE INDEX `my_index`'
-            ' ON `tests_testmodel` (`int_field1`);',
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX `my_index`,'
+            ' ADD INDEX `my_index` (`int_field1`);',
         ],
 
         # NOTE: opclasses is ignored for MySQL.
         'replace_opclasses': [
-            'DROP INDEX `my_index` ON `tests_testmodel`;',
-
-            'CREATE INDEX `my_index`'
-            ' ON `tests_testmodel` (`char_field1`);',
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX `my_index`,'
+            ' ADD INDEX `my_index` (`char_field1`);',
         ],
 
         'replace_list': [
-            {
-                'DROP INDEX `%s` ON `tests_testmodel`;'
-                % generate_index_name('tests_testmodel', ['int_field1'],
-                                      model_meta_indexes=True),
-
-                'DROP INDEX `my_custom_index` ON `tests_testmodel`;',
-            },
-
-            'CREATE INDEX `%s`'
-            ' ON `tests_testmodel` (`int_field2`);'
-            % generate_index_name('tests_testmodel', ['int_field2'],
-                                  model_meta_indexes=True),
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX `%s`,'
+            ' DROP INDEX `my_custom_index`,'
+            ' ADD INDEX `%s` (`int_field2`);'
+            % (generate_index_name('tests_testmodel', ['int_field1'],
+                                   model_meta_indexes=True),
+               generate_index_name('tests_testmodel', ['int_field2'],
+                                   model_meta_indexes=True)),
         ],
 
         'append_list': [
-            'CREATE INDEX `%s`'
-            ' ON `tests_testmodel` (`int_field2`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD INDEX `%s` (`int_field2`);'
             % generate_index_name('tests_testmodel', ['int_field2'],
                                   model_meta_indexes=True),
         ],
 
-        'removing': {
-            'DROP INDEX `%s` ON `tests_testmodel`;'
+        'removing': [
+            'ALTER TABLE `tests_testmodel`'
+            ' DROP INDEX `%s`,'
+            ' DROP INDEX `my_custom_index`;'
             % generate_index_name('tests_testmodel', ['int_field1'],
                                   model_meta_indexes=True),
-
-            'DROP INDEX `my_custom_index` ON `tests_testmodel`;',
-        },
+        ],
 
         'ignore_missing_indexes': [
-            'CREATE INDEX `%s`'
-            ' ON `tests_testmodel` (`int_field2`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD INDEX `%s` (`int_field2`);'
             % generate_index_name('tests_testmodel', ['int_field2'],
                                   model_meta_indexes=True),
         ],
 
-        'setting_from_empty': {
-            'CREATE INDEX `%s`'
-            ' ON `tests_testmodel` (`int_field1`);'
-            % generate_index_name('tests_testmodel',
-                                  ['int_field1'],
-                                  model_meta_indexes=True),
-
-            'CREATE INDEX `my_custom_index`'
-            ' ON `tests_testmodel` (`char_field1`, `char_field2`%s);'
-            % desc,
-        },
+        'setting_from_empty': [
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD INDEX `%s` (`int_field1`),'
+            ' ADD INDEX `my_custom_index` (`char_field1`, `char_field2`%s);'
+            % (generate_index_name('tests_testmodel',
+                                   ['int_field1'],
+                                   model_meta_indexes=True),
+               desc),
+        ],
 
         # NOTE: condition is ignored for MySQL.
         'setting_from_empty_with_condition': [
-            'CREATE INDEX `my_index`'
-            ' ON `tests_testmodel` (`int_field1`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD INDEX `my_index` (`int_field1`);'
         ],
 
         # NOTE: db_tablespace is ignored for MySQL.
         'setting_from_empty_with_db_tablespace': [
-            'CREATE INDEX `%s`'
-            ' ON `tests_testmodel` (`int_field1`)%s;'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD INDEX `%s` (`int_field1`)%s;'
             % (generate_index_name('tests_testmodel',
                                    ['int_field1'],
                                    model_meta_indexes=True),
@@ -1754,29 +1724,28 @@ def indexes(connection):
 
         # NOTE: include is ignored for MySQL.
         'setting_from_empty_with_include': [
-            'CREATE INDEX `my_index`'
-            ' ON `tests_testmodel` (`int_field1`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD INDEX `my_index` (`int_field1`);'
         ],
 
         # NOTE: opclasses is ignored for MySQL.
         'setting_from_empty_with_opclasses': [
-            'CREATE INDEX `my_index`'
-            ' ON `tests_testmodel` (`char_field1`);'
+            'ALTER TABLE `tests_testmodel`'
+            ' ADD INDEX `my_index` (`char_field1`);'
         ],
     }
 
     if supports_expression_indexes:
         mappings.update({
             'replace_expressions': [
-                'DROP INDEX `my_index` ON `tests_testmodel`;',
-
-                'CREATE INDEX `my_index`'
-                ' ON `tests_testmodel` (((`int_field2` - `int_field1`)));',
+                'ALTER TABLE `tests_testmodel`'
+                ' DROP INDEX `my_index`,'
+                ' ADD INDEX `my_index` (((`int_field2` - `int_field1`)));',
             ],
 
             'setting_from_empty_with_expressions': [
-                'CREATE INDEX `my_index`'
-                ' ON `tests_testmodel` (((`int_field1` + `int_field2`)));'
+                'ALTER TABLE `tests_testmodel`'
+                ' ADD INDEX `my_index` (((`int_field1` + `int_field2`)));'
             ],
         })
     else:
@@ -1858,9 +1827,8 @@ def preprocessing(connection):
         'add_field_rename_model': [
             f'ALTER TABLE `tests_testmodel`'
             f' ADD COLUMN `added_field_id` {pk_type} NULL'
-            f' REFERENCES `tests_reffedpreprocmodel` (`id`);',
-
-            'CREATE INDEX `%s` ON `tests_testmodel` (`added_field_id`);'
+            f' REFERENCES `tests_reffedpreprocmodel` (`id`),'
+            f' ADD INDEX `%s` (`added_field_id`);'
             % generate_index_name('tests_testmodel', 'added_field_id',
                                   'added_field'),
         ],
@@ -1868,9 +1836,8 @@ def preprocessing(connection):
         'add_rename_field_rename_model': [
             f'ALTER TABLE `tests_testmodel`'
             f' ADD COLUMN `renamed_field_id` {pk_type} NULL'
-            f' REFERENCES `tests_reffedpreprocmodel` (`id`);',
-
-            'CREATE INDEX `%s` ON `tests_testmodel` (`renamed_field_id`);'
+            f' REFERENCES `tests_reffedpreprocmodel` (`id`),'
+            f' ADD INDEX `%s` (`renamed_field_id`);'
             % generate_index_name('tests_testmodel', 'renamed_field_id',
                                   'renamed_field'),
         ],
@@ -1966,10 +1933,8 @@ def evolver(connection):
         'complex_deps_upgrade_task_2': [
             f'ALTER TABLE `evolutions_app2_evolutionsapp2testmodel`'
             f' ADD COLUMN `fkey_id` {pk_type} NULL'
-            f' REFERENCES `evolutions_app_evolutionsapptestmodel` (`id`);',
-
-            'CREATE INDEX `%s` ON `evolutions_app2_evolutionsapp2testmodel`'
-            ' (`fkey_id`);'
+            f' REFERENCES `evolutions_app_evolutionsapptestmodel` (`id`),'
+            f' ADD INDEX `%s` (`fkey_id`);'
             % generate_index_name('evolutions_app2_evolutionsapp2testmodel',
                                   'fkey_id', 'fkey'),
         ],
@@ -880,8 +880,7 @@ def change_field(connection):
 
         'IncreasingMaxLengthChangeModel': [
             'ALTER TABLE "tests_testmodel"'
-            ' ALTER COLUMN "char_field" TYPE varchar(45)'
-            ' USING CAST("char_field" as varchar(45));',
+            ' ALTER COLUMN "char_field" TYPE varchar(45);',
         ],
 
         'DecreasingMaxLengthChangeModel': [
@@ -962,14 +961,12 @@ def change_field(connection):
             ' RENAME COLUMN "custom_db_column" TO "custom_db_column2";',
 
             'ALTER TABLE "tests_testmodel"'
-            ' ALTER COLUMN "char_field" TYPE varchar(35)'
-            ' USING CAST("char_field" as varchar(35));',
+            ' ALTER COLUMN "char_field" TYPE varchar(35);',
         ],
 
         'MultiAttrSingleFieldChangeModel': [
             'ALTER TABLE "tests_testmodel"'
-            ' ALTER COLUMN "char_field2" TYPE varchar(35)'
-            ' USING CAST("char_field2" as varchar(35)),'
+            ' ALTER COLUMN "char_field2" TYPE varchar(35),'
             ' ALTER COLUMN "char_field2" DROP NOT NULL;',
         ],
 
@@ -981,8 +978,7 @@ def change_field(connection):
             ' RENAME COLUMN "custom_db_column" TO "custom_db_column3";',
 
             'ALTER TABLE "tests_testmodel"'
-            ' ALTER COLUMN "char_field" TYPE varchar(35)'
-            ' USING CAST("char_field" as varchar(35));',
+            ' ALTER COLUMN "char_field" TYPE varchar(35);',
         ],
 
         'M2MNullChangeModel': [],
@@ -1099,12 +1095,12 @@ def change_field(connection):
 
         'field_type': [
             'ALTER TABLE "tests_testmodel"'
-            ' ALTER COLUMN "char_field" TYPE text USING char_field::text;',
+            ' ALTER COLUMN "char_field" TYPE text;',
         ],
 
         'field_type_null_false': [
             'ALTER TABLE "tests_testmodel"'
-            ' ALTER COLUMN "char_field1" TYPE text USING char_field1::text;',
+            ' ALTER COLUMN "char_field1" TYPE text;',
 
             'UPDATE "tests_testmodel"'
             ' SET "char_field1" = \'test123\''
@@ -2312,8 +2308,7 @@ def preprocessing(connection):
 
         'change_rename_change_rename_field': [
             'ALTER TABLE "tests_testmodel"'
-            ' ALTER COLUMN "char_field" TYPE varchar(30)'
-            ' USING CAST("char_field" as varchar(30)),'
+            ' ALTER COLUMN "char_field" TYPE varchar(30),'
             ' ALTER COLUMN "char_field" DROP NOT NULL;',
 
             'ALTER TABLE "tests_testmodel"'
@@ -2337,8 +2332,7 @@ def preprocessing(connection):
             ' RENAME COLUMN "char_field" TO "renamed_field";',
 
             'ALTER TABLE "tests_testmodel"'
-            ' ALTER COLUMN "renamed_field" TYPE varchar(50)'
-            ' USING CAST("renamed_field" as varchar(50)),'
+            ' ALTER COLUMN "renamed_field" TYPE varchar(50),'
             ' ALTER COLUMN "renamed_field" DROP NOT NULL;',
         ],
 
@@ -2390,8 +2384,7 @@ def evolver(connection):
 
         'evolve_app_task': [
             'ALTER TABLE "tests_testmodel"'
-            ' ALTER COLUMN "value" TYPE varchar(100)'
-            ' USING CAST("value" as varchar(100));',
+            ' ALTER COLUMN "value" TYPE varchar(100);',
         ],
 
         'purge_app_task': [
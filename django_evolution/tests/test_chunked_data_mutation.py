@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from django.db import models
+
+from django_evolution.errors import SimulationFailure
+from django_evolution.mutations import ChunkedDataMutation
+from django_evolution.mutators import AppMutator
+from django_evolution.signals import processed_data_chunk
+from django_evolution.signature import AppSignature, ProjectSignature
+from django_evolution.tests.base_test_case import EvolutionTestCase
+from django_evolution.tests.models import BaseTestModel
+from django_evolution.tests.utils import ensure_test_db, execute_test_sql
+
+
+class ChunkedDataBaseModel(BaseTestModel):
+    char_field = models.CharField(max_length=20)
+    int_field = models.IntegerField()
+
+
+class ChunkedDataMutationTests(EvolutionTestCase):
+    """Testing ChunkedDataMutation."""
+
+    default_base_model = ChunkedDataBaseModel
+
+    def default_create_test_data(self, db_name):
+        """Create test data for the base model.
+
+        Args:
+            db_name (unicode):
+                The name of the database to create models on.
+        """
+        for i in range(5):
+            ChunkedDataBaseModel.objects.using(db_name).create(
+                char_field='test%s' % i,
+                int_field=i)
+
+    def test_generate_hint(self):
+        """Testing ChunkedDataMutation.generate_hint"""
+        mutation = ChunkedDataMutation('test', 'TestModel',
+                                       lambda cursor, rows: None,
+                                       chunk_size=2)
+
+        self.assertEqual(mutation.generate_hint(),
+                         "ChunkedDataMutation('test', 'TestModel', "
+                         "chunk_size=2)")
+
+    def test_with_bad_model(self):
+        """Testing ChunkedDataMutation with model not in signature"""
+        mutation = ChunkedDataMutation('test', 'TestModel',
+                                       lambda cursor, rows: None)
+
+        project_sig = ProjectSignature()
+        project_sig.add_app_sig(AppSignature(app_id='tests'))
+
+        message = (
+            'Cannot run the data mutation "test" on the model '
+            '"tests.TestModel". The model could not be found in the '
+            'signature.'
+        )
+
+        with self.assertRaisesMessage(SimulationFailure, message):
+            mutation.run_simulation(app_label='tests',
+                                    project_sig=project_sig,
+                                    database_state=None)
+
+    def test_process_rows(self):
+        """Testing ChunkedDataMutation processes rows in chunks"""
+        chunks = []
+        total_row_counts = []
+
+        def _process_chunk(cursor, rows):
+            chunks.append([
+                row['int_field']
+                for row in rows
+            ])
+
+        def _on_processed_data_chunk(total_row_count, **kwargs):
+            total_row_counts.append(total_row_count)
+
+        processed_data_chunk.connect(_on_processed_data_chunk)
+
+        try:
+            self.perform_mutations(
+                [
+                    ChunkedDataMutation('test', 'TestModel', _process_chunk,
+                                        chunk_size=2),
+                ],
+                end=self.copy_models(self.start),
+                end_sig=self.start_sig.clone(),
+                create_test_data_func=self.default_create_test_data)
+        finally:
+            processed_data_chunk.disconnect(_on_processed_data_chunk)
+
+        self.assertEqual(chunks, [[0, 1], [2, 3], [4]])
+        self.assertEqual(total_row_counts, [2, 4, 5])
+
+    def test_process_rows_with_writes(self):
+        """Testing ChunkedDataMutation persists writes made in chunks"""
+        def _process_chunk(cursor, rows):
+            self._update_rows(cursor, rows)
+
+        rows, error = self._perform_chunked_data_mutation(
+            ChunkedDataMutation('test', 'TestModel', _process_chunk,
+                                chunk_size=2))
+
+        self.assertIsNone(error)
+        self.assertEqual(rows, [100, 101, 102, 103, 104])
+
+    def test_process_rows_with_error(self):
+        """Testing ChunkedDataMutation commits each chunk before an error in
+        a later chunk
+        """
+        def _process_chunk(cursor, rows):
+            self._update_rows(cursor, rows)
+
+            if rows[0]['int_field'] == 4:
+                raise ValueError('Oh no')
+
+        rows, error = self._perform_chunked_data_mutation(
+            ChunkedDataMutation('test', 'TestModel', _process_chunk,
+                                chunk_size=2))
+
+        # The first two chunks were committed, and the third was rolled back.
+        self.assertIsInstance(error, ValueError)
+        self.assertEqual(str(error), 'Oh no')
+        self.assertEqual(rows, [100, 101, 102, 103, 4])
+
+    def _perform_chunked_data_mutation(self, mutation):
+        """Apply a ChunkedDataMutation to the test data.
+
+        Args:
+            mutation (django_evolution.mutations.ChunkedDataMutation):
+                The mutation to apply.
+
+        Returns:
+            tuple:
+            A 2-tuple containing:
+
+            1. The ``int_field`` values of the rows after applying the
+               mutation, in primary key order.
+            2. The error raised while applying the mutation, or ``None``.
+        """
+        db_name = self.default_database_name
+        error = None
+
+        with ensure_test_db(model_entries=self.start.items(),
+                            app_label='tests',
+                            database=db_name):
+            self.default_create_test_data(db_name)
+
+            app_mutator = AppMutator(
+                app_label='tests',
+                project_sig=self.start_sig.clone(),
+                database_state=self.database_state.clone(),
+                database=db_name)
+            app_mutator.run_mutations([mutation])
+
+            try:
+                execute_test_sql(app_mutator.to_sql(),
+                                 database=db_name)
+            except Exception as e:
+                error = e
+
+            rows = list(
+                ChunkedDataBaseModel.objects
+                .using(db_name)
+                .order_by('pk')
+                .values_list('int_field', flat=True)
+            )
+
+        return rows, error
+
+    def _update_rows(self, cursor, rows):
+        """Add 100 to the int_field value of rows in a chunk.
+
+        Args:
+            cursor (django.db.backends.utils.CursorWrapper):
+                The cursor for the chunk's transaction.
+
+            rows (list of dict):
+                The rows in the chunk.
+        """
+        qn = cursor.db.ops.quote_name
+
+        cursor.executemany(
+            'UPDATE %s SET %s = %s + 100 WHERE %s = %%s'
+            % (qn(ChunkedDataBaseModel._meta.db_table),
+               qn('int_field'),
+               qn('int_field'),
+               qn('id')),
+            [
+                [row['id']]
+                for row in rows
+            ])
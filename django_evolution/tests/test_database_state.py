@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import connection, models
 from django.db.models import Q
+from django.db.transaction import atomic, set_rollback
 from django.test.testcases import TestCase
 
 try:
@@ -13,6 +14,7 @@ except ImportError:
     CheckConstraint = None
 
 from django_evolution.compat.models import get_remote_field
+from django_evolution.db import EvolutionOperationsMulti
 from django_evolution.db.state import DatabaseState, IndexState
 from django_evolution.errors import DatabaseStateError
 from django_evolution.models import Evolution
@@ -76,6 +78,51 @@ class DatabaseStateTests(TestCase):
         self.assertEqual(cloned_state.db_name, database_state.db_name)
         self.assertEqual(cloned_state._tables, database_state._tables)
 
+    def test_serialize(self):
+        """Testing DatabaseState.serialize and deserialize"""
+        database_state = DatabaseState(db_name='default', scan=False)
+        database_state.add_table('my_test_table')
+        database_state.add_index(table_name='my_test_table',
+                                 index_name='my_index',
+                                 columns=['col1', 'col2'])
+        database_state.add_index(table_name='my_test_table',
+                                 index_name='my_unique_index',
+                                 columns=['col3'],
+                                 unique=True)
+
+        state_dict = database_state.serialize()
+        self.assertEqual(
+            state_dict,
+            {
+                'tables': {
+                    'my_test_table': [
+                        ['my_index', ['col1', 'col2'], False],
+                        ['my_unique_index', ['col3'], True],
+                    ],
+                },
+                'version': DatabaseState.SERIALIZED_VERSION,
+            })
+
+        new_state = DatabaseState.deserialize('default', state_dict)
+        self.assertEqual(new_state._tables, database_state._tables)
+        self.assertEqual(
+            new_state.find_index(table_name='my_test_table',
+                                 columns=['col3'],
+                                 unique=True),
+            IndexState(name='my_unique_index',
+                       columns=['col3'],
+                       unique=True))
+
+    def test_deserialize_with_bad_version(self):
+        """Testing DatabaseState.deserialize with unsupported version"""
+        message = 'Unsupported serialized database state version 999.'
+
+        with self.assertRaisesMessage(DatabaseStateError, message):
+            DatabaseState.deserialize('default', {
+                'tables': {},
+                'version': 999,
+            })
+
     def test_add_table(self):
         """Testing DatabaseState.add_table"""
         database_state = DatabaseState(db_name='default', scan=False)
@@ -373,6 +420,94 @@ class DatabaseStateTests(TestCase):
                                           unique=True)
         self.assertIsNone(index)
 
+    def test_find_index_with_multiple_matches(self):
+        """Testing DatabaseState.find_index with multiple matching indexes"""
+        database_state = DatabaseState(db_name='default', scan=False)
+        database_state.add_table('my_test_table')
+        database_state.add_index(table_name='my_test_table',
+                                 index_name='my_index1',
+                                 columns=['col1'])
+        database_state.add_index(table_name='my_test_table',
+                                 index_name='my_index2',
+                                 columns=['col1'])
+
+        index = database_state.find_index(table_name='my_test_table',
+                                          columns=['col1'])
+        self.assertEqual(index.name, 'my_index1')
+
+        database_state.remove_index(table_name='my_test_table',
+                                    index_name='my_index1')
+
+        index = database_state.find_index(table_name='my_test_table',
+                                          columns=['col1'])
+        self.assertEqual(index.name, 'my_index2')
+
+    def test_find_index_after_remove_index(self):
+        """Testing DatabaseState.find_index after remove_index"""
+        database_state = DatabaseState(db_name='default', scan=False)
+        database_state.add_table('my_test_table')
+        database_state.add_index(table_name='my_test_table',
+                                 index_name='my_index',
+                                 columns=['col1', 'col2'])
+        database_state.remove_index(table_name='my_test_table',
+                                    index_name='my_index')
+
+        self.assertIsNone(database_state.find_index(
+            table_name='my_test_table',
+            columns=['col1', 'col2']))
+
+    def test_find_index_after_clear_indexes(self):
+        """Testing DatabaseState.find_index after clear_indexes"""
+        database_state = DatabaseState(db_name='default', scan=False)
+        database_state.add_table('my_test_table')
+        database_state.add_index(table_name='my_test_table',
+                                 index_name='my_index',
+                                 columns=['col1', 'col2'],
+                                 unique=True)
+        database_state.clear_indexes('my_test_table')
+
+        self.assertIsNone(database_state.find_index(
+            table_name='my_test_table',
+            columns=['col1', 'col2'],
+            unique=True))
+
+    def test_find_index_with_clone(self):
+        """Testing DatabaseState.find_index on a cloned state"""
+        database_state = DatabaseState(db_name='default', scan=False)
+        database_state.add_table('my_test_table')
+        database_state.add_index(table_name='my_test_table',
+                                 index_name='my_index',
+                                 columns=['col1', 'col2'])
+
+        cloned_state = database_state.clone()
+        cloned_state.remove_index(table_name='my_test_table',
+                                  index_name='my_index')
+
+        self.assertIsNone(cloned_state.find_index(
+            table_name='my_test_table',
+            columns=['col1', 'col2']))
+        self.assertIsNotNone(database_state.find_index(
+            table_name='my_test_table',
+            columns=['col1', 'col2']))
+
+    def test_find_index_with_apply_changes(self):
+        """Testing DatabaseState.find_index after apply_changes"""
+        old_state = DatabaseState(db_name='default', scan=False)
+        old_state.add_table('my_test_table')
+
+        new_state = old_state.clone()
+        new_state.add_index(table_name='my_test_table',
+                            index_name='my_index',
+                            columns=['col1'])
+
+        old_state.apply_changes(new_state.get_changes(old_state))
+
+        self.assertEqual(
+            old_state.find_index(table_name='my_test_table',
+                                 columns=['col1']),
+            IndexState(name='my_index',
+                       columns=['col1']))
+
     def clear_indexes(self):
         """Testing DatabaseState.clear_indexes"""
         database_state = DatabaseState(db_name='default', scan=False)
@@ -448,6 +583,77 @@ class DatabaseStateTests(TestCase):
 
         self.assertIn((['version_id'], False), indexes)
 
+    def test_get_constraints_concurrently(self):
+        """Testing DatabaseState._get_constraints_concurrently matches
+        serial introspection
+        """
+        database_state = DatabaseState(db_name='default', scan=False)
+        evolver = EvolutionOperationsMulti('default').get_evolver()
+        table_names = [
+            'django_content_type',
+            'django_evolution',
+            'django_project_version',
+        ]
+
+        self.assertEqual(
+            database_state._get_constraints_concurrently(
+                table_names=table_names,
+                jobs=2),
+            {
+                table_name: evolver.get_constraints_for_table(table_name)
+                for table_name in table_names
+            })
+
+    def test_rescan_tables_with_jobs_in_transaction(self):
+        """Testing DatabaseState.rescan_tables with jobs inside a transaction
+        introspects tables serially
+        """
+        evolver = EvolutionOperationsMulti('default').get_evolver()
+        evolution_ops_cls = type(evolver)
+        old_supports = evolution_ops_cls.__dict__.get(
+            'supports_concurrent_introspection')
+        database_state = DatabaseState(db_name='default', scan=False)
+        concurrent_table_names = []
+
+        def _get_constraints_concurrently(table_names, jobs):
+            concurrent_table_names.extend(table_names)
+
+            return {}
+
+        database_state._get_constraints_concurrently = \
+            _get_constraints_concurrently
+        evolution_ops_cls.supports_concurrent_introspection = True
+
+        try:
+            with atomic():
+                # This table isn't committed, so other connections couldn't
+                # see it.
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'CREATE TABLE test_uncommitted_table ('
+                        ' id INTEGER NOT NULL PRIMARY KEY,'
+                        ' value INTEGER NOT NULL)')
+                    cursor.execute(
+                        'CREATE INDEX test_uncommitted_table_value_idx'
+                        ' ON test_uncommitted_table (value)')
+
+                database_state.rescan_tables(jobs=2)
+
+                # Leave the database as it was for other tests.
+                set_rollback(True)
+        finally:
+            if old_supports is None:
+                del evolution_ops_cls.supports_concurrent_introspection
+            else:
+                evolution_ops_cls.supports_concurrent_introspection = \
+                    old_supports
+
+        self.assertEqual(concurrent_table_names, [])
+        self.assertTrue(database_state.has_table('test_uncommitted_table'))
+        self.assertIsNotNone(database_state.get_index(
+            table_name='test_uncommitted_table',
+            index_name='test_uncommitted_table_value_idx'))
+
 
 class RescanTableConstraintsTests(EvolutionTestCase):
     """Tests for DatabaseState.rescan_tables constraint filtering.
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from django.db import models
+from django.test.utils import override_settings
 
+from django_evolution.db import EvolutionOperationsMulti
 from django_evolution.errors import SimulationFailure
 from django_evolution.mutations import DeleteModel
 from django_evolution.signature import AppSignature, ProjectSignature
 from django_evolution.tests.base_test_case import EvolutionTestCase
 from django_evolution.tests.models import BaseTestModel
+from django_evolution.utils.sql import drain_deferred_table_drops
 
 
 class DeleteModelAnchor(BaseTestModel):
@@ -74,6 +77,48 @@ class DeleteModelTests(EvolutionTestCase):
             end_sig=end_sig,
             end=end)
 
+    def test_delete_model_with_deferred_table_drops(self):
+        """Testing DeleteModel with DEFERRED_TABLE_DROPS"""
+        class BasicWithM2MModel(BaseTestModel):
+            value = models.IntegerField()
+            m2m = models.ManyToManyField(DeleteModelAnchor)
+
+        self.set_base_model(
+            BasicWithM2MModel,
+            name='BasicWithM2MModel',
+            extra_models=[('DeleteModelAnchor', DeleteModelAnchor)])
+
+        end_sig = self.start_sig.clone()
+        end = self.copy_models(self.start)
+
+        end_sig.get_app_sig('tests').remove_model_sig('BasicWithM2MModel')
+        end.pop('basicwithm2mmodel')
+
+        with override_settings(DJANGO_EVOLUTION={
+            'DEFERRED_TABLE_DROPS': True,
+        }):
+            self.perform_mutations([DeleteModel('BasicWithM2MModel')],
+                                   end,
+                                   end_sig)
+
+        db_name = self.default_database_name
+        evolver_backend = EvolutionOperationsMulti(db_name).get_evolver()
+        table_names = evolver_backend.get_deferred_drop_table_names()
+
+        if evolver_backend.supports_deferred_table_drops:
+            self.assertEqual(len(table_names), 2)
+
+            for table_name in table_names:
+                self.assertTrue(table_name.startswith('_evodrop_'))
+
+            self.assertEqual(
+                sorted(drain_deferred_table_drops(db_name, chunk_size=10)),
+                table_names)
+        else:
+            self.assertEqual(table_names, [])
+
+        self.assertEqual(evolver_backend.get_deferred_drop_table_names(), [])
+
     def test_delete_model_with_m2m_field(self):
         """Testing DeleteModel with a model containing a ManyToManyField"""
         class BasicWithM2MModel(BaseTestModel):
@@ -230,3 +230,30 @@ class DependencyGraphTests(TestCase):
 
         self.assertEqual(graph.get_ordered(),
                          [first, grandparent, parent, child, foo, last])
+
+    def test_get_ordered_with_shared_dependencies(self):
+        """Testing DependencyGraph.get_ordered with leaf nodes sharing
+        dependencies
+        """
+        graph = DependencyGraph()
+
+        base = graph.add_node('base')
+        middle = graph.add_node('middle')
+        leaf1 = graph.add_node('leaf1')
+        leaf2 = graph.add_node('leaf2')
+        leaf3 = graph.add_node('leaf3')
+
+        graph.add_dependency(node_key='middle',
+                             dep_node_key='base')
+        graph.add_dependency(node_key='leaf1',
+                             dep_node_key='middle')
+        graph.add_dependency(node_key='leaf2',
+                             dep_node_key='middle')
+        graph.add_dependency(node_key='leaf3',
+                             dep_node_key='base')
+        graph.add_dependency(node_key='leaf3',
+                             dep_node_key='leaf2')
+        graph.finalize()
+
+        self.assertEqual(graph.get_ordered(),
+                         [base, middle, leaf1, leaf2, leaf3])
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from django.db import DEFAULT_DB_ALIAS, connections
+from django.db import DEFAULT_DB_ALIAS, connections, models
 
 from django_evolution.models import Evolution, Version
 from django_evolution.support import supports_migrations
@@ -12,7 +12,9 @@ from django_evolution.tests.decorators import requires_migrations
 from django_evolution.tests.evolutions_app.models import EvolutionsAppTestModel
 from django_evolution.tests.evolutions_app2.models import \
     EvolutionsApp2TestModel
-from django_evolution.utils.apps import get_app
+from django_evolution.tests.migrations_app.models import \
+    MigrationsAppTestModel
+from django_evolution.utils.apps import get_app, unregister_app_model
 from django_evolution.utils.graph import EvolutionGraph
 from django_evolution.utils.migrations import (MigrationExecutor,
                                                MigrationList,
@@ -323,6 +325,38 @@ class EvolutionGraphTests(MigrationsTestsMixin, TestCase):
                 'app': app,
             })
 
+    def test_mark_apps_evolutions_applied(self):
+        """Testing EvolutionGraph.mark_apps_evolutions_applied"""
+        app_label = 'app_deps_app'
+        app = get_app(app_label)
+
+        evolutions = [
+            Evolution(app_label=app_label,
+                      label='test_evolution'),
+        ]
+
+        graph = EvolutionGraph()
+        graph.process_migration_deps = False
+
+        graph.add_evolutions(app=app,
+                             evolutions=evolutions)
+        graph.mark_apps_evolutions_applied([
+            (get_app('evolutions_app'), ['first_evolution']),
+            (get_app('evolutions_app2'), ['second_evolution']),
+        ])
+        graph.finalize()
+
+        self.assertEqual(
+            [
+                node.key
+                for node in graph.get_ordered()
+            ],
+            [
+                'evolution:app_deps_app:__first__',
+                'evolution:app_deps_app:test_evolution',
+                'evolution:app_deps_app:__last__',
+            ])
+
     @requires_migrations
     def test_mark_migrations_applied(self):
         """Testing EvolutionGraph.mark_migrations_applied"""
@@ -700,6 +734,176 @@ class EvolutionGraphTests(MigrationsTestsMixin, TestCase):
 
         return migration_plan
 
+    def test_iter_batches_with_coalesce_evolutions(self):
+        """Testing EvolutionGraph.iter_batches with coalesce_evolutions=True
+        """
+        graph = self._build_coalesce_graph()
+
+        # Without coalescing, evolutions_app's second evolution ends up in a
+        # batch after the migration, even though it doesn't depend on it.
+        self.assertEqual(
+            self._get_batch_keys(graph.iter_batches()),
+            [
+                (graph.NODE_TYPE_EVOLUTION, [
+                    'evolution:evolutions_app:evolution1',
+                ]),
+                (graph.NODE_TYPE_MIGRATION, [
+                    'migration:migrations_app:0001_initial',
+                ]),
+                (graph.NODE_TYPE_EVOLUTION, [
+                    'evolution:evolutions_app2:evolution1',
+                    'evolution:evolutions_app:evolution2',
+                ]),
+            ])
+
+        self.assertEqual(
+            self._get_batch_keys(
+                graph.iter_batches(coalesce_evolutions=True)),
+            [
+                (graph.NODE_TYPE_EVOLUTION, [
+                    'evolution:evolutions_app:evolution1',
+                    'evolution:evolutions_app:evolution2',
+                ]),
+                (graph.NODE_TYPE_MIGRATION, [
+                    'migration:migrations_app:0001_initial',
+                ]),
+                (graph.NODE_TYPE_EVOLUTION, [
+                    'evolution:evolutions_app2:evolution1',
+                ]),
+            ])
+
+    def test_iter_batches_with_coalesce_evolutions_and_related_migration(
+        self):
+        """Testing EvolutionGraph.iter_batches with coalesce_evolutions=True
+        and evolution for app with relation to model created by migration
+        """
+        class FKToMigrationsAppModel(models.Model):
+            fkey = models.ForeignKey(MigrationsAppTestModel,
+                                     on_delete=models.CASCADE)
+
+            class Meta:
+                app_label = 'evolutions_app'
+
+        try:
+            graph = self._build_coalesce_graph()
+
+            # evolutions_app's second evolution was ordered after the
+            # migration creating the model it now points to, so it must stay
+            # there.
+            self.assertEqual(
+                self._get_batch_keys(
+                    graph.iter_batches(coalesce_evolutions=True)),
+                [
+                    (graph.NODE_TYPE_EVOLUTION, [
+                        'evolution:evolutions_app:evolution1',
+                    ]),
+                    (graph.NODE_TYPE_MIGRATION, [
+                        'migration:migrations_app:0001_initial',
+                    ]),
+                    (graph.NODE_TYPE_EVOLUTION, [
+                        'evolution:evolutions_app2:evolution1',
+                        'evolution:evolutions_app:evolution2',
+                    ]),
+                ])
+        finally:
+            unregister_app_model('evolutions_app', 'fktomigrationsappmodel')
+
+    def test_iter_batches_with_coalesce_evolutions_and_unknown_app(self):
+        """Testing EvolutionGraph.iter_batches with coalesce_evolutions=True
+        and nodes without a known app
+        """
+        graph = EvolutionGraph()
+        graph.add_node('evolution:app1:evolution1',
+                       state={'type': graph.NODE_TYPE_EVOLUTION})
+        graph.add_node('migration:app2:0001_initial',
+                       state={'type': graph.NODE_TYPE_MIGRATION})
+        graph.add_node('evolution:app1:evolution2',
+                       state={'type': graph.NODE_TYPE_EVOLUTION})
+        graph.add_dependency(node_key='migration:app2:0001_initial',
+                             dep_node_key='evolution:app1:evolution1')
+        graph.finalize()
+
+        self.assertEqual(
+            self._get_batch_keys(
+                graph.iter_batches(coalesce_evolutions=True)),
+            [
+                (graph.NODE_TYPE_EVOLUTION, ['evolution:app1:evolution1']),
+                (graph.NODE_TYPE_MIGRATION, ['migration:app2:0001_initial']),
+                (graph.NODE_TYPE_EVOLUTION, ['evolution:app1:evolution2']),
+            ])
+
+    def _build_coalesce_graph(self):
+        """Build a graph for testing coalescing of evolutions.
+
+        The graph contains two evolutions for ``evolutions_app``, with a
+        migration for ``migrations_app`` and an evolution for
+        ``evolutions_app2`` (which depends on the migration) ordered between
+        them.
+
+        Returns:
+            django_evolution.utils.graph.EvolutionGraph:
+            The finalized graph.
+        """
+        evolutions_app = get_app('evolutions_app')
+        evolutions_app2 = get_app('evolutions_app2')
+
+        graph = EvolutionGraph()
+        graph.add_node('evolution:evolutions_app:evolution1',
+                       state={
+                           'app': evolutions_app,
+                           'type': graph.NODE_TYPE_EVOLUTION,
+                       })
+        graph.add_node('migration:migrations_app:0001_initial',
+                       state={
+                           'migration_target': ('migrations_app',
+                                                '0001_initial'),
+                           'type': graph.NODE_TYPE_MIGRATION,
+                       })
+        graph.add_node('evolution:evolutions_app2:evolution1',
+                       state={
+                           'app': evolutions_app2,
+                           'type': graph.NODE_TYPE_EVOLUTION,
+                       })
+        graph.add_node('evolution:evolutions_app:__last__',
+                       state={'anchor': True})
+        graph.add_node('evolution:evolutions_app:evolution2',
+                       state={
+                           'app': evolutions_app,
+                           'type': graph.NODE_TYPE_EVOLUTION,
+                       })
+
+        graph.add_dependency(
+            node_key='migration:migrations_app:0001_initial',
+            dep_node_key='evolution:evolutions_app:evolution1')
+        graph.add_dependency(
+            node_key='evolution:evolutions_app2:evolution1',
+            dep_node_key='migration:migrations_app:0001_initial')
+        graph.add_dependency(
+            node_key='evolution:evolutions_app:__last__',
+            dep_node_key='evolution:evolutions_app:evolution1')
+        graph.add_dependency(
+            node_key='evolution:evolutions_app:evolution2',
+            dep_node_key='evolution:evolutions_app:__last__')
+        graph.finalize()
+
+        return graph
+
+    def _get_batch_keys(self, batches):
+        """Return the node keys for batches.
+
+        Args:
+            batches (iterable):
+                The batches from :py:meth:`EvolutionGraph.iter_batches`.
+
+        Returns:
+            list of tuple:
+            A list of ``(batch_type, node_keys)`` tuples.
+        """
+        return [
+            (batch_type, [node.key for node in nodes])
+            for batch_type, nodes in batches
+        ]
+
     def _check_node(self, node, key, insert_index=None, dependencies=set(),
                     required_by=set(), state={}):
         """Check a graph node for validity.
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 
 from django.db import models
@@ -14,17 +15,21 @@ from django_evolution.support import supports_migrations
 from django_evolution.tests.base_test_case import (MigrationsTestsMixin,
                                                    TestCase)
 from django_evolution.utils.apps import get_app
-from django_evolution.utils.evolutions import (get_app_pending_mutations,
+from django_evolution.utils.evolutions import (build_evolutions_manifest,
+                                               get_app_mutations,
+                                               get_app_pending_mutations,
                                                get_app_upgrade_info,
                                                get_applied_evolutions,
                                                get_evolution_app_dependencies,
                                                get_evolution_dependencies,
                                                get_evolution_module,
                                                get_evolution_sequence,
+                                               get_evolutions_manifest,
                                                get_evolutions_module,
                                                get_evolutions_module_name,
                                                get_evolutions_path,
-                                               get_evolutions_source)
+                                               get_evolutions_source,
+                                               write_evolutions_manifest)
 
 
 class GetAppPendingMutationsTests(TestCase):
@@ -145,6 +150,183 @@ class GetAppPendingMutationsTests(TestCase):
         self.assertEqual(pending_mutations, mutations)
 
 
+class EvolutionsManifestTests(TestCase):
+    """Unit tests for evolutions manifests."""
+
+    def write_manifest(self, app):
+        """Write an evolutions manifest, removing it after the test.
+
+        Args:
+            app (module):
+                The app to write the manifest for.
+
+        Returns:
+            str:
+            The path to the manifest.
+        """
+        manifest_path = write_evolutions_manifest(app)
+        self.addCleanup(os.unlink, manifest_path)
+
+        return manifest_path
+
+    def test_build_evolutions_manifest(self):
+        """Testing build_evolutions_manifest"""
+        app = get_app('evolution_deps_app')
+        manifest = build_evolutions_manifest(app)
+
+        self.assertEqual(manifest['version'], 1)
+        self.assertEqual(manifest['sequence'], ['test_evolution'])
+        self.assertEqual(manifest['files'],
+                         ['__init__.py', 'test_evolution.py'])
+        self.assertEqual(list(manifest['evolutions']), ['test_evolution'])
+
+        entry = manifest['evolutions']['test_evolution']
+        self.assertEqual(entry['kind'], 'python')
+        self.assertEqual(entry['path'], 'test_evolution.py')
+        self.assertIsNone(entry['mark_applied'])
+        self.assertIsNotNone(entry['hash'])
+
+    def test_build_evolutions_manifest_with_builtin(self):
+        """Testing build_evolutions_manifest with built-in evolutions"""
+        self.assertIsNone(build_evolutions_manifest(get_app('auth')))
+
+    def test_build_evolutions_manifest_without_evolutions(self):
+        """Testing build_evolutions_manifest without evolutions"""
+        self.assertIsNone(
+            build_evolutions_manifest(get_app('migrations_app')))
+
+    def test_get_evolutions_manifest(self):
+        """Testing get_evolutions_manifest"""
+        app = get_app('evolution_deps_app')
+        self.write_manifest(app)
+
+        self.assertEqual(
+            get_evolutions_manifest(app),
+            json.loads(json.dumps(build_evolutions_manifest(app))))
+
+    def test_get_evolutions_manifest_without_manifest(self):
+        """Testing get_evolutions_manifest without a manifest"""
+        self.assertIsNone(
+            get_evolutions_manifest(get_app('evolution_deps_app')))
+
+    def test_get_evolutions_manifest_with_new_file(self):
+        """Testing get_evolutions_manifest with a file added after building
+        """
+        app = get_app('evolution_deps_app')
+        self.write_manifest(app)
+        self.assertIsNotNone(get_evolutions_manifest(app))
+
+        sql_path = os.path.join(get_evolutions_path(app),
+                                'test_evolution.sql')
+
+        with open(sql_path, 'w') as fp:
+            fp.write('SELECT 1;\n')
+
+        self.addCleanup(os.unlink, sql_path)
+
+        self.assertIsNone(get_evolutions_manifest(app))
+
+    def test_get_evolutions_manifest_with_touched_files(self):
+        """Testing get_evolutions_manifest with files touched but unchanged
+        after building
+        """
+        app = get_app('evolution_deps_app')
+        self.write_manifest(app)
+
+        evolutions_path = get_evolutions_path(app)
+
+        # Simulate a fresh checkout or install, which changes modification
+        # times without changing contents.
+        for filename in ('__init__.py', 'test_evolution.py'):
+            path = os.path.join(evolutions_path, filename)
+            st = os.stat(path)
+            self.addCleanup(os.utime, path,
+                            ns=(st.st_atime_ns, st.st_mtime_ns))
+            os.utime(path, ns=(st.st_atime_ns,
+                               st.st_mtime_ns + 10 * 1000 * 1000 * 1000))
+
+        manifest = get_evolutions_manifest(app)
+        self.assertIsNotNone(manifest)
+        self.assertEqual(
+            manifest,
+            json.loads(json.dumps(build_evolutions_manifest(app))))
+
+    def test_get_evolution_dependencies_with_manifest_and_custom_evolutions(
+        self):
+        """Testing get_evolution_dependencies with evolutions manifest and
+        custom evolutions
+        """
+        app = get_app('evolution_deps_app')
+        self.write_manifest(app)
+
+        self.assertEqual(
+            get_evolution_dependencies(
+                app=app,
+                evolution_label='test_custom_evolution',
+                custom_evolutions=[
+                    {
+                        'label': 'test_custom_evolution',
+                        'after_migrations': [
+                            ('other_app2', '0001_migration'),
+                        ],
+                        'mutations': [],
+                    },
+                ]),
+            {
+                'after_evolutions': set(),
+                'after_migrations': {
+                    ('other_app2', '0001_migration'),
+                },
+                'before_evolutions': set(),
+                'before_migrations': set(),
+                'replace_migrations': set(),
+            })
+
+    def test_get_evolution_dependencies_with_manifest(self):
+        """Testing get_evolution_dependencies with evolutions manifest"""
+        app = get_app('evolution_deps_app')
+        expected_deps = get_evolution_dependencies(app, 'test_evolution')
+        expected_app_deps = get_evolution_app_dependencies(app)
+
+        self.write_manifest(app)
+
+        self.assertEqual(get_evolution_dependencies(app, 'test_evolution'),
+                         expected_deps)
+        self.assertEqual(get_evolution_app_dependencies(app),
+                         expected_app_deps)
+
+    def test_get_app_mutations_with_manifest(self):
+        """Testing get_app_mutations with evolutions manifest"""
+        app = get_app('evolutions_app')
+        expected_mutations = get_app_mutations(app)
+
+        self.write_manifest(app)
+
+        self.assertEqual(get_app_mutations(app), expected_mutations)
+        self.assertEqual(get_evolution_sequence(app),
+                         ['first_evolution', 'second_evolution'])
+
+    def test_get_app_upgrade_info_with_manifest(self):
+        """Testing get_app_upgrade_info with evolutions manifest and
+        MoveToDjangoMigrations
+        """
+        app = get_app('move_to_migrations_app')
+        expected_upgrade_info = get_app_upgrade_info(app,
+                                                     simulate_applied=True)
+
+        manifest_path = self.write_manifest(app)
+        manifest = get_evolutions_manifest(app)
+
+        self.assertIsNotNone(manifest)
+        self.assertEqual(
+            manifest['evolutions']['move_to_migrations']['mark_applied'],
+            ['0001_initial'])
+        self.assertEqual(
+            get_app_upgrade_info(app, simulate_applied=True),
+            expected_upgrade_info)
+        self.assertTrue(os.path.exists(manifest_path))
+
+
 class GetEvolutionAppDependenciesTests(TestCase):
     """Unit tests for get_evolution_app_dependencies."""
 
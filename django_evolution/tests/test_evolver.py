@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import json
+import os
+import shutil
+import tempfile
 from collections import OrderedDict
+from contextlib import contextmanager
+from unittest import SkipTest
 
-from django.db import DEFAULT_DB_ALIAS, models
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, models
+from django.db.transaction import atomic, set_rollback
 
 try:
     # Django >= 1.7
@@ -15,12 +23,16 @@ except ImportError:
 
 from django_evolution.compat.db import sql_create_app, sql_delete
 from django_evolution.consts import UpgradeMethod
+from django_evolution.db import EvolutionOperationsMulti
 from django_evolution.db.state import DatabaseState
-from django_evolution.errors import (EvolutionTaskAlreadyQueuedError,
+from django_evolution.errors import (EvolutionException,
+                                     EvolutionTaskAlreadyQueuedError,
                                      QueueEvolverTaskError)
 from django_evolution.evolve import (BaseEvolutionTask, EvolveAppTask,
                                      Evolver, PurgeAppTask)
-from django_evolution.models import Evolution, Version
+from django_evolution.models import (DatabaseStateSnapshot,
+                                     Evolution,
+                                     Version)
 from django_evolution.mutations import (AddField, ChangeField,
                                         MoveToDjangoMigrations)
 from django_evolution.signals import (applied_evolution,
@@ -29,12 +41,14 @@ from django_evolution.signals import (applied_evolution,
                                       applying_migration,
                                       created_models,
                                       creating_models)
-from django_evolution.signature import AppSignature, ModelSignature
+from django_evolution.signature import (AppSignature, ModelSignature,
+                                        ProjectSignature)
 from django_evolution.support import supports_migrations
 from django_evolution.tests import models as evo_test
 from django_evolution.tests.evolutions_app import models as test_app2
 from django_evolution.tests.base_test_case import (EvolutionTestCase,
-                                                   MigrationsTestsMixin)
+                                                   MigrationsTestsMixin,
+                                                   TestCase)
 from django_evolution.tests.decorators import requires_migrations
 from django_evolution.tests.evolutions_app.models import EvolutionsAppTestModel
 from django_evolution.tests.evolutions_app2.models import (
@@ -56,6 +70,7 @@ from django_evolution.utils.apps import (
     get_apps,
     register_app_models,
 )
+from django_evolution.utils.graph import EvolutionGraph
 from django_evolution.utils.migrations import (MigrationList,
                                                record_applied_migrations)
 
@@ -126,6 +141,213 @@ class EvolverTests(BaseEvolverTestCase):
         self.assertEqual(len(app_sigs), 1)
         self.assertEqual(app_sigs[0].app_id, 'django_evolution')
 
+    def test_init_with_no_baseline_and_use_lock(self):
+        """Testing Evolver.__init__ with no baseline signatures and
+        use_lock=True
+        """
+        Version.objects.all().delete()
+
+        evolution_ops_cls = \
+            type(EvolutionOperationsMulti(DEFAULT_DB_ALIAS).get_evolver())
+        orig_acquire_evolve_lock = evolution_ops_cls.acquire_evolve_lock
+        lock_calls = []
+
+        def _acquire_evolve_lock(_self):
+            lock_calls.append('acquire')
+            orig_acquire_evolve_lock(_self)
+
+        evolution_ops_cls.acquire_evolve_lock = _acquire_evolve_lock
+
+        try:
+            evolver = Evolver(use_lock=True)
+        finally:
+            evolution_ops_cls.acquire_evolve_lock = orig_acquire_evolve_lock
+
+        self.assertEqual(lock_calls, ['acquire'])
+        self.assertTrue(evolver.installed_new_database)
+
+        version = Version.objects.get()
+        self.assertEqual(evolver.version, version)
+
+    def test_init_with_no_baseline_and_use_lock_installed_elsewhere(self):
+        """Testing Evolver.__init__ with no baseline signatures and
+        use_lock=True and database installed by another process
+        """
+        orig_version = Version.objects.get()
+        orig_version.delete()
+
+        evolution_ops_cls = \
+            type(EvolutionOperationsMulti(DEFAULT_DB_ALIAS).get_evolver())
+        orig_acquire_evolve_lock = evolution_ops_cls.acquire_evolve_lock
+
+        def _acquire_evolve_lock(_self):
+            # Simulate another process installing the baseline while this
+            # evolver waits on the lock.
+            Version.objects.create(signature=orig_version.signature)
+            orig_acquire_evolve_lock(_self)
+
+        evolution_ops_cls.acquire_evolve_lock = _acquire_evolve_lock
+
+        try:
+            evolver = Evolver(use_lock=True)
+        finally:
+            evolution_ops_cls.acquire_evolve_lock = orig_acquire_evolve_lock
+
+        self.assertFalse(evolver.installed_new_database)
+        self.assertEqual(Version.objects.count(), 1)
+        self.assertEqual(evolver.project_sig, orig_version.signature)
+
+    def test_init_with_database_state_snapshot(self):
+        """Testing Evolver.__init__ with a matching database state snapshot"""
+        evolver_backend = \
+            EvolutionOperationsMulti(DEFAULT_DB_ALIAS).get_evolver()
+        fingerprint = evolver_backend.get_schema_fingerprint()
+
+        if fingerprint is None:
+            raise SkipTest('Schema fingerprints are not supported on this '
+                           'database.')
+
+        # Start from a real scan, so the evolver sees the tables it expects,
+        # and add a table that only exists in the snapshot.
+        database_state = DatabaseState(DEFAULT_DB_ALIAS)
+        database_state.add_table('my_test_table')
+
+        DatabaseStateSnapshot.objects.all().delete()
+        DatabaseStateSnapshot.objects.create(
+            fingerprint=fingerprint,
+            state=json.dumps(database_state.serialize()))
+
+        try:
+            evolver = Evolver()
+        finally:
+            DatabaseStateSnapshot.objects.all().delete()
+
+        self.assertTrue(evolver.database_state.has_table('my_test_table'))
+        self.assertEqual(evolver.database_state.get_digest(),
+                         database_state.get_digest())
+
+    def test_init_with_stale_database_state_snapshot(self):
+        """Testing Evolver.__init__ with a stale database state snapshot"""
+        database_state = DatabaseState(DEFAULT_DB_ALIAS)
+        database_state.add_table('my_test_table')
+
+        DatabaseStateSnapshot.objects.all().delete()
+        DatabaseStateSnapshot.objects.create(
+            fingerprint='stale',
+            state=json.dumps(database_state.serialize()))
+
+        try:
+            evolver = Evolver()
+        finally:
+            DatabaseStateSnapshot.objects.all().delete()
+
+        self.assertFalse(evolver.database_state.has_table('my_test_table'))
+        self.assertTrue(evolver.database_state.has_model(Version))
+
+    def test_evolve_installs_database_state_snapshot_model(self):
+        """Testing Evolver.evolve installs DatabaseStateSnapshot on databases
+        evolved before it was added
+        """
+        # Simulate a database from before the model was introduced, with no
+        # table and no record of it in the stored signature.
+        connection = connections[DEFAULT_DB_ALIAS]
+        execute_test_sql([
+            'DROP TABLE %s' % connection.ops.quote_name(
+                DatabaseStateSnapshot._meta.db_table),
+        ])
+
+        version = Version.objects.current_version()
+        version.signature.get_app_sig('django_evolution').remove_model_sig(
+            'DatabaseStateSnapshot')
+        version.save()
+
+        evolver = Evolver()
+        self.assertFalse(evolver.database_state.has_model(
+            DatabaseStateSnapshot))
+
+        evolver.queue_evolve_app(get_app('django_evolution'))
+        evolver.evolve()
+
+        evolver = Evolver()
+        self.assertTrue(evolver.database_state.has_model(
+            DatabaseStateSnapshot))
+        self.assertIsNotNone(
+            evolver.project_sig
+            .get_app_sig('django_evolution')
+            .get_model_sig('DatabaseStateSnapshot'))
+
+    @requires_migrations
+    def test_get_applied_migrations(self):
+        """Testing Evolver.get_applied_migrations"""
+        evolver = Evolver()
+
+        migration_list = MigrationList()
+        migration_list.add_migration_info(app_label='tests',
+                                          name='0001_initial')
+        record_applied_migrations(connection=evolver.connection,
+                                  migrations=migration_list)
+
+        applied_migrations = evolver.get_applied_migrations()
+
+        self.assertTrue(applied_migrations.has_migration_info(
+            app_label='tests',
+            name='0001_initial'))
+
+        # Subsequent calls should use the cached list.
+        with self.assertNumQueries(0):
+            self.assertIs(evolver.get_applied_migrations(),
+                          applied_migrations)
+
+    @requires_migrations
+    def test_get_applied_migrations_tracks_applied_migration(self):
+        """Testing Evolver.get_applied_migrations updates when the
+        applied_migration signal is emitted
+        """
+        evolver = Evolver()
+        applied_migrations = evolver.get_applied_migrations()
+
+        migration = migrations.Migration('0002_squashed', 'tests')
+        migration.replaces = [
+            ('tests', '0001_initial'),
+            ('tests', '0002_add_field'),
+        ]
+
+        # Migrations applied by other senders should be ignored.
+        applied_migration.send(sender=self, migration=migration)
+        self.assertFalse(applied_migrations.has_migration_info(
+            app_label='tests',
+            name='0002_squashed'))
+
+        with self.assertNumQueries(0):
+            applied_migration.send(sender=evolver, migration=migration)
+
+        self.assertIs(evolver.get_applied_migrations(), applied_migrations)
+
+        for name in ('0001_initial', '0002_add_field', '0002_squashed'):
+            self.assertTrue(applied_migrations.has_migration_info(
+                app_label='tests',
+                name=name))
+
+    @requires_migrations
+    def test_mark_migrations_applied(self):
+        """Testing Evolver.mark_migrations_applied"""
+        evolver = Evolver()
+        applied_migrations = evolver.get_applied_migrations()
+
+        migration_list = MigrationList()
+        migration_list.add_migration_info(app_label='tests',
+                                          name='0001_initial')
+        evolver.mark_migrations_applied(migration_list)
+        evolver.mark_migrations_applied(migration_list)
+
+        self.assertEqual(
+            [
+                info['name']
+                for info in applied_migrations
+                if info['app_label'] == 'tests'
+            ],
+            ['0001_initial'])
+
     def test_can_simulate_with_all_can_simulate_true_evolution_true(self):
         """Testing Evolver.can_simulate with all tasks having can_simulate=True
         """
@@ -555,6 +777,190 @@ class EvolverTests(BaseEvolverTestCase):
             200)
         self.assertIsNotNone(model_sig.get_field_sig('new_field'))
 
+    def test_evolve_with_use_lock(self):
+        """Testing Evolver.evolve with use_lock=True"""
+        model_sig = ModelSignature.from_model(EvolverTestModel)
+        model_sig.get_field_sig('value').field_attrs['max_length'] = 50
+
+        app_sig = AppSignature(app_id='tests')
+        app_sig.add_model_sig(model_sig)
+
+        orig_version = Version.objects.current_version()
+        orig_version.signature.add_app_sig(app_sig)
+        orig_version.save()
+
+        with ensure_test_db(model_entries=[('TestModel', EvolverTestModel)]):
+            evolver = Evolver(use_lock=True)
+            evolver.queue_task(EvolveAppTask(
+                evolver=evolver,
+                app=evo_test,
+                evolutions=[
+                    {
+                        'label': 'my_evolution1',
+                        'mutations': [
+                            ChangeField('TestModel', 'value', max_length=200),
+                        ],
+                    },
+                ]))
+            evolver.evolve()
+
+        self.assertTrue(evolver.evolved)
+        self.assertFalse(evolver.evolved_elsewhere)
+
+        version = Version.objects.current_version()
+        self.assertNotEqual(version, orig_version)
+        self.assertEqual(evolver.version, version)
+
+        self.assertAppliedEvolutions([('tests', 'my_evolution1')],
+                                     version=version)
+
+    def test_evolve_with_use_lock_and_evolved_elsewhere(self):
+        """Testing Evolver.evolve with use_lock=True and database evolved by
+        another process
+        """
+        model_sig = ModelSignature.from_model(EvolverTestModel)
+        model_sig.get_field_sig('value').field_attrs['max_length'] = 50
+
+        app_sig = AppSignature(app_id='tests')
+        app_sig.add_model_sig(model_sig)
+
+        orig_version = Version.objects.current_version()
+        orig_version.signature.add_app_sig(app_sig)
+        orig_version.save()
+
+        with ensure_test_db(model_entries=[('TestModel', EvolverTestModel)]):
+            evolver = Evolver(use_lock=True)
+            evolver.queue_task(EvolveAppTask(
+                evolver=evolver,
+                app=evo_test,
+                evolutions=[
+                    {
+                        'label': 'my_evolution1',
+                        'mutations': [
+                            ChangeField('TestModel', 'value', max_length=200),
+                        ],
+                    },
+                ]))
+
+            # Simulate another process applying the same evolution before
+            # this evolver acquires the lock.
+            other_project_sig = orig_version.signature.clone()
+            (
+                other_project_sig
+                .get_app_sig('tests')
+                .get_model_sig('TestModel')
+                .get_field_sig('value')
+                .field_attrs['max_length']
+            ) = 200
+            other_version = Version.objects.create(
+                signature=other_project_sig)
+
+            evolver.evolve()
+
+        self.assertTrue(evolver.evolved)
+        self.assertTrue(evolver.evolved_elsewhere)
+        self.assertEqual(evolver.version, other_version)
+        self.assertEqual(Version.objects.current_version(), other_version)
+        self.assertFalse(Evolution.objects.filter(
+            app_label='tests',
+            label='my_evolution1').exists())
+
+        with self.assertRaises(EvolutionException):
+            evolver.evolve()
+
+    def test_evolve_with_use_lock_and_partially_evolved_elsewhere(self):
+        """Testing Evolver.evolve with use_lock=True and database partially
+        evolved by another process that failed, followed by a rerun
+        """
+        model_sig = ModelSignature.from_model(EvolverTestModel)
+        model_sig.get_field_sig('value').field_attrs['max_length'] = 50
+
+        app_sig = AppSignature(app_id='tests')
+        app_sig.add_model_sig(model_sig)
+
+        orig_version = Version.objects.current_version()
+        orig_version.signature.add_app_sig(app_sig)
+        orig_version.save()
+
+        evolutions = [
+            {
+                'label': 'my_evolution1',
+                'mutations': [
+                    ChangeField('TestModel', 'value', max_length=200),
+                ],
+            },
+            {
+                'label': 'my_evolution2',
+                'mutations': [
+                    AddField('TestModel', 'new_field', models.BooleanField,
+                             null=True),
+                ],
+            },
+        ]
+
+        with ensure_test_db(model_entries=[('TestModel', EvolverTestModel)]):
+            evolver = Evolver(use_lock=True)
+            evolver.queue_task(EvolveAppTask(
+                evolver=evolver,
+                app=evo_test,
+                evolutions=evolutions))
+
+            # Simulate another process checkpointing the first evolution
+            # and then failing, before this evolver acquires the lock.
+            checkpoint_project_sig = orig_version.signature.clone()
+            (
+                checkpoint_project_sig
+                .get_app_sig('tests')
+                .get_model_sig('TestModel')
+                .get_field_sig('value')
+                .field_attrs['max_length']
+            ) = 200
+            checkpoint_version = Version.objects.create(
+                signature=checkpoint_project_sig)
+            Evolution.objects.create(version=checkpoint_version,
+                                     app_label='tests',
+                                     label='my_evolution1')
+
+            message = (
+                'The database was partially evolved by another process '
+                'while waiting to evolve it. Run the evolution again to '
+                'apply the remaining changes.'
+            )
+
+            with self.assertRaisesMessage(EvolutionException, message):
+                evolver.evolve()
+
+            self.assertFalse(evolver.evolved)
+            self.assertFalse(evolver.evolved_elsewhere)
+            self.assertEqual(Version.objects.current_version(),
+                             checkpoint_version)
+
+            # A rerun picks up from the saved progress.
+            evolver = Evolver(use_lock=True)
+            evolver.queue_task(EvolveAppTask(
+                evolver=evolver,
+                app=evo_test,
+                evolutions=evolutions[1:]))
+            evolver.evolve()
+
+        self.assertTrue(evolver.evolved)
+        self.assertFalse(evolver.evolved_elsewhere)
+
+        version = Version.objects.current_version()
+        self.assertNotEqual(version, checkpoint_version)
+        self.assertAppliedEvolutions([('tests', 'my_evolution2')],
+                                     version=version)
+
+        model_sig = (
+            version.signature
+            .get_app_sig('tests')
+            .get_model_sig('TestModel')
+        )
+        self.assertEqual(
+            model_sig.get_field_sig('value').field_attrs['max_length'],
+            200)
+        self.assertIsNotNone(model_sig.get_field_sig('new_field'))
+
     def test_evolve_with_hinted(self):
         """Testing Evolver.evolve with hinting"""
         model_sig = ModelSignature.from_model(EvolverTestModel)
@@ -588,6 +994,64 @@ class EvolverTests(BaseEvolverTestCase):
             100)
 
 
+class EvolveLockTests(TestCase):
+    """Unit tests for evolve locks in database backends."""
+
+    def test_sqlite_acquire_evolve_lock(self):
+        """Testing SQLite EvolutionOperations.acquire_evolve_lock"""
+        try:
+            import fcntl
+        except ImportError:
+            raise SkipTest('fcntl is not available on this platform')
+
+        from django_evolution.db.sqlite3 import EvolutionOperations
+
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+
+        class DummyConnection(object):
+            settings_dict = {
+                'NAME': os.path.join(tempdir, 'test.db'),
+            }
+
+        evolution_ops = EvolutionOperations(database_state=None,
+                                            connection=DummyConnection())
+        evolution_ops.acquire_evolve_lock()
+
+        lock_path = os.path.join(tempdir, 'test.db.evolve-lock')
+        self.assertTrue(os.path.exists(lock_path))
+
+        with open(lock_path, 'a') as fp:
+            # Another process (or open file) can't take the lock.
+            with self.assertRaises(IOError):
+                fcntl.flock(fp.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+            evolution_ops.release_evolve_lock()
+
+            # Now it can.
+            fcntl.flock(fp.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+
+    def test_sqlite_acquire_evolve_lock_with_memory_db(self):
+        """Testing SQLite EvolutionOperations.acquire_evolve_lock with
+        in-memory database
+        """
+        from django_evolution.db.sqlite3 import EvolutionOperations
+
+        class DummyConnection(object):
+            settings_dict = {
+                'NAME': ':memory:',
+            }
+
+        evolution_ops = EvolutionOperations(database_state=None,
+                                            connection=DummyConnection())
+        evolution_ops.acquire_evolve_lock()
+
+        self.assertIsNone(evolution_ops._evolve_lock_file)
+
+        evolution_ops.release_evolve_lock()
+
+
 class EvolveAppTaskTests(MigrationsTestsMixin, BaseEvolverTestCase):
     """Unit tests for django_evolution.evolve.EvolveAppTask."""
 
@@ -1235,6 +1699,10 @@ class EvolveAppTaskTests(MigrationsTestsMixin, BaseEvolverTestCase):
                 app_label='tests',
                 name='0002_add_field'))
 
+            # The evolver's cached list should match what's in the database.
+            self.assertEqual(evolver.get_applied_migrations().to_targets(),
+                             applied_migrations.to_targets())
+
             # Make sure we can now use the model.
             MigrationTestModel.objects.create(field1=42,
                                               field2='foo',
@@ -1389,6 +1857,110 @@ class EvolveAppTaskTests(MigrationsTestsMixin, BaseEvolverTestCase):
                                           field2='foo',
                                           field3=True)
 
+    @requires_migrations
+    def test_execute_tasks_with_failure_saves_checkpoint(self):
+        """Testing EvolveAppTask.execute_tasks saves progress from completed
+        batches when a later batch fails
+        """
+        class EvolveMigrateTestModel(BaseTestModel):
+            field1 = models.IntegerField()
+
+        class InitialMigration(migrations.Migration):
+            operations = [
+                migrations.CreateModel(
+                    name='TestModel',
+                    fields=[
+                        ('id', models.AutoField(verbose_name='ID',
+                                                serialize=False,
+                                                auto_created=True,
+                                                primary_key=True)),
+                        ('field1', models.IntegerField()),
+                        ('field2', models.CharField(max_length=10)),
+                    ]
+                ),
+            ]
+
+        class BadMigration(migrations.Migration):
+            dependencies = [
+                ('tests', '0001_initial'),
+            ]
+
+            operations = [
+                migrations.RunSQL('THIS IS NOT VALID SQL'),
+            ]
+
+        self.set_base_model(EvolveMigrateTestModel)
+        self.app_sig.remove_model_sig('TestModel')
+        self.app_sig.add_model_sig(ModelSignature.from_model(
+            EvolveMigrateTestModel))
+        self.version.save()
+
+        model_entries = [
+            ('TestModel', EvolveMigrateTestModel),
+        ]
+
+        with ensure_test_db(model_entries=model_entries):
+            evolver = Evolver()
+            app_sig = evolver.project_sig.get_app_sig('tests')
+            app_sig.upgrade_method = UpgradeMethod.EVOLUTIONS
+
+            task = EvolveAppTask(
+                evolver=evolver,
+                app=evo_test,
+                evolutions=[
+                    {
+                        'label': 'add_field2',
+                        'mutations': [
+                            AddField('TestModel', 'field2',
+                                     models.CharField,
+                                     max_length=10,
+                                     initial=0),
+                        ],
+                    },
+                    {
+                        'label': 'move_to_migrations',
+                        'mutations': [
+                            MoveToDjangoMigrations(
+                                mark_applied=['0001_initial']),
+                        ],
+                    },
+                ],
+                migrations=[
+                    InitialMigration('0001_initial', 'tests'),
+                    BadMigration('0002_bad', 'tests'),
+                ])
+
+            evolver.queue_task(task)
+            EvolveAppTask.prepare_tasks(evolver, [task])
+
+            with self.assertRaises(Exception):
+                EvolveAppTask.execute_tasks(evolver, [task])
+
+            # The evolutions batch should have been recorded, along with
+            # the signature as of that batch.
+            version = Version.objects.current_version()
+            self.assertEqual(version, evolver.version)
+            self.assertAppliedEvolutions(
+                [
+                    ('tests', 'add_field2'),
+                    ('tests', 'move_to_migrations'),
+                ],
+                version=version)
+
+            saved_app_sig = version.signature.get_app_sig('tests')
+            self.assertEqual(saved_app_sig.upgrade_method,
+                             UpgradeMethod.MIGRATIONS)
+            self.assertIsNotNone(
+                saved_app_sig.get_model_sig('TestModel')
+                .get_field_sig('field2'))
+
+            # Saving the final state shouldn't record the evolutions again.
+            evolver._save_project_sig(new_evolutions=task.new_evolutions)
+
+            self.assertEqual(
+                Evolution.objects.filter(app_label='tests').count(),
+                2)
+
     def test_execute_tasks_with_dependencies_and_new_db(self):
         """Testing EvolveAppTask.execute_tasks with complex dependencies and
         new database
@@ -1710,6 +2282,82 @@ class EvolveAppTaskTests(MigrationsTestsMixin, BaseEvolverTestCase):
 
         self.assertSQLMappingEqual(sql, 'create_tables_with_deferred_refs')
 
+    def test_apply_deferred_sql_with_concurrent_indexes(self):
+        """Testing EvolveAppTask._apply_deferred_sql with bulk_install_jobs
+        creating indexes concurrently on a new database
+        """
+        if connections[DEFAULT_DB_ALIAS].vendor != 'sqlite':
+            raise SkipTest('This test only runs on SQLite.')
+
+        with self._tenant_databases('tenant1') as databases:
+            database = databases[0]
+
+            with self._force_concurrent_index_creation() as index_sql:
+                # Installing the database will create all tables in a
+                # transaction, and then the indexes over new connections.
+                # Those can only see the tables once they're committed.
+                evolver = Evolver(database_name=database,
+                                  bulk_install=True,
+                                  bulk_install_jobs=2)
+
+            self.assertTrue(evolver.installed_new_database)
+            self.assertNotEqual(index_sql, [])
+            self.assertIsNotNone(
+                Version.objects.current_version(using=database))
+
+            database_state = DatabaseState(database)
+            self.assertIsNotNone(database_state.find_index(
+                table_name='django_evolution',
+                columns=['version_id']))
+
+    def test_apply_deferred_sql_with_concurrent_indexes_in_transaction(self):
+        """Testing EvolveAppTask._apply_deferred_sql with bulk_install_jobs
+        creating indexes serially inside an existing transaction
+        """
+        evolver = Evolver()
+        evolver.bulk_install = True
+        evolver.bulk_install_jobs = 2
+
+        with atomic():
+            with self._force_concurrent_index_creation() as index_sql:
+                with evolver.sql_executor() as sql_executor:
+                    sql = EvolveAppTask._apply_deferred_sql(
+                        sql_executor=sql_executor,
+                        evolver=evolver,
+                        sql=['CREATE INDEX "test_evolution_label_idx"'
+                             ' ON "django_evolution" ("label");'])
+
+            # Anything created in this transaction wouldn't be visible to
+            # other connections, so the index must have been created here.
+            database_state = DatabaseState(DEFAULT_DB_ALIAS)
+
+            # Leave the database as it was for other tests.
+            set_rollback(True)
+
+        self.assertEqual(index_sql, [])
+        self.assertEqual(
+            sql,
+            ['CREATE INDEX "test_evolution_label_idx"'
+             ' ON "django_evolution" ("label");'])
+        self.assertIsNotNone(database_state.get_index(
+            table_name='django_evolution',
+            index_name='test_evolution_label_idx'))
+
+    def test_build_batches_with_coalesce_evolutions_disabled(self):
+        """Testing EvolveAppTask._build_batches with
+        DJANGO_EVOLUTION['COALESCE_EVOLUTIONS'] disabled
+        """
+        self.assertEqual(self._get_build_batches_coalesce_evolutions(),
+                         [False])
+
+    def test_build_batches_with_coalesce_evolutions_enabled(self):
+        """Testing EvolveAppTask._build_batches with
+        DJANGO_EVOLUTION['COALESCE_EVOLUTIONS'] enabled
+        """
+        with self.settings(DJANGO_EVOLUTION={'COALESCE_EVOLUTIONS': True}):
+            self.assertEqual(self._get_build_batches_coalesce_evolutions(),
+                             [True])
+
     def test_prepare_with_hinted_false(self):
         """Testing EvolveAppTask.prepare with hinted=False"""
         register_app_models('tests', [('TestModel', EvolverTestModel)],
@@ -1742,6 +2390,38 @@ class EvolveAppTaskTests(MigrationsTestsMixin, BaseEvolverTestCase):
         self.assertEqual(evolution.app_label, 'tests')
         self.assertEqual(evolution.label, 'my_evolution1')
 
+    def test_prepare_with_sql_notes(self):
+        """Testing EvolveAppTask.prepare with SQL notes from the database
+        backend
+        """
+        if connections[DEFAULT_DB_ALIAS].vendor != 'postgresql':
+            raise SkipTest('This test only runs on Postgres.')
+
+        register_app_models('tests', [('TestModel', EvolverTestModel)],
+                            reset=True)
+
+        with ensure_test_db(model_entries=[('TestModel', EvolverTestModel)]):
+            evolver = Evolver()
+            task = EvolveAppTask(
+                evolver=evolver,
+                app=evo_test,
+                evolutions=[
+                    {
+                        'label': 'my_evolution1',
+                        'mutations': [
+                            ChangeField('TestModel', 'value', max_length=100),
+                        ],
+                    },
+                ])
+            task.prepare(hinted=False)
+
+        self.assertEqual(
+            task.sql_notes,
+            [
+                'Column type change (metadata-only):'
+                ' "tests_testmodel"."value" varchar(50) -> varchar(100)',
+            ])
+
     def test_prepare_with_hinted_true(self):
         """Testing EvolveAppTask.prepare with hinted=True"""
         register_app_models('tests', [('TestModel', EvolverTestModel)],
@@ -1827,6 +2507,299 @@ class EvolveAppTaskTests(MigrationsTestsMixin, BaseEvolverTestCase):
         self.assertEqual(task.new_model_names, ['TestModel'])
         self.assertSQLMappingEqual(task._new_models_sql, 'create_table')
 
+    def test_generate_mutations_info_with_compiled_plan(self):
+        """Testing EvolveAppTask.generate_mutations_info reuses compiled plans
+        for matching state
+        """
+        register_app_models('tests', [('TestModel', EvolverTestModel)],
+                            reset=True)
+
+        mutations = [
+            ChangeField('TestModel', 'value', max_length=100),
+        ]
+
+        with ensure_test_db(model_entries=[('TestModel', EvolverTestModel)]):
+            evolver1 = Evolver()
+            task1 = EvolveAppTask(evolver=evolver1,
+                                  app=evo_test)
+            mutations_info1 = task1.generate_mutations_info(
+                mutations,
+                evolution_labels=['my_evolution'])
+
+            evolver2 = Evolver()
+            app_sig = evolver2.project_sig.get_app_sig('tests')
+            task2 = EvolveAppTask(evolver=evolver2,
+                                  app=evo_test)
+            mutations_info2 = task2.generate_mutations_info(
+                mutations,
+                evolution_labels=['my_evolution'])
+
+        self.assertIsNotNone(mutations_info1['app_mutator'])
+        self.assertIsNone(mutations_info2['app_mutator'])
+        self.assertEqual(mutations_info2['sql'], mutations_info1['sql'])
+        self.assertEqual(mutations_info2['mutations'],
+                         mutations_info1['mutations'])
+        self.assertTrue(mutations_info2['can_simulate'])
+
+        # The evolver's signature should be updated in place.
+        self.assertIs(evolver2.project_sig.get_app_sig('tests'), app_sig)
+        self.assertEqual(evolver2.project_sig, evolver1.project_sig)
+
+        field_sig = (
+            app_sig
+            .get_model_sig('TestModel')
+            .get_field_sig('value')
+        )
+        self.assertEqual(field_sig.readonly_field_attrs['max_length'], 100)
+
+    def test_generate_mutations_info_with_compiled_plan_and_changed_sig(self):
+        """Testing EvolveAppTask.generate_mutations_info doesn't reuse
+        compiled plans for a different signature
+        """
+        register_app_models('tests', [('TestModel', EvolverTestModel)],
+                            reset=True)
+
+        mutations = [
+            ChangeField('TestModel', 'value', max_length=100),
+        ]
+
+        with ensure_test_db(model_entries=[('TestModel', EvolverTestModel)]):
+            evolver1 = Evolver()
+            task1 = EvolveAppTask(evolver=evolver1,
+                                  app=evo_test)
+            task1.generate_mutations_info(mutations,
+                                          evolution_labels=['my_evolution'])
+
+            evolver2 = Evolver()
+            evolver2.project_sig.get_app_sig('tests').applied_migrations = \
+                ['0001_initial']
+            task2 = EvolveAppTask(evolver=evolver2,
+                                  app=evo_test)
+            mutations_info = task2.generate_mutations_info(
+                mutations,
+                evolution_labels=['my_evolution'])
+
+        self.assertIsNotNone(mutations_info['app_mutator'])
+
+    def test_generate_mutations_info_with_compiled_plan_same_evolver(self):
+        """Testing EvolveAppTask.generate_mutations_info doesn't reuse a
+        compiled plan in the evolver that compiled it
+        """
+        register_app_models('tests', [('TestModel', EvolverTestModel)],
+                            reset=True)
+
+        mutations = [
+            ChangeField('TestModel', 'value', max_length=100),
+        ]
+
+        with ensure_test_db(model_entries=[('TestModel', EvolverTestModel)]):
+            evolver = Evolver()
+            task = EvolveAppTask(evolver=evolver,
+                                 app=evo_test)
+            task.generate_mutations_info(mutations,
+                                         update_evolver=False,
+                                         evolution_labels=['my_evolution'])
+            mutations_info = task.generate_mutations_info(
+                mutations,
+                evolution_labels=['my_evolution'])
+
+        self.assertIsNotNone(mutations_info['app_mutator'])
+
+    def test_generate_mutations_info_with_compiled_plan_and_changed_labels(
+        self):
+        """Testing EvolveAppTask.generate_mutations_info doesn't reuse
+        compiled plans for different evolutions
+        """
+        register_app_models('tests', [('TestModel', EvolverTestModel)],
+                            reset=True)
+
+        mutations = [
+            ChangeField('TestModel', 'value', max_length=100),
+        ]
+
+        with ensure_test_db(model_entries=[('TestModel', EvolverTestModel)]):
+            evolver1 = Evolver()
+            task1 = EvolveAppTask(evolver=evolver1,
+                                  app=evo_test)
+            task1.generate_mutations_info(mutations,
+                                          evolution_labels=['my_evolution'])
+
+            evolver2 = Evolver()
+            task2 = EvolveAppTask(evolver=evolver2,
+                                  app=evo_test)
+            mutations_info = task2.generate_mutations_info(
+                [
+                    ChangeField('TestModel', 'value', max_length=100),
+                ],
+                evolution_labels=['other_evolution'])
+
+        self.assertIsNotNone(mutations_info['app_mutator'])
+
+    def test_evolve_with_compiled_plan_for_tenant_databases(self):
+        """Testing Evolver.evolve with a compiled plan reused for a second
+        database with identical state
+        """
+        if connections[DEFAULT_DB_ALIAS].vendor != 'sqlite':
+            raise SkipTest('This test only runs on SQLite.')
+
+        register_app_models('tests', [('TestModel', EvolverTestModel)],
+                            reset=True)
+
+        results = []
+
+        with self._tenant_databases('tenant1', 'tenant2') as databases:
+            for database in databases:
+                # Set up each database the same way, with the test app's
+                # tables and a signature covering them.
+                Evolver(database_name=database)
+                execute_test_sql(sql_create_app(app=evo_test,
+                                                db_name=database),
+                                 database=database)
+                Version.objects.using(database).create(
+                    signature=ProjectSignature.from_database(database))
+
+                plan_keys = set(EvolveAppTask._compiled_plans)
+
+                # Now apply an evolution to it.
+                evolver = Evolver(database_name=database)
+                task = EvolveAppTask(
+                    evolver=evolver,
+                    app=evo_test,
+                    evolutions=[
+                        {
+                            'label': 'tenant_evolution',
+                            'mutations': [
+                                ChangeField('TestModel', 'value',
+                                            max_length=200),
+                            ],
+                        },
+                    ])
+                evolver.queue_task(task)
+                evolver.evolve()
+
+                results.append({
+                    'new_plan_keys':
+                        set(EvolveAppTask._compiled_plans) - plan_keys,
+                    'signature': (
+                        Version.objects.current_version(using=database)
+                        .signature
+                        .serialize()
+                    ),
+                    'sql': task.sql,
+                })
+
+        result1, result2 = results
+
+        # The first database compiled the plan, and the second reused it.
+        self.assertEqual(len(result1['new_plan_keys']), 1)
+        self.assertEqual(result2['new_plan_keys'], set())
+
+        self.assertNotEqual(result1['sql'], [])
+        self.assertEqual(result2['sql'], result1['sql'])
+        self.assertEqual(result2['signature'], result1['signature'])
+        self.assertEqual(
+            (result2['signature']['apps']['tests']['models']['TestModel']
+             ['fields']['value']['attrs']['max_length']),
+            200)
+
+    def _get_build_batches_coalesce_evolutions(self):
+        """Return how EvolveAppTask._build_batches iterated graph batches.
+
+        Returns:
+            list of bool:
+            The ``coalesce_evolutions`` value passed for each call to
+            :py:meth:`EvolutionGraph.iter_batches
+            <django_evolution.utils.graph.EvolutionGraph.iter_batches>`.
+        """
+        calls = []
+
+        class RecordingEvolutionGraph(EvolutionGraph):
+            def iter_batches(self, coalesce_evolutions=False):
+                calls.append(coalesce_evolutions)
+
+                return super(RecordingEvolutionGraph, self).iter_batches(
+                    coalesce_evolutions=coalesce_evolutions)
+
+        graph = RecordingEvolutionGraph()
+        graph.finalize()
+
+        batches = EvolveAppTask._build_batches(evolver=Evolver(),
+                                               graph=graph,
+                                               hinted=False)
+        self.assertEqual(batches, [])
+
+        return calls
+
+    @contextmanager
+    def _force_concurrent_index_creation(self):
+        """Force concurrent index creation for the test, and record it.
+
+        Context:
+            list of unicode:
+            The index SQL statements that were created concurrently.
+        """
+        evolution_ops_cls = \
+            type(EvolutionOperationsMulti(DEFAULT_DB_ALIAS).get_evolver())
+        old_supports = evolution_ops_cls.__dict__.get(
+            'supports_concurrent_index_creation')
+        old_create_indexes = \
+            EvolveAppTask.__dict__['_create_indexes_concurrently']
+        index_sql = []
+
+        def _create_indexes_concurrently(cls, evolver, sql):
+            index_sql.extend(sql)
+
+            return old_create_indexes.__func__(cls, evolver=evolver, sql=sql)
+
+        evolution_ops_cls.supports_concurrent_index_creation = True
+        EvolveAppTask._create_indexes_concurrently = \
+            classmethod(_create_indexes_concurrently)
+
+        try:
+            yield index_sql
+        finally:
+            EvolveAppTask._create_indexes_concurrently = old_create_indexes
+
+            if old_supports is None:
+                del evolution_ops_cls.supports_concurrent_index_creation
+            else:
+                evolution_ops_cls.supports_concurrent_index_creation = \
+                    old_supports
+
+    @contextmanager
+    def _tenant_databases(self, *databases):
+        """Provide new, empty SQLite databases for the test.
+
+        Args:
+            *databases (tuple of unicode):
+                The names of the databases to add.
+
+        Context:
+            list of unicode:
+            The names of the new databases.
+        """
+        tempdir = tempfile.mkdtemp(prefix='django-evolution-')
+        settings_dict = connections[DEFAULT_DB_ALIAS].settings_dict
+
+        for database in databases:
+            # Django's connection handler shares this dictionary, so the new
+            # database is available through both.
+            settings.DATABASES[database] = dict(
+                settings_dict,
+                ENGINE='django.db.backends.sqlite3',
+                NAME=os.path.join(tempdir, '%s.db' % database),
+                TEST={})
+
+        try:
+            yield list(databases)
+        finally:
+            for database in databases:
+                connections[database].close()
+                del connections[database]
+                del settings.DATABASES[database]
+
+            shutil.rmtree(tempdir)
+
     def test_execute(self):
         """Testing EvolveAppTask.execute"""
         with ensure_test_db(model_entries=[('TestModel', EvolverTestModel)]):
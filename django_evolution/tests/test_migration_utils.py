@@ -690,6 +690,30 @@ class MigrationLoadTests(MigrationsTestsMixin, TestCase):
         self.assertIs(loader.get_migration('auth', '0001_initial'),
                       migration)
 
+    @requires_migrations
+    def test_build_graph_with_database_applied_migrations(self):
+        """Testing MigrationLoader.build_graph with
+        database_applied_migrations
+        """
+        custom_migrations = MigrationList()
+        custom_migrations.add_migration(
+            InitialMigration('0001_initial', 'tests'))
+
+        database_applied_migrations = MigrationList()
+        database_applied_migrations.add_migration_info(app_label='tests',
+                                                       name='0001_initial')
+
+        loader = MigrationLoader(
+            connection=connections[DEFAULT_DB_ALIAS],
+            custom_migrations=custom_migrations,
+            database_applied_migrations=database_applied_migrations)
+
+        with self.assertNumQueries(0):
+            loader.build_graph(reload_migrations=False)
+
+        self.assertIn(('tests', '0001_initial'), loader.applied_migrations)
+        self.assertIs(loader.connection, connections[DEFAULT_DB_ALIAS])
+
 
 class MigrationExecutorTests(MigrationsTestsMixin, TestCase):
     """Unit tests for django_evolution.utils.migrations.MigrationExecutor."""
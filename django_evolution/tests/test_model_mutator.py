@@ -6,6 +6,7 @@ from django.db import models
 
 from django_evolution.errors import EvolutionBaselineMissingError
 from django_evolution.mutators import AppMutator, ModelMutator
+from django_evolution.signature import ModelSignature
 from django_evolution.tests.base_test_case import EvolutionTestCase
 from django_evolution.tests.models import BaseTestModel
 
@@ -67,3 +68,49 @@ class ModelMutatorTests(EvolutionTestCase):
 
         with self.assertRaisesMessage(EvolutionBaselineMissingError, message):
             self.model_mutator.model_sig
+
+    def test_create_model(self):
+        """Testing ModelMutator.create_model"""
+        model = self.model_mutator.create_model()
+
+        self.assertEqual(model._meta.object_name, 'TestModel')
+        self.assertEqual(model._meta.get_field('value').max_length, 100)
+        self.assertIs(self.model_mutator.create_model(), model)
+
+    def test_create_model_with_changed_model_sig(self):
+        """Testing ModelMutator.create_model after the model signature has
+        changed
+        """
+        model = self.model_mutator.create_model()
+
+        self.model_sig.get_field_sig('value').field_attrs['max_length'] = 200
+
+        new_model = self.model_mutator.create_model()
+        self.assertIsNot(new_model, model)
+        self.assertEqual(new_model._meta.get_field('value').max_length, 200)
+        self.assertIs(self.model_mutator.create_model(), new_model)
+
+    def test_create_model_with_changed_related_model_sig(self):
+        """Testing ModelMutator.create_model after another model signature
+        in the project has changed
+        """
+        model = self.model_mutator.create_model()
+
+        self.app_sig.add_model_sig(ModelSignature(
+            model_name='OtherModel',
+            table_name='tests_othermodel'))
+
+        new_model = self.model_mutator.create_model()
+        self.assertIsNot(new_model, model)
+        self.assertIs(self.model_mutator.create_model(), new_model)
+
+    def test_to_sql_with_sql_notes(self):
+        """Testing ModelMutator.to_sql collects SQL notes from the database
+        backend
+        """
+        model_mutator = self.model_mutator
+        model_mutator.evolver.sql_notes.append('Test note')
+
+        model_mutator.to_sql()
+
+        self.assertEqual(model_mutator.sql_notes, ['Test note'])
@@ -2,9 +2,14 @@ from __future__ import annotations
 
 from django.db import models
 
+from django_evolution.consts import UpgradeMethod
 from django_evolution.mutations import (AddField, ChangeField, DeleteField,
-                                        DeleteModel, RenameField, RenameModel,
+                                        DeleteModel, MoveToDjangoMigrations,
+                                        RenameField, RenameModel,
                                         SQLMutation)
+from django_evolution.mutators import AppMutator
+from django_evolution.mutators.upgrade_method_mutator import \
+    UpgradeMethodMutator
 from django_evolution.tests.base_test_case import EvolutionTestCase
 from django_evolution.tests.models import BaseTestModel
 
@@ -678,3 +683,30 @@ class PreprocessingTests(EvolutionTestCase):
             ],
             'rename_delete_model',
             model_name='DestModel')
+
+    def test_add_move_to_django_migrations_delete_field(self):
+        """Testing pre-processing AddField + MoveToDjangoMigrations +
+        DeleteField
+        """
+        test_sig = self.start_sig.clone()
+        app_mutator = AppMutator(app_label='tests',
+                                 project_sig=test_sig,
+                                 database_state=self.database_state.clone())
+        app_mutator.run_mutations([
+            AddField('TestModel', 'added_field', models.CharField,
+                     initial='', max_length=20),
+            MoveToDjangoMigrations(mark_applied=['0001_initial']),
+            DeleteField('TestModel', 'added_field'),
+        ])
+
+        # The AddField and DeleteField should have been optimized out,
+        # despite the MoveToDjangoMigrations between them.
+        self.assertEqual(len(app_mutator._mutators), 1)
+        self.assertIsInstance(app_mutator._mutators[0], UpgradeMethodMutator)
+
+        app_sig = test_sig.get_app_sig('tests')
+        self.assertEqual(app_sig.upgrade_method, UpgradeMethod.MIGRATIONS)
+        self.assertIsNone(app_sig.get_model_sig('TestModel')
+                          .get_field_sig('added_field'))
+
+        self.assertEqual(app_mutator.to_sql(), [])
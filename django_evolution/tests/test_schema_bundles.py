@@ -0,0 +1,239 @@
+"""Unit tests for django_evolution.utils.schema_bundles."""
+
+from __future__ import annotations
+
+import io
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from unittest import SkipTest
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from django_evolution.db import EvolutionOperationsMulti
+from django_evolution.errors import InvalidSchemaBundleError
+from django_evolution.evolve import Evolver
+from django_evolution.management.commands import evolve as evolve_command
+from django_evolution.models import Evolution
+from django_evolution.signature import ProjectSignature
+from django_evolution.tests.base_test_case import TestCase
+from django_evolution.utils.apps import get_app
+from django_evolution.utils.evolutions import get_evolution_sequence
+from django_evolution.utils.schema_bundles import (SCHEMA_BUNDLE_VERSION,
+                                                   build_schema_bundle,
+                                                   install_schema_bundle,
+                                                   load_schema_bundle,
+                                                   serialize_schema_bundle)
+
+
+class SchemaBundlesTests(TestCase):
+    """Unit tests for django_evolution.utils.schema_bundles."""
+
+    needs_evolution_models = True
+
+    def test_build_schema_bundle(self):
+        """Testing build_schema_bundle"""
+        bundle = build_schema_bundle(DEFAULT_DB_ALIAS)
+
+        self.assertEqual(bundle['version'], SCHEMA_BUNDLE_VERSION)
+        self.assertEqual(bundle['vendor'],
+                         connections[DEFAULT_DB_ALIAS].vendor)
+        # Compare against a serialized signature, since serializing turns
+        # an app's unknown applied migrations (None) into an empty list.
+        self.assertEqual(
+            bundle['signature'],
+            ProjectSignature.from_database(DEFAULT_DB_ALIAS).serialize())
+
+        evolution_labels = get_evolution_sequence(get_app('auth'))
+        self.assertTrue(evolution_labels)
+
+        for evolution_label in evolution_labels:
+            self.assertIn(['auth', evolution_label], bundle['evolutions'])
+
+        self.assertTrue(any(
+            'django_project_version' in statement
+            for statement in bundle['sql']
+        ))
+
+    def test_load_schema_bundle(self):
+        """Testing load_schema_bundle with a serialized bundle"""
+        bundle = build_schema_bundle(DEFAULT_DB_ALIAS)
+        loaded_bundle = load_schema_bundle(
+            io.StringIO(serialize_schema_bundle(bundle)))
+
+        # JSON turns tuples into lists, so the signature is compared after
+        # deserializing it, rather than as raw data.
+        self.assertEqual(
+            ProjectSignature.deserialize(loaded_bundle['signature']),
+            ProjectSignature.deserialize(bundle['signature']))
+
+        for key in ('version', 'vendor', 'evolutions', 'sql'):
+            self.assertEqual(loaded_bundle[key], bundle[key])
+
+    def test_load_schema_bundle_with_bad_version(self):
+        """Testing load_schema_bundle with unsupported version"""
+        message = 'Schema bundle version 999 is not supported.'
+
+        with self.assertRaisesMessage(InvalidSchemaBundleError, message):
+            load_schema_bundle(io.StringIO('{"version": 999}'))
+
+    def test_load_schema_bundle_with_invalid_json(self):
+        """Testing load_schema_bundle with invalid JSON"""
+        with self.assertRaises(InvalidSchemaBundleError):
+            load_schema_bundle(io.StringIO('{'))
+
+    def test_install_schema_bundle_with_other_vendor(self):
+        """Testing install_schema_bundle with bundle for another backend"""
+        bundle = build_schema_bundle(DEFAULT_DB_ALIAS)
+        bundle['vendor'] = 'other'
+
+        message = (
+            'The schema bundle was built for "other", but the "default" '
+            'database uses "%s".'
+            % connections[DEFAULT_DB_ALIAS].vendor
+        )
+
+        with self.assertRaisesMessage(InvalidSchemaBundleError, message):
+            install_schema_bundle(bundle, DEFAULT_DB_ALIAS)
+
+    def test_install_schema_bundle_with_tables(self):
+        """Testing install_schema_bundle with a non-empty database"""
+        bundle = build_schema_bundle(DEFAULT_DB_ALIAS)
+
+        message = (
+            'The schema bundle can only be installed into an empty '
+            'database, but "default" already contains tables.'
+        )
+
+        with self.assertRaisesMessage(InvalidSchemaBundleError, message):
+            install_schema_bundle(bundle, DEFAULT_DB_ALIAS)
+
+    def test_install_schema_bundle(self):
+        """Testing install_schema_bundle into an empty database"""
+        if connections[DEFAULT_DB_ALIAS].vendor != 'sqlite':
+            raise SkipTest('Empty databases for this test can only be '
+                           'created on SQLite.')
+
+        bundle = build_schema_bundle(DEFAULT_DB_ALIAS)
+
+        with self._empty_database() as database:
+            self.assertEqual(install_schema_bundle(bundle, database),
+                             len(bundle['sql']))
+
+            self.assertEqual(
+                set(
+                    Evolution.objects
+                    .using(database)
+                    .values_list('app_label', 'label')
+                ),
+                {
+                    tuple(evolution)
+                    for evolution in bundle['evolutions']
+                })
+
+            evolver = Evolver(database_name=database)
+            self.assertFalse(evolver.installed_new_database)
+            self.assertTrue(evolver.initial_diff.is_empty())
+
+            evolver.queue_evolve_all_apps()
+            self.assertFalse(evolver.get_evolution_required())
+
+    def test_evolve_with_schema_bundle_and_lock(self):
+        """Testing evolve --schema-bundle --lock installs the bundle while
+        holding the evolve lock
+        """
+        if connections[DEFAULT_DB_ALIAS].vendor != 'sqlite':
+            raise SkipTest('Empty databases for this test can only be '
+                           'created on SQLite.')
+
+        bundle = build_schema_bundle(DEFAULT_DB_ALIAS)
+
+        with self._empty_database() as database:
+            path = os.path.join(
+                os.path.dirname(settings.DATABASES[database]['NAME']),
+                'bundle.json')
+
+            with open(path, 'w') as fp:
+                fp.write(serialize_schema_bundle(bundle))
+
+            evolution_ops_cls = \
+                type(EvolutionOperationsMulti(database).get_evolver())
+            old_acquire = evolution_ops_cls.acquire_evolve_lock
+            old_release = evolution_ops_cls.release_evolve_lock
+            old_install = evolve_command.install_schema_bundle
+            held_locks = []
+            installed_with_lock = []
+
+            def _acquire_evolve_lock(_self):
+                old_acquire(_self)
+                held_locks.append(_self)
+
+            def _release_evolve_lock(_self):
+                held_locks.remove(_self)
+                old_release(_self)
+
+            def _install_schema_bundle(*args, **kwargs):
+                installed_with_lock.append(bool(held_locks))
+
+                return old_install(*args, **kwargs)
+
+            evolution_ops_cls.acquire_evolve_lock = _acquire_evolve_lock
+            evolution_ops_cls.release_evolve_lock = _release_evolve_lock
+            evolve_command.install_schema_bundle = _install_schema_bundle
+
+            try:
+                call_command('evolve',
+                             database=database,
+                             execute=True,
+                             interactive=False,
+                             use_lock=True,
+                             schema_bundle=path,
+                             stdout=io.StringIO(),
+                             stderr=io.StringIO())
+            finally:
+                evolution_ops_cls.acquire_evolve_lock = old_acquire
+                evolution_ops_cls.release_evolve_lock = old_release
+                evolve_command.install_schema_bundle = old_install
+
+            self.assertEqual(installed_with_lock, [True])
+            self.assertEqual(held_locks, [])
+            self.assertEqual(
+                set(
+                    Evolution.objects
+                    .using(database)
+                    .values_list('app_label', 'label')
+                ),
+                {
+                    tuple(evolution)
+                    for evolution in bundle['evolutions']
+                })
+
+    @contextmanager
+    def _empty_database(self):
+        """Provide a new, empty SQLite database for the test.
+
+        Context:
+            unicode:
+            The name of the new database.
+        """
+        database = 'schema_bundle_test'
+        tempdir = tempfile.mkdtemp(prefix='django-evolution-')
+        settings_dict = dict(connections[DEFAULT_DB_ALIAS].settings_dict,
+                             ENGINE='django.db.backends.sqlite3',
+                             NAME=os.path.join(tempdir, 'bundle.db'),
+                             TEST={})
+
+        # Django's connection handler shares this dictionary, so the new
+        # database is available through both.
+        settings.DATABASES[database] = settings_dict
+
+        try:
+            yield database
+        finally:
+            connections[database].close()
+            del connections[database]
+            del settings.DATABASES[database]
+            shutil.rmtree(tempdir)
@@ -41,6 +41,7 @@ from django_evolution.compat.models import (
 from django_evolution.consts import UpgradeMethod
 from django_evolution.errors import MissingSignatureError
 from django_evolution.models import Evolution
+from django_evolution.mutations import ChangeMeta
 from django_evolution.signature import (AppSignature,
                                         ConstraintSignature,
                                         FieldSignature,
@@ -630,6 +631,152 @@ class ProjectSignatureTests(BaseSignatureTestCase):
             self.assertIsNot(cloned_app_sig, app_sig)
             self.assertEqual(cloned_app_sig, app_sig)
 
+    def test_get_digest(self):
+        """Testing ProjectSignature.get_digest"""
+        project_sig = ProjectSignature()
+        project_sig.add_app_sig(AppSignature.from_app(
+            get_app('django_evolution'),
+            database='default'))
+
+        cloned_project_sig = project_sig.clone()
+        digest = project_sig.get_digest()
+
+        self.assertEqual(cloned_project_sig.get_digest(), digest)
+        self.assertEqual(project_sig.get_digest(), digest)
+
+    def test_get_digest_after_field_change(self):
+        """Testing ProjectSignature.get_digest after changing a field in
+        place
+        """
+        project_sig = ProjectSignature()
+        project_sig.add_app_sig(AppSignature.from_app(
+            get_app('django_evolution'),
+            database='default'))
+
+        cloned_project_sig = project_sig.clone()
+        app_sig = cloned_project_sig.get_app_sig('django_evolution')
+        model_sig = app_sig.get_model_sig('Version')
+        field_sig = model_sig.get_field_sig('when')
+
+        digest = project_sig.get_digest()
+        app_digest = app_sig.get_digest()
+        model_digest = model_sig.get_digest()
+        self.assertEqual(cloned_project_sig.get_digest(), digest)
+
+        field_sig.field_attrs['null'] = True
+
+        self.assertNotEqual(cloned_project_sig.get_digest(), digest)
+        self.assertNotEqual(app_sig.get_digest(), app_digest)
+        self.assertNotEqual(model_sig.get_digest(), model_digest)
+        self.assertNotEqual(cloned_project_sig, project_sig)
+        self.assertEqual(
+            cloned_project_sig.diff(project_sig),
+            {
+                'changed': {
+                    'django_evolution': {
+                        'changed': {
+                            'Version': {
+                                'changed': {
+                                    'when': ['null'],
+                                },
+                            },
+                        },
+                    },
+                },
+            })
+
+    def test_get_digest_after_remove_model_sig(self):
+        """Testing ProjectSignature.get_digest after removing a model
+        signature
+        """
+        project_sig = ProjectSignature()
+        project_sig.add_app_sig(AppSignature.from_app(
+            get_app('django_evolution'),
+            database='default'))
+
+        cloned_project_sig = project_sig.clone()
+        digest = cloned_project_sig.get_digest()
+
+        app_sig = cloned_project_sig.get_app_sig('django_evolution')
+        app_sig.remove_model_sig('Evolution')
+
+        self.assertNotEqual(cloned_project_sig.get_digest(), digest)
+
+        app_sig.add_model_sig(
+            project_sig.get_app_sig('django_evolution')
+            .get_model_sig('Evolution')
+            .clone())
+
+        self.assertEqual(cloned_project_sig.get_digest(), digest)
+
+    def test_get_digest_after_setting_attribute(self):
+        """Testing ProjectSignature.get_digest after setting an attribute on
+        an application signature
+        """
+        project_sig = ProjectSignature()
+        project_sig.add_app_sig(AppSignature('app1'))
+
+        digest = project_sig.get_digest()
+
+        project_sig.get_app_sig('app1').upgrade_method = \
+            UpgradeMethod.MIGRATIONS
+
+        self.assertNotEqual(project_sig.get_digest(), digest)
+
+    @requires_meta_indexes
+    def test_get_digest_after_change_meta_simulation(self):
+        """Testing ProjectSignature.get_digest after simulating a ChangeMeta
+        on a model
+        """
+        project_sig = ProjectSignature()
+        project_sig.add_app_sig(AppSignature.from_app(
+            get_app('django_evolution'),
+            database='default'))
+
+        cloned_project_sig = project_sig.clone()
+        app_sig = cloned_project_sig.get_app_sig('django_evolution')
+        model_sig = app_sig.get_model_sig('Version')
+
+        app_digest = app_sig.get_digest()
+        model_digest = model_sig.get_digest()
+        self.assertEqual(cloned_project_sig.get_digest(),
+                         project_sig.get_digest())
+
+        ChangeMeta('Version', 'indexes', [
+            {
+                'name': 'my_custom_index',
+                'fields': ['when'],
+            },
+        ]).run_simulation(app_label='django_evolution',
+                          project_sig=cloned_project_sig,
+                          database_state=None)
+
+        self.assertNotEqual(app_sig.get_digest(), app_digest)
+        self.assertNotEqual(model_sig.get_digest(), model_digest)
+        self.assertEqual(
+            cloned_project_sig.diff(project_sig),
+            {
+                'changed': {
+                    'django_evolution': {
+                        'changed': {
+                            'Version': {
+                                'meta_changed': ['indexes'],
+                            },
+                        },
+                    },
+                },
+            })
+
+        # The new index signatures must be owned by the model signature, so
+        # that changing them invalidates the model and app digests.
+        app_digest = app_sig.get_digest()
+        model_digest = model_sig.get_digest()
+
+        model_sig.index_sigs[0].name = 'my_renamed_index'
+
+        self.assertNotEqual(app_sig.get_digest(), app_digest)
+        self.assertNotEqual(model_sig.get_digest(), model_digest)
+
     def test_serialize_v1(self):
         """Testing ProjectSignature.serialize (signature v1)"""
         project_sig = ProjectSignature()
@@ -1324,6 +1471,165 @@ class FieldSignatureTests(BaseSignatureTestCase):
                 'db_column': 'test_column',
             })
 
+    def test_deserialize_v2_with_renamed_field_types_changed(self):
+        """Testing FieldSignature.deserialize (signature v2) with
+        RENAMED_FIELD_TYPES changed after a cached lookup
+        """
+        field_sig_dict = {
+            'type': 'legacy.CustomField',
+        }
+
+        with self.settings(DJANGO_EVOLUTION={
+            'RENAMED_FIELD_TYPES': {
+                'legacy.CustomField': 'django.db.models.CharField',
+            },
+        }):
+            field_sig = FieldSignature.deserialize('myfield', field_sig_dict,
+                                                   sig_version=2)
+
+        self.assertIs(field_sig.field_type, models.CharField)
+
+        with self.settings(DJANGO_EVOLUTION={
+            'RENAMED_FIELD_TYPES': {
+                'legacy.CustomField': 'django.db.models.TextField',
+            },
+        }):
+            field_sig = FieldSignature.deserialize('myfield', field_sig_dict,
+                                                   sig_version=2)
+
+        self.assertIs(field_sig.field_type, models.TextField)
+
+        message = 'Unable to locate field type legacy.CustomField'
+
+        with self.assertRaisesMessage(ImportError, message):
+            FieldSignature.deserialize('myfield', field_sig_dict,
+                                       sig_version=2)
+
+    def test_field_attrs_with_unset(self):
+        """Testing FieldSignature.field_attrs with no attributes set and
+        modified in place
+        """
+        field_sig = FieldSignature(field_name='myfield',
+                                   field_type=models.CharField)
+
+        self.assertFalse(hasattr(field_sig, '__dict__'))
+        self.assertIsNone(field_sig.get_attr_value('max_length'))
+        self.assertEqual(field_sig.serialize(), {
+            'type': 'django.db.models.CharField',
+        })
+
+        field_sig.field_attrs['max_length'] = 100
+
+        self.assertEqual(field_sig.get_attr_value('max_length'), 100)
+        self.assertEqual(field_sig.field_attrs, {
+            'max_length': 100,
+        })
+
+        other_field_sig = FieldSignature(field_name='myfield',
+                                         field_type=models.CharField)
+        self.assertEqual(other_field_sig.field_attrs, {})
+        self.assertNotEqual(field_sig, other_field_sig)
+        self.assertEqual(field_sig.diff(other_field_sig), ['max_length'])
+
+    def test_field_attrs_read_keeps_digest(self):
+        """Testing FieldSignature.field_attrs keeps the cached digest when
+        read, and invalidates it when modified in place
+        """
+        model_sig = ModelSignature(model_name='TestModel',
+                                   table_name='tests_testmodel')
+        field_sig = FieldSignature(field_name='myfield',
+                                   field_type=models.CharField,
+                                   field_attrs={
+                                       'max_length': 100,
+                                   })
+        model_sig.add_field_sig(field_sig)
+
+        model_digest = model_sig.get_digest()
+        field_digest = field_sig.get_digest()
+
+        self.assertEqual(field_sig.field_attrs['max_length'], 100)
+        self.assertEqual(field_sig._digest, field_digest)
+        self.assertEqual(model_sig._digest, model_digest)
+
+        field_sig.field_attrs['max_length'] = 200
+
+        self.assertIsNone(field_sig._digest)
+        self.assertIsNone(model_sig._digest)
+        self.assertNotEqual(model_sig.get_digest(), model_digest)
+
+        # Copies must not be tied to the signature.
+        field_digest = field_sig.get_digest()
+        field_attrs = field_sig.field_attrs.copy()
+        field_attrs['null'] = True
+
+        self.assertEqual(field_sig._digest, field_digest)
+        self.assertNotIn('null', field_sig.field_attrs)
+
+    def test_get_attr_default_cached(self):
+        """Testing FieldSignature.get_attr_default with cached defaults per
+        field type
+        """
+        defaults_cache = FieldSignature._field_type_defaults_cache
+        old_attribute_defaults = FieldSignature._ATTRIBUTE_DEFAULTS
+        lookups = []
+
+        class RecordingDict(dict):
+            def get(self, *args, **kwargs):
+                lookups.append(args[0])
+
+                return super(RecordingDict, self).get(*args, **kwargs)
+
+            def __getitem__(self, key):
+                lookups.append(key)
+
+                return super(RecordingDict, self).__getitem__(key)
+
+        FieldSignature.clear_caches()
+
+        field_sig = FieldSignature(field_name='myfield',
+                                   field_type=models.ForeignKey)
+
+        try:
+            FieldSignature._ATTRIBUTE_DEFAULTS = \
+                RecordingDict(old_attribute_defaults)
+
+            # The first lookup computes and caches the defaults.
+            self.assertNotIn(models.ForeignKey, defaults_cache)
+            self.assertTrue(field_sig.get_attr_default('db_index'))
+            self.assertIn(models.ForeignKey, defaults_cache)
+            self.assertNotEqual(lookups, [])
+
+            defaults = defaults_cache[models.ForeignKey]
+            self.assertTrue(defaults['db_index'])
+
+            # Later lookups, for any attribute, reuse the cached defaults.
+            del lookups[:]
+
+            self.assertFalse(field_sig.get_attr_default('null'))
+            self.assertIsNone(field_sig.get_attr_default('max_digits'))
+            self.assertIs(defaults_cache[models.ForeignKey], defaults)
+            self.assertEqual(lookups, [])
+
+            # Clearing the caches discards the defaults, so they're computed
+            # again.
+            FieldSignature.clear_caches()
+            self.assertEqual(defaults_cache, {})
+
+            self.assertTrue(field_sig.get_attr_default('db_index'))
+            self.assertNotEqual(lookups, [])
+            self.assertIsNot(defaults_cache[models.ForeignKey], defaults)
+        finally:
+            FieldSignature._ATTRIBUTE_DEFAULTS = old_attribute_defaults
+            FieldSignature.clear_caches()
+
+        # Each field type has its own defaults.
+        field_sig = FieldSignature(field_name='myfield',
+                                   field_type=models.DecimalField)
+
+        self.assertFalse(field_sig.get_attr_default('db_index'))
+        self.assertIsNone(field_sig.get_attr_default('max_digits'))
+        self.assertIn(models.DecimalField, defaults_cache)
+
     def test_get_attr_value(self):
         """Testing FieldSignature.get_attr_value"""
         field_sig = FieldSignature.from_field(
@@ -3,8 +3,10 @@ from __future__ import annotations
 from django.db import models
 
 from django_evolution.errors import CannotSimulate
-from django_evolution.mutations import SQLMutation
-from django_evolution.signature import FieldSignature, ProjectSignature
+from django_evolution.mutations import AddField, SQLMutation
+from django_evolution.signature import (AppSignature,
+                                        FieldSignature,
+                                        ProjectSignature)
 from django_evolution.tests.base_test_case import EvolutionTestCase
 from django_evolution.tests.models import BaseTestModel
 
@@ -109,3 +111,44 @@ class SQLMutationTests(EvolutionTestCase):
              "    Field 'added_field2' has been added\n"
              "    Field 'added_field3' has been added"),
             sql_name='SQLMutationOutput')
+
+    def test_add_fields_with_effects(self):
+        """Testing SQLMutation and adding fields with effects"""
+        self.perform_evolution_tests(
+            AddFieldsModel,
+            [
+                SQLMutation(
+                    'first-two-fields',
+                    self.get_sql_mapping('AddFirstTwoFields'),
+                    effects=[
+                        AddField('TestModel', 'added_field1',
+                                 models.IntegerField, null=True),
+                        AddField('TestModel', 'added_field2',
+                                 models.IntegerField, null=True),
+                    ]),
+                SQLMutation(
+                    'third-field',
+                    self.get_sql_mapping('AddThirdField'),
+                    effects=[
+                        AddField('TestModel', 'added_field3',
+                                 models.IntegerField, null=True),
+                    ]),
+            ],
+            ("In model tests.TestModel:\n"
+             "    Field 'added_field1' has been added\n"
+             "    Field 'added_field2' has been added\n"
+             "    Field 'added_field3' has been added"),
+            sql_name='SQLMutationOutput')
+
+    def test_simulate_with_empty_effects(self):
+        """Testing SQLMutation simulation with empty effects"""
+        project_sig = ProjectSignature()
+        project_sig.add_app_sig(AppSignature(app_id='tests'))
+
+        mutation = SQLMutation('test', '', effects=[])
+        mutation.run_simulation(app_label='tests',
+                                project_sig=project_sig,
+                                database_state=None)
+
+        self.assertEqual(project_sig.get_app_sig('tests'),
+                         AppSignature(app_id='tests'))
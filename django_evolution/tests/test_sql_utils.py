@@ -0,0 +1,116 @@
+"""Unit tests for django_evolution.utils.sql."""
+
+from __future__ import annotations
+
+from django.db import DEFAULT_DB_ALIAS
+
+from django_evolution.tests.base_test_case import TestCase
+from django_evolution.utils.sql import (NewTransactionSQL,
+                                        NoTransactionSQL,
+                                        SQLExecutor,
+                                        join_sql_statements)
+
+
+class SQLExecutorTests(TestCase):
+    """Unit tests for django_evolution.utils.sql.SQLExecutor."""
+
+    def test_iter_sql_with_capture(self):
+        """Testing SQLExecutor.iter_sql with capture=True"""
+        sql = [
+            'SELECT 1;',
+            '-- Comment',
+            ('SELECT %s;', (2,)),
+            NewTransactionSQL(['SELECT 3;']),
+            NoTransactionSQL(['SELECT 4;']),
+        ]
+
+        with SQLExecutor(database=DEFAULT_DB_ALIAS) as executor:
+            self.assertEqual(
+                list(executor.iter_sql(sql, capture=True)),
+                [
+                    'SELECT 1;',
+                    'SELECT 2;',
+                    '-- Start of a new transaction:',
+                    'SELECT 3;',
+                    '-- Run outside of a transaction:',
+                    'SELECT 4;',
+                ])
+
+    def test_iter_sql_is_lazy(self):
+        """Testing SQLExecutor.iter_sql consumes SQL only as needed"""
+        consumed = []
+
+        def _gen_sql():
+            for i in range(3):
+                consumed.append(i)
+                yield 'SELECT %s;' % i
+
+        with SQLExecutor(database=DEFAULT_DB_ALIAS) as executor:
+            statements = executor.iter_sql(_gen_sql(),
+                                           capture=True,
+                                           execute=True)
+
+            self.assertEqual(next(statements), 'SELECT 0;')
+            self.assertEqual(consumed, [0])
+
+            self.assertEqual(next(statements), 'SELECT 1;')
+            self.assertEqual(consumed, [0, 1])
+
+            self.assertEqual(list(statements), ['SELECT 2;'])
+            self.assertEqual(consumed, [0, 1, 2])
+
+    def test_run_sql_with_capture(self):
+        """Testing SQLExecutor.run_sql with capture=True"""
+        with SQLExecutor(database=DEFAULT_DB_ALIAS) as executor:
+            self.assertEqual(
+                executor.run_sql(['SELECT 1;', ('SELECT %s;', (2,))],
+                                 capture=True,
+                                 execute=True),
+                [
+                    'SELECT 1;',
+                    'SELECT 2;',
+                ])
+
+    def test_run_sql_without_capture(self):
+        """Testing SQLExecutor.run_sql without capture=True"""
+        with SQLExecutor(database=DEFAULT_DB_ALIAS) as executor:
+            self.assertEqual(executor.run_sql(['SELECT 1;'], execute=True),
+                             [])
+
+
+class JoinSQLStatementsTests(TestCase):
+    """Unit tests for django_evolution.utils.sql.join_sql_statements."""
+
+    def test_join_sql_statements(self):
+        """Testing join_sql_statements"""
+        new_transaction_sql = NewTransactionSQL(['SELECT 5;'])
+
+        self.assertEqual(
+            join_sql_statements([
+                'SELECT 1;',
+                'SELECT 2',
+                '',
+                '-- Comment',
+                'SELECT 3;',
+                ('SELECT %s;', (4,)),
+                new_transaction_sql,
+                'SELECT 6;',
+            ]),
+            [
+                'SELECT 1;\nSELECT 2;',
+                '-- Comment',
+                'SELECT 3;',
+                ('SELECT %s;', (4,)),
+                new_transaction_sql,
+                'SELECT 6;',
+            ])
+
+    def test_join_sql_statements_with_max_statements(self):
+        """Testing join_sql_statements with max_statements"""
+        self.assertEqual(
+            join_sql_statements(['SELECT 1;', 'SELECT 2;', 'SELECT 3;'],
+                                max_statements=2),
+            [
+                'SELECT 1;\nSELECT 2;',
+                'SELECT 3;',
+            ])
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import os
+import sys
 from importlib import import_module
+from importlib.util import find_spec
 
 from django.db import connections
 from django.db.utils import DEFAULT_DB_ALIAS
@@ -18,6 +23,42 @@ from django_evolution.utils.migrations import (MigrationList,
                                                has_migrations_module)
 
 
+logger = logging.getLogger(__name__)
+
+
+#: The filename of an evolutions manifest.
+#:
+#: Version Added:
+#:     3.0
+EVOLUTIONS_MANIFEST_FILENAME = 'manifest.json'
+
+#: The current version of the evolutions manifest format.
+#:
+#: Version Added:
+#:     3.0
+EVOLUTIONS_MANIFEST_VERSION = 1
+
+#: The keys used for evolution dependencies.
+_DEPENDENCY_KEYS = (
+    'after_evolutions',
+    'after_migrations',
+    'before_evolutions',
+    'before_migrations',
+)
+
+#: Loaded evolutions manifests, keyed by evolutions directory.
+#:
+#: Each value is a tuple of the modification times the manifest was
+#: validated against, and the manifest (or ``None`` if stale).
+_evolutions_manifests = {}
+
+#: Content hashes of files tracked by manifests, keyed by path.
+#:
+#: Each value is a tuple of the file's modification time and size when it
+#: was hashed, and the hash. Files are only hashed again when these change.
+_manifest_file_hashes = {}
+
+
 def has_evolutions_module(app):
     """Return whether an app has an evolutions module.
 
@@ -150,6 +191,10 @@ def get_evolutions_path(app):
 def get_evolution_sequence(app):
     """Return the list of evolution labels for a Django app.
 
+    Version Changed:
+        3.0:
+        This will use the app's evolutions manifest, if up-to-date.
+
     Args:
         app (module):
             The app to return evolutions for.
@@ -163,6 +208,11 @@ def get_evolution_sequence(app):
     if app_name in BUILTIN_SEQUENCES:
         return BUILTIN_SEQUENCES[app_name]
 
+    manifest = get_evolutions_manifest(app)
+
+    if manifest is not None:
+        return manifest['sequence']
+
     module = get_evolutions_module(app)
 
     if module is not None:
@@ -185,6 +235,10 @@ def get_evolution_dependencies(app, evolution_label, custom_evolutions=[]):
     containing an app label, which will reference the sequence of evolutions
     as a whole for that app.
 
+    Version Changed:
+        3.0:
+        This will use the app's evolutions manifest, if up-to-date.
+
     Version Changed:
         2.2:
         Added the ``custom_evolutions`` argument.
@@ -253,6 +307,46 @@ def get_evolution_dependencies(app, evolution_label, custom_evolutions=[]):
         If the evolution module was not found, this will return ``None``
         instead.
     """
+    # Custom evolutions aren't part of the manifest, so they must be checked
+    # for first.
+    if not any(
+        custom_evolution['label'] == evolution_label
+        for custom_evolution in custom_evolutions or []
+    ):
+        entry = _get_evolutions_manifest_entry(app, evolution_label)
+
+        if entry is not None and entry['dependencies'] is not None:
+            return _deserialize_dependencies(entry['dependencies'])
+
+    return _load_evolution_dependencies(app=app,
+                                        evolution_label=evolution_label,
+                                        custom_evolutions=custom_evolutions)
+
+
+def _load_evolution_dependencies(app, evolution_label, custom_evolutions=[]):
+    """Load dependencies for an evolution from its module.
+
+    This is used by :py:func:`get_evolution_dependencies` when an
+    up-to-date evolutions manifest isn't available.
+
+    Version Added:
+        3.0
+
+    Args:
+        app (module):
+            The app the evolution is for.
+
+        evolution_label (unicode):
+            The label identifying the evolution for the app.
+
+        custom_evolutions (list of dict, optional):
+            An optional list of custom evolutions pertaining to the app.
+
+    Returns:
+        dict:
+        A dictionary of dependency information for the evolution, or
+        ``None`` if the evolution module was not found.
+    """
     module = get_evolution_module(app=app,
                                   evolution_label=evolution_label)
 
@@ -322,6 +416,10 @@ def get_evolution_app_dependencies(app):
     Version Added:
         2.1
 
+    Version Changed:
+        3.0:
+        This will use the app's evolutions manifest, if up-to-date.
+
     Args:
         app (module):
             The app the evolution is for.
@@ -339,6 +437,11 @@ def get_evolution_app_dependencies(app):
         If the evolutions module was not found, this will return ``None``
         instead.
     """
+    manifest = get_evolutions_manifest(app)
+
+    if manifest is not None:
+        return _deserialize_dependencies(manifest['app_dependencies'])
+
     module = get_evolutions_module(app)
 
     if not module:
@@ -415,6 +518,11 @@ def get_applied_evolutions(app, database=DEFAULT_DB_ALIAS):
 def get_app_mutations(app, evolution_labels=None, database=DEFAULT_DB_ALIAS):
     """Return the mutations on an app provided by the given evolution names.
 
+    Version Changed:
+        3.0:
+        SQL evolutions are looked up in the app's evolutions manifest, if
+        up-to-date, rather than probing the filesystem.
+
     Args:
         app (module):
             The app the evolutions belong to.
@@ -447,6 +555,14 @@ def get_app_mutations(app, evolution_labels=None, database=DEFAULT_DB_ALIAS):
 
     mutations = []
     directory_name = os.path.dirname(evolutions_module.__file__)
+    manifest = get_evolutions_manifest(app)
+
+    if manifest is None:
+        manifest_files = None
+    else:
+        # The manifest lists every file in the evolutions directory, so we
+        # can avoid probing the filesystem for SQL evolutions.
+        manifest_files = set(manifest['files'])
 
     if evolution_labels is None:
         evolution_labels = get_evolution_sequence(app)
@@ -454,14 +570,21 @@ def get_app_mutations(app, evolution_labels=None, database=DEFAULT_DB_ALIAS):
     for label in evolution_labels:
         # The first element is used for compatibility purposes.
         filenames = [
-            os.path.join(directory_name, '%s.sql' % label),
-            os.path.join(directory_name, '%s_%s.sql' % (database, label)),
+            '%s.sql' % label,
+            '%s_%s.sql' % (database, label),
         ]
 
         found = False
 
         for filename in filenames:
-            if os.path.exists(filename):
+            filename = os.path.join(directory_name, filename)
+
+            if manifest_files is None:
+                exists = os.path.exists(filename)
+            else:
+                exists = os.path.basename(filename) in manifest_files
+
+            if exists:
                 with open(filename, 'r') as fp:
                     sql = fp.readlines()
 
@@ -564,20 +687,28 @@ def get_app_pending_mutations(app, evolution_labels=[], mutations=None,
         # that aren't in the old signature. If a model signature isn't found
         # in the old app signature, it's a new model, and we don't want to
         # try to apply evolutions to it.
-        changed_models = set(
-            model_sig.model_name
-            for model_sig in app_sig.model_sigs
-            if old_app_sig.get_model_sig(model_sig.model_name) not in (
-                None, model_sig)
-        )
-
-        # Now do the same for models in the old signature, in case the
-        # model has been deleted.
-        changed_models.update(
-            old_model_sig.model_name
-            for old_model_sig in old_app_sig.model_sigs
-            if app_sig.get_model_sig(old_model_sig.model_name) is None
-        )
+        #
+        # If the app's signature digests match, nothing in the app has
+        # changed, and we can skip comparing models entirely.
+        changed_models = set()
+
+        if old_app_sig.get_digest() != app_sig.get_digest():
+            for model_sig in app_sig.model_sigs:
+                model_name = model_sig.model_name
+                old_model_sig = old_app_sig.get_model_sig(model_name)
+
+                if (old_model_sig is not None and
+                    old_model_sig.get_digest() != model_sig.get_digest() and
+                    old_model_sig != model_sig):
+                    changed_models.add(model_name)
+
+            # Now do the same for models in the old signature, in case the
+            # model has been deleted.
+            changed_models.update(
+                old_model_sig.model_name
+                for old_model_sig in old_app_sig.model_sigs
+                if app_sig.get_model_sig(old_model_sig.model_name) is None
+            )
 
         # We should now have a full list of which models changed. Filter
         # the list of mutations appropriately.
@@ -597,7 +728,7 @@ def get_app_pending_mutations(app, evolution_labels=[], mutations=None,
 
 
 def get_app_upgrade_info(app, scan_evolutions=True, simulate_applied=False,
-                         database=None):
+                         database=None, database_applied_migrations=None):
     """Return the upgrade information to use for a given app.
 
     This will determine if the app should be using Django Evolution or
@@ -620,6 +751,15 @@ def get_app_upgrade_info(app, scan_evolutions=True, simulate_applied=False,
     an app even on versions of Django that do not support migrations. It's
     up to the caller to handle this however it chooses.
 
+    Version Changed:
+        3.0:
+        This will use the app's evolutions manifest, if up-to-date, rather
+        than importing each evolution module.
+
+    Version Changed:
+        3.0:
+        Added the ``database_applied_migrations`` argument.
+
     Args:
         app (module):
             The app module to determine the upgrade method for.
@@ -639,6 +779,12 @@ def get_app_upgrade_info(app, scan_evolutions=True, simulate_applied=False,
             The database to use for accessing stored evolution and migration
             information.
 
+        database_applied_migrations (django_evolution.utils.migrations.
+                                     MigrationList, optional):
+            The migrations already known to be applied to the database,
+            across all apps. If provided, the app's applied migrations will
+            be taken from this instead of being queried from the database.
+
     Returns:
         dict:
         A dictionary of information containing the following keys:
@@ -675,27 +821,34 @@ def get_app_upgrade_info(app, scan_evolutions=True, simulate_applied=False,
         # that, or if it's handed control over to Django migrations.
         if scan_evolutions:
             if simulate_applied:
-                evolutions = None
+                evolutions = get_evolution_sequence(app)
             else:
                 evolutions = get_applied_evolutions(app,
                                                     database=database)
 
-            mutations = get_app_mutations(app=app,
-                                          evolution_labels=evolutions)
+            found, mark_applied = _find_manifest_mark_applied(app, evolutions)
 
-            for mutation in reversed(mutations):
-                if isinstance(mutation, MoveToDjangoMigrations):
-                    app_label = get_app_label(app)
-                    upgrade_method = UpgradeMethod.MIGRATIONS
+            if not found:
+                # There's no up-to-date manifest to consult, so we'll need
+                # to load all the mutations.
+                mutations = get_app_mutations(app=app,
+                                              evolution_labels=evolutions)
 
-                    applied_migrations = MigrationList()
+                for mutation in reversed(mutations):
+                    if isinstance(mutation, MoveToDjangoMigrations):
+                        mark_applied = mutation.mark_applied
+                        break
 
-                    for name in mutation.mark_applied:
-                        applied_migrations.add_migration_info(
-                            app_label=app_label,
-                            name=name)
+            if mark_applied is not None:
+                app_label = get_app_label(app)
+                upgrade_method = UpgradeMethod.MIGRATIONS
 
-                    break
+                applied_migrations = MigrationList()
+
+                for name in mark_applied:
+                    applied_migrations.add_migration_info(
+                        app_label=app_label,
+                        name=name)
 
         if not upgrade_method:
             upgrade_method = UpgradeMethod.EVOLUTIONS
@@ -705,9 +858,18 @@ def get_app_upgrade_info(app, scan_evolutions=True, simulate_applied=False,
             upgrade_method = UpgradeMethod.MIGRATIONS
 
         if supports_migrations:
-            applied_migrations = MigrationList.from_database(
-                connection=connections[database or DEFAULT_DB_ALIAS],
-                app_label=get_app_label(app))
+            app_label = get_app_label(app)
+
+            if database_applied_migrations is None:
+                applied_migrations = MigrationList.from_database(
+                    connection=connections[database or DEFAULT_DB_ALIAS],
+                    app_label=app_label)
+            else:
+                applied_migrations = MigrationList()
+
+                for info in database_applied_migrations:
+                    if info['app_label'] == app_label:
+                        applied_migrations.add_migration_info(**info)
 
             if not applied_migrations:
                 applied_migrations = None
@@ -718,3 +880,490 @@ def get_app_upgrade_info(app, scan_evolutions=True, simulate_applied=False,
         'has_migrations': has_migrations,
         'upgrade_method': upgrade_method,
     }
+
+
+def get_evolutions_manifest(app):
+    """Return the up-to-date evolutions manifest for an app.
+
+    An evolutions manifest is a pre-computed index of an app's evolutions,
+    generated by :py:func:`write_evolutions_manifest` (or the
+    :command:`build-evolution-manifest` management command). It allows
+    evolution information to be looked up without probing the filesystem
+    for SQL evolutions or importing each evolution module.
+
+    The manifest is only returned if it's up-to-date. It's considered stale
+    if files have been added to or removed from the evolutions directory, or
+    if the contents of the evolutions module's :file:`__init__.py` have
+    changed since the manifest was built.
+
+    Version Added:
+        3.0
+
+    Args:
+        app (module):
+            The app.
+
+    Returns:
+        dict:
+        The evolutions manifest, or ``None`` if the app doesn't have an
+        up-to-date manifest.
+    """
+    directory = _get_evolutions_dir(app)
+
+    if directory is None:
+        return None
+
+    manifest_path = os.path.join(directory, EVOLUTIONS_MANIFEST_FILENAME)
+
+    try:
+        manifest_mtime = os.stat(manifest_path).st_mtime_ns
+        dir_mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+    cache_key = (manifest_mtime, dir_mtime)
+    cached = _evolutions_manifests.get(directory)
+
+    if cached is not None and cached[0] == cache_key:
+        manifest = cached[1]
+
+        if (manifest is not None and
+            not _is_manifest_file_current(directory, manifest['init'])):
+            manifest = None
+    else:
+        manifest = _load_evolutions_manifest(directory, manifest_path)
+        _evolutions_manifests[directory] = (cache_key, manifest)
+
+    return manifest
+
+
+def build_evolutions_manifest(app):
+    """Build an evolutions manifest for an app.
+
+    This will import the app's evolutions and compute the information
+    needed by the evolution utility functions.
+
+    Evolutions built into Django Evolution don't use manifests.
+
+    Version Added:
+        3.0
+
+    Args:
+        app (module):
+            The app.
+
+    Returns:
+        dict:
+        The evolutions manifest, or ``None`` if the app doesn't have any
+        evolutions that can use a manifest.
+    """
+    # Avoids a nasty circular import. Util modules should always be
+    # importable, so we compensate here.
+    from django_evolution.mutations import MoveToDjangoMigrations
+
+    if get_evolutions_source(app) == EvolutionsSource.BUILTIN:
+        return None
+
+    evolutions_module = get_evolutions_module(app)
+
+    if evolutions_module is None:
+        return None
+
+    directory = os.path.dirname(evolutions_module.__file__)
+    files = _list_evolutions_dir(directory)
+    sequence = list(evolutions_module.SEQUENCE)
+
+    # Include any evolution modules not in the sequence as well, since
+    # they may have been applied in the past.
+    labels = list(sequence)
+    labels += sorted(
+        os.path.splitext(filename)[0]
+        for filename in files
+        if (filename.endswith('.py') and
+            filename != '__init__.py' and
+            os.path.splitext(filename)[0] not in sequence)
+    )
+
+    evolutions = {}
+
+    for label in labels:
+        module = get_evolution_module(app=app,
+                                      evolution_label=label)
+        mark_applied = None
+
+        if '%s.sql' % label in files:
+            kind = 'sql'
+            path = '%s.sql' % label
+        elif module is not None:
+            kind = 'python'
+            path = os.path.relpath(module.__file__, directory)
+
+            for mutation in reversed(getattr(module, 'MUTATIONS', [])):
+                if isinstance(mutation, MoveToDjangoMigrations):
+                    mark_applied = sorted(mutation.mark_applied)
+                    break
+        else:
+            kind = None
+            path = None
+
+        dependencies = _load_evolution_dependencies(app=app,
+                                                    evolution_label=label)
+
+        if dependencies is not None:
+            dependencies = _serialize_dependencies(dependencies)
+
+        evolutions[label] = {
+            'dependencies': dependencies,
+            'kind': kind,
+            'mark_applied': mark_applied,
+            'path': path,
+            'hash': _get_manifest_file_hash(directory, path),
+        }
+
+    app_dependencies = {
+        key: set(getattr(evolutions_module, key.upper(), []))
+        for key in _DEPENDENCY_KEYS
+    }
+
+    return {
+        'app_dependencies': _serialize_dependencies(app_dependencies),
+        'evolutions': evolutions,
+        'files': files,
+        'init': {
+            'hash': _get_manifest_file_hash(
+                directory,
+                os.path.basename(evolutions_module.__file__)),
+            'path': os.path.basename(evolutions_module.__file__),
+        },
+        'sequence': sequence,
+        'version': EVOLUTIONS_MANIFEST_VERSION,
+    }
+
+
+def write_evolutions_manifest(app):
+    """Build and write an evolutions manifest for an app.
+
+    The manifest will be written to the app's evolutions directory.
+
+    Version Added:
+        3.0
+
+    Args:
+        app (module):
+            The app.
+
+    Returns:
+        str:
+        The path to the written manifest, or ``None`` if the app doesn't
+        have any evolutions that can use a manifest.
+    """
+    manifest = build_evolutions_manifest(app)
+
+    if manifest is None:
+        return None
+
+    directory = get_evolutions_path(app)
+    manifest_path = os.path.join(directory, EVOLUTIONS_MANIFEST_FILENAME)
+
+    with open(manifest_path, 'w') as fp:
+        json.dump(manifest, fp, indent=2, sort_keys=True)
+
+    _evolutions_manifests.pop(directory, None)
+
+    return manifest_path
+
+
+def _get_evolutions_dir(app):
+    """Return the evolutions directory for an app, without importing it.
+
+    Version Added:
+        3.0
+
+    Args:
+        app (module):
+            The app.
+
+    Returns:
+        str:
+        The path to the evolutions directory, or ``None`` if not found or if
+        the evolutions are built into Django Evolution.
+    """
+    if get_app_name(app) in BUILTIN_SEQUENCES:
+        return None
+
+    module_name = get_evolutions_module_name(app)
+    module = sys.modules.get(module_name)
+
+    if module is not None:
+        filename = getattr(module, '__file__', None)
+
+        if filename is None:
+            return None
+
+        return os.path.dirname(filename)
+
+    try:
+        spec = find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+
+    if spec is None or not spec.submodule_search_locations:
+        return None
+
+    return list(spec.submodule_search_locations)[0]
+
+
+def _list_evolutions_dir(directory):
+    """Return the files in an evolutions directory tracked by a manifest.
+
+    Version Added:
+        3.0
+
+    Args:
+        directory (str):
+            The evolutions directory.
+
+    Returns:
+        list of str:
+        The sorted list of filenames.
+    """
+    return sorted(
+        filename
+        for filename in os.listdir(directory)
+        if filename not in (EVOLUTIONS_MANIFEST_FILENAME, '__pycache__')
+    )
+
+
+def _get_manifest_file_hash(directory, path):
+    """Return the content hash of a file tracked by a manifest.
+
+    Hashes are based on file contents, rather than modification times, so
+    that manifests stay valid when files are checked out or installed
+    elsewhere. The hash is cached until the file's modification time or
+    size changes.
+
+    Version Added:
+        3.0
+
+    Args:
+        directory (str):
+            The evolutions directory.
+
+        path (str):
+            The path to the file, relative to ``directory``. This may be
+            ``None``.
+
+    Returns:
+        str:
+        The SHA-256 hash of the file's contents, or ``None`` if there's no
+        file.
+    """
+    if path is None:
+        return None
+
+    full_path = os.path.join(directory, path)
+
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        return None
+
+    stat_key = (st.st_mtime_ns, st.st_size)
+    cached = _manifest_file_hashes.get(full_path)
+
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
+
+    try:
+        with open(full_path, 'rb') as fp:
+            file_hash = hashlib.sha256(fp.read()).hexdigest()
+    except IOError:
+        return None
+
+    _manifest_file_hashes[full_path] = (stat_key, file_hash)
+
+    return file_hash
+
+
+def _is_manifest_file_current(directory, file_info):
+    """Return whether a file tracked by a manifest is unchanged.
+
+    Version Added:
+        3.0
+
+    Args:
+        directory (str):
+            The evolutions directory.
+
+        file_info (dict):
+            The manifest information on the file, containing ``path`` and
+            ``hash`` keys.
+
+    Returns:
+        bool:
+        ``True`` if the file is unchanged since the manifest was built.
+    """
+    return (_get_manifest_file_hash(directory, file_info['path']) ==
+            file_info.get('hash'))
+
+
+def _load_evolutions_manifest(directory, manifest_path):
+    """Load and validate an evolutions manifest from disk.
+
+    Version Added:
+        3.0
+
+    Args:
+        directory (str):
+            The evolutions directory.
+
+        manifest_path (str):
+            The path to the manifest.
+
+    Returns:
+        dict:
+        The manifest, or ``None`` if it couldn't be loaded or is stale.
+    """
+    try:
+        with open(manifest_path, 'r') as fp:
+            manifest = json.load(fp)
+    except (IOError, ValueError) as e:
+        logger.warning('Unable to load evolutions manifest %s: %s',
+                       manifest_path, e)
+        return None
+
+    if (not isinstance(manifest, dict) or
+        manifest.get('version') != EVOLUTIONS_MANIFEST_VERSION):
+        logger.debug('Ignoring evolutions manifest %s with unsupported '
+                     'version', manifest_path)
+        return None
+
+    if (manifest['files'] != _list_evolutions_dir(directory) or
+        not _is_manifest_file_current(directory, manifest['init'])):
+        logger.debug('Ignoring stale evolutions manifest %s', manifest_path)
+        return None
+
+    return manifest
+
+
+def _get_evolutions_manifest_entry(app, evolution_label):
+    """Return the up-to-date manifest entry for an evolution.
+
+    Version Added:
+        3.0
+
+    Args:
+        app (module):
+            The app.
+
+        evolution_label (unicode):
+            The label of the evolution.
+
+    Returns:
+        dict:
+        The manifest entry, or ``None`` if there's no up-to-date entry.
+    """
+    manifest = get_evolutions_manifest(app)
+
+    if manifest is None:
+        return None
+
+    entry = manifest['evolutions'].get(evolution_label)
+
+    if (entry is None or
+        not _is_manifest_file_current(_get_evolutions_dir(app), entry)):
+        return None
+
+    return entry
+
+
+def _find_manifest_mark_applied(app, evolution_labels):
+    """Find the migrations marked applied by evolutions, using a manifest.
+
+    This looks for the last
+    :py:class:`~django_evolution.mutations.MoveToDjangoMigrations` mutation
+    in the given evolutions.
+
+    Version Added:
+        3.0
+
+    Args:
+        app (module):
+            The app.
+
+        evolution_labels (list of unicode):
+            The labels of the evolutions to check.
+
+    Returns:
+        tuple:
+        A 2-tuple containing:
+
+        1. Whether an up-to-date manifest covering all evolutions was found.
+           If ``False``, the caller must load the mutations instead.
+        2. The list of migration names marked as applied, or ``None`` if
+           the app wasn't moved to migrations.
+    """
+    manifest = get_evolutions_manifest(app)
+
+    if manifest is None:
+        return False, None
+
+    directory = _get_evolutions_dir(app)
+    entries = manifest['evolutions']
+
+    for label in reversed(evolution_labels):
+        entry = entries.get(label)
+
+        if entry is None:
+            continue
+
+        if not _is_manifest_file_current(directory, entry):
+            return False, None
+
+        if entry['mark_applied'] is not None:
+            return True, entry['mark_applied']
+
+    return True, None
+
+
+def _serialize_dependencies(deps):
+    """Serialize dependencies for storage in a manifest.
+
+    Version Added:
+        3.0
+
+    Args:
+        deps (dict):
+            The dependencies, mapping keys to sets of dependencies.
+
+    Returns:
+        dict:
+        The JSON-compatible dependencies.
+    """
+    return {
+        key: sorted(value, key=repr)
+        for key, value in deps.items()
+    }
+
+
+def _deserialize_dependencies(deps):
+    """Deserialize dependencies stored in a manifest.
+
+    Version Added:
+        3.0
+
+    Args:
+        deps (dict):
+            The dependencies from the manifest.
+
+    Returns:
+        dict:
+        The dependencies, mapping keys to sets of dependencies.
+    """
+    return {
+        key: set(
+            tuple(item) if isinstance(item, list) else item
+            for item in value
+        )
+        for key, value in deps.items()
+    }
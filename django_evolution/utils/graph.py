@@ -6,7 +6,7 @@ Version Added:
 
 from __future__ import annotations
 
-from django_evolution.compat.models import get_model_name
+from django_evolution.compat.models import get_model_name, get_models
 from django_evolution.models import Evolution
 from django_evolution.support import supports_migrations
 from django_evolution.utils.apps import get_app_label
@@ -189,11 +189,11 @@ class DependencyGraph(object):
         if not isinstance(node_keys, set):
             node_keys = set(node_keys)
 
-        self._pending_deps -= set(
+        self._pending_deps = {
             dep
             for dep in self._pending_deps
-            if dep[0] in node_keys or dep[1] in node_keys
-        )
+            if dep[0] not in node_keys and dep[1] not in node_keys
+        }
 
     def finalize(self):
         """Finalize the graph.
@@ -276,6 +276,11 @@ class DependencyGraph(object):
 
         The graph must be finalized before this is called.
 
+        Version Changed:
+            3.0:
+            Nodes already in the result are no longer walked again for each
+            leaf node, making this linear in the size of the graph.
+
         Returns:
             list of Node:
             The list of ndoes, in dependency order.
@@ -297,6 +302,11 @@ class DependencyGraph(object):
         #
         # We're using the same general algorithm/approach as Django's
         # MigrationGraph, for compatibility.
+        #
+        # Any node already in the result has had all of its dependencies
+        # added before it, so there's no need to walk it again when reached
+        # from another leaf node. Without this, shared branches of the tree
+        # would be walked once per leaf node.
         for leaf_node in self.get_leaf_nodes():
             stack = [leaf_node]
             visited = set()
@@ -305,6 +315,9 @@ class DependencyGraph(object):
             while stack:
                 node = stack.pop()
 
+                if node in result_set:
+                    continue
+
                 if node not in visited:
                     # We haven't fully completed this branch of the tree yet.
                     # Figure out what we need to do with this node.
@@ -325,9 +338,14 @@ class DependencyGraph(object):
                         # We'll mark that we've processed this, so we don't
                         # re-scan the dependencies again.
                         stack.append(node)
-                        stack += sorted(node.dependencies,
-                                        key=lambda dep: dep.insert_index,
-                                        reverse=True)
+                        stack += sorted(
+                            (
+                                dep
+                                for dep in node.dependencies
+                                if dep not in result_set
+                            ),
+                            key=lambda dep: dep.insert_index,
+                            reverse=True)
 
                         processed.add(node)
 
@@ -525,17 +543,41 @@ class EvolutionGraph(DependencyGraph):
             evolution_labels (list of unicode):
                 The list of evolutions labels to mark as applied.
         """
-        app_label = get_app_label(app)
+        self.mark_apps_evolutions_applied([(app, evolution_labels)])
+
+    def mark_apps_evolutions_applied(self, applied_evolutions):
+        """Mark evolutions for several apps as applied.
+
+        This works like :py:meth:`mark_evolutions_applied`, but removes the
+        pending dependencies for all apps in a single pass. This should be
+        used when marking evolutions for many apps at once.
 
-        if app not in self._app_evolution_nodes:
-            # There aren't any evolution nodes for this app, so let's also
-            # get rid of any dependencies to the anchors.
-            evolution_labels += ['__first__', '__last__']
+        Version Added:
+            3.0
 
-        self.remove_dependencies({
-            self._make_evolution_key((app_label, evolution_label))
-            for evolution_label in evolution_labels
-        })
+        Args:
+            applied_evolutions (list of tuple):
+                A list of 2-tuples, each containing an app module and a list
+                of evolution labels to mark as applied for that app.
+        """
+        node_keys = set()
+
+        for app, evolution_labels in applied_evolutions:
+            app_label = get_app_label(app)
+
+            if app not in self._app_evolution_nodes:
+                # There aren't any evolution nodes for this app, so let's
+                # also get rid of any dependencies to the anchors.
+                evolution_labels = \
+                    list(evolution_labels) + ['__first__', '__last__']
+
+            node_keys.update(
+                self._make_evolution_key((app_label, evolution_label))
+                for evolution_label in evolution_labels
+            )
+
+        if node_keys:
+            self.remove_dependencies(node_keys)
 
     def mark_migrations_applied(self, migrations):
         """Mark one or more migrations as applied.
@@ -552,13 +594,34 @@ class EvolutionGraph(DependencyGraph):
             for migration_target in migrations.to_targets()
         ))
 
-    def iter_batches(self):
+    def iter_batches(self, coalesce_evolutions=False):
         """Iterate through batches of consecutive evolutions and migrations.
 
         The nodes will be iterated in dependency order, with each batch
         containing a sequence of either evolutions or migrations that can be
         applied at once.
 
+        If ``coalesce_evolutions`` is set, evolutions will be moved into the
+        earliest batch of evolutions permitted by their dependencies, rather
+        than staying in the batch following the migrations that happened to
+        be ordered before them. This results in fewer, larger batches of
+        evolutions, giving more room for optimizing the mutations within
+        them.
+
+        Only declared dependencies and current model relations are
+        considered when moving evolutions. Custom SQL in evolutions or
+        migrations may still depend on the original order, so this should
+        only be used when that's known not to be the case.
+
+        Version Changed:
+            3.0:
+            Added the ``coalesce_evolutions`` argument.
+
+        Args:
+            coalesce_evolutions (bool, optional):
+                Whether to move evolutions into the earliest batch of
+                evolutions allowed by their dependencies.
+
         Yields:
             tuple:
             A 2-tuple containing:
@@ -568,6 +631,12 @@ class EvolutionGraph(DependencyGraph):
                :py:attr:`NODE_TYPE_MIGRATION`).
             2. A list of :py:class:`Node` instances.
         """
+        if coalesce_evolutions:
+            for batch in self._build_coalesced_batches():
+                yield batch
+
+            return
+
         batch_nodes = []
         batch_type = None
 
@@ -589,6 +658,167 @@ class EvolutionGraph(DependencyGraph):
         if batch_nodes:
             yield batch_type, batch_nodes
 
+    def _build_coalesced_batches(self):
+        """Build batches, moving evolutions as early as possible.
+
+        This walks the nodes in dependency order, tracking the earliest batch
+        each evolution could be placed in without coming before any of its
+        dependencies. An evolution can share a batch with an evolution it
+        depends on, but must come after any batch containing a migration or
+        model creation it depends on.
+
+        An evolution also won't be moved ahead of a migration or model
+        creation it was already ordered behind if that node belongs to an
+        app its models are related to (in either direction), or to an app
+        that can't be determined. Those dependencies aren't always declared
+        (for instance, a field added by an evolution may point to a model
+        created by a migration), so the original order is kept for them.
+
+        Version Added:
+            3.0
+
+        Returns:
+            list of tuple:
+            The list of batches, in the form yielded by
+            :py:meth:`iter_batches`.
+        """
+        NODE_TYPE_EVOLUTION = self.NODE_TYPE_EVOLUTION
+
+        batches = []
+
+        # A mapping of nodes to the earliest batch index that an evolution
+        # depending on them could be placed in.
+        min_evolution_indexes = {}
+
+        # The index of the last migration or model creation batch for each
+        # app, and the last one for nodes without a known app.
+        last_barrier_indexes = {}
+        last_unknown_barrier_index = -1
+        related_app_labels_cache = {}
+
+        for node in self.get_ordered():
+            min_index = max(
+                (
+                    min_evolution_indexes[dep_node]
+                    for dep_node in node.dependencies
+                ),
+                default=0)
+
+            if node.state.get('anchor'):
+                # Anchors don't belong in batches, but still need to carry
+                # the constraints from their dependencies through to the
+                # nodes depending on them.
+                min_evolution_indexes[node] = min_index
+                continue
+
+            node_type = node.state['type']
+            app_label = self._get_node_app_label(node)
+            batch_index = None
+
+            if node_type == NODE_TYPE_EVOLUTION:
+                if app_label is None:
+                    min_index = max(
+                        [min_index, last_unknown_barrier_index + 1] +
+                        [
+                            barrier_index + 1
+                            for barrier_index in last_barrier_indexes.values()
+                        ])
+                else:
+                    try:
+                        related_app_labels = \
+                            related_app_labels_cache[app_label]
+                    except KeyError:
+                        related_app_labels = \
+                            self._get_related_app_labels(node.state['app'])
+                        related_app_labels_cache[app_label] = \
+                            related_app_labels
+
+                    min_index = max(
+                        [min_index, last_unknown_barrier_index + 1] +
+                        [
+                            last_barrier_indexes[related_app_label] + 1
+                            for related_app_label in related_app_labels
+                            if related_app_label in last_barrier_indexes
+                        ])
+
+                for i in range(min_index, len(batches)):
+                    if batches[i][0] == NODE_TYPE_EVOLUTION:
+                        batch_index = i
+                        break
+            elif batches and batches[-1][0] == node_type:
+                batch_index = len(batches) - 1
+
+            if batch_index is None:
+                batch_index = len(batches)
+                batches.append((node_type, []))
+
+            batches[batch_index][1].append(node)
+
+            if node_type == NODE_TYPE_EVOLUTION:
+                min_evolution_indexes[node] = batch_index
+            else:
+                min_evolution_indexes[node] = batch_index + 1
+
+                if app_label is None:
+                    last_unknown_barrier_index = batch_index
+                else:
+                    last_barrier_indexes[app_label] = batch_index
+
+        return batches
+
+    def _get_node_app_label(self, node):
+        """Return the label of the app a node applies to.
+
+        Version Added:
+            3.0
+
+        Args:
+            node (Node):
+                The node to return the app label for.
+
+        Returns:
+            str:
+            The app label, or ``None`` if it could not be determined.
+        """
+        state = node.state
+
+        if 'app' in state:
+            return get_app_label(state['app'])
+        elif 'migration_target' in state:
+            return state['migration_target'][0]
+
+        return None
+
+    def _get_related_app_labels(self, app):
+        """Return the labels of apps related to an app's models.
+
+        This includes the app itself, any apps containing models that the
+        app's models have relations to, and any apps containing models with
+        relations to the app's models.
+
+        Version Added:
+            3.0
+
+        Args:
+            app (module):
+                The app module.
+
+        Returns:
+            set of str:
+            The set of related app labels.
+        """
+        related_app_labels = {get_app_label(app)}
+
+        for model in get_models(app, include_auto_created=True):
+            for field in model._meta.get_fields(include_hidden=True):
+                related_model = field.related_model
+
+                if related_model is not None and not isinstance(related_model,
+                                                                str):
+                    related_app_labels.add(related_model._meta.app_label)
+
+        return related_app_labels
+
     def _add_create_model(self, app, model, extra_state={}):
         """Add a node for creating a model.
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from importlib import import_module
 
 import django
@@ -45,20 +46,26 @@ from django_evolution.utils.apps import get_app_name
 django_version = django.VERSION[:2]
 
 
-#: A list of all globally-registered custom migrations.
+#: State for the globally-registered custom migrations.
 #:
-#: These migrations may not exist on disk. This is primarily useful for
-#: unit testing.
+#: The ``migrations`` attribute contains the registered list of custom
+#: migrations. These migrations may not exist on disk. This is primarily
+#: useful for unit testing.
 #:
-#: This list is managed by :py:func:`register_global_custom_migrations` and
+#: This is managed by :py:func:`register_global_custom_migrations` and
 #: :py:func:`clear_global_custom_migrations`.
 #:
 #: Version Added:
 #:     2.2
 #:
+#: Version Changed:
+#:     3.0:
+#:     This is now local to each thread, so that evolutions can be prepared
+#:     for multiple databases concurrently.
+#:
 #: Type:
-#:     MigrationList
-_global_custom_migrations = None
+#:     threading.local
+_global_custom_migrations = threading.local()
 
 
 class MigrationList(object):
@@ -420,14 +427,27 @@ class MigrationLoader(DjangoMigrationLoader):
     providing additional migrations not available on disk.
 
     Attributes:
+        database_applied_migrations (MigrationList):
+            Migrations known to be applied to the database. If set, these
+            will be used when building the graph instead of querying the
+            database.
+
+            Version Added:
+                3.0
+
         extra_applied_migrations (MigrationList):
             Migrations to mark as already applied. This can be used to
             augment the results calculated from the database.
     """
 
-    def __init__(self, connection, custom_migrations=None, *args, **kwargs):
+    def __init__(self, connection, custom_migrations=None,
+                 database_applied_migrations=None, *args, **kwargs):
         """Initialize the loader.
 
+        Version Changed:
+            3.0:
+            Added the ``database_applied_migrations`` argument.
+
         Args:
             connection (django.db.backends.base.BaseDatabaseWrapper):
                 The connection to load applied migrations from.
@@ -435,6 +455,10 @@ class MigrationLoader(DjangoMigrationLoader):
             custom_migrations (MigrationList, optional):
                 Custom migrations not available on disk.
 
+            database_applied_migrations (MigrationList, optional):
+                Migrations known to be applied to the database. If provided,
+                these will be used instead of querying the database.
+
             *args (tuple):
                 Additional positional arguments for the parent class.
 
@@ -445,6 +469,7 @@ class MigrationLoader(DjangoMigrationLoader):
         self._applied_migrations = None
         self._lock_migrations = False
 
+        self.database_applied_migrations = database_applied_migrations
         self.extra_applied_migrations = MigrationList()
 
         super(MigrationLoader, self).__init__(connection, *args, **kwargs)
@@ -454,9 +479,14 @@ class MigrationLoader(DjangoMigrationLoader):
         """The migrations already applied.
 
         This will contain both the migrations applied from the database
-        and any set in :py:attr:`extra_applied_migrations`.
+        (or :py:attr:`database_applied_migrations`, if set) and any set in
+        :py:attr:`extra_applied_migrations`.
         """
-        extra_migrations = self.extra_applied_migrations
+        if self.database_applied_migrations is None:
+            extra_migrations = self.extra_applied_migrations
+        else:
+            extra_migrations = (self.database_applied_migrations +
+                                self.extra_applied_migrations)
 
         if isinstance(self._applied_migrations, dict):
             # Django >= 3.0
@@ -513,18 +543,33 @@ class MigrationLoader(DjangoMigrationLoader):
     def build_graph(self, reload_migrations=True):
         """Rebuild the migrations graph.
 
+        Version Changed:
+            3.0:
+            The database is no longer queried for applied migrations if
+            :py:attr:`database_applied_migrations` is set.
+
         Args:
             reload_migrations (bool, optional):
                 Whether to reload migration instances from disk. If ``False``,
                 the ones loaded before will be used.
         """
+        connection = self.connection
+
         if not reload_migrations:
             self._lock_migrations = True
 
+        if self.database_applied_migrations is not None:
+            # Django only queries the applied migrations if there's a
+            # connection. We already know them, so don't provide one while
+            # building. The known migrations will be included by
+            # applied_migrations.
+            self.connection = None
+
         try:
             super(MigrationLoader, self).build_graph()
         finally:
             self._lock_migrations = False
+            self.connection = connection
 
     def load_disk(self):
         """Load migrations from disk.
@@ -557,7 +602,8 @@ class MigrationExecutor(DjangoMigrationExecutor):
     emitting our own signals when processing migrations.
     """
 
-    def __init__(self, connection, custom_migrations=None, signal_sender=None):
+    def __init__(self, connection, custom_migrations=None, signal_sender=None,
+                 database_applied_migrations=None):
         """Initialize the executor.
 
         Version Changed:
@@ -566,6 +612,10 @@ class MigrationExecutor(DjangoMigrationExecutor):
             custom migrations set in
             :py:func:`register_global_custom_migrations`.
 
+        Version Changed:
+            3.0:
+            Added the ``database_applied_migrations`` argument.
+
         Args:
             connection (django.db.backends.base.BaseDatabaseWrapper):
                 The connection to load applied migrations from.
@@ -580,9 +630,14 @@ class MigrationExecutor(DjangoMigrationExecutor):
             signal_sender (object, optional):
                 A custom sender to pass when sending signals. This defaults
                 to this instance.
+
+            database_applied_migrations (MigrationList, optional):
+                Migrations known to be applied to the database. If provided,
+                the loader will use these instead of querying the database.
         """
         if custom_migrations is None:
-            custom_migrations = _global_custom_migrations
+            custom_migrations = getattr(_global_custom_migrations,
+                                        'migrations', None)
 
         self._signal_sender = signal_sender or self
 
@@ -594,8 +649,10 @@ class MigrationExecutor(DjangoMigrationExecutor):
         # or at the very least prevent the default one from loading from
         # disk, but it's not often that these will be constructed, so it's
         # probably fine.
-        self.loader = MigrationLoader(connection=connection,
-                                      custom_migrations=custom_migrations)
+        self.loader = MigrationLoader(
+            connection=connection,
+            custom_migrations=custom_migrations,
+            database_applied_migrations=database_applied_migrations)
 
     def run_checks(self):
         """Perform checks on the migrations and any history.
@@ -666,6 +723,10 @@ def register_global_custom_migrations(custom_migrations):
     Version Added:
         2.2
 
+    Version Changed:
+        3.0:
+        Registered migrations are now local to the calling thread.
+
     Args:
         custom_migrations (MigrationList):
             The list of custom migrations.
@@ -674,15 +735,13 @@ def register_global_custom_migrations(custom_migrations):
         AssertionError:
             Custom migrations were already registered.
     """
-    global _global_custom_migrations
-
-    assert _global_custom_migrations is None, (
+    assert getattr(_global_custom_migrations, 'migrations', None) is None, (
         'register_global_custom_migrations() cannot be called until any '
         'existing migrations are unregistered through '
         'clear_global_custom_migrations()'
     )
 
-    _global_custom_migrations = custom_migrations
+    _global_custom_migrations.migrations = custom_migrations
 
 
 def clear_global_custom_migrations():
@@ -690,10 +749,12 @@ def clear_global_custom_migrations():
 
     Version Added:
         2.2
-    """
-    global _global_custom_migrations
 
-    _global_custom_migrations = None
+    Version Changed:
+        3.0:
+        This only clears migrations registered by the calling thread.
+    """
+    _global_custom_migrations.migrations = None
 
 
 def has_migrations_module(app):
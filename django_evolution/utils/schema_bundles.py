@@ -0,0 +1,259 @@
+"""Utilities for exporting and installing schema bundles.
+
+A schema bundle contains everything needed to install a new database for a
+project without generating SQL from the models: the SQL for creating every
+table, the project signature, and the evolutions to mark as applied.
+
+Version Added:
+    3.0
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections import OrderedDict
+
+from django.db import connections
+from django.db.utils import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext as _
+
+from django_evolution.compat.db import (atomic,
+                                        db_get_installable_models_for_app,
+                                        sql_create_models)
+from django_evolution.db.state import DatabaseState
+from django_evolution.errors import InvalidSchemaBundleError
+from django_evolution.models import Evolution, Version
+from django_evolution.signature import ProjectSignature
+from django_evolution.support import supports_migrations
+from django_evolution.utils.apps import get_app_label, get_apps
+from django_evolution.utils.evolutions import get_evolution_sequence
+from django_evolution.utils.migrations import (MigrationList,
+                                               record_applied_migrations)
+from django_evolution.utils.sql import SQLExecutor
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The current version of the schema bundle format.
+#:
+#: Version Added:
+#:     3.0
+SCHEMA_BUNDLE_VERSION = 1
+
+
+def build_schema_bundle(database=DEFAULT_DB_ALIAS):
+    """Build a schema bundle for installing a new database.
+
+    The SQL in the bundle is generated for the database's backend, and can
+    only be installed on databases using the same backend. The database does
+    not need to contain any tables.
+
+    Version Added:
+        3.0
+
+    Args:
+        database (unicode, optional):
+            The name of the database to build the bundle for.
+
+    Returns:
+        dict:
+        The schema bundle. This can be serialized to JSON.
+    """
+    connection = connections[database]
+
+    # Nothing is scanned, so that every model is considered installable,
+    # regardless of what's in the database.
+    database_state = DatabaseState(database, scan=False)
+
+    models = []
+    evolutions = []
+
+    for app in get_apps():
+        app_label = get_app_label(app)
+
+        models += db_get_installable_models_for_app(app, database_state)
+        evolutions += [
+            [app_label, evolution_label]
+            for evolution_label in get_evolution_sequence(app)
+        ]
+
+    if models:
+        sql, deferred_sql = sql_create_models(models,
+                                              db_name=database,
+                                              return_deferred=True)
+    else:
+        sql = []
+        deferred_sql = []
+
+    return OrderedDict([
+        ('version', SCHEMA_BUNDLE_VERSION),
+        ('vendor', connection.vendor),
+        ('signature', ProjectSignature.from_database(database).serialize()),
+        ('evolutions', evolutions),
+        ('sql', list(sql) + list(deferred_sql)),
+    ])
+
+
+def serialize_schema_bundle(bundle):
+    """Serialize a schema bundle for writing to a file.
+
+    Version Added:
+        3.0
+
+    Args:
+        bundle (dict):
+            The schema bundle to serialize.
+
+    Returns:
+        unicode:
+        The serialized schema bundle.
+    """
+    return json.dumps(bundle, indent=2)
+
+
+def load_schema_bundle(fp):
+    """Load a schema bundle from a file.
+
+    Version Added:
+        3.0
+
+    Args:
+        fp (file):
+            The file to load from.
+
+    Returns:
+        dict:
+        The loaded schema bundle.
+
+    Raises:
+        django_evolution.errors.InvalidSchemaBundleError:
+            The file did not contain a supported schema bundle.
+    """
+    try:
+        bundle = json.load(fp, object_pairs_hook=OrderedDict)
+    except ValueError as e:
+        raise InvalidSchemaBundleError(
+            _('The schema bundle could not be parsed: %s') % e)
+
+    if not isinstance(bundle, dict):
+        raise InvalidSchemaBundleError(_('The schema bundle is not valid.'))
+
+    if bundle.get('version') != SCHEMA_BUNDLE_VERSION:
+        raise InvalidSchemaBundleError(
+            _('Schema bundle version %r is not supported.')
+            % bundle.get('version'))
+
+    for key in ('vendor', 'signature', 'evolutions', 'sql'):
+        if key not in bundle:
+            raise InvalidSchemaBundleError(
+                _('The schema bundle is missing "%s".') % key)
+
+    return bundle
+
+
+def is_database_empty(database=DEFAULT_DB_ALIAS):
+    """Return whether a database contains no tables.
+
+    Version Added:
+        3.0
+
+    Args:
+        database (unicode, optional):
+            The name of the database.
+
+    Returns:
+        bool:
+        ``True`` if the database contains no tables.
+    """
+    connection = connections[database]
+
+    with connection.cursor() as cursor:
+        return not connection.introspection.table_names(cursor)
+
+
+def install_schema_bundle(bundle, database=DEFAULT_DB_ALIAS):
+    """Install a schema bundle into an empty database.
+
+    All SQL in the bundle is executed in order. The bundle's project
+    signature is then stored, and its evolutions and any migrations in the
+    signature are marked as applied, as if the database had been installed
+    by an :py:class:`~django_evolution.evolve.Evolver`.
+
+    Any evolutions or migrations added since the bundle was built can be
+    applied afterward by evolving the database as normal.
+
+    Version Added:
+        3.0
+
+    Args:
+        bundle (dict):
+            The schema bundle to install.
+
+        database (unicode, optional):
+            The name of the database to install into.
+
+    Returns:
+        int:
+        The number of SQL statements executed.
+
+    Raises:
+        django_evolution.errors.InvalidSchemaBundleError:
+            The bundle was built for a different database backend, or the
+            database is not empty.
+    """
+    connection = connections[database]
+
+    if bundle['vendor'] != connection.vendor:
+        raise InvalidSchemaBundleError(
+            _('The schema bundle was built for "%(bundle_vendor)s", but '
+              'the "%(database)s" database uses "%(vendor)s".')
+            % {
+                'bundle_vendor': bundle['vendor'],
+                'database': database,
+                'vendor': connection.vendor,
+            })
+
+    if not is_database_empty(database):
+        raise InvalidSchemaBundleError(
+            _('The schema bundle can only be installed into an empty '
+              'database, but "%s" already contains tables.')
+            % database)
+
+    project_sig = ProjectSignature.deserialize(bundle['signature'],
+                                               database=database)
+    sql = bundle['sql']
+
+    logger.debug('Installing schema bundle with %d statements into '
+                 'database "%s"',
+                 len(sql), database)
+
+    with SQLExecutor(database, check_constraints=False) as sql_executor:
+        sql_executor.run_sql(sql, execute=True)
+        sql_executor.ensure_transaction()
+
+        with atomic(using=database):
+            if supports_migrations:
+                applied_migrations = MigrationList()
+
+                for app_sig in project_sig.app_sigs:
+                    if app_sig.applied_migrations:
+                        applied_migrations.update(
+                            MigrationList.from_app_sig(app_sig))
+
+                if applied_migrations:
+                    record_applied_migrations(connection=connection,
+                                              migrations=applied_migrations)
+
+            version = Version(signature=project_sig)
+            version.save(using=database)
+
+            Evolution.objects.using(database).bulk_create([
+                Evolution(app_label=app_label,
+                          label=evolution_label,
+                          version=version)
+                for app_label, evolution_label in bundle['evolutions']
+            ])
+
+    return len(sql)
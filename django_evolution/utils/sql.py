@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 
-from django.db import connections
+from django.db import DatabaseError, connections
 from django.db.transaction import TransactionManagementError
 
 from django_evolution.compat.db import atomic
@@ -40,7 +40,17 @@ class NewTransactionSQL(BaseGroupedSQL):
 
 
 class NoTransactionSQL(BaseGroupedSQL):
-    """A list of SQL statements to execute outside of a transaction."""
+    """A list of SQL statements to execute outside of a transaction.
+
+    Along with SQL statements, this may contain callables that take a
+    database cursor. These will be called when executing, at that point in
+    the list, outside of any transaction, and are responsible for managing
+    their own transactions.
+
+    Version Changed:
+        3.0:
+        Added support for callables.
+    """
 
 
 class SQLExecutor(object):
@@ -141,7 +151,7 @@ class SQLExecutor(object):
         """
         self.finish_transaction()
 
-        transaction = atomic()
+        transaction = atomic(using=self._database)
         transaction.__enter__()
         self._latest_transaction = transaction
 
@@ -164,6 +174,10 @@ class SQLExecutor(object):
     def run_sql(self, sql, capture=False, execute=False):
         """Run (execute and/or capture) a list of SQL statements.
 
+        This will process all statements before returning. Callers that want
+        to handle each statement as it's processed should use
+        :py:meth:`iter_sql` instead.
+
         Args:
             sql (list):
                 A list of SQL statements. Each entry might be a string, a
@@ -182,6 +196,49 @@ class SQLExecutor(object):
             The list of SQL statements executed, if passing
             ``capture=True``. Otherwise, this will just be an empty list.
 
+        Raises:
+            django.db.transaction.TransactionManagementError:
+                Could not execute a batch of SQL statements inside of an
+                existing transaction.
+        """
+        return list(self.iter_sql(sql,
+                                  capture=capture,
+                                  execute=execute))
+
+    def iter_sql(self, sql, capture=False, execute=False):
+        """Run (execute and/or capture) SQL statements, one at a time.
+
+        This works like :py:meth:`run_sql`, but processes statements lazily.
+        Each statement is executed (if ``execute=True``) and then yielded (if
+        ``capture=True``) before the next statement is generated, allowing
+        callers to stream output without building up a full list of SQL.
+
+        ``sql`` may be any iterable, including a generator. It will only be
+        consumed as statements are needed, unless executing inside of an
+        existing transaction, in which case all statements must be checked
+        before any are run.
+
+        Version Added:
+            3.0
+
+        Args:
+            sql (iterable):
+                The SQL statements. Each entry might be a string, a tuple
+                consisting of a format string and formatting arguments, or a
+                subclass of :py:class:`BaseGroupedSQL`, or a callable that
+                returns a list of the above.
+
+            capture (bool, optional):
+                Whether to yield any processed SQL statements.
+
+            execute (bool, optional):
+                Whether to execute any processed SQL statements.
+
+        Yields:
+            unicode:
+            Each SQL statement processed, if passing ``capture=True``. This
+            will include comments marking transaction boundaries.
+
         Raises:
             django.db.transaction.TransactionManagementError:
                 Could not execute a batch of SQL statements inside of an
@@ -192,54 +249,77 @@ class SQLExecutor(object):
 
         statement = None
         params = None
-        out_sql = []
 
         try:
-            batches = self._prepare_transaction_batches(
-                self._prepare_sql(sql))
+            prepared_sql = self._prepare_sql(sql)
 
             if execute and self._connection.in_atomic_block:
                 # Check if there are any statements that must run outside of
-                # a transaction.
-                batches = list(batches)
-
-                for batch, use_transaction in batches:
-                    if not use_transaction:
-                        logging.error(
-                            'Unable to execute the following SQL inside of a '
-                            'transaction: %r',
-                            batch)
-
-                        raise TransactionManagementError(
-                            'Unable to execute SQL inside of an existing '
-                            'transaction. See the logging for more '
-                            'information.')
-
-            for i, (batch, use_transaction) in enumerate(batches):
-                if execute:
-                    if use_transaction:
-                        self.new_transaction()
-                    else:
-                        self.finish_transaction()
-
-                if capture and i > 0:
-                    if use_transaction:
-                        out_sql.append('-- Start of a new transaction:')
-                    else:
-                        out_sql.append('-- Run outside of a transaction:')
+                # a transaction. We have to do this before executing anything,
+                # so all statements must be prepared up-front.
+                prepared_sql = list(prepared_sql)
+                no_transaction_sql = [
+                    (_statement, _params)
+                    for _statement, _params, _use_transaction, _new_transaction
+                    in prepared_sql
+                    if not _use_transaction
+                ]
+
+                if no_transaction_sql:
+                    logging.error(
+                        'Unable to execute the following SQL inside of a '
+                        'transaction: %r',
+                        no_transaction_sql)
+
+                    raise TransactionManagementError(
+                        'Unable to execute SQL inside of an existing '
+                        'transaction. See the logging for more '
+                        'information.')
+
+            first_batch = True
+            last_use_transaction = None
+
+            for (statement, params, use_transaction,
+                 new_transaction) in prepared_sql:
+                if (new_transaction or
+                    use_transaction is not last_use_transaction):
+                    # This is the start of a new batch of statements to run
+                    # together inside or outside of a transaction.
+                    if execute:
+                        if use_transaction:
+                            self.new_transaction()
+                        else:
+                            self.finish_transaction()
 
-                for statement, params in batch:
-                    if capture:
-                        if params:
-                            out_sql.append(statement % tuple(
-                                qp(param)
-                                for param in params
-                            ))
+                    if capture and not first_batch:
+                        if use_transaction:
+                            yield '-- Start of a new transaction:'
                         else:
-                            out_sql.append(statement)
+                            yield '-- Run outside of a transaction:'
+
+                    first_batch = False
+                    last_use_transaction = use_transaction
 
+                if callable(statement):
+                    # This manages its own execution and transactions (such
+                    # as processing rows in chunks). There's no SQL to
+                    # capture.
                     if execute:
-                        cursor.execute(statement, params)
+                        statement(cursor)
+
+                    continue
+
+                if execute:
+                    cursor.execute(statement, params)
+
+                if capture:
+                    if params:
+                        yield statement % tuple(
+                            qp(param)
+                            for param in params
+                        )
+                    else:
+                        yield statement
         except Exception as e:
             # Augment the exception so that callers can get the SQL statement
             # that failed.
@@ -247,8 +327,6 @@ class SQLExecutor(object):
 
             raise
 
-        return out_sql
-
     def _prepare_sql(self, sql):
         """Prepare batches of SQL statements for execution.
 
@@ -269,7 +347,8 @@ class SQLExecutor(object):
             A tuple containing a statement to execute, in order. This will be
             a tuple containing:
 
-            1. The SQL statement as a string
+            1. The SQL statement as a string, or a callable from a
+               :py:class:`NoTransactionSQL`
             2. A tuple of parameters for the SQL statements (which may be
                empty)
             3. Whether this statement should be run in a transaction.
@@ -302,6 +381,15 @@ class SQLExecutor(object):
                         statements = [statements]
 
                 for statement in statements:
+                    if callable(statement):
+                        assert not use_transaction, \
+                            'Callables are only supported in NoTransactionSQL'
+
+                        yield (statement, None, use_transaction,
+                               new_transaction)
+                        new_transaction = False
+                        continue
+
                     if isinstance(statement, tuple):
                         statement, params = statement
                         assert isinstance(params, tuple)
@@ -326,38 +414,185 @@ class SQLExecutor(object):
                         # first statement in a batch to flag a new transaction.
                         new_transaction = False
 
-    def _prepare_transaction_batches(self, prepared_sql):
-        """Prepare batches of SQL statements to run together.
 
-        This takes in prepared SQL statements and generates batches of
-        statements to run together inside or outside of a transaction.
+def join_sql_statements(sql, max_statements=100):
+    """Join consecutive SQL statements into multi-statement strings.
 
-        Args:
-            prepared_sql (list of tuple):
-                A list of SQL statement information generated by
-                :py:meth:`_prepare_sql`.
+    This allows backends that can execute several statements in one call to
+    do so, reducing the number of round-trips to the database when running
+    large amounts of SQL, such as when creating tables for a new database.
 
-        Yields:
-            tuple:
-            Information on a batch of statements to to execute. This will be
-            a tuple containing:
+    Only plain SQL strings at the top level of ``sql`` are joined. Comments,
+    statements with parameters, grouped statements, and callables are left
+    as-is, and mark the boundaries between joined statements.
 
-            1. The list of SQL statements.
-            2. Whether to execute these statements in a transaction.
-        """
-        batch = None
-        last_use_transaction = None
+    Version Added:
+        3.0
+
+    Args:
+        sql (list):
+            The list of SQL statements. Each entry might be a string, a tuple
+            consisting of a format string and formatting arguments, or a
+            subclass of :py:class:`BaseGroupedSQL`, or a callable that
+            returns a list of the above.
+
+        max_statements (int, optional):
+            The maximum number of statements to join into a single string.
+
+    Returns:
+        list:
+        The new list of SQL statements.
+    """
+    assert max_statements > 0, 'max_statements must be greater than 0'
+
+    result = []
+    pending = []
+
+    def _flush():
+        if pending:
+            result.append('\n'.join(pending))
+            del pending[:]
+
+    for statement in sql:
+        if isinstance(statement, str):
+            statement = statement.strip()
+
+            if not statement:
+                continue
+
+            if not statement.startswith('--'):
+                if not statement.endswith(';'):
+                    statement += ';'
+
+                pending.append(statement)
+
+                if len(pending) >= max_statements:
+                    _flush()
+
+                continue
+
+        _flush()
+        result.append(statement)
+
+    _flush()
+
+    return result
+
+
+def drain_deferred_table_drops(database, chunk_size=None):
+    """Drop all tables that were set aside to be dropped later.
+
+    Tables are set aside by deleting models while
+    ``settings.DJANGO_EVOLUTION['DEFERRED_TABLE_DROPS']`` is enabled. Each
+    table is dropped in its own transaction, outside of any evolution.
+
+    If ``chunk_size`` is provided, and the database supports it, rows will
+    first be deleted from each table in transactions of up to that many rows.
+    This can reduce the time that the final drop holds locks.
 
-        for (statement, params, use_transaction,
-             new_transaction) in prepared_sql:
-            if new_transaction or use_transaction is not last_use_transaction:
-                if batch:
-                    yield batch, last_use_transaction
+    Tables that can't yet be dropped (for instance, due to a foreign key
+    from another table being dropped) will be retried after the others.
+
+    Version Added:
+        3.0
+
+    Args:
+        database (unicode):
+            The name of the database.
+
+        chunk_size (int, optional):
+            The maximum number of rows to delete per transaction before
+            dropping each table.
+
+    Returns:
+        list of unicode:
+        The names of the tables that were dropped.
+
+    Raises:
+        django.db.DatabaseError:
+            One or more tables could not be dropped.
+    """
+    connection = connections[database]
+    evolver_backend = EvolutionOperationsMulti(database).get_evolver()
+
+    pending_table_names = evolver_backend.get_deferred_drop_table_names()
+    dropped_table_names = []
+
+    while pending_table_names:
+        failed_table_names = []
+        last_error = None
+
+        for table_name in pending_table_names:
+            try:
+                if chunk_size:
+                    _delete_table_rows_in_chunks(
+                        connection=connection,
+                        evolver_backend=evolver_backend,
+                        table_name=table_name,
+                        chunk_size=chunk_size)
+
+                with atomic(using=database):
+                    with connection.cursor() as cursor:
+                        sql_result = \
+                            evolver_backend.get_drop_deferred_table_sql(
+                                table_name)
+
+                        for statement in sql_result.to_sql():
+                            cursor.execute(statement)
+            except DatabaseError as e:
+                logger.debug('Unable to drop deferred table "%s" yet: %s',
+                             table_name, e)
+                failed_table_names.append(table_name)
+                last_error = e
+            else:
+                dropped_table_names.append(table_name)
+
+        if len(failed_table_names) == len(pending_table_names):
+            # None of the remaining tables could be dropped, so trying again
+            # won't help.
+            raise last_error
+
+        pending_table_names = failed_table_names
+
+    return dropped_table_names
+
+
+def _delete_table_rows_in_chunks(connection, evolver_backend, table_name,
+                                 chunk_size):
+    """Delete all rows from a table, in transactions of limited size.
+
+    Version Added:
+        3.0
+
+    Args:
+        connection (django.db.backends.base.base.BaseDatabaseWrapper):
+            The database connection.
+
+        evolver_backend (django_evolution.db.common.
+                         BaseEvolutionOperations):
+            The evolution operations backend for the database.
+
+        table_name (unicode):
+            The name of the table.
+
+        chunk_size (int):
+            The maximum number of rows to delete per transaction.
+
+    Raises:
+        django.db.DatabaseError:
+            The rows could not be deleted.
+    """
+    sql = evolver_backend.get_delete_table_rows_chunk_sql(table_name,
+                                                          chunk_size)
 
-                batch = []
-                last_use_transaction = use_transaction
+    if sql is None:
+        return
 
-            batch.append((statement, params))
+    while True:
+        with atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute(sql)
+                row_count = cursor.rowcount
 
-        if batch:
-            yield batch, last_use_transaction
+        if row_count < chunk_size:
+            break